@@ -13,10 +13,10 @@ from .core.Projection import Projection
 from .inputs import *
 from .core.Dendrite import Dendrite
 from .core.Random import Uniform, DiscreteUniform, Normal, LogNormal, Gamma, Exponential, Binomial
-from .core.IO import save, load, load_parameter, load_parameters, save_parameters
+from .core.IO import save, load, wait_for_save, load_parameter, load_parameters, save_parameters
 from .core.Utils import sparse_random_matrix, sparse_delays_from_weights
 from .core.Monitor import *
-from .core.Network import Network, parallel_run
+from .core.Network import Network, parallel_run, ParallelPool
 from .parser.report.Report import report
 from .models.Neurons import *
 from .models.Synapses import *
@@ -36,7 +36,7 @@ Warning: Cython modules can not be imported. If you are installing ANNarchy, thi
 """)
 
 # ANNarchy compilation
-from .generator import compile
+from .generator import compile, compilation_cache_statistics, clear_compilation_cache, export_compiled, load_compiled
 
 # several setup() arguments can be set on command-line
 from ANNarchy.generator.CmdLineArgParser import CmdLineArgParser
@@ -9,7 +9,6 @@ import numpy as np
 
 from ANNarchy.core.Random import RandomDistribution, DiscreteUniform
 from ANNarchy.core.PopulationView import PopulationView
-from ANNarchy.parser.report.LatexParser import _process_random
 from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern import Messages
 
@@ -18,6 +17,13 @@ try:
 except Exception as e:
     Messages._print(e)
 
+def _process_random(val):
+    "Transforms a connector attribute (weights, delays) into a string representation"
+    if isinstance(val, RandomDistribution):
+        return val.latex()
+    else:
+        return str(val)
+
 ################################
 ## Connector methods
 ################################
@@ -383,7 +389,7 @@ def connect_from_matrix(self, weights: np.array, delays=0.0, pre_post=False, sto
 def _load_from_matrix(self, pre, post, weights, delays, pre_post):
     """
     Initializes a connectivity matrix between two populations based on a provided matrix.
-    This connector method always return a LIL-structure.
+    This connector method always return a CSR-structure.
 
     :param pre: pre-synaptic Population instance
     :param post: post-synaptic Population instance
@@ -391,8 +397,6 @@ def _load_from_matrix(self, pre, post, weights, delays, pre_post):
     :param delays: matrix / list-in-list which contains synaptic delays
     :param pre_post: needs to be set to True if the weights are not a post times pre matrix.
     """
-    lil = LILConnectivity()
-
     uniform_delay = not isinstance(delays, (list, np.ndarray))
     if isinstance(delays, list):
         try:
@@ -418,31 +422,20 @@ def _load_from_matrix(self, pre, post, weights, delays, pre_post):
             Messages._print('Received:', shape)
         Messages._error('Quitting...')
 
-    for i in range(self.post.size):
-        if isinstance(self.post, PopulationView):
-            rk_post = self.post.ranks[i]
-        else:
-            rk_post = i
-        r = []
-        w = []
-        d = []
-        for j in range(self.pre.size):
-            val = weights[i, j]
-            if val != None:
-                if isinstance(self.pre, PopulationView):
-                    rk_pre = self.pre.ranks[j]
-                else:
-                    rk_pre = j
-                r.append(rk_pre)
-                w.append(val)
-                if not uniform_delay:
-                    d.append(delays[i, j])
-        if uniform_delay:
-            d.append(delays)
-        if len(r) > 0:
-            lil.add(rk_post, r, w, d)
-
-    return lil
+    # Synapses are created for all values except None
+    if weights.dtype == object:
+        mask = np.not_equal(weights, None).astype(bool)
+    else:
+        mask = np.ones(shape, dtype=bool)
+
+    # Row pointer and column indices in CSR format (post x pre)
+    indptr = np.concatenate(([0], np.cumsum(np.count_nonzero(mask, axis=1))))
+    _, cols = np.nonzero(mask)
+    indices = np.asarray(self.pre.ranks)[cols]
+    w = np.asarray(weights[mask], dtype=np.float64)
+    d = delays if uniform_delay else np.asarray(delays[mask], dtype=np.float64)
+
+    return CSRConnectivity(np.asarray(self.post.ranks), indptr, indices, w, d)
 
 def connect_from_sparse(self, weights:"scipy.sparse.lil_matrix", delays: int | float=0.0, storage_format:str=None, storage_order:str=None) -> "Projection":
     """
@@ -477,37 +470,27 @@ def connect_from_sparse(self, weights:"scipy.sparse.lil_matrix", delays: int | f
     return self
 
 def _load_from_sparse(self, pre, post, weights, delays):
-    # Create an empty LIL object
-    lil = LILConnectivity()
-
-    # Find offsets
-    if isinstance(self.pre, PopulationView):
-        pre_ranks = self.pre.ranks
-    else:
-        pre_ranks = [i for i in range(self.pre.size)]
-
-    if isinstance(self.post, PopulationView):
-        post_ranks = self.post.ranks
-    else:
-        post_ranks = [i for i in range(self.post.size)]
-
-    # Process the sparse matrix and fill the lil
-    weights.sort_indices()
+    """
+    Initializes the connectivity based on a scipy sparse matrix (pre times post). The
+    arrays of the sparse matrix are re-used for the returned CSR-structure where possible.
+    """
+    # Check the dimensions of the sparse matrix
     (pre, post) = weights.shape
 
-    if (pre, post) != (len(pre_ranks), len(post_ranks)):
+    if (pre, post) != (self.pre.size, self.post.size):
         Messages._print("ERROR: connect_from_sparse(): the sparse matrix does not have the correct dimensions.")
-        Messages._print('Expected:', (len(pre_ranks), len(post_ranks)))
+        Messages._print('Expected:', (self.pre.size, self.post.size))
         Messages._print('Received:', (pre, post))
         Messages._error('Quitting...')
 
-    for idx_post in range(post):
-        idx_pre = weights.getcol(idx_post).indices
-        w = weights.getcol(idx_post).data
-        pr = [pre_ranks[i] for i in idx_pre]
-        lil.add(post_ranks[idx_post], pr, w, [float(delays)])
+    # The transpose of the (pre x post) CSC matrix is a (post x pre) CSR matrix
+    weights = weights.T.tocsr()
+    weights.sort_indices()
+
+    # Map to the ranks in the populations
+    indices = np.asarray(self.pre.ranks)[weights.indices]
 
-    return lil
+    return CSRConnectivity(np.asarray(self.post.ranks), weights.indptr, indices, weights.data, float(delays))
 
 def connect_from_file(self, filename:str, pickle_encoding:str=None, storage_format:str=None, storage_order:str=None)  -> "Projection":
     """
@@ -62,6 +62,10 @@ class Constant(float):
     def __repr__(self):
         return self.__str__()
 
+    def __deepcopy__(self, memo):
+        # Constants are global objects, analysed neuron/synapse types refer to them
+        return self
+
     def set(self, value:float, network=None) -> None:
         """
         Changes the value of the constant.
@@ -121,10 +121,7 @@ class Dendrite :
             
             elif name in self.proj.attributes:
                 # Determine C++ data type
-                ctype = None
-                for var in self.proj.synapse_type.description['variables']+self.proj.synapse_type.description['parameters']:
-                    if var['name'] == name:
-                        ctype = var['ctype']
+                ctype = self.proj._get_attribute_cpp_type(name)
 
                 if name in self.proj.synapse_type.description['local']:
                     return self.proj.cyInstance.get_local_attribute_row(name, self.idx, ctype)
@@ -145,11 +142,10 @@ class Dendrite :
             object.__setattr__(self, 'attributes', value)
         elif hasattr(self, 'proj'):
             if name in self.proj.attributes:
+                self.proj._modified_attributes.add(name)
+
                 # Determine C++ data type
-                ctype = None
-                for var in self.proj.synapse_type.description['variables']+self.proj.synapse_type.description['parameters']:
-                    if var['name'] == name:
-                        ctype = var['ctype']
+                ctype = self.proj._get_attribute_cpp_type(name)
 
                 if name in self.proj.synapse_type.description['local']:
                     if isinstance(value, (np.ndarray, list)):
@@ -267,6 +263,7 @@ class Dendrite :
             self.proj.cyInstance.add_synapse(self.post_rank, rank, w, int(delay/get_global_config('dt')), **extra_attributes)
         except Exception as e:
             Messages._print(e)
+        self.proj._invalidate_views()
 
     def create_synapses(self, ranks:list[int], weights:list[float]=None, delays:list[float]=None) -> None:
         """
@@ -312,6 +309,7 @@ class Dendrite :
                 self.proj.cyInstance.add_synapse(self.post_rank, rank, w, int(delay/get_global_config('dt')), **extra_attributes)
             except Exception as e:
                 Messages._print(e)
+            self.proj._invalidate_views()
 
     def prune_synapse(self, rank:int) -> None:
         """
@@ -328,6 +326,7 @@ class Dendrite :
             return
 
         self.proj.cyInstance.remove_synapse(self.post_rank, rank)
+        self.proj._invalidate_views()
 
     def prune_synapses(self, ranks:list[int]):
         """
@@ -354,11 +353,10 @@ class IndividualSynapse :
             return object.__getattribute__(self, name)
 
         elif name in self.dendrite.proj.synapse_type.description['attributes']:
+            self.dendrite.proj._modified_attributes.add(name)
+
             # Determine C++ data type
-            ctype = None
-            for var in self.dendrite.proj.synapse_type.description['variables']+self.dendrite.proj.synapse_type.description['parameters']:
-                if var['name'] == name:
-                    ctype = var['ctype']
+            ctype = self.dendrite.proj._get_attribute_cpp_type(name)
 
             if name in self.dendrite.proj.synapse_type.description['local']:
                 return self.dendrite.proj.cyInstance.get_local_attribute(name, self.dendrite.idx, self.rank, ctype)
@@ -376,11 +374,10 @@ class IndividualSynapse :
             object.__setattr__(self, name, value)
 
         elif name in self.dendrite.proj.synapse_type.description['attributes']:
+            self.dendrite.proj._modified_attributes.add(name)
+
             # Determine C++ data type
-            ctype = None
-            for var in self.dendrite.proj.synapse_type.description['variables']+self.dendrite.proj.synapse_type.description['parameters']:
-                if var['name'] == name:
-                    ctype = var['ctype']
+            ctype = self.dendrite.proj._get_attribute_cpp_type(name)
 
             if name in self.dendrite.proj.synapse_type.description['local']:
                 self.dendrite.proj.cyInstance.set_local_attribute(name, self.dendrite.idx, self.rank, value, ctype)
@@ -17,6 +17,8 @@ from ANNarchy.intern import Messages
 
 # Minimum number of neurons to apply OMP parallel regions
 OMP_MIN_NB_NEURONS = 100
+# Minimum number of neurons to compute global operations (min/max/mean...) with parallel reductions
+OMP_MIN_NB_GLOBAL_OPS = 10000
 
 def clear(functions:bool=True, neurons:bool=True, synapses:bool=True, constants:bool=True):
     """
@@ -9,9 +9,12 @@ from ANNarchy.core import Global
 from ANNarchy.core.Constant import Constant
 from ANNarchy.intern.NetworkManager import NetworkManager
 from ANNarchy.intern.GlobalObjects import GlobalObjectManager
+from ANNarchy.intern.CheckpointWriter import CheckpointWriter
 from ANNarchy.intern import Messages
 
 import os
+from concurrent.futures import Future
+import json
 import pickle
 import numpy as np
 
@@ -286,6 +289,12 @@ def _save_data(filename, data):
     Internal routine to save data in a file.
 
     """
+    # Directory format
+    if _is_directory_format(filename):
+        Messages._print("Saving network in directory format...")
+        _save_directory(filename, data)
+        return
+
     # Check if the repertory exist
     (path, fname) = os.path.split(filename)
 
@@ -337,12 +346,14 @@ def _save_data(filename, data):
                 return
         return
 
-def save(filename:str, populations:bool=True, projections:bool=True, net_id=0) -> None :
+def save(filename:str, populations:bool=True, projections:bool=True, net_id=0, incremental:bool=False, asynchronous:bool=False) -> Future :
     """
     Save the current network state (parameters and variables) to a file.
 
     * If the extension is '.npz', the data will be saved and compressed using `np.savez_compressed` (recommended).
 
+    * If the filename ends with a path separator (or is an existing directory), each array is stored as a raw binary file in this directory, together with a JSON manifest (`manifest.json`). The files are memory-mapped by `load()`, which is recommended for very large networks.
+
     * If the extension is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
     * If the extension ends with '.gz', the data will be pickled into a binary file and compressed using gzip.
@@ -351,6 +362,31 @@ def save(filename:str, populations:bool=True, projections:bool=True, net_id=0) -
 
     **Warning:** The '.mat' data will not be loadable by ANNarchy, it is only for external analysis purpose.
 
+    If `incremental` is True, only the attributes modified since the last checkpoint (the last file saved
+    or loaded with all populations and projections) are saved, together with a reference to this
+    checkpoint. The variables are considered modified if the network was simulated (for projections,
+    only when learning is enabled), the parameters when they were set from Python. `load()` replays
+    the chain of checkpoints, which must therefore be kept at the same relative location:
+
+    ```python
+    ann.save('results/checkpoint_0.npz')
+    for trial in range(100):
+        ann.simulate(1000.)
+        ann.save('results/checkpoint_%(trial)s.npz' % {'trial': trial+1}, incremental=True)
+    ```
+
+    If `asynchronous` is True, the data is copied from the simulation core and `save()` returns immediately
+    a `concurrent.futures.Future`, while the file is written in a background thread. At most
+    `checkpoint_queue_size` checkpoints (see `setup()`) can be in flight, further calls block until the
+    oldest one is written. `wait_for_save()` blocks until all files are written, `load()` does it implicitly:
+
+    ```python
+    for trial in range(100):
+        ann.simulate(1000.)
+        ann.save('results/checkpoint_%(trial)s.npz' % {'trial': trial}, asynchronous=True)
+    ann.wait_for_save()
+    ```
+
     Example:
 
     ```python
@@ -360,15 +396,56 @@ def save(filename:str, populations:bool=True, projections:bool=True, net_id=0) -
 
     ann.save('results/init.txt.gz')
 
+    ann.save('results/checkpoint/')
+
     ann.save('1000_trials.mat')
     ```
 
     :param filename: filename, may contain relative or absolute path.
     :param populations: if True, population data will be saved (by default True)
     :param projections: if True, projection data will be saved (by default True)
+    :param incremental: if True, only the modifications since the last checkpoint are saved (by default False).
+    :param asynchronous: if True, the file is written in a background thread (by default False).
+    :returns: a `concurrent.futures.Future` if `asynchronous` is True, None otherwise.
+    """
+    if incremental:
+        checkpoint = NetworkManager().get_checkpoint(net_id)
+        if checkpoint is None:
+            Messages._error('save(): an incremental checkpoint requires a previous call to save() or load() with all populations and projections.')
+        if not (populations and projections):
+            Messages._error('save(): incremental checkpoints contain all populations and projections.')
+        data = _net_delta(filename, checkpoint, net_id)
+    else:
+        data = _net_description(populations, projections, net_id)
+
+    future = None
+    if asynchronous:
+        future = CheckpointWriter().submit(_save_data, filename, _snapshot(data))
+    else:
+        _save_data(filename, data)
+
+    # Reference for the next incremental checkpoint
+    if populations and projections and not filename.endswith('.mat'):
+        _mark_checkpoint(filename, net_id)
+
+    return future
+
+def wait_for_save() -> None:
+    """
+    Blocks until all files of `save(..., asynchronous=True)` are written.
     """
-    data = _net_description(populations, projections, net_id)
-    _save_data(filename, data)
+    CheckpointWriter().wait()
+
+def _snapshot(data):
+    """
+    Copies the arrays of *data* which do not own their memory, so that the simulation
+    can continue while the data is written.
+    """
+    if isinstance(data, dict):
+        return {key: _snapshot(value) for key, value in data.items()}
+    elif isinstance(data, np.ndarray) and not data.flags.owndata:
+        return np.array(data, copy=True)
+    return data
 
 def _load_data(filename, pickle_encoding):
     """
@@ -378,6 +455,14 @@ def _load_data(filename, pickle_encoding):
     :param pickle_encoding: if set to None the default is used, e.g. Python2 files ("latin1") or Python3 files ("ASCII")
     :return: A dictionary with the connectivity and synaptic variables if the file ``filename`` is available otherwise None is returned.
     """
+    if _is_directory_format(filename):
+        try:
+            return _load_directory(filename)
+        except Exception as e:
+            Messages._print('Unable to read the directory ' + filename)
+            Messages._print(e)
+            return None
+
     (_, fname) = os.path.split(filename)
     extension = os.path.splitext(fname)[1]
 
@@ -449,6 +534,14 @@ def _load_connectivity_data(filename, pickle_encoding):
     :param pickle_encoding: Pickle encoding.
     :return: A dictionary with the connectivity and synaptic variables if the file ``filename`` is available otherwise None is returned.
     """
+    if _is_directory_format(filename):
+        try:
+            return _load_directory(filename)
+        except Exception as e:
+            Messages._print('Unable to read the directory ' + filename)
+            Messages._print(e)
+            return None
+
     (_, fname) = os.path.split(filename)
     extension = os.path.splitext(fname)[1]
 
@@ -517,18 +610,30 @@ def load(filename:str, populations:bool=True, projections:bool=True, pickle_enco
 
     ```python
     ann.load('results/network.npz')
+    ann.load('results/checkpoint/')
     ```
 
+    Networks saved in the directory format are memory-mapped, the synaptic data is transferred
+    row by row to the projections without loading the whole file.
+
     :param filename: the filename with relative or absolute path.
     :param populations: if True, population data will be loaded (by default True)
     :param projections: if True, projection data will be loaded (by default True)
     :param pickle_encoding: optional parameter provided to the pickle.load() method. If set to None the default is used.
     """
 
+    # The file could still be written in the background
+    if CheckpointWriter().pending() > 0:
+        CheckpointWriter().wait()
+
     desc = _load_data(filename, pickle_encoding)
     if desc is None:
         return
 
+    # Incremental checkpoint: the previous checkpoints are loaded first
+    if 'base' in desc:
+        load(_checkpoint_path(filename, str(desc['base'])), populations, projections, pickle_encoding, net_id)
+
     if 'time_step' in desc.keys():
         Global.set_current_step(desc['time_step'], net_id)
 
@@ -544,6 +649,8 @@ def load(filename:str, populations:bool=True, projections:bool=True, pickle_enco
             if proj.name in desc.keys():
                 proj._load_proj_data(desc[proj.name])
 
+    if populations and projections:
+        _mark_checkpoint(filename, net_id)
 
 def _net_description(populations, projections, net_id=0):
     """
@@ -578,3 +685,202 @@ def _net_description(populations, projections, net_id=0):
     }
 
     return network_desc
+
+
+def _net_delta(filename, checkpoint, net_id=0):
+    """
+    Returns a dictionary containing the data modified since the last checkpoint. The path
+    of the checkpoint is stored relative to the new file.
+
+    :param filename: file where the data will be saved.
+    :param checkpoint: last checkpoint (see NetworkManager.get_checkpoint()).
+    """
+    time_advanced = Global.get_current_step(net_id) != checkpoint['step']
+
+    network_desc = {}
+    network_desc['time_step'] = Global.get_current_step(net_id)
+    network_desc['net_id'] = net_id
+
+    base = os.path.relpath(checkpoint['filename'], _checkpoint_dir(filename))
+    if _is_directory_format(checkpoint['filename']):
+        base = os.path.join(base, '')
+    network_desc['base'] = base
+
+    pop_names = []
+    proj_names = []
+
+    for pop in NetworkManager().get_populations(net_id=net_id):
+        data = pop._checkpoint_data(time_advanced)
+        if data is not None:
+            network_desc[pop.name] = data
+            pop_names.append(pop.name)
+
+    for proj in NetworkManager().get_projections(net_id=net_id):
+        if not proj._saveable:
+            continue
+        data = proj._checkpoint_data(time_advanced)
+        if data is not None:
+            network_desc[proj.name] = data
+            proj_names.append(proj.name)
+
+    network_desc['obj_names'] = {
+        'populations': pop_names,
+        'projections': proj_names,
+    }
+
+    return network_desc
+
+def _checkpoint_dir(filename):
+    "Directory containing the file (or directory) of a checkpoint."
+    return os.path.dirname(os.path.abspath(os.path.normpath(filename)))
+
+def _checkpoint_path(filename, base):
+    "Path of the checkpoint *base* referenced by the incremental checkpoint *filename*."
+    return os.path.join(_checkpoint_dir(filename), base)
+
+def _mark_checkpoint(filename, net_id):
+    "Records the last checkpoint of the network, the modifications are tracked from this point."
+    path = os.path.abspath(filename)
+    if _is_directory_format(filename):
+        path = os.path.join(path, '')
+    NetworkManager().set_checkpoint(net_id, path, Global.get_current_step(net_id))
+
+    for pop in NetworkManager().get_populations(net_id=net_id):
+        pop._mark_checkpoint()
+    for proj in NetworkManager().get_projections(net_id=net_id):
+        proj._mark_checkpoint()
+
+################################
+## Directory format
+################################
+_MANIFEST = 'manifest.json'
+_DIRECTORY_FORMAT_VERSION = 1
+
+def _is_directory_format(filename):
+    "The directory format is used when the filename ends with a separator or is an existing directory."
+    return filename.endswith(os.sep) or filename.endswith('/') or os.path.isdir(filename)
+
+def _is_ragged(value):
+    "Lists of rows (dendrites) are flattened, the rows can have different sizes."
+    if isinstance(value, np.ndarray):
+        return value.dtype == np.dtype('O') and value.ndim == 1 and \
+            all(isinstance(row, (list, tuple, np.ndarray)) for row in value)
+    if isinstance(value, list):
+        return len(value) > 0 and all(isinstance(row, (list, tuple, np.ndarray)) for row in value)
+    return False
+
+def _save_directory(dirname, data):
+    """
+    Saves the dictionary *data* in the directory *dirname*. Each array is written in a raw binary file,
+    lists of rows are flattened and stored together with their row pointer (CSR). The structure of
+    *data*, the data types and shapes are described in the JSON manifest.
+    """
+    if not os.path.isdir(dirname):
+        Messages._print('Creating folder', dirname)
+        os.makedirs(dirname)
+
+    # Remove the arrays of a previous save
+    manifest_file = os.path.join(dirname, _MANIFEST)
+    if os.path.isfile(manifest_file):
+        try:
+            with open(manifest_file, 'r') as f:
+                for fname in json.load(f)['files']:
+                    if os.path.isfile(os.path.join(dirname, fname)):
+                        os.remove(os.path.join(dirname, fname))
+        except Exception:
+            pass
+
+    files = []
+
+    def write_array(key, array):
+        "Writes the array and returns its description."
+        fname = "%04d_%s.bin" % (len(files), "".join(c if c.isalnum() else '_' for c in str(key)))
+        files.append(fname)
+        array = np.ascontiguousarray(array)
+        array.tofile(os.path.join(dirname, fname))
+        return {'file': fname, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+    def write_ragged(key, rows):
+        "Writes the rows one after the other in the same file, no copy of the whole data is made."
+        fname = "%04d_%s.bin" % (len(files), "".join(c if c.isalnum() else '_' for c in str(key)))
+        files.append(fname)
+        # empty rows are converted to float64 by numpy, they should not influence the type
+        dtypes = set(np.asarray(row).dtype for row in rows if len(row) > 0)
+        dtype = np.result_type(*dtypes) if len(dtypes) > 0 else np.dtype(np.float64)
+        row_ptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        with open(os.path.join(dirname, fname), 'wb') as f:
+            for idx, row in enumerate(rows):
+                row = np.asarray(row, dtype=dtype)
+                row.tofile(f)
+                row_ptr[idx+1] = row_ptr[idx] + row.size
+        desc = write_array(str(key) + '_row_ptr', row_ptr)
+        return {'kind': 'ragged', 'file': fname, 'dtype': dtype.str, 'shape': [int(row_ptr[-1])], 'row_ptr': desc}
+
+    def encode(key, value):
+        if isinstance(value, dict):
+            return {'kind': 'dict', 'items': {str(k): encode(k, v) for k, v in value.items()}}
+        elif _is_ragged(value):
+            return write_ragged(key, value)
+        elif isinstance(value, np.ndarray) and value.ndim > 0:
+            if value.dtype == np.dtype('O'):
+                return {'kind': 'value', 'value': value.tolist()}
+            return dict(kind='array', **write_array(key, value))
+        elif isinstance(value, np.ndarray) or isinstance(value, np.generic):
+            return {'kind': 'scalar', 'value': value.item(), 'dtype': value.dtype.str}
+        elif isinstance(value, tuple):
+            return {'kind': 'tuple', 'value': list(value)}
+        elif isinstance(value, list) and len(value) > 0 and all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in value):
+            return dict(kind='array', **write_array(key, np.array(value)))
+        else:
+            return {'kind': 'value', 'value': value}
+
+    content = encode('data', data)
+
+    with open(manifest_file, 'w') as f:
+        json.dump({'version': _DIRECTORY_FORMAT_VERSION, 'files': files, 'data': content}, f, indent=1)
+
+def _load_directory(dirname):
+    """
+    Loads the data saved by _save_directory(). The arrays are memory-mapped (copy-on-write), the rows
+    of flattened arrays are views on the mapped file. The flat arrays are also provided in the entry
+    '_flat' of the dictionary, as (row_ptr, values) tuples, so that projections can be initialized
+    without building the list of rows.
+    """
+    with open(os.path.join(dirname, _MANIFEST), 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version', 0) > _DIRECTORY_FORMAT_VERSION:
+        Messages._error('load(): the directory', dirname, 'was saved by a more recent version of ANNarchy.')
+
+    def read_array(desc):
+        shape = tuple(desc['shape'])
+        if int(np.prod(shape)) == 0:
+            return np.zeros(shape, dtype=np.dtype(desc['dtype']))
+        return np.memmap(os.path.join(dirname, desc['file']), dtype=np.dtype(desc['dtype']), mode='c', shape=shape)
+
+    def decode(desc, parent=None, key=None):
+        kind = desc['kind']
+        if kind == 'dict':
+            res = {}
+            for k, v in desc['items'].items():
+                res[k] = decode(v, res, k)
+            return res
+        elif kind == 'array':
+            return read_array(desc)
+        elif kind == 'ragged':
+            values = read_array(desc)
+            row_ptr = read_array(desc['row_ptr'])
+            rows = np.empty(len(row_ptr) - 1, dtype=object)
+            for idx in range(len(rows)):
+                rows[idx] = values[row_ptr[idx]:row_ptr[idx+1]]
+            if parent is not None:
+                parent.setdefault('_flat', {})[key] = (row_ptr, values)
+            return rows
+        elif kind == 'scalar':
+            return np.array(desc['value'], dtype=np.dtype(desc['dtype']))
+        elif kind == 'tuple':
+            return tuple(desc['value'])
+        else:
+            return desc['value']
+
+    return decode(manifest['data'])
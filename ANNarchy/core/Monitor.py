@@ -14,6 +14,7 @@ from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern import Messages
 
 import numpy as np
+import os
 import re
 import sys
 from copy import copy, deepcopy
@@ -22,6 +23,9 @@ from typing import Any
 # objects/functions that should be available by "from ANNarchy import *"
 __all__ = ["Monitor", "raster_plot", "histogram", "population_rate", "smoothed_rate", "mean_fr", "inter_spike_interval", "coefficient_of_variation"]
 
+# Numpy types of the recordings spilled to disk (bool is written as one byte)
+_spill_dtypes = {'double': np.float64, 'float': np.float32, 'int': np.int32, 'bool': np.bool_}
+
 class Monitor :
     """
     Monitoring class allowing to record easily parameters or variables from Population, PopulationView, Dendrite or Projection objects.
@@ -43,9 +47,26 @@ class Monitor :
     :param period: delay in ms between two recording (default: dt). Not valid for the ``spike`` variable of a Population(View).
     :param period_offset: determine the moment in ms of recording within the period (default 0). Must be smaller than **period**.
     :param start: defines if the recording should start immediately (default: True). If not, you should later start the recordings with the ``start()`` method.
+    :param spill_dir: directory where the recordings are written during the simulation instead of being kept in memory (default: None, see below).
+    :param flush_every: number of recordings buffered in memory before they are appended to the files in ``spill_dir`` (default: 1000).
+
+    Long recordings of large populations can exhaust the memory. If ``spill_dir`` is set, the buffer of each variable
+    is appended to a raw binary file in that directory every ``flush_every`` recordings, and ``get()`` returns a
+    read-only memory-mapped array over this file:
+
+    ```python
+    m = ann.Monitor(pop, 'v', spill_dir='recordings/', flush_every=1000)
+    ann.simulate(100000.0)
+    v = m.get('v') # np.memmap of shape (100000, pop.size)
+    ```
+
+    Unless ``keep=True`` is passed, ``get()`` renames the file (``<name>_<variable>.<n>.bin``) so that the next recordings
+    go to a new file, the returned array remains valid. Spilling is only available for the variables of a Population(View)
+    with the openMP paradigm, spikes are always kept in memory.
     """
 
-    def __init__(self, obj: Any, variables:list=[], period:float=None, period_offset:float=None, start:bool=True, net_id:int=0):
+    def __init__(self, obj: Any, variables:list=[], period:float=None, period_offset:float=None, start:bool=True, net_id:int=0,
+                 spill_dir:str=None, flush_every:int=1000):
 
 
         # Object to record (Population, PopulationView, Dendrite)
@@ -100,6 +121,18 @@ class Monitor :
         if isinstance(self.object, Projection) and self._period == get_global_config('dt'):
             Messages._warning('Monitor(): it is a bad idea to record synaptic variables of a projection at each time step!')
 
+        # Spilling of the recordings to disk
+        self._spill_dir = spill_dir
+        self._flush_every = int(flush_every)
+        self._spill_chunks = {}
+        if self._spill_dir is not None:
+            if not isinstance(self.object, (Population, PopulationView)):
+                Messages._error('Monitor(): spill_dir is only available when recording a Population or PopulationView.')
+            if get_global_config('paradigm') != "openmp":
+                Messages._error('Monitor(): spill_dir is only available for the openMP paradigm.')
+            if self._flush_every < 1:
+                Messages._error('Monitor(): flush_every must be a positive number of recordings.')
+
         # Start
         self._start = start
         self._recorded_variables = {}
@@ -200,6 +233,12 @@ class Monitor :
             # Reinitializes the timings
             self._add_variable(var)
 
+        # The recordings spilled to disk are discarded
+        for filename in self._spill_chunks.values():
+            if os.path.exists(filename):
+                os.remove(filename)
+        self._spill_chunks = {}
+
     def _init_monitoring(self):
         "To be called after compile() as it accesses cython objects"
         # Start recording dependent on the recorded object
@@ -225,6 +264,11 @@ class Monitor :
         offset = Global.get_current_step(self.net_id) % period
         self.cyInstance = getattr(NetworkManager().cy_instance(self.net_id), 'PopRecorder'+str(self.object.id)+'_wrapper')(self.ranks, period, period_offset, offset)
 
+        if self._spill_dir is not None:
+            os.makedirs(self._spill_dir, exist_ok=True)
+            self._remove_spilled()
+            self.cyInstance.spill(self._spill_prefix(), self._flush_every)
+
         for var in self._variables:
             self._add_variable(var)
 
@@ -377,7 +421,7 @@ class Monitor :
 
 
     def get(self, variables:str | list[str]=None, 
-            keep:bool=False, reshape:bool=False, force_dict:bool=False) -> dict:
+            keep:bool=False, reshape:bool=False, force_dict:bool=False, events:bool=False) -> dict:
         """
         Returns the recorded variables as a Numpy array (first dimension is time, second is neuron index).
 
@@ -385,21 +429,37 @@ class Monitor :
         If a list is provided or the argument left empty, a dictionary with all recorded variables is returned.
 
         The `spike` variable of a population will be returned as a dictionary of lists, where the spike times (in steps) for each recorded neurons are returned.
+        With `events=True`, the spikes are returned as two Numpy arrays (time steps, ranks) in the order of emission, which avoids the creation
+        of one Python list per neuron for large populations:
+
+        ```python
+        times, ranks = m.get('spike', events=True)
+        ```
+
+        When several instances of the network are simulated (`setup(batch_size=...)`), the recordings of a whole population have the shape (time, batch, neuron index),
+        the spikes are indexed by `instance * pop.size + rank`.
 
         :param variables: (list of) variables. By default, a dictionary with all variables is returned.
         :param keep: defines if the content in memory for each variable should be kept (default: False).
         :param reshape: transforms the second axis of the array to match the population's geometry (default: False).
+        :param events: returns the spikes as a tuple of arrays (time steps, ranks) instead of a dictionary (default: False).
         :return: Recorded variables
         """
 
         def reshape_recording(self, data):
+            batch = (self.object._batch_size,) if isinstance(self.object, Population) and self.object._batch_size > 1 else ()
             if not reshape:
+                if batch != () and isinstance(data, np.ndarray) and data.ndim == 2:
+                    return data.reshape((data.shape[0],) + batch + (self.object.size,))
                 return data
             else:
-                return data.reshape((data.shape[0],) + self.object.geometry)
+                return data.reshape((data.shape[0],) + batch + self.object.geometry)
 
         def return_variable(self, name, keep):
             if isinstance(self.object, (Population, PopulationView)):
+                if name in ['spike', 'axon_spike']:
+                    times, ranks = self._get_population(self.object, name, keep)
+                    return (times, ranks) if events else self._spike_dict(times, ranks)
                 return reshape_recording(self, self._get_population(self.object, name, keep))
             elif isinstance(self.object, (Dendrite, Projection)):
                 data = self._get_dendrite(self.object, name, keep)
@@ -445,6 +505,18 @@ class Monitor :
             return data
 
     def _get_population(self, pop, name, keep):
+        if self._spill_dir is not None and name not in ['spike', 'axon_spike']:
+            return self._get_spilled(pop, name, keep)
+
+        if name in ['spike', 'axon_spike']:
+            try:
+                times, ranks = getattr(self.cyInstance, 'get_' + name + '_events')()
+                if not keep:
+                    getattr(self.cyInstance, 'clear_' + name)()
+            except:
+                times, ranks = np.zeros(0, dtype=np.int_), np.zeros(0, dtype=np.intc)
+            return times, ranks
+
         try:
             data = getattr(self.cyInstance, name)
             if not keep:
@@ -452,10 +524,87 @@ class Monitor :
         except:
             data = []
 
-        if name not in ['spike', 'axon_spike']:
-            return np.array(data)
+        return np.array(data)
+
+    def _recorded_neurons(self):
+        "Ranks of the neurons whose spikes are recorded."
+        if isinstance(self.object, PopulationView):
+            return self.object.ranks
+        return range(self.object.size * self.object._batch_size)
+
+    def _spike_dict(self, times, ranks):
+        "Converts the spike events into the dictionary returned by get('spike'), with a list for each recorded neuron."
+        spikes = {int(rank): [] for rank in self._recorded_neurons()}
+        spikes.update(_spike_dict(times, ranks))
+        return spikes
+
+    def _spike_data(self, spikes, events=False):
+        "Returns the spikes passed to the analysis methods, or the recorded ones (erased from memory) if None."
+        if spikes is None or (isinstance(spikes, dict) and len(spikes) == 0):
+            return self.get('spike', events=events)
+        if isinstance(spikes, dict):
+            if 'spike' in spikes.keys():
+                return spikes['spike']
+            elif 'axon_spike' in spikes.keys():
+                return spikes['axon_spike']
+        return spikes
+
+    def _spill_prefix(self):
+        "Prefix of the files holding the recordings spilled to disk."
+        return os.path.join(self._spill_dir, "%s_%s_%s_" % (self.name, self.net_id, self.id))
+
+    def _remove_spilled(self):
+        """
+        Removes the files left in the spill directory by a previous run using the
+        same prefix, as the C++ side appends to them.
+        """
+        prefix = os.path.basename(self._spill_prefix())
+        pattern = re.compile(re.escape(prefix) + r"(%s)(\.\d+)?\.bin$" % "|".join(re.escape(var) for var in self._variables))
+        for filename in os.listdir(self._spill_dir):
+            if pattern.match(filename):
+                os.remove(os.path.join(self._spill_dir, filename))
+        self._spill_chunks = {}
+
+    def _get_spilled(self, pop, name, keep):
+        """
+        Appends the recordings still buffered in C++ to the file of the variable
+        and returns a memory-mapped array over it.
+        """
+        pop = pop.population if isinstance(pop, PopulationView) else pop
+
+        try:
+            getattr(self.cyInstance, 'flush_' + name)()
+        except AttributeError:
+            Messages._error('Monitor: the variable', name, 'can not be spilled to disk.')
+
+        # Type and shape of a single recording
+        if name.startswith('_sum_'):
+            ctype = get_global_config('precision')
+            locality = 'local'
         else:
-            return data
+            var = [v for v in pop.neuron_type.description['variables'] if v['name'] == name][0]
+            ctype, locality = var['ctype'], var['locality']
+        dtype = np.dtype(_spill_dtypes[ctype])
+        if locality == 'global':
+            shape = ()
+        else:
+            shape = (pop.size * pop._batch_size,) if self.ranks == [-1] else (len(self.ranks),)
+
+        filename = self._spill_prefix() + name + ".bin"
+        if not keep and os.path.exists(filename):
+            # Following recordings go to a new file, the returned array stays valid
+            idx = len([f for f in self._spill_chunks if f[0] == name])
+            chunk = self._spill_prefix() + name + "." + str(idx) + ".bin"
+            os.replace(filename, chunk)
+            self._spill_chunks[(name, idx)] = chunk
+            filename = chunk
+
+        nb_bytes = os.path.getsize(filename) if os.path.exists(filename) else 0
+        nb_recordings = nb_bytes // (dtype.itemsize * int(np.prod(shape)))
+        if nb_recordings == 0:
+            return np.zeros((0,) + shape, dtype=dtype)
+
+        return np.memmap(filename, dtype=dtype, mode='r', shape=(nb_recordings,) + shape)
 
     def _get_dendrite(self, proj, name, keep):
         try:
@@ -518,31 +667,13 @@ class Monitor :
         plt.plot(t, n, '.')
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the spikes returned by ``get('spike')`` or ``get('spike', events=True)``. If left empty, the recorded spikes are retrieved. Beware: this erases the data from memory.
         :returns: spike times and neuron indices as numpy arrays..
         """
-        times = []; ranks=[]
         if not 'spike' in self._variables:
             Messages._error('Monitor: spike was not recorded')
 
-        # Get data
-        if spikes is None:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            elif 'axon_spike' in spikes.keys():
-                data = spikes['axon_spike']
-            else:
-                data = spikes
-
-        # Compute raster
-        for n in data.keys():
-            for t in data[n]:
-                times.append(t)
-                ranks.append(n)
-
-        return Global.dt()* np.array(times), np.array(ranks)
+        return raster_plot(self._spike_data(spikes, events=True))
 
     def histogram(self, spikes=None, bins=None, per_neuron=False, recording_window=None):
         """
@@ -567,20 +698,13 @@ class Monitor :
         plt.plot(histo)
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the spikes returned by ``get('spike')`` or ``get('spike', events=True)``. If left empty, the recorded spikes are retrieved. Beware: this erases the data from memory.
         :param bins: the bin size in ms (default: dt).
         """
         if not 'spike' in self._variables:
             Messages._error('Monitor: spike was not recorded')
 
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = self._spike_data(spikes, events=True)
 
         return histogram(data, bins=bins, per_neuron=per_neuron, recording_window=recording_window)
 
@@ -588,18 +712,13 @@ class Monitor :
         """
         Computes the inter-spike interval for the recorded spikes in the population.
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the spikes returned by ``get('spike')`` or ``get('spike', events=True)``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
         :ranks:        a list of neurons that should be evaluated. By default (None), all neurons are evaluated.
         :per_neuron:   if set to True, the computed inter-spike intervals are stored per neuron (analog to spikes), otherwise all values are stored in one huge vector (default: False).
         """
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = self._spike_data(spikes)
+        if isinstance(data, tuple):
+            data = self._spike_dict(*data)
 
         return inter_spike_interval(data, ranks=ranks, per_neuron=per_neuron)
 
@@ -607,17 +726,12 @@ class Monitor :
         """
         Computes the coefficient of variation for the recorded spikes in the population.
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the spikes returned by ``get('spike')`` or ``get('spike', events=True)``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
         :ranks:        a list of neurons that should be evaluated. By default (None), all neurons are evaluated.
         """
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = self._spike_data(spikes)
+        if isinstance(data, tuple):
+            data = self._spike_dict(*data)
 
         return coefficient_of_variation(data, ranks=ranks)
 
@@ -642,32 +756,22 @@ class Monitor :
         fr = m.mean_fr(spikes)
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the spikes returned by ``get('spike')`` or ``get('spike', events=True)``. If left empty, the recorded spikes are retrieved. Beware: this erases the data from memory.
 
         """
         if not 'spike' in self._variables:
             Messages._error('Monitor: spike was not recorded')
 
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
-
+        _, ranks = _spike_events(self._spike_data(spikes, events=True))
 
         # Compute the duration of the recordings
         duration = self._last_recorded_variables['spike']['stop'][-1] - self._last_recorded_variables['spike']['start'][-1]
 
         # Number of neurons
-        neurons = self.object.ranks if isinstance(self.object, PopulationView) else range(self.object.size)
+        neurons = self._recorded_neurons()
 
         # Compute fr
-        fr = 0
-        for neuron in neurons:
-            fr += len(data[neuron])
+        fr = np.count_nonzero(np.isin(ranks, neurons))
 
         return fr/float(len(neurons))/duration/Global.dt()*1000.0
 
@@ -694,14 +798,9 @@ class Monitor :
         if not 'spike' in self._variables:
             Messages._error('Monitor: spike was not recorded')
 
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = self._spike_data(spikes)
+        if isinstance(data, tuple):
+            data = self._spike_dict(*data)
 
         import ANNarchy.cython_ext.Transformations as Transformations
         return Transformations.smoothed_rate(
@@ -738,14 +837,9 @@ class Monitor :
         if not 'spike' in self._variables:
             Messages._error('Monitor: spike was not recorded')
 
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = self._spike_data(spikes)
+        if isinstance(data, tuple):
+            data = self._spike_dict(*data)
 
         import ANNarchy.cython_ext.Transformations as Transformations
         return Transformations.population_rate(
@@ -825,6 +919,30 @@ class MemoryStats :
 ######################
 # Static methods to plot spike patterns without a Monitor (e.g. offline)
 ######################
+def _spike_events(spikes):
+    """
+    Returns the spikes as two arrays (time steps, ranks), from either the dictionary returned
+    by get('spike') or the tuple returned by get('spike', events=True).
+    """
+    if isinstance(spikes, tuple):
+        return np.asarray(spikes[0]), np.asarray(spikes[1])
+
+    nb_spikes = [len(times) for times in spikes.values()]
+    if sum(nb_spikes) == 0:
+        return np.zeros(0, dtype=np.int_), np.zeros(0, dtype=np.int_)
+
+    ranks = np.repeat(np.array(list(spikes.keys()), dtype=np.int_), nb_spikes)
+    times = np.concatenate([np.asarray(times, dtype=np.int_) for times in spikes.values()])
+    return times, ranks
+
+def _spike_dict(times, ranks):
+    "Groups the spike events by rank, only the neurons which emitted a spike are present."
+    if len(ranks) == 0:
+        return {}
+    order = np.argsort(ranks, kind='stable')
+    neurons, first = np.unique(ranks[order], return_index=True)
+    return {int(rank): events.tolist() for rank, events in zip(neurons, np.split(times[order], first[1:]))}
+
 def raster_plot(spikes:dict) -> tuple:
     """
     Returns two vectors representing for each recorded spike 1) the spike times and 2) the ranks of the neurons.
@@ -840,17 +958,11 @@ def raster_plot(spikes:dict) -> tuple:
     plt.plot(t, n, '.')
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes returned by ``get('spike')``, or the arrays returned by ``get('spike', events=True)``.
     """
-    times = []; ranks=[]
-
-    # Compute raster
-    for n in spikes.keys():
-        for t in spikes[n]:
-            times.append(t)
-            ranks.append(n)
+    times, ranks = _spike_events(spikes)
 
-    return Global.dt()* np.array(times), np.array(ranks)
+    return Global.dt()* times, ranks
 
 
 def histogram(spikes:dict, bins:float=None, per_neuron:bool=False, recording_window:tuple=None):
@@ -867,7 +979,7 @@ def histogram(spikes:dict, bins:float=None, per_neuron:bool=False, recording_win
     plt.plot(histo)
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes returned by ``get('spike')``, or the arrays returned by ``get('spike', events=True)``.
     :param bins: the bin size in ms (default: dt).
     """
     if bins is None:
@@ -875,17 +987,12 @@ def histogram(spikes:dict, bins:float=None, per_neuron:bool=False, recording_win
 
     bin_step = int(bins/get_global_config('dt'))
 
-    # Compute the duration of the recordings
-    t_maxes = []
-    t_mines = []
-    for neuron in spikes.keys():
-        if len(spikes[neuron]) == 0 : continue
-        t_maxes.append(np.max(spikes[neuron]))
-        t_mines.append(np.min(spikes[neuron]))
+    times, ranks = _spike_events(spikes)
 
+    # Compute the duration of the recordings
     if recording_window is None:
-        t_max = np.max(t_maxes)
-        t_min = np.min(t_mines)
+        t_max = np.max(times)
+        t_min = np.min(times)
     else:
         t_min = recording_window[0]
         t_max = recording_window[1]
@@ -893,38 +1000,36 @@ def histogram(spikes:dict, bins:float=None, per_neuron:bool=False, recording_win
 
     # Number of bins
     nb_bins = int(duration/bin_step)
-    #print(t_min, t_max, duration, nb_bins)
 
-    if per_neuron:
-        max_rank = np.amax([x for x in spikes.keys()])+1
-        # Initialize histogram
-        histo = [ [0 for _ in range(nb_bins+1)] for _ in range(max_rank) ]
+    # Bin of each spike, the spikes outside the recording window are ignored
+    bin_idx = ((times - t_min)/float(bin_step)).astype(np.int_)
+    inside = (times >= t_min) & (bin_idx <= nb_bins)
 
-        # Compute per step histogram
-        for neuron in spikes.keys():
-            for t in spikes[neuron]:
-                histo[neuron][int((t-t_min)/float(bin_step))] += 1
+    if per_neuron:
+        if isinstance(spikes, dict):
+            max_rank = np.amax([x for x in spikes.keys()])+1
+        else:
+            max_rank = np.amax(ranks)+1
+        histo = np.zeros((max_rank, nb_bins+1), dtype=np.int_)
+        np.add.at(histo, (ranks[inside], bin_idx[inside]), 1)
 
     else:
-        # Initialize histogram
-        histo = [0 for t in range(nb_bins+1)]
-
-        # Compute per step histogram
-        for neuron in spikes.keys():
-            for t in spikes[neuron]:
-                histo[int((t-t_min)/float(bin_step))] += 1
+        histo = np.bincount(bin_idx[inside], minlength=nb_bins+1)
 
-    return np.array(histo)
+    return histo
 
 def inter_spike_interval(spikes:dict, ranks:list=None, per_neuron:bool=False):
     """
     Computes the inter-spike interval (ISI) for the recorded spike events of a population.
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes returned by ``get('spike')``, or the arrays returned by ``get('spike', events=True)``.
     :param ranks: list of ranks.
     :param per_neuron: if True, the ISI will be computed per neuron, not globally.
 
     """
+    if isinstance(spikes, tuple):
+        spikes = _spike_dict(*_spike_events(spikes))
+
     isi = {}
     for neuron_rank, spike_events in spikes.items():
         # ISI computation requires at least 2 events
@@ -955,7 +1060,7 @@ def coefficient_of_variation(spikes:dict, ranks:list=None, per_neuron:bool=False
     """
     Computes the coefficient of variation of the inter-spike intervals for the recorded spike events of a population.
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes returned by ``get('spike')``, or the arrays returned by ``get('spike', events=True)``.
     :param ranks: list of ranks.
     :param per_neuron: if True, the ISI will be computed per neuron, not globally.
     """
@@ -1000,6 +1105,9 @@ def population_rate(spikes:dict, smooth:float=0.0):
     :param spikes: the dictionary of spikes returned by ``get('spike')``.
     :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
     """
+    if isinstance(spikes, tuple):
+        spikes = _spike_dict(*_spike_events(spikes))
+
     # Compute the duration of the recordings
     t_maxes = []
     t_mines = []
@@ -1040,6 +1148,9 @@ def smoothed_rate(spikes:dict, smooth:float=0.):
     :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
     :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
     """
+    if isinstance(spikes, tuple):
+        spikes = _spike_dict(*_spike_events(spikes))
+
     # Compute the duration of the recordings
     t_maxes = []
     t_mines = []
@@ -1074,30 +1185,24 @@ def mean_fr(spikes, duration=None):
     fr = mean_fr(spikes)
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes returned by ``get('spike')``, or the arrays returned by ``get('spike', events=True)``.
     :param duration: duration of the recordings. By default, the mean firing rate is computed between the first and last spikes of the recordings.
 
 
     """
-    if duration is None:
-
-        # Compute the duration of the recordings
-        t_maxes = []
-        t_mines = []
-        for neuron in spikes.keys():
-            if len(spikes[neuron]) == 0 : continue
-            t_maxes.append(np.max(spikes[neuron]))
-            t_mines.append(np.min(spikes[neuron]))
+    times, ranks = _spike_events(spikes)
 
-        t_max = np.max(t_maxes)
-        t_min = np.min(t_mines)
-        duration = t_max - t_min
+    # Only the neurons which emitted a spike are known from the events
+    if isinstance(spikes, dict):
+        nb_neurons = len(spikes.keys())
+    else:
+        nb_neurons = len(np.unique(ranks))
 
-    nb_neurons = len(spikes.keys())
+    if duration is None:
+        # Compute the duration of the recordings
+        duration = np.max(times) - np.min(times)
 
     # Compute fr
-    fr = 0
-    for neuron in spikes:
-        fr += len(spikes[neuron])
+    fr = len(times)
 
     return fr/float(nb_neurons)/duration/Global.dt()*1000.0
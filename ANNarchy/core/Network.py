@@ -10,13 +10,18 @@ from .Monitor import Monitor
 from ANNarchy.intern.NetworkManager import NetworkManager
 from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern import Messages
-from ANNarchy.extensions.bold import BoldMonitor
 
 import ANNarchy.core.Global as Global
 import ANNarchy.core.Simulate as Simulate
 import ANNarchy.core.IO as IO
 import ANNarchy.generator.Compiler as Compiler
 import numpy as np
+import sys
+
+def _is_bold_monitor(obj):
+    "BoldMonitors only exist if the bold extension was imported, so we do not import it here."
+    bold = sys.modules.get('ANNarchy.extensions.bold')
+    return bold is not None and isinstance(obj, bold.BoldMonitor)
 
 class Network :
     """
@@ -175,6 +180,7 @@ class Network :
             pop.name = obj.name
             pop.class_name = obj.class_name
             pop.init = obj.init
+            pop._init_distributions = obj._init_distributions
             pop.enabled = obj.enabled
             if not obj.enabled: # Also copy the enabled state:
                 pop.disable()
@@ -222,7 +228,9 @@ class Network :
             NetworkManager().add_projection(net_id=self.id, projection=proj)
             self.projections.append(proj)
 
-        elif isinstance(obj, BoldMonitor):
+        elif _is_bold_monitor(obj):
+            from ANNarchy.extensions.bold import BoldMonitor
+
             # Create a copy of the monitor
             m = BoldMonitor(
                 populations=obj._populations,
@@ -276,7 +284,7 @@ class Network :
                 except:
                     pass
             # Create a copy of the monitor
-            m = Monitor(obj=self._get_object(obj.object), variables=obj.variables, period=obj._period, period_offset=obj._period_offset, start=obj._start, net_id=self.id)
+            m = Monitor(obj=self._get_object(obj.object), variables=obj.variables, period=obj._period, period_offset=obj._period_offset, start=obj._start, net_id=self.id, spill_dir=obj._spill_dir, flush_every=obj._flush_every)
 
             # there is a bad mismatch between object ids:
             #
@@ -330,7 +338,7 @@ class Network :
             for m in self.monitors:
                 if m.id == obj.id:
                     return m
-        elif isinstance(obj, BoldMonitor):
+        elif _is_bold_monitor(obj):
             for m in self.extensions:
                 if m.id == obj.id:
                     return m
@@ -348,7 +356,8 @@ class Network :
                 annarchy_json:str="",
                 silent:bool=False,
                 debug_build:bool=False,
-                profile_enabled:bool=False):
+                profile_enabled:bool=False,
+                jobs:int=None):
         """
         Compiles the network.
 
@@ -359,9 +368,10 @@ class Network :
         :param cuda_config: dictionary defining the CUDA configuration for each population and projection.
         :param annarchy_json: compiler flags etc are stored in a .json file normally placed in the home directory. With this flag one can directly assign a file location.
         :param silent: defines if the "Compiling... OK" should be printed.
+        :param jobs: number of parallel jobs used by make. If set to None, the number of available CPU cores is used.
 
         """
-        Compiler.compile(directory=directory, clean=clean, silent=silent, debug_build=debug_build, add_sources=add_sources, extra_libs=extra_libs, compiler=compiler, compiler_flags=compiler_flags, cuda_config=cuda_config, annarchy_json=annarchy_json, profile_enabled=profile_enabled, net_id=self.id)
+        Compiler.compile(directory=directory, clean=clean, silent=silent, debug_build=debug_build, add_sources=add_sources, extra_libs=extra_libs, compiler=compiler, compiler_flags=compiler_flags, cuda_config=cuda_config, annarchy_json=annarchy_json, profile_enabled=profile_enabled, jobs=jobs, net_id=self.id)
 
     def simulate(self, duration:float, measure_time:bool=False):
         """
@@ -553,15 +563,17 @@ class Network :
         """
         IO.load(filename=filename, populations=populations, projections=projections, pickle_encoding=pickle_encoding, net_id=self.id)
 
-    def save(self, filename:str, populations:bool=True, projections:bool=True):
+    def save(self, filename:str, populations:bool=True, projections:bool=True, incremental:bool=False, asynchronous:bool=False):
         """
         Saves the current network by calling ANNarchy.core.IO.save().
 
         :param filename: filename, may contain relative or absolute path.
         :param populations: if True, population data will be saved (by default True)
         :param projections: if True, projection data will be saved (by default True)
+        :param incremental: if True, only the modifications since the last checkpoint are saved (by default False).
+        :param asynchronous: if True, the file is written in a background thread and a `concurrent.futures.Future` is returned (by default False).
         """
-        IO.save(filename, populations, projections, self.id)
+        return IO.save(filename, populations, projections, self.id, incremental, asynchronous)
 
 def parallel_run(
         method, 
@@ -573,6 +585,7 @@ def parallel_run(
         same_seed:bool=False, 
         annarchy_json:str="", 
         visible_cores:list=[], 
+        shared_connectivity:bool=True,
         **args) -> list:
     """
     Allows to run multiple networks in parallel using multiprocessing.
@@ -581,7 +594,9 @@ def parallel_run(
 
     If ``number`` is given instead, the same number of networks will be created and the method is applied.
 
-    If ``number`` is used, the created networks are not returned, you should return what you need to analyse.
+    If ``number`` is used, the created networks are not returned, you should return what you need to analyse. The connectivity of the projections is then built only once by the calling process and placed into shared memory, from which each network is initialized (except for the connectivity patterns implemented in C++, see ``use_cpp_connectors`` in ``setup()``).
+
+    For many short simulations of the same network, ``ParallelPool`` keeps the worker processes and their networks alive between the calls.
 
     Example:
 
@@ -616,6 +631,7 @@ def parallel_run(
     :param same_seed: if True, all networks will use the same seed. If not, the seed will be randomly initialized with time(0) for each network (default). It has no influence when the ``networks`` argument is set (the seed has to be set individually for each network using ``net.set_seed()``), only when ``number`` is used.
     :param annarchy_json: path to a different configuration file if needed (default "").
     :param visible_cores: a list of CPU core ids to simulate on (must have max_processes entries and max_processes must be != -1)
+    :param shared_connectivity: if True, the connectivity is built once and shared by the networks when ``number`` is used. If False, each network calls the connector methods again (default: True).
     :param args: other named arguments you want to pass to the simulation method.
     :returns: a list of the values returned by each call to `method`.
 
@@ -635,7 +651,7 @@ def parallel_run(
         Messages._error('parallel_run(): the method argument must be a method.', exit=True)
 
     if not networks: # The magic network will run N times
-        return _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, args)
+        return _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, shared_connectivity, args)
 
     if not isinstance(networks, list):
         Messages._error('parallel_run(): the networks argument must be a list.', exit=True)
@@ -713,7 +729,7 @@ def _parallel_networks(method, networks, max_processes, measure_time, sequential
     return results
 
 
-def _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, args):
+def _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, shared_connectivity, args):
     "Method when the same network must be simulated multiple times."
     import multiprocessing
     from multiprocessing import Pool
@@ -744,8 +760,19 @@ def _parallel_multi(method, number, max_processes, measure_time, sequential, sam
     else: # draw it everytime with time(0)
         seed = np.random.get_state()[1][0] # old api < 1.17
 
+    # The connectivity is identical for all instances, build it only once
+    if shared_connectivity:
+        from ANNarchy.intern.SharedConnectivity import SharedConnectivity
+        shared = SharedConnectivity(NetworkManager().get_projections(net_id=0, suppress_error=True))
+        descriptors = shared.descriptors
+        if get_global_config('verbose'):
+            Messages._print('parallel_run(): the connectivity of', len(descriptors), 'projections is shared (', shared.size_in_bytes(), 'bytes)')
+    else:
+        shared = None
+        descriptors = {}
+
     # Build arguments list for each instance with the following structure:
-    # [ net_id, arguments for method, seed ]
+    # [ net_id, arguments for method, seed, visible cores, shared connectivity ]
     arguments = [[n, method] for n in range(number)]
     if len(args) != method.__code__.co_argcount-2:  # idx, net are default
         Messages._error('the method', method.__name__, 'takes', method.__code__.co_argcount-2,
@@ -767,42 +794,51 @@ def _parallel_multi(method, number, max_processes, measure_time, sequential, sam
     else:
         for n in range(number):
             arguments[n].append([visible_cores[np.mod(n,max_processes)]])
+    for n in range(number):
+        arguments[n].append(descriptors)
 
-    # Simulation
-    if not sequential and len(visible_cores) == 0:
-        try:
-            pool = Pool(max_processes)
-            results = pool.map(_create_and_run_method, arguments)
-            pool.close()
-            pool.join()
-        except Exception as e:
-            Messages._print(e)
-            Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+    try:
+        # Simulation
+        if not sequential and len(visible_cores) == 0:
+            try:
+                pool = Pool(max_processes)
+                results = pool.map(_create_and_run_method, arguments)
+                pool.close()
+                pool.join()
+            except Exception as e:
+                Messages._print(e)
+                Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
 
-    elif not sequential and len(visible_cores) > 0:
-        # Thread placement requires some more fine-grained control
-        # on the execution
-        try:
-            n_iter = int(np.ceil(number / max_processes))
-            pool = Pool(max_processes)
-            for idx in range(n_iter):
-                beg = int(idx * max_processes)
-                end = int(min((idx+1) * max_processes, number))
-                results = pool.map(_create_and_run_method, arguments[beg:end])
-            pool.close()
-            pool.join()
-        except Exception as e:
-            Messages._print(e)
-            Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+        elif not sequential and len(visible_cores) > 0:
+            # Thread placement requires some more fine-grained control
+            # on the execution
+            try:
+                n_iter = int(np.ceil(number / max_processes))
+                pool = Pool(max_processes)
+                results = []
+                for idx in range(n_iter):
+                    beg = int(idx * max_processes)
+                    end = int(min((idx+1) * max_processes, number))
+                    results += pool.map(_create_and_run_method, arguments[beg:end])
+                pool.close()
+                pool.join()
+            except Exception as e:
+                Messages._print(e)
+                Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
 
-    else:
-        results = []
-        try:
-            for n in range(number):
-                results.append(_create_and_run_method(arguments[0]))
-        except Exception as e:
-            Messages._print(e)
-            Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+        else:
+            results = []
+            try:
+                for n in range(number):
+                    results.append(_create_and_run_method(arguments[n]))
+            except Exception as e:
+                Messages._print(e)
+                Messages._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+
+    finally:
+        # All instances are created, the workers do not need the shared memory anymore
+        if shared is not None:
+            shared.release()
 
     # Time measurement
     if measure_time:
@@ -821,18 +857,25 @@ def _create_and_run_method(args):
     """
     Method called to wrap the user-defined method when different networks are created.
     """
+    from ANNarchy.intern.SharedConnectivity import attach_shared_connectivity, detach_shared_connectivity
+
     # Get arguments
     n = args[0]
     method = args[1]
-    visible_cores = args[-1]
-    seed = args[-2]
+    descriptors = args[-1]
+    visible_cores = args[-2]
+    seed = args[-3]
     # Create and instantiate the network 0, not compile it!
     net = Network(True)
+    # The connectivity shared by the parent process is copied by the C++ side
+    projections = net.get_projections(suppress_error=True)
+    blocks = attach_shared_connectivity(projections, descriptors)
     Compiler._instantiate(net_id=net.id, import_id=0, core_list=visible_cores)
+    detach_shared_connectivity(projections, blocks)
     # Set the seed
     net.set_seed(seed)
     # Create the arguments
-    arguments = args[:-2] # all arguments except seed and visible_cores
+    arguments = args[:-3] # all arguments except seed, visible_cores and the shared connectivity
     arguments[1] = net # replace the second argument method with net
     # Call the method
     res = method(*arguments)
@@ -848,3 +891,223 @@ def _only_run_method(args):
     arguments = args[1:]
     res = method(*arguments)
     return res
+
+
+class ParallelPool:
+    """
+    Pool of worker processes simulating copies of the magic network, which can be re-used for many calls (e.g. parameter sweeps with thousands of short simulations).
+
+    Contrary to ``parallel_run()``, the processes are started and the network is instantiated only once per worker, when the pool is created. Before each task, the network of the worker is reset to its initial state (see the ``reset`` argument). The results can be retrieved in the order in which they complete with ``imap()``, or all at once with ``run()``.
+
+    Example:
+
+    ```python
+    pop1 = ann.PoissonPopulation(100, rates=10.0)
+    pop2 = ann.Population(100, ann.Izhikevich)
+    proj = ann.Projection(pop1, pop2, 'exc')
+    proj.connect_fixed_probability(weights=5.0, probability=0.2)
+    m = ann.Monitor(pop2, 'spike')
+
+    ann.compile()
+
+    def simulation(idx, net, rate):
+        net.get(pop1).rates = rate
+        net.simulate(100.)
+        return net.get(m).raster_plot()
+
+    rates = np.linspace(1.0, 100.0, 1000)
+
+    with ann.ParallelPool(max_processes=4) as pool:
+        for idx, (t, n) in pool.imap(simulation, number=1000, rate=rates):
+            print(rates[idx], len(t))
+    ```
+
+    :param max_processes: number of worker processes (default: the available number of cores on the machine).
+    :param visible_cores: a list of CPU core ids, each worker is pinned to one of them (must have max_processes entries and max_processes must be != -1).
+    :param same_seed: if True, all tasks use the same seed. If not, the seed is incremented for each task (default).
+    :param shared_connectivity: if True (default), the connectivity is built once and shared by the workers (see ``parallel_run()``).
+    :param reset: if True (default), the neural and synaptic variables (including the weights) and the monitors are reset before each task. The connectivity itself is not recreated. If False, the network keeps its state between the tasks.
+    :param measure_time: if True, the duration of each call and the overhead per task (dispatching, transfer of the results and idle workers) are printed.
+    :param annarchy_json: path to a different configuration file if the network is not compiled yet (default "").
+    """
+    def __init__(self,
+            max_processes:int=-1,
+            visible_cores:list=[],
+            same_seed:bool=False,
+            shared_connectivity:bool=True,
+            reset:bool=True,
+            measure_time:bool=False,
+            annarchy_json:str=""):
+
+        import multiprocessing
+
+        if len(visible_cores) > 0 and max_processes == -1:
+            Messages._error('ParallelPool: when using visible cores the number of max_processes must be set.', exit=True)
+
+        if (len(visible_cores) > 0) and (len(visible_cores) != max_processes):
+            Messages._error('ParallelPool: the number of entries in visible_cores must be equal to max_processes.', exit=True)
+
+        # Make sure the magic network is compiled
+        if not NetworkManager().is_compiled(net_id=0):
+            Messages._warning('ParallelPool: the network is not compiled yet, doing it now...')
+            Compiler.compile(annarchy_json=annarchy_json)
+
+        # Number of processes to create
+        if max_processes < 0:
+            if get_global_config('paradigm') == "openmp":
+                max_processes = multiprocessing.cpu_count()
+            elif get_global_config('paradigm') == "cuda":
+                Messages._warning("In the present ANNarchy version the usage of parallel networks and multi-GPUs is disabled.")
+                max_processes = 1
+            else:
+                raise NotImplementedError
+        self.max_processes = max_processes
+        self.measure_time = measure_time
+
+        # Seed
+        if same_seed and get_global_config('seed') is not None: # use the global seed
+            self._seed = get_global_config('seed')
+        else: # draw it everytime with time(0)
+            self._seed = np.random.get_state()[1][0] # old api < 1.17
+        self._same_seed = same_seed
+
+        # The connectivity is identical for all workers, build it only once
+        if shared_connectivity:
+            from ANNarchy.intern.SharedConnectivity import SharedConnectivity
+            self._shared = SharedConnectivity(NetworkManager().get_projections(net_id=0, suppress_error=True))
+            descriptors = self._shared.descriptors
+        else:
+            self._shared = None
+            descriptors = {}
+
+        # Each worker takes one of the cores when it starts
+        if len(visible_cores) > 0:
+            cores = multiprocessing.Queue()
+            for core in visible_cores:
+                cores.put(core)
+        else:
+            cores = None
+
+        self._pool = multiprocessing.Pool(max_processes, initializer=_pool_initializer, initargs=(cores, descriptors, reset))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def imap(self, method, number:int, chunksize:int=1, **args):
+        """
+        Executes the method *number* times in the workers and yields the tuples ``(idx, result)`` in the order in which the tasks complete.
+
+        :param method: a Python method which will be executed for each task. This function must accept an integer as first argument (id of the task) and a Network object as second argument.
+        :param number: the number of tasks.
+        :param chunksize: number of tasks sent at once to a worker, higher values reduce the dispatch overhead of very short tasks (default: 1).
+        :param args: other named arguments you want to pass to the method, as lists of *number* values.
+        """
+        from time import time
+
+        if self._pool is None:
+            Messages._error('ParallelPool.imap(): the pool is already closed.')
+
+        import types
+        if not isinstance(method, types.FunctionType):
+            Messages._error('ParallelPool.imap(): the method argument must be a method.', exit=True)
+
+        # Build the arguments list: [ idx, method, arguments for method, seed ]
+        if len(args) != method.__code__.co_argcount-2:  # idx, net are default
+            Messages._error('the method', method.__name__, 'takes', method.__code__.co_argcount-2,
+                          'arguments (in addition to idx and net) which have to be passed to ParallelPool:', method.__code__.co_varnames[2:method.__code__.co_argcount])
+        method_args = [[] for n in range(number)]
+        for arg in range(2, method.__code__.co_argcount):
+            varname = method.__code__.co_varnames[arg]
+            data = args[varname]
+            if not len(data) == number:
+                Messages._error('ParallelPool.imap(): the argument', varname, 'must be a list of values for each of the', number, 'tasks.')
+            for n in range(number):
+                method_args[n].append(data[n])
+        tasks = [[n, method, method_args[n], self._seed + n if not self._same_seed else self._seed] for n in range(number)]
+
+        ts = time()
+        busy = 0.0
+        for idx, res, duration in self._pool.imap_unordered(_pool_run_task, tasks, chunksize=chunksize):
+            busy += duration
+            yield idx, res
+
+        # Time measurement
+        if self.measure_time and number > 0:
+            elapsed = time() - ts
+            overhead = max(0.0, elapsed * min(self.max_processes, number) - busy) / number
+            Messages._print('Running', number, 'tasks on', self.max_processes, 'processes took:', elapsed,
+                            '(' + str(busy/number*1000.) + ' ms per task, ' + str(overhead*1000.) + ' ms overhead per task)')
+
+    def run(self, method, number:int, chunksize:int=1, **args) -> list:
+        """
+        Executes the method *number* times in the workers and returns the list of results ordered by the id of the tasks.
+
+        The arguments are the same as for ``imap()``.
+        """
+        results = [None] * number
+        for idx, res in self.imap(method, number, chunksize, **args):
+            results[idx] = res
+        return results
+
+    def close(self):
+        "Terminates the worker processes and releases the shared connectivity."
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.release()
+            self._shared = None
+
+# Network of a ParallelPool worker process
+_pool_worker = None
+
+def _pool_initializer(cores, descriptors, reset):
+    """
+    Instantiates the network in a ParallelPool worker.
+    """
+    from ANNarchy.intern.SharedConnectivity import attach_shared_connectivity, detach_shared_connectivity
+
+    global _pool_worker
+
+    core_list = [cores.get()] if cores is not None else []
+
+    net = Network(True)
+    projections = net.get_projections(suppress_error=True)
+    blocks = attach_shared_connectivity(projections, descriptors)
+    Compiler._instantiate(net_id=net.id, import_id=0, core_list=core_list)
+    detach_shared_connectivity(projections, blocks)
+
+    # reset() does not restore the weights, keep the initial ones of all projections
+    # as the tasks may also modify non-plastic weights
+    weights = {}
+    if reset:
+        for proj in projections:
+            if 'w' in proj.attributes:
+                weights[proj.id] = proj.w
+
+    _pool_worker = {'net': net, 'reset': reset, 'weights': weights}
+
+def _pool_run_task(args):
+    """
+    Method called by a ParallelPool worker for each task, returns the id of the task, the result and the duration.
+    """
+    from time import time
+
+    t0 = time()
+    idx, method, method_args, seed = args
+    net = _pool_worker['net']
+
+    if _pool_worker['reset']:
+        net.reset(populations=True, projections=True, monitors=True)
+        for proj in net.get_projections(suppress_error=True):
+            if proj.id in _pool_worker['weights']:
+                proj.w = _pool_worker['weights'][proj.id]
+
+    net.set_seed(seed)
+    res = method(idx, net, *method_args)
+
+    return idx, res, time() - t0
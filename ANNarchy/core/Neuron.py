@@ -3,7 +3,6 @@
 :license: GPLv2, see LICENSE for details.
 """
 
-from ANNarchy.parser.AnalyseNeuron import analyse_neuron
 from ANNarchy.core.PopulationView import PopulationView
 from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern.GlobalObjects import GlobalObjectManager
@@ -71,6 +70,8 @@ class Neuron :
     def _analyse(self):
         # Analyse the neuron type
         if not self.description:
+            # The parser depends on sympy, which is slow to import
+            from ANNarchy.parser.AnalyseNeuron import analyse_neuron
             self.description = analyse_neuron(self)
 
     def __repr__(self):
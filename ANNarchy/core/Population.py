@@ -8,13 +8,14 @@ from ANNarchy.intern.NetworkManager import NetworkManager
 from ANNarchy.intern.Profiler import Profiler
 from ANNarchy.intern.ConfigManagement import get_global_config, _check_paradigm
 from ANNarchy.intern import Messages
+from ANNarchy.intern.AttributeView import AttributeView
 
 from .PopulationView import PopulationView
 from .Random import RandomDistribution
 from .Neuron import Neuron, IndividualNeuron
 
 import numpy as np
-import copy, inspect
+import copy, inspect, weakref
 
 
 class Population :
@@ -92,6 +93,8 @@ class Population :
         "Size of the population."
         self.ranks = np.arange(self.size, dtype="int32")
         "Array of ranks in the population (between 0 and `size - 1`)."
+        # Number of instances simulated by the C++ core (setup(batch_size=...)), known after compilation
+        self._batch_size = 1
 
         # Store the neuron type
         if inspect.isclass(neuron):
@@ -139,6 +142,9 @@ class Population :
         for var in self.neuron_type.description['variables']:
             self.init[var['name']] = var['init']
 
+        # Random distributions used as initial values, drawn again for each instance in batched mode
+        self._init_distributions = {}
+
         # List of targets actually connected
         self.targets = []
         "List of connected targets."
@@ -182,6 +188,15 @@ class Population :
         # Recorded variables
         self._monitor = None
 
+        # Attributes set from Python since the last checkpoint (incremental save)
+        self._modified_attributes = set()
+
+        # Zero-copy views onto the C++ attributes: list of (attribute, weakref to array, writable, validity flag)
+        self._views = []
+
+        # C++ data types of the attributes, filled by _get_attribute_cpp_type()
+        self._attribute_ctypes = {}
+
         # Is overwritten by SpecificPopulations
         self._specific_template = {}
 
@@ -208,7 +223,8 @@ class Population :
             t1 = time.time()
 
         try:
-            self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size, self.max_delay)
+            self._batch_size = get_global_config('batch_size')
+            self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size * self._batch_size, self.max_delay)
         except:
             Messages._error('unable to instantiate the population', self.name)
 
@@ -221,6 +237,13 @@ class Population :
         # Initialize the population
         self.initialized = True
 
+        # Each instance of a batched network starts from its own random values. The dictionary
+        # of initial values can be shared with the population of another network.
+        if self._batch_size > 1 and len(self._init_distributions) > 0:
+            self.init = dict(self.init)
+            for name, dist in self._init_distributions.items():
+                self.init[name] = np.array(dist.get_values(self.size * self._batch_size)).reshape(self._local_shape())
+
         # Transfer the initial values of all attributes
         for name, value in self.init.items():
             if isinstance(value, Constant):
@@ -262,6 +285,7 @@ class Population :
         Warning: should be only called by the net deconstruction ( in context of parallel_run() ).
         """
         if self.initialized:
+            self._invalidate_views()
             self.cyInstance.clear()
             self.initialized = False
 
@@ -359,8 +383,10 @@ class Population :
                 if not self.initialized:
                     if isinstance(value, RandomDistribution): # Make sure it is generated only once
                         self.init[name] = np.array(value.get_values(self.size)).reshape(self.geometry)
+                        self._init_distributions[name] = value
                     else:
                         self.init[name] = value
+                        self._init_distributions.pop(name, None)
                 else:
                     self._set_cython_attribute(name, value)
             else:
@@ -382,7 +408,7 @@ class Population :
                 ctype = self._get_attribute_cpp_type(attribute)
                 if attribute in self.neuron_type.description['local']:
                     data = self.cyInstance.get_local_attribute_all(attribute, ctype)
-                    return data.reshape(self.geometry)
+                    return data.reshape(self._local_shape())
                 else:
                     return self.cyInstance.get_global_attribute(attribute, ctype)
         except Exception as e:
@@ -397,15 +423,16 @@ class Population :
         :param attribute: should be a string representing the variables's name.
         :param value: a value or Numpy array of the right size.
         """
+        self._modified_attributes.add(attribute)
         try:
             ctype = self._get_attribute_cpp_type(attribute)
             if attribute in self.neuron_type.description['local']:
                 if isinstance(value, np.ndarray):
-                    self.cyInstance.set_local_attribute_all(attribute, value.reshape(self.size), ctype)
+                    self.cyInstance.set_local_attribute_all(attribute, self._batched_values(value), ctype)
                 elif isinstance(value, list):
-                    self.cyInstance.set_local_attribute_all(attribute, np.array(value).reshape(self.size), ctype)
+                    self.cyInstance.set_local_attribute_all(attribute, self._batched_values(np.array(value)), ctype)
                 else:
-                    self.cyInstance.set_local_attribute_all(attribute, value * np.ones( self.size ), ctype)
+                    self.cyInstance.set_local_attribute_all(attribute, value * np.ones( self.size * self._batch_size ), ctype)
             else:
                 self.cyInstance.set_global_attribute(attribute, value, ctype)
         except Exception as e:
@@ -413,15 +440,33 @@ class Population :
             err_msg = """Population.set(): either the variable '%(attr)s' does not exist in the population '%(pop)s', or the provided array does not have the right size."""
             Messages._error(err_msg  % { 'attr': attribute, 'pop': self.name } )
 
+    def _local_shape(self):
+        "Shape of the local attributes: the geometry, preceded by the batch dimension if several instances are simulated."
+        if self._batch_size > 1:
+            return (self._batch_size,) + self.geometry
+        return self.geometry
+
+    def _batched_values(self, value):
+        """
+        Returns the flat array of values for all instances. In batched mode, *value* either has the size
+        of the population (the same values are used by all instances) or one value per neuron and instance.
+        """
+        if self._batch_size > 1 and value.size == self.size:
+            return np.tile(value.reshape(self.size), self._batch_size)
+        return value.reshape(self.size * self._batch_size)
+
     def _get_attribute_cpp_type(self, attribute):
         """
-        Determines C++ data type for a given attribute
+        Determines C++ data type for a given attribute. The lookup is done at each access
+        to an attribute (also through PopulationViews), so the result is cached.
         """
-        ctype = None
-        for var in self.neuron_type.description['variables']+self.neuron_type.description['parameters']:
-            if var['name'] == attribute:
-                ctype = var['ctype']
-                break
+        ctype = self._attribute_ctypes.get(attribute)
+        if ctype is None:
+            for var in self.neuron_type.description['variables']+self.neuron_type.description['parameters']:
+                if var['name'] == attribute:
+                    ctype = var['ctype']
+                    self._attribute_ctypes[attribute] = ctype
+                    break
 
         return ctype
 
@@ -453,7 +498,65 @@ class Population :
         """
         return self.__getattr__(name)
 
+    def view(self, name:str, writable:bool=False) -> np.ndarray:
+        """
+        Returns a Numpy array sharing its memory with a local attribute of the C++ core.
+
+        Contrary to ``pop.r`` or ``get()``, which copy the data at each call, the view reflects
+        the current values after each call to ``simulate()``. This is useful in closed-loop
+        experiments where an attribute is read (or written) every few steps:
+
+        ```python
+        r = pop.view('r')
+        for trial in range(1000):
+            ann.simulate(10.0)
+            action = np.argmax(r)
+        ```
+
+        The view is read-only by default. Writing into a writable view changes the values used by the
+        next simulation step, without any check of the bounds declared in the neuron model.
+
+        The view becomes invalid when the C++ data is deallocated (e.g. when the network is cleared):
+        any further access to its values raises an error and ``view()`` has to be called again.
+
+        Only available for local attributes with the openMP paradigm, boolean attributes are not supported.
+
+        :param name: name of the local parameter or variable.
+        :param writable: if the view can be modified (default: False).
+        """
+        if not self.initialized:
+            Messages._error('Population.view(): the network is not compiled yet.')
+
+        if name not in self.neuron_type.description['local']:
+            Messages._error('Population.view():', name, 'is not a local attribute of the population', self.name)
+
+        ctype = self._get_attribute_cpp_type(name)
+        try:
+            data = self.cyInstance.get_local_attribute_view(name, ctype)
+        except Exception as e:
+            Messages._debug(e)
+            data = None
+
+        if data is None:
+            Messages._error('Population.view(): no view can be created for the attribute', name, '(' + ctype + ') with the paradigm', get_global_config('paradigm'))
+
+        valid = [True]
+        data = AttributeView(data.reshape(self._local_shape()), writable, valid)
+        if writable:
+            self._modified_attributes.add(name)
+        self._views.append((name, weakref.ref(data), writable, valid))
+
+        return data
 
+    def _writable_view_attributes(self):
+        "Names of the attributes which can be modified through a writable view."
+        return set([name for name, ref, writable, _ in self._views if writable and ref() is not None])
+
+    def _invalidate_views(self):
+        "Called before the C++ data is deallocated, the existing views (and the arrays derived from them) become unusable."
+        for _, _, _, valid in self._views:
+            AttributeView.invalidate(valid)
+        self._views = []
 
     ################################
     ## Access to functions
@@ -496,12 +599,15 @@ class Population :
         # Check if a projection has this type
         if not target in self.targets:
             Messages._warning('sum(): the population', self.name, 'receives no projection with the target', target)
-            return np.zeros(self.geometry)
+            return np.zeros(self._local_shape())
         # Spiking neurons already have conductances available
         if self.neuron_type.type == 'spike':
             return getattr(self, 'g_'+target)
         # Otherwise, call the Cython method
-        return self.cyInstance.get_local_attribute_all("_sum_"+target, get_global_config('precision'))
+        sums = self.cyInstance.get_local_attribute_all("_sum_"+target, get_global_config('precision'))
+        if self._batch_size > 1:
+            return sums.reshape((self._batch_size, self.size))
+        return sums
 
     ################################
     ## Refractory period
@@ -531,11 +637,11 @@ class Population :
 
             if self.initialized:
                 if isinstance(value, RandomDistribution):
-                    refs = (value.get_values(self.size)/get_global_config('dt')).astype(int)
+                    refs = (value.get_values(self.size * self._batch_size)/get_global_config('dt')).astype(int)
                 elif isinstance(value, np.ndarray):
-                    refs = (value / get_global_config('dt')).astype(int).reshape(self.size)
+                    refs = self._batched_values((value / get_global_config('dt')).astype(int))
                 else:
-                    refs = (value/ get_global_config('dt')*np.ones(self.size)).astype(int)
+                    refs = (value/ get_global_config('dt')*np.ones(self.size * self._batch_size)).astype(int)
                 # TODO cast into int
                 self.cyInstance.set_refractory(refs)
             else: # not initialized yet, saving for later
@@ -783,23 +889,30 @@ class Population :
     ################################
     ## Save/load methods
     ################################
-    def _data(self):
-        "Returns a dictionary containing all information about the population. Used for saving."
+    def _data(self, attributes=None):
+        """
+        Returns a dictionary containing all information about the population. Used for saving.
+
+        :param attributes: list of attributes to save (default: all).
+        """
+        if attributes is None:
+            attributes = self.attributes
+
         desc = {}
         desc['name'] = self.name
         desc['geometry'] = self.geometry
         desc['size'] = self.size
         # Attributes
-        desc['attributes'] = self.attributes
+        desc['attributes'] = attributes
         desc['parameters'] = self.parameters
         desc['variables'] = self.variables
         # Save all attributes
-        for var in self.attributes:
+        for var in attributes:
             try:
                 ctype = self._get_attribute_cpp_type(var)
                 if var in self.neuron_type.description['local']:
                     data = self.cyInstance.get_local_attribute_all(var, ctype)
-                    desc[var] = data.reshape(self.geometry)
+                    desc[var] = data.reshape(self._local_shape())
                 else:
                     desc[var] = self.cyInstance.get_global_attribute(var, ctype)
 
@@ -808,6 +921,27 @@ class Population :
 
         return desc
 
+    def _checkpoint_data(self, time_advanced):
+        """
+        Returns the data modified since the last checkpoint, or None if nothing changed. The variables
+        are modified by the simulation, the parameters only by set().
+
+        :param time_advanced: True if the network was simulated since the last checkpoint.
+        """
+        modified = set(self._modified_attributes) | self._writable_view_attributes()
+        if time_advanced:
+            modified |= set(self.variables)
+
+        attributes = [var for var in self.attributes if var in modified]
+        if len(attributes) == 0:
+            return None
+
+        return self._data(attributes)
+
+    def _mark_checkpoint(self):
+        "Called after a checkpoint was saved or loaded."
+        self._modified_attributes = set()
+
     def save(self, filename:str) -> None:
         """
         Saves all information about the population (structure, current value of parameters and variables) into a file.
@@ -816,6 +950,8 @@ class Population :
 
         * If the file name ends with '.gz', the data will be pickled into a binary file and compressed using gzip.
 
+        * If the file name ends with a path separator, each array is stored as a raw binary file in this directory, described by a JSON manifest. The files are memory-mapped when loading.
+
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
@@ -139,9 +139,12 @@ class PopulationView :
         if name == 'population':
             return object.__getattribute__(self, name)
         elif name == 'spike':
-            all_events = set(self.population.spike)
-            own_ranks = set(self.ranks)
-            return list(sorted(set.intersection(all_events, own_ranks)))
+            spikes = np.array(self.population.spike, dtype=int)
+            if self.population._batch_size > 1:
+                # One list of ranks per instance, as for get()
+                instances, ranks = np.divmod(spikes, self.population.size)
+                return [np.intersect1d(ranks[instances == b], self.ranks).tolist() for b in range(self.population._batch_size)]
+            return np.intersect1d(spikes, self.ranks).tolist()
         elif hasattr(self.population, 'attributes'):
             if name in self.population.attributes:
                 return self.get(name)
@@ -169,6 +172,14 @@ class PopulationView :
         :param name: name of the parameter/variable.
         """
         if name in self.population.attributes:
+            # Only the values of the selected neurons are copied by the C++ core
+            if self._subset_access(name):
+                ctype = self.population._get_attribute_cpp_type(name)
+                values = self.population.cyInstance.get_local_attribute_subset(name, self._cpp_ranks(), ctype)
+                if self.population._batch_size > 1:
+                    return values.reshape((self.population._batch_size, self.size))
+                return values
+
             all_val = getattr(self.population, name).reshape(self.population.size)
             return all_val[self.ranks]
         else:
@@ -209,6 +220,14 @@ class PopulationView :
             else:
                 ctype = self.population._get_attribute_cpp_type(name)
                 self.population.cyInstance.set_local_attribute(name, rank, value, ctype)
+                self.population._modified_attributes.add(name)
+
+        def _set_subset(name, values):
+            # The same values are used by all instances of a batched network
+            ctype = self.population._get_attribute_cpp_type(name)
+            values = np.tile(values, self.population._batch_size)
+            self.population.cyInstance.set_local_attribute_subset(name, self._cpp_ranks(), values, ctype)
+            self.population._modified_attributes.add(name)
 
         for val_key in value.keys():
             if hasattr(self.population, val_key):
@@ -223,8 +242,11 @@ class PopulationView :
                         Messages._error("Global attributes can only have one value in a population.")
                         return None
                     # Assign the value
-                    for idx, rk in enumerate(self.ranks):
-                        _set_single(val_key, rk, value[val_key][idx])
+                    if self._subset_access(val_key):
+                        _set_subset(val_key, value[val_key])
+                    else:
+                        for idx, rk in enumerate(self.ranks):
+                            _set_single(val_key, rk, value[val_key][idx])
 
                 elif isinstance(value[val_key], list): # list
                     if len(value[val_key]) != self.size:
@@ -234,16 +256,35 @@ class PopulationView :
                         Messages._error("Global attributes can only have one value in a population.")
                         return None
                     # Assign the value
-                    for idx, rk in enumerate(self.ranks):
-                        _set_single(val_key, rk, value[val_key][idx])
+                    if self._subset_access(val_key):
+                        _set_subset(val_key, np.array(value[val_key]))
+                    else:
+                        for idx, rk in enumerate(self.ranks):
+                            _set_single(val_key, rk, value[val_key][idx])
 
                 else: # single value
-                    for rk in self.ranks:
-                        _set_single(val_key, rk, value[val_key])
+                    if self._subset_access(val_key):
+                        _set_subset(val_key, np.full(self.size, value[val_key]))
+                    else:
+                        for rk in self.ranks:
+                            _set_single(val_key, rk, value[val_key])
             else:
                 Messages._error("the population has no attribute called ", val_key)
                 return None
 
+    def _subset_access(self, name):
+        "Checks if the values of a local attribute can be gathered/scattered by the C++ core."
+        return self.population.initialized and \
+            name in self.population.neuron_type.description['local'] and \
+            hasattr(self.population.cyInstance, 'get_local_attribute_subset')
+
+    def _cpp_ranks(self):
+        "Indices of the selected neurons in the C++ arrays (one block of ranks per instance in batched networks)."
+        batch_size = self.population._batch_size
+        if batch_size == 1:
+            return self.ranks
+        return (np.arange(batch_size)[:, None] * self.population.size + self.ranks).flatten()
+
     ################################
     ## Access to weighted sums
     ################################
@@ -263,7 +304,10 @@ class PopulationView :
 
         **Note:** it is not possible to distinguish the original population when the same target is used.
         """
-        return self.population.sum(target)[self.ranks]
+        sums = self.population.sum(target)
+        if self.population._batch_size > 1:
+            return sums.reshape((self.population._batch_size, self.population.size))[:, self.ranks]
+        return sums.reshape(self.population.size)[self.ranks]
 
     ################################
     ## Composition
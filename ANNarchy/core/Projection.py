@@ -7,10 +7,12 @@ import numpy as np
 import math, os
 import copy, inspect
 import pickle
+import weakref
 
 from ANNarchy.core import Global
 from ANNarchy.intern.NetworkManager import NetworkManager
 from ANNarchy.intern import Messages
+from ANNarchy.intern.AttributeView import AttributeView
 from ANNarchy.core.Random import RandomDistribution
 from ANNarchy.core.Population import Population
 from ANNarchy.core.Neuron import IndividualNeuron
@@ -169,6 +171,7 @@ class Projection :
         self._connection_delay = None
         self._connector = None
         self._lil_connectivity = None
+        self._shared_connectivity = None # set by parallel_run() in the worker processes
 
         # Default configuration for connectivity
         self._storage_format = "lil"
@@ -193,6 +196,17 @@ class Projection :
         # data, e. g. in case of weight-sharing projections
         self._saveable = True
 
+        # Changes since the last checkpoint (incremental save)
+        self._modified_attributes = set()
+        self._connectivity_modified = False
+        self._updated_since_checkpoint = set()
+
+        # Zero-copy views onto the C++ attributes: list of (attribute, weakref to array, writable, validity flag)
+        self._views = []
+
+        # C++ data types of the attributes, filled by _get_attribute_cpp_type()
+        self._attribute_ctypes = {}
+
         # To allow case-specific adjustment of parallelization
         # parameters, e. g. openMP schedule, we introduce a
         # dictionary read by the ProjectionGenerator.
@@ -330,6 +344,7 @@ class Projection :
         """
         # Local import to prevent circular import (HD: 28th June 2021)
         from ANNarchy.generator.Utils import cpp_connector_available
+        from ANNarchy.cython_ext import CSRConnectivity
 
         # Sanity check
         if not self._connection_method:
@@ -346,11 +361,22 @@ class Projection :
 
         # Check if there is a specialized CPP connector
         if not cpp_connector_available(self.connector_name, self._storage_format, self._storage_order):
-            # No default connector -> initialize from LIL
-            if self._lil_connectivity:
-                return self.cyInstance.init_from_lil_connectivity(self._lil_connectivity)
+            # No default connector -> initialize from LIL or CSR
+            if self._shared_connectivity is not None:
+                # Built by the parent process (parallel_run)
+                synapses = self._shared_connectivity
+            elif self._lil_connectivity:
+                synapses = self._lil_connectivity
             else:
-                return self.cyInstance.init_from_lil_connectivity(self._connection_method(*((self.pre, self.post,) + self._connection_args)))
+                synapses = self._connection_method(*((self.pre, self.post,) + self._connection_args))
+
+            # The flat arrays are passed directly if the wrapper supports it
+            if isinstance(synapses, CSRConnectivity):
+                if hasattr(self.cyInstance, 'init_from_csr_connectivity'):
+                    return self.cyInstance.init_from_csr_connectivity(synapses)
+                synapses = synapses.to_lil()
+
+            return self.cyInstance.init_from_lil_connectivity(synapses)
 
         else:
             if get_global_config('verbose'):
@@ -606,6 +632,7 @@ class Projection :
             attributes = self.attributes
 
         if synapses:
+            self._connectivity_modified = True
             # destroy the previous C++ content
             self._clear()
             # call the init connectivity again
@@ -773,6 +800,78 @@ class Projection :
         for name, val in value.items():
             self.__setattr__(name, val)
 
+    def view(self, name:str, writable:bool=False) -> list[np.ndarray] | np.ndarray:
+        """
+        Returns Numpy arrays sharing their memory with a local or semiglobal attribute of the C++ core.
+
+        Contrary to ``proj.w`` or ``get()``, which copy the data at each call, the views reflect the
+        current values after each call to ``simulate()``. For a local attribute, a list with one array
+        per dendrite (in the order of ``post_ranks``) is returned, for a semiglobal attribute a single
+        array:
+
+        ```python
+        w = proj.view('w')
+        ann.simulate(1000.0)
+        print(w[0].mean())
+        ```
+
+        The views are read-only by default. Writing into a writable view changes the values used by the
+        next simulation step.
+
+        The views become invalid when the C++ side reallocates the data: when the connectivity changes
+        (``reset(synapses=True)``, ``load()``, creation or pruning of synapses) or after each call to
+        ``simulate()`` when structural plasticity is enabled. Any further access to the values of an
+        invalidated array raises an error and ``view()`` has to be called again.
+
+        Only available for projections using the LIL format with the openMP paradigm (not partitioned
+        between threads), boolean attributes are not supported.
+
+        :param name: name of the local or semiglobal parameter or variable.
+        :param writable: if the views can be modified (default: False).
+        """
+        if not self.initialized:
+            Messages._error('Projection.view(): the network is not compiled yet.')
+
+        ctype = self._get_attribute_cpp_type(name)
+        try:
+            if name == "w" and self._has_single_weight():
+                data = None
+            elif name in self.synapse_type.description['local']:
+                data = self.cyInstance.get_local_attribute_view(name, ctype)
+            elif name in self.synapse_type.description['semiglobal']:
+                data = self.cyInstance.get_semiglobal_attribute_view(name, ctype)
+            else:
+                Messages._error('Projection.view():', name, 'is not a local or semiglobal attribute of the projection', self.name)
+        except AttributeError as e:
+            Messages._debug(e)
+            data = None
+
+        if data is None:
+            Messages._error('Projection.view(): no view can be created for the attribute', name, 'of the projection', self.name, '(storage format ' + self._storage_format + ').')
+
+        if writable:
+            self._modified_attributes.add(name)
+        valid = [True]
+        if isinstance(data, list):
+            data = [AttributeView(arr, writable, valid) for arr in data]
+            for arr in data:
+                self._views.append((name, weakref.ref(arr), writable, valid))
+        else:
+            data = AttributeView(data, writable, valid)
+            self._views.append((name, weakref.ref(data), writable, valid))
+
+        return data
+
+    def _writable_view_attributes(self):
+        "Names of the attributes which can be modified through a writable view."
+        return set([name for name, ref, writable, _ in self._views if writable and ref() is not None])
+
+    def _invalidate_views(self):
+        "Called when the C++ side reallocates the data, the existing views (and the arrays derived from them) become unusable."
+        for _, _, _, valid in self._views:
+            AttributeView.invalidate(valid)
+        self._views = []
+
     def __getattr__(self, name):
         # Method called when accessing an attribute.
         if name == 'initialized' or not hasattr(self, 'initialized'): # Before the end of the constructor
@@ -844,6 +943,8 @@ class Projection :
         :param value: the value it should take.
 
         """
+        self._modified_attributes.add(attribute)
+
         # Determine C++ data type
         ctype = self._get_attribute_cpp_type(attribute=attribute)
 
@@ -895,12 +996,15 @@ class Projection :
 
     def _get_attribute_cpp_type(self, attribute):
         """
-        Determine C++ data type for a given attribute
+        Determine C++ data type for a given attribute. The lookup is done at each access
+        to an attribute (also through dendrites and synapses), so the result is cached.
         """
-        ctype = None
-        for var in self.synapse_type.description['variables']+self.synapse_type.description['parameters']:
-            if var['name'] == attribute:
-                ctype = var['ctype']
+        ctype = self._attribute_ctypes.get(attribute)
+        if ctype is None:
+            for var in self.synapse_type.description['variables']+self.synapse_type.description['parameters']:
+                if var['name'] == attribute:
+                    ctype = var['ctype']
+                    self._attribute_ctypes[attribute] = ctype
 
         return ctype
 
@@ -915,6 +1019,7 @@ class Projection :
         "control flow flags such as learning, transmission"
         if self.cyInstance is not None:
             getattr(self.cyInstance, '_set_'+attribute)(value)
+            self._updated_since_checkpoint |= self._updated_variables()
         else:
             self.init[attribute] = value
 
@@ -934,6 +1039,7 @@ class Projection :
     def _set_delay(self, value):
 
         if self.cyInstance: # After compile()
+            self._modified_attributes.add('delays')
             if not hasattr(self.cyInstance, 'get_delay'):
                 if self.max_delay <= 1 and value != get_global_config('dt'):
                     Messages._error("set_delay: the projection was instantiated without delays, it is too late to create them...")
@@ -976,8 +1082,8 @@ class Projection :
                 if len(value) != len(self.post_ranks):
                     Messages._error("set_delay with variable delays: the sizes do not match. You have to provide one value for each existing synapse.")
 
-                # Convert to steps
-                if isinstance(value, np.ndarray):
+                # Convert to steps (ragged arrays are handled as list of rows)
+                if isinstance(value, np.ndarray) and value.ndim == 2:
                     delays = [[max(1, round(value[i, j]/get_global_config('dt'))) for j in range(value.shape[1])] for i in range(value.shape[0])]
                 else:
                     delays = [[max(1, round(v/get_global_config('dt'))) for v in c] for c in value]
@@ -1058,6 +1164,7 @@ class Projection :
                 self.cyInstance._set_update_offset(int(int(relative_offset%period)/get_global_config('dt')))
             else:
                 self.cyInstance._set_update_offset(int(0))
+            self._updated_since_checkpoint |= self._updated_variables()
         except:
             Messages._warning('Enable_learning() is only possible after compile()')
 
@@ -1195,16 +1302,13 @@ class Projection :
             x_size = int( math.floor(math.sqrt(self.post.size)) )
             y_size = int( math.ceil(math.sqrt(self.post.size)) )
 
+        # Dense (post, pre) matrix, restricted to the pre-synaptic neurons of the projection
+        matrix = self._dense_matrix(variable, 0.0)
+        if isinstance(self.pre, PopulationView):
+            matrix = matrix[:, self.pre.ranks]
 
-        def get_rf(rank): # TODO: IMPROVE
-            res = np.zeros( self.pre.size )
-            for n in range(len(self.post_ranks)):
-                if self.post_ranks[n] == n:
-                    pre_ranks = self.cyInstance.pre_rank(n)
-                    data = self.cyInstance.get_local_attribute_row(variable, rank, get_global_config('precision'))
-                    for j in range(len(pre_ranks)):
-                        res[pre_ranks[j]] = data[j]
-            return res.reshape(self.pre.geometry)
+        def get_rf(rank):
+            return matrix[rank].reshape(self.pre.geometry)
 
         res = np.zeros((1, x_size*self.pre.geometry[1]))
         for y in range ( y_size ):
@@ -1226,46 +1330,119 @@ class Projection :
         if not self.initialized:
             Messages._error('The connectivity matrix can only be accessed after compilation')
 
-        # get correct dimensions for dense matrix
-        if isinstance(self.pre, PopulationView):
-            size_pre = self.pre.population.size
-        else:
-            size_pre = self.pre.size
-        if isinstance(self.post, PopulationView):
-            size_post = self.post.population.size
-        else:
-            size_post = self.post.size
+        return self._dense_matrix("w", fill)
 
-        # create empty dense matrix with default values
-        res = np.ones((size_post, size_pre)) * fill
+    def sparse_matrix(self, variable:str='w', raw:bool=False):
+        """
+        Returns a synaptic attribute as a sparse matrix in CSR format (``scipy.sparse.csr_matrix``).
 
-        # fill row-by-row with real values
-        for rank in self.post_ranks:
-            # row-rank
-            if self._storage_format == "dense":
-                idx = rank
-            else:
-                idx =  self.post_ranks.index(rank)
-            # pre-ranks
-            preranks = self.cyInstance.pre_rank(idx)
-            # get the values
-            if "w" in self.synapse_type.description['local'] and (not self._has_single_weight()):
-                w = self.cyInstance.get_local_attribute_row("w", idx, get_global_config('precision'))
-            elif "w" in self.synapse_type.description['semiglobal']:
-                w = self.cyInstance.get_semiglobal_attribute("w", idx, get_global_config('precision'))*np.ones(self.cyInstance.dendrite_size(idx))
-            else:
-                w = self.cyInstance.get_global_attribute("w", get_global_config('precision'))*np.ones(self.cyInstance.dendrite_size(idx))
-            res[rank, preranks] = w
+        The rows of the matrix represent the post-synaptic neurons, the columns the pre-synaptic ones.
+        If PopulationViews were used for creating the projection, the matrix is expanded to the whole
+        populations. Semiglobal and global attributes are repeated for each synapse.
+
+        ```python
+        W = proj.sparse_matrix('w')
+        print(W.sum(axis=1)) # sum of the weights received by each post-synaptic neuron
+        ```
+
+        Contrary to ``connectivity_matrix()``, the data is copied by the C++ core into preallocated arrays
+        in a single pass, the dense matrix is never built.
+
+        :param variable: name of the synaptic parameter or variable (default: 'w').
+        :param raw: if True, the arrays ``(indptr, indices, data)`` are returned instead of a ``csr_matrix``.
+        """
+        if not self.initialized:
+            Messages._error('Projection.sparse_matrix(): the network is not compiled yet.')
+
+        indptr, indices, data = self._export_csr(variable)
+        if raw:
+            return indptr, indices, data
+
+        from scipy.sparse import csr_matrix
+        return csr_matrix((data, indices, indptr), shape=(len(indptr)-1, self._population_sizes()[1]))
+
+    def _population_sizes(self):
+        "Sizes of the post- and pre-synaptic populations, PopulationViews are expanded to the whole population."
+        size_post = self.post.population.size if isinstance(self.post, PopulationView) else self.post.size
+        size_pre = self.pre.population.size if isinstance(self.pre, PopulationView) else self.pre.size
+        return size_post, size_pre
+
+    def _dense_matrix(self, variable, fill):
+        "Dense (post, pre) matrix of the given attribute, filled with *fill* where there is no synapse."
+        size_post, size_pre = self._population_sizes()
+        indptr, indices, data = self._export_csr(variable)
+
+        res = np.full((size_post, size_pre), fill, dtype=float)
+        res[np.repeat(np.arange(size_post), np.diff(indptr)), indices] = data
         return res
 
+    def _export_csr(self, variable):
+        """
+        Returns the arrays (indptr, indices, data) of the given attribute in CSR format, with one row per
+        neuron of the post-synaptic population.
+
+        The C++ core exports the connectivity and the local attributes in one pass (see
+        export_csr_connectivity() in the sparse matrix classes). The other configurations (CUDA,
+        specific projections) fall back to the accessors returning lists of lists.
+        """
+        if not variable in self.attributes:
+            Messages._error('Projection.sparse_matrix():', variable, 'is not an attribute of the projection', self.name)
+
+        # Connectivity, one row per dendrite
+        post_ranks = np.array(self.cyInstance.post_rank(), dtype=np.intc)
+        if hasattr(self.cyInstance, 'export_csr_connectivity'):
+            row_ptr, pre_ranks = self.cyInstance.export_csr_connectivity()
+        else:
+            rows = self.cyInstance.pre_rank_all()
+            row_ptr = np.zeros(len(rows)+1, dtype=np.longlong)
+            np.cumsum([len(row) for row in rows], out=row_ptr[1:])
+            pre_ranks = np.concatenate(rows).astype(np.intc) if row_ptr[-1] > 0 else np.zeros(0, dtype=np.intc)
+        row_lengths = np.diff(row_ptr)
+        nb_synapses = int(row_ptr[-1])
+
+        # Values in the order of pre_ranks
+        ctype = self._get_attribute_cpp_type(attribute=variable)
+        if variable == "w" and self._has_single_weight() or variable in self.synapse_type.description['global']:
+            data = np.full(nb_synapses, self.cyInstance.get_global_attribute(variable, ctype))
+        elif variable in self.synapse_type.description['semiglobal']:
+            data = np.repeat(np.array(self.cyInstance.get_semiglobal_attribute_all(variable, ctype)), row_lengths)
+        else:
+            data = None
+            if hasattr(self.cyInstance, 'export_local_attribute_csr'):
+                data = self.cyInstance.export_local_attribute_csr(variable, ctype)
+            if data is None:
+                rows = self.cyInstance.get_local_attribute_all(variable, ctype)
+                data = np.concatenate(rows) if nb_synapses > 0 else np.zeros(0)
+
+        # Rows of the whole post-synaptic population, the dendrites are not necessarily sorted
+        if np.any(post_ranks[1:] <= post_ranks[:-1]):
+            order = np.argsort(post_ranks, kind='stable')
+            lengths = row_lengths[order]
+            offsets = np.zeros(len(order), dtype=np.longlong)
+            np.cumsum(lengths[:-1], out=offsets[1:])
+            idx = np.arange(nb_synapses) + np.repeat(row_ptr[:-1][order] - offsets, lengths)
+            pre_ranks, data = pre_ranks[idx], data[idx]
+            post_ranks, row_lengths = post_ranks[order], lengths
+
+        size_post, _ = self._population_sizes()
+        counts = np.zeros(size_post, dtype=np.longlong)
+        counts[post_ranks] = row_lengths
+        indptr = np.zeros(size_post+1, dtype=np.longlong)
+        np.cumsum(counts, out=indptr[1:])
+
+        return indptr, pre_ranks, data
 
     ################################
     ## Save/load methods
     ################################
 
-    def _data(self):
-        "Method gathering all info about the projection when calling save()"
+    def _data(self, attributes=None):
+        """
+        Method gathering all info about the projection when calling save()
 
+        :param attributes: list of attributes to save (default: all). The connectivity (ranks and delays)
+            is only saved with all attributes, 'delays' can be added to the list.
+        """
         if not self.initialized:
             Messages._error('save_connectivity(): the network has not been compiled yet.')
 
@@ -1274,11 +1451,8 @@ class Projection :
         desc['pre'] = self.pre.name
         desc['post'] = self.post.name
         desc['target'] = self.target
-        desc['post_ranks'] = self.post_ranks
-        desc['attributes'] = self.attributes
         desc['parameters'] = self.parameters
         desc['variables'] = self.variables
-        desc['delays'] = self._get_delay()
 
         # Determine if we have varying number of elements per row
         # based on the pre-synaptic ranks
@@ -1290,16 +1464,27 @@ class Projection :
                 ragged_list = True
                 break
 
-        # Save pre_ranks
-        if ragged_list:
-            desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all(), dtype=object)
-        else:
-            desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all())
+        if attributes is None:
+            desc['post_ranks'] = self.post_ranks
+            desc['attributes'] = self.attributes
+            desc['delays'] = self._get_delay()
 
-        # Attributes to save
-        attributes = self.attributes
-        if not 'w' in self.attributes:
-            attributes.append('w')
+            # Save pre_ranks
+            if ragged_list:
+                desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all(), dtype=object)
+            else:
+                desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all())
+
+            # Attributes to save
+            attributes = self.attributes
+            if not 'w' in self.attributes:
+                attributes.append('w')
+
+        else:
+            if 'delays' in attributes:
+                desc['delays'] = self._get_delay()
+            attributes = [var for var in attributes if var != 'delays']
+            desc['attributes'] = attributes
 
         # Save all attributes
         for var in attributes:
@@ -1330,6 +1515,8 @@ class Projection :
 
         * If the file name ends with '.gz', the data will be pickled into a binary file and compressed using gzip.
 
+        * If the file name ends with a path separator, each array is stored as a raw binary file in this directory, described by a JSON manifest. The files are memory-mapped when loading.
+
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
@@ -1396,7 +1583,7 @@ class Projection :
         # Check row-sorting
         last_pr = -1
         requires_sorting = False
-        for pr in desc['post_ranks']:
+        for pr in desc.get('post_ranks', []):
             if pr < last_pr:
                 if requires_sorting == False:
                     requires_sorting = True
@@ -1420,12 +1607,17 @@ class Projection :
             elif desc['pre_ranks'].shape != current_pre_ranks.shape:
                 connectivity_changed = True
 
-            # compare two ragged arrays
+            # compare two ragged arrays row by row (the rows can be lists or arrays)
+            elif desc['pre_ranks'].dtype == np.dtype('O') and desc['pre_ranks'].ndim == 1:
+                if not all(np.array_equal(saved, current) for saved, current in zip(desc['pre_ranks'], current_pre_ranks)):
+                    connectivity_changed = True
+
+            # compare two matrices
             elif not np.all((desc['pre_ranks']) == current_pre_ranks):
                 connectivity_changed = True
 
-        # synaptic weights
-        weights = desc["w"]
+        # synaptic weights (not contained in incremental checkpoints if unchanged)
+        weights = desc["w"] if "w" in desc else None
 
         # Delays can be either uniform (int, float) or non-uniform (np.ndarray).
         # HD (30th May 2022):
@@ -1457,17 +1649,25 @@ class Projection :
             # Some patterns like fixed_number_pre/post or fixed_probability change the
             # connectivity. If this is not the case, we can simply set the values.
             if connectivity_changed:
+                self._invalidate_views()
                 # (re-)initialize connectivity
-                if isinstance(delays, (float, int)):
-                    delays = [[delays]] # wrapper expects list from list
+                if '_flat' in desc and 'pre_ranks' in desc['_flat'] and hasattr(self.cyInstance, 'init_from_csr_connectivity'):
+                    # Directory format (see IO._load_directory()): the memory-mapped flat arrays
+                    # are handed over as CSR, the list of rows is never created.
+                    self.cyInstance.init_from_csr_connectivity(self._csr_from_flat(desc, weights, delays))
+                else:
+                    if isinstance(delays, (float, int)):
+                        delays = [[delays]] # wrapper expects list from list
 
-                self.cyInstance.init_from_lil(desc['post_ranks'], desc['pre_ranks'], weights, delays, requires_sorting)
+                    self.cyInstance.init_from_lil(desc['post_ranks'], desc['pre_ranks'], weights, delays, requires_sorting)
             else:
                 # set weights
-                self._set_cython_attribute("w", weights)
+                if "w" in desc:
+                    self._set_cython_attribute("w", weights)
 
                 # set delays if there were some
-                self._set_delay(delays)
+                if "delays" in desc:
+                    self._set_delay(delays)
 
             # Other variables
             for var in desc['attributes']:
@@ -1491,6 +1691,7 @@ class Projection :
             Messages._warning("This might require some time to adapt the data structure ...")
 
             # (re-)initialize connectivity
+            self._invalidate_views()
             if isinstance(delays, (float, int)):
                 delays = [[delays] for _ in range(len(desc['post_ranks']))] # wrapper expects list from list
 
@@ -1503,6 +1704,64 @@ class Projection :
                 for lil_idx, post_rank in enumerate(desc['post_ranks']):
                     self.dendrite(post_rank).__setattr__(var, desc[var][lil_idx])
 
+    def _updated_variables(self):
+        "Variables currently modified by the simulation, depending on the learning flags."
+        try:
+            if not self.cyInstance._get_update():
+                return set()
+            if self.synapse_type.type == 'spike' and not self.cyInstance._get_plasticity():
+                return set(self.variables) - {'w'}
+        except AttributeError: # specific projections without learning flags
+            pass
+        return set(self.variables)
+
+    def _checkpoint_data(self, time_advanced):
+        """
+        Returns the data modified since the last checkpoint, or None if nothing changed. The variables
+        are modified by the simulation when learning is enabled, the parameters only by set(). The
+        connectivity is saved completely if it could have changed (structural plasticity, reset()).
+
+        :param time_advanced: True if the network was simulated since the last checkpoint.
+        """
+        if self._connectivity_modified or (time_advanced and get_global_config('structural_plasticity')):
+            return self._data()
+
+        modified = set(self._modified_attributes) | self._writable_view_attributes()
+        if time_advanced:
+            modified |= self._updated_since_checkpoint
+
+        attributes = [var for var in self.attributes + ['delays'] if var in modified]
+        if len(attributes) == 0:
+            return None
+
+        return self._data(attributes)
+
+    def _mark_checkpoint(self):
+        "Called after a checkpoint was saved or loaded."
+        self._modified_attributes = set()
+        self._connectivity_modified = False
+        self._updated_since_checkpoint = self._updated_variables()
+
+    def _csr_from_flat(self, desc, weights, delays):
+        """
+        Builds a CSRConnectivity from the flat arrays of a file saved in the directory format.
+        """
+        from ANNarchy.cython_ext import CSRConnectivity
+
+        row_ptr, pre_ranks = desc['_flat']['pre_ranks']
+
+        if 'w' in desc['_flat']:
+            weights = desc['_flat']['w'][1]
+        elif isinstance(weights, np.ndarray) and weights.ndim > 1: # all rows have the same size
+            weights = weights.reshape(-1)
+
+        if 'delays' in desc['_flat']:
+            delays = desc['_flat']['delays'][1]
+        elif isinstance(delays, np.ndarray) and delays.ndim > 1:
+            delays = delays.reshape(-1)
+
+        return CSRConnectivity(desc['post_ranks'], row_ptr, pre_ranks, weights, delays)
+
     ################################
     ## Structural plasticity
     ################################
@@ -1625,5 +1884,6 @@ class Projection :
         Warning: should be only called by the net deconstructor (in the context of parallel_run).
         """
         if self.initialized:
+            self._invalidate_views()
             self.cyInstance.clear()
             self.initialized = False
@@ -8,6 +8,7 @@ from ANNarchy.core import Global
 from ANNarchy.core.Population import Population
 
 from ANNarchy.intern.Profiler import Profiler
+from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern import Messages
 
 
@@ -58,6 +59,8 @@ def simulate(
     else:
         NetworkManager().cy_instance(net_id=net_id).pyx_run(nb_steps, progress_bar)
 
+    _invalidate_views(net_id)
+
     if measure_time:
         if net_id > 0:
             Messages._print('Simulating', duration/1000.0, 'seconds of the network', net_id, 'took', time.time() - tstart, 'seconds.')
@@ -120,6 +123,7 @@ def simulate_until(max_duration:float, population: Population | list[Population]
         tstart = time.time()
 
     nb = NetworkManager().cy_instance(net_id).pyx_run_until(nb_steps, [pop.id for pop in population], True if operator=='and' else False)
+    _invalidate_views(net_id)
 
     sim_time = float(nb) / Global.dt()
     if measure_time:
@@ -135,6 +139,18 @@ def step(net_id=0):
         Messages._error('simulate_until(): the network is not compiled yet.')
 
     NetworkManager().cy_instance(net_id).pyx_step()
+    _invalidate_views(net_id)
+
+def _invalidate_views(net_id):
+    """
+    Structural plasticity can reallocate the attributes of the projections during the simulation,
+    the zero-copy views (Projection.view()) are therefore invalidated after each call.
+    """
+    if not get_global_config('structural_plasticity'):
+        return
+
+    for proj in NetworkManager().get_projections(net_id=net_id):
+        proj._invalidate_views()
 
 
 ################################
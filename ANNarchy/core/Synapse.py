@@ -6,7 +6,6 @@
 from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern.GlobalObjects import GlobalObjectManager
 from ANNarchy.intern import Messages
-from ANNarchy.parser.AnalyseSynapse import analyse_synapse
 
 class Synapse :
     """
@@ -98,6 +97,8 @@ class Synapse :
     def _analyse(self):
         # Analyse the synapse type
         if not self.description:
+            # The parser depends on sympy, which is slow to import
+            from ANNarchy.parser.AnalyseSynapse import analyse_synapse
             self.description = analyse_synapse(self)
 
     def __add__(self, synapse):
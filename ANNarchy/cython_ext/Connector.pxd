@@ -25,6 +25,7 @@ cdef class LILConnectivity:
     # Insert methods
     cpdef add(self, int rk, r, w, d)
     cpdef push_back(self, int rk, vector[int] r, vector[double] w, vector[double] d)
+    cpdef add_csr(self, post_ranks, indptr, indices, weights, delays)
 
     # Access methods
     cpdef int get_max_delay(self)
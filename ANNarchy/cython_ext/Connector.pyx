@@ -2,6 +2,9 @@
 
 from libcpp.vector cimport vector
 from libcpp cimport bool
+from libcpp.algorithm cimport sort as std_sort
+from libc.stdint cimport uint64_t
+from cython.parallel cimport prange, threadid
 
 import numpy as np
 cimport numpy as np
@@ -21,12 +24,8 @@ cimport ANNarchy.cython_ext.Coordinates as Coordinates
 ### exported towards ConnectorMethods         ####
 ##################################################
 def all_to_all(pre, post, weights, delays, allow_self_connections, storage_format, storage_order):
-    """ Cython implementation of the all-to-all pattern."""
-    # instantiate pattern
-    projection = LILConnectivity()
-    projection.all_to_all(pre, post, weights, delays, allow_self_connections)
-
-    return projection
+    """ Cython implementation of the all-to-all pattern, the synapses are directly stored as CSR."""
+    return CSRConnectivity(*_all_to_all_csr(pre, post, weights, delays, allow_self_connections))
 
 def one_to_one(pre, post, weights, delays, storage_format, storage_order):
     """ Cython implementation of the one-to-one pattern."""
@@ -37,20 +36,12 @@ def one_to_one(pre, post, weights, delays, storage_format, storage_order):
     return projection
 
 def fixed_probability(pre, post, probability, weights, delays, allow_self_connections, storage_format, storage_order):
-    """ Cython implementation of the fixed_probability pattern."""
-    # instantiate pattern
-    projection = LILConnectivity()
-    projection.fixed_probability(pre, post, probability, weights, delays, allow_self_connections)
-
-    return projection
+    """ Cython implementation of the fixed_probability pattern, the synapses are directly stored as CSR."""
+    return CSRConnectivity(*_fixed_probability_csr(pre, post, probability, weights, delays, allow_self_connections))
 
 def fixed_number_pre(pre, post, int number, weights, delays, allow_self_connections, storage_format, storage_order):
-    """ Cython implementation of the fixed_number_pre pattern."""
-    # instantiate pattern
-    projection = LILConnectivity()
-    projection.fixed_number_pre(pre, post, number, weights, delays, allow_self_connections)
-
-    return projection
+    """ Cython implementation of the fixed_number_pre pattern, the synapses are directly stored as CSR."""
+    return CSRConnectivity(*_fixed_number_pre_csr(pre, post, number, weights, delays, allow_self_connections))
 
 def fixed_number_post(pre, post, int number, weights, delays, allow_self_connections, storage_format, storage_order):
     """ Cython implementation of the fixed_number_post pattern."""
@@ -61,20 +52,270 @@ def fixed_number_post(pre, post, int number, weights, delays, allow_self_connect
     return projection
 
 def gaussian(pre_pop, post_pop, float amp, float sigma, delays, limit, allow_self_connections, storage_format, storage_order):
-    """ Cython implementation of the gaussian pattern."""
-    # instantiate pattern
-    projection = LILConnectivity()
-    projection.gaussian(pre_pop, post_pop, amp, sigma, delays, limit, allow_self_connections)
-
-    return projection
+    """ Cython implementation of the gaussian pattern, the synapses are directly stored as CSR."""
+    return CSRConnectivity(*_dog_csr(pre_pop, post_pop, amp, sigma, 0.0, 1.0, delays, limit * amp, False, allow_self_connections))
 
 def dog(pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections, storage_format, storage_order):
-    """ Cython implementation of the difference-of-gaussian (dog) pattern."""
-    # instantiate pattern
-    projection = LILConnectivity()
-    projection.dog(pre_pop, post_pop, amp_pos, sigma_pos, amp_neg, sigma_neg, delays, limit, allow_self_connections)
+    """ Cython implementation of the difference-of-gaussian (dog) pattern, the synapses are directly stored as CSR."""
+    return CSRConnectivity(*_dog_csr(pre_pop, post_pop, amp_pos, sigma_pos, amp_neg, sigma_neg, delays, limit * fabs(amp_pos - amp_neg), True, allow_self_connections))
+
+# Maximal number of random values drawn at once by the vectorized connectors
+_connector_block_elements = 1 << 24
+
+def _fixed_probability_csr(pre, post, probability, weights, delays, allow_self_connections):
+    """
+    Vectorized sampling of the fixed-probability pattern. Returns the arguments
+    (post_ranks, indptr, indices, weights, delays) of LILConnectivity.add_csr().
+    """
+    cdef int nb_post, nb_pre, block_size, block_start, block_stop
+    cdef Py_ssize_t nb_synapses
+    cdef np.ndarray post_ranks, pre_ranks, mask, rows, cols, indptr, indices
+    cdef list all_indptr, all_indices
+    cdef object w, d
+
+    # Retríeve ranks, the pre ranks are sorted to obtain sorted rows
+    post_ranks = np.asarray(post.ranks)
+    pre_ranks = np.sort(np.asarray(pre.ranks))
+    nb_post = post_ranks.size
+    nb_pre = pre_ranks.size
+
+    # The random values are drawn for blocks of rows to limit the memory footprint
+    block_size = max(1, min(nb_post, _connector_block_elements // max(1, nb_pre)))
+
+    all_indptr = [np.zeros(1, dtype=np.intp)]
+    all_indices = [np.zeros(0, dtype=pre_ranks.dtype)]
+    nb_synapses = 0
+    for block_start in range(0, nb_post, block_size):
+        block_stop = min(block_start + block_size, nb_post)
+
+        # Draw the whole block at once (row-major, same sequence as one call per row)
+        mask = np.random.random((block_stop - block_start, nb_pre)) < probability
+        if not allow_self_connections:
+            mask &= (post_ranks[block_start:block_stop, None] != pre_ranks[None, :])
+
+        # np.nonzero() returns the row-major (i.e. sorted) coordinates
+        rows, cols = np.nonzero(mask)
+        indices = pre_ranks[cols]
+        indptr = np.cumsum(np.bincount(rows, minlength=block_stop - block_start)) + nb_synapses
+        nb_synapses += indices.size
+
+        all_indptr.append(indptr)
+        all_indices.append(indices)
+
+    # Weights and delays are drawn for all synapses at once
+    w = weights.get_values(nb_synapses) if isinstance(weights, RandomDistribution) else weights
+    d = delays.get_values(nb_synapses) if isinstance(delays, RandomDistribution) else delays
+
+    return post_ranks, np.concatenate(all_indptr), np.concatenate(all_indices), w, d
 
-    return projection
+
+##################################################
+### Parallel generation of the dendrites      ####
+##################################################
+# Each row uses its own random stream derived from a base seed and the row index,
+# the result is therefore independent of the number of threads and the scheduling.
+cdef inline uint64_t _splitmix64(uint64_t* state) noexcept nogil:
+    " SplitMix64 generator (Steele et al., 2014), returns the next 64-bit value of *state*. "
+    cdef uint64_t z
+    state[0] += <uint64_t>0x9E3779B97F4A7C15
+    z = state[0]
+    z = (z ^ (z >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    z = (z ^ (z >> 27)) * <uint64_t>0x94D049BB133111EB
+    return z ^ (z >> 31)
+
+cdef inline uint64_t _row_seed(uint64_t base_seed, Py_ssize_t row) noexcept nogil:
+    " Initial state of the random stream for *row*. "
+    cdef uint64_t state = base_seed ^ (<uint64_t>row * <uint64_t>0xD1B54A32D192ED03)
+    return _splitmix64(&state)
+
+cdef void _sample_row(int* perm, int* swaps, int n, int number, int excluded, uint64_t state, const int* pre_ranks, int* out) noexcept nogil:
+    """
+    Draws *number* distinct elements of pre_ranks (without the position *excluded* if >= 0) using a partial
+    Fisher-Yates shuffle on *perm*, which contains the identity permutation and is restored afterwards.
+    """
+    cdef int j, k, tmp
+    cdef int m = n
+
+    if excluded >= 0:
+        m = n - 1
+        perm[excluded] = n - 1
+        perm[n - 1] = excluded
+
+    for j in range(number):
+        k = j + <int>(_splitmix64(&state) % <uint64_t>(m - j))
+        swaps[j] = k
+        tmp = perm[j]
+        perm[j] = perm[k]
+        perm[k] = tmp
+        out[j] = pre_ranks[perm[j]]
+
+    # restore the identity
+    for j in range(number - 1, -1, -1):
+        k = swaps[j]
+        tmp = perm[j]
+        perm[j] = perm[k]
+        perm[k] = tmp
+    if excluded >= 0:
+        perm[excluded] = excluded
+        perm[n - 1] = n - 1
+
+    std_sort(out, out + number)
+
+cdef int _dog_row(Py_ssize_t post, const double* post_coord, const double* pre_coord, int pre_size, int dim,
+                  double amp_pos, double sigma_pos, double amp_neg, double sigma_neg, double threshold,
+                  bint absolute, bint allow_self_connections, int* out_idx, double* out_val) noexcept nogil:
+    """
+    Computes the row *post* of the (difference-of-)gaussian pattern. Only the number of synapses
+    is returned if out_idx is NULL.
+    """
+    cdef int pre, d, nb_synapses = 0
+    cdef double distance, diff, value
+
+    for pre in range(pre_size):
+        if not allow_self_connections and pre == post:
+            continue
+        distance = 0.0
+        for d in range(dim):
+            diff = pre_coord[pre * dim + d] - post_coord[d]
+            distance = distance + diff * diff
+        value = amp_pos * exp(-distance/(2.0*sigma_pos*sigma_pos))
+        if amp_neg != 0.0:
+            value = value - amp_neg * exp(-distance/(2.0*sigma_neg*sigma_neg))
+        if (absolute and fabs(value) > threshold) or (not absolute and value > threshold):
+            if out_idx != NULL:
+                out_idx[nb_synapses] = pre
+                out_val[nb_synapses] = value
+            nb_synapses = nb_synapses + 1
+
+    return nb_synapses
+
+def _connector_threads():
+    " Number of threads used to generate the connectivity. "
+    return max(1, get_global_config('num_threads'))
+
+def _normalized_coordinates(geometry):
+    """
+    Normalized coordinates (between 0 and 1) of all neurons of a population, array of shape (size, dim).
+    """
+    if isinstance(geometry, int):
+        geometry = (geometry, )
+    coords = np.stack(np.unravel_index(np.arange(int(np.prod(geometry))), geometry), axis=1).astype(np.float64)
+    for d, size in enumerate(geometry):
+        coords[:, d] = coords[:, d] / float(size - 1) if size > 1 else 0.0
+    return np.ascontiguousarray(coords)
+
+def _all_to_all_csr(pre, post, weights, delays, allow_self_connections):
+    """
+    Vectorized all-to-all pattern. Returns the arguments of LILConnectivity.add_csr().
+    """
+    cdef np.ndarray post_ranks, pre_ranks, mask, cols
+    cdef Py_ssize_t nb_synapses
+
+    post_ranks = np.asarray(post.ranks)
+    pre_ranks = np.asarray(pre.ranks)
+
+    if allow_self_connections:
+        indptr = np.arange(post_ranks.size + 1, dtype=np.intp) * pre_ranks.size
+        indices = np.tile(pre_ranks, post_ranks.size)
+    else:
+        mask = post_ranks[:, None] != pre_ranks[None, :]
+        indptr = np.concatenate(([0], np.cumsum(np.count_nonzero(mask, axis=1))))
+        _, cols = np.nonzero(mask)
+        indices = pre_ranks[cols]
+
+    nb_synapses = indices.size
+    w = weights.get_values(nb_synapses) if isinstance(weights, RandomDistribution) else weights
+    d = delays.get_values(nb_synapses) if isinstance(delays, RandomDistribution) else delays
+
+    return post_ranks, indptr, indices, w, d
+
+def _fixed_number_pre_csr(pre, post, int number, weights, delays, allow_self_connections):
+    """
+    Parallel fixed_number_pre pattern. Returns the arguments of LILConnectivity.add_csr().
+    """
+    cdef np.ndarray post_ranks_arr = np.ascontiguousarray(post.ranks, dtype=np.intc)
+    cdef np.ndarray pre_ranks_arr = np.ascontiguousarray(pre.ranks, dtype=np.intc)
+    cdef int[::1] post_ranks = post_ranks_arr
+    cdef int[::1] pre_ranks = pre_ranks_arr
+    cdef int nb_post = post_ranks_arr.size
+    cdef int nb_pre = pre_ranks_arr.size
+    cdef int num_threads = _connector_threads()
+    cdef int[::1] position
+    cdef int[:, ::1] perm, swaps
+    cdef int[::1] indices
+    cdef uint64_t base_seed
+    cdef Py_ssize_t i
+    cdef int tid, excluded
+
+    if number > nb_pre or (not allow_self_connections and number == nb_pre and np.intersect1d(pre_ranks_arr, post_ranks_arr).size > 0):
+        ANNarchy.intern.Messages._error('connect_fixed_number_pre: not enough pre-synaptic neurons to create', number, 'synapses per post-synaptic neuron.')
+
+    indices = np.zeros(nb_post * number, dtype=np.intc)
+    if nb_post == 0 or number == 0:
+        return post_ranks_arr, np.zeros(nb_post + 1, dtype=np.intp), np.asarray(indices), 0.0, 0.0
+
+    # Position of a rank in pre_ranks (-1 if not pre-synaptic), to avoid self-connections
+    position = np.full(max(np.max(pre_ranks_arr), np.max(post_ranks_arr)) + 1, -1, dtype=np.intc)
+    if not allow_self_connections:
+        np.asarray(position)[pre_ranks_arr] = np.arange(nb_pre, dtype=np.intc)
+
+    # One permutation buffer per thread
+    perm = np.tile(np.arange(nb_pre, dtype=np.intc), (num_threads, 1))
+    swaps = np.zeros((num_threads, number), dtype=np.intc)
+
+    # The base seed is drawn from numpy, i.e. it depends on np.random.seed()/setup(seed=...)
+    base_seed = <uint64_t>np.random.randint(0, 2**62, dtype=np.int64)
+
+    for i in prange(nb_post, nogil=True, num_threads=num_threads, schedule='static'):
+        tid = threadid()
+        excluded = position[post_ranks[i]]
+        _sample_row(&perm[tid, 0], &swaps[tid, 0], nb_pre, number, excluded, _row_seed(base_seed, i), &pre_ranks[0], &indices[i * number])
+
+    w = weights.get_values(nb_post * number) if isinstance(weights, RandomDistribution) else weights
+    d = delays.get_values(nb_post * number) if isinstance(delays, RandomDistribution) else delays
+
+    return post_ranks_arr, np.arange(nb_post + 1, dtype=np.intp) * number, np.asarray(indices), w, d
+
+def _dog_csr(pre_pop, post_pop, double amp_pos, double sigma_pos, double amp_neg, double sigma_neg, delays, double threshold, bint absolute, bint allow_self_connections):
+    """
+    Parallel (difference-of-)gaussian pattern, the gaussian pattern is obtained with amp_neg=0. The
+    synapses are kept if value > threshold (or abs(value) > threshold if *absolute* is set). Returns
+    the arguments of LILConnectivity.add_csr().
+    """
+    cdef np.ndarray pre_arr = _normalized_coordinates(pre_pop.geometry)
+    cdef np.ndarray post_arr = _normalized_coordinates(post_pop.geometry)
+    cdef double[:, ::1] pre_coord = pre_arr
+    cdef double[:, ::1] post_coord = post_arr
+    cdef int pre_size = pre_arr.shape[0]
+    cdef int post_size = post_arr.shape[0]
+    cdef int dim = pre_arr.shape[1]
+    cdef int num_threads = _connector_threads()
+    cdef Py_ssize_t[::1] indptr
+    cdef int[::1] indices
+    cdef double[::1] values
+    cdef Py_ssize_t post, nb_synapses
+    cdef int count
+
+    if post_arr.shape[1] != dim:
+        ANNarchy.intern.Messages._error('The (difference-of-)gaussian pattern requires populations with the same number of dimensions.')
+
+    # First pass: number of synapses per row
+    indptr = np.zeros(post_size + 1, dtype=np.intp)
+    for post in prange(post_size, nogil=True, num_threads=num_threads, schedule='static'):
+        count = _dog_row(post, &post_coord[post, 0], &pre_coord[0, 0], pre_size, dim, amp_pos, sigma_pos, amp_neg, sigma_neg, threshold, absolute, allow_self_connections, NULL, NULL)
+        indptr[post + 1] = count
+    np.cumsum(indptr, out=np.asarray(indptr))
+    nb_synapses = indptr[post_size]
+
+    # Second pass: ranks and values
+    indices = np.zeros(max(1, nb_synapses), dtype=np.intc)
+    values = np.zeros(max(1, nb_synapses), dtype=np.float64)
+    for post in prange(post_size, nogil=True, num_threads=num_threads, schedule='static'):
+        _dog_row(post, &post_coord[post, 0], &pre_coord[0, 0], pre_size, dim, amp_pos, sigma_pos, amp_neg, sigma_neg, threshold, absolute, allow_self_connections, &indices[indptr[post]], &values[indptr[post]])
+
+    d = delays.get_values(nb_synapses) if isinstance(delays, RandomDistribution) else delays
+
+    return np.arange(post_size, dtype=np.intc), np.asarray(indptr), np.asarray(indices)[:nb_synapses], np.asarray(values)[:nb_synapses], d
 
 ###################################################
 ########## LIL object to hold synapses ############
@@ -156,6 +397,118 @@ cdef class LILConnectivity:
         self.size += 1
         self.nb_synapses += r.size()
 
+    cpdef add_csr(self, post_ranks, indptr, indices, weights, delays):
+        """
+        Adds several dendrites at once from arrays in compressed sparse row (CSR) format.
+
+        The row i contains the pre-synaptic ranks indices[indptr[i]:indptr[i+1]] of the
+        post-synaptic neuron post_ranks[i]. Empty rows are skipped as in push_back().
+
+        :param post_ranks: post-synaptic rank of each row, None if row i corresponds to rank i.
+        :param indptr: row pointer array of size (number of rows + 1).
+        :param indices: pre-synaptic ranks, array of size indptr[-1].
+        :param weights: single value or array of size indptr[-1].
+        :param delays: single value or array of size indptr[-1] (in ms).
+        """
+        cdef Py_ssize_t[::1] ptr = np.ascontiguousarray(indptr, dtype=np.intp)
+        cdef int[::1] idx = np.ascontiguousarray(indices, dtype=np.intc)
+        cdef Py_ssize_t[::1] rks
+        cdef double[::1] w_arr
+        cdef int[::1] d_arr
+        cdef int* idx_ptr
+        cdef double* w_ptr
+        cdef int* d_ptr
+        cdef vector[int] r, int_delays
+        cdef vector[double] w
+        cdef bool uniform_w, uniform_d
+        cdef double w_val
+        cdef int unif_d, max_d, n_rows, i, rk
+        cdef Py_ssize_t start, stop
+
+        n_rows = ptr.shape[0] - 1
+        if n_rows <= 0:
+            return
+
+        if post_ranks is None:
+            rks = np.arange(n_rows, dtype=np.intp)
+        else:
+            rks = np.ascontiguousarray(post_ranks, dtype=np.intp)
+            if rks.shape[0] != n_rows:
+                ANNarchy.intern.Messages._error("LILConnectivity.add_csr(): post_ranks must contain one rank per row.")
+        if idx.shape[0] != ptr[n_rows]:
+            ANNarchy.intern.Messages._error("LILConnectivity.add_csr(): indices must contain indptr[-1] elements.")
+
+        # Nothing to store
+        if ptr[n_rows] == 0:
+            return
+        idx_ptr = &idx[0]
+
+        # Weights
+        uniform_w = np.ndim(weights) == 0
+        if uniform_w:
+            w_val = weights
+        else:
+            w_arr = np.ascontiguousarray(weights, dtype=np.float64)
+            if w_arr.shape[0] != idx.shape[0]:
+                ANNarchy.intern.Messages._error("LILConnectivity.add_csr(): weights must be a single value or contain one value per synapse.")
+            w_ptr = &w_arr[0]
+
+        # Delays are converted into steps
+        uniform_d = np.ndim(delays) == 0
+        if uniform_d:
+            unif_d = round(delays/self.dt)
+            max_d = unif_d
+        else:
+            d_arr = np.ascontiguousarray(np.round(np.asarray(delays, dtype=np.float64)/self.dt), dtype=np.intc)
+            if d_arr.shape[0] != idx.shape[0]:
+                ANNarchy.intern.Messages._error("LILConnectivity.add_csr(): delays must be a single value or contain one value per synapse.")
+            d_ptr = &d_arr[0]
+            max_d = np.max(d_arr)
+
+        for i in range(n_rows):
+            rk = rks[i]
+
+            # sanity check: added rows should be ascending sorted
+            if rk < self.last_added_idx:
+                if self.requires_sorting == False:
+                    ANNarchy.intern.Messages._warning("LILConnectivity.add_csr(): dendrites should be added in an ascending order for performance reasons.")
+                    ANNarchy.intern.Messages._print("ANNarchy will sort the dendrites during compile() which increases the required time.")
+                self.requires_sorting = True
+            else:
+                self.last_added_idx = rk
+
+            start = ptr[i]
+            stop = ptr[i+1]
+            if stop <= start:
+                continue
+
+            r.assign(idx_ptr + start, idx_ptr + stop)
+            self.post_rank.push_back(rk)
+            self.pre_rank.push_back(r)
+
+            if uniform_w:
+                self.w.push_back(vector[double](stop - start, w_val))
+            else:
+                w.assign(w_ptr + start, w_ptr + stop)
+                self.w.push_back(w)
+
+            if uniform_d:
+                self.delay.push_back(vector[int](1, unif_d))
+                if self.uniform_delay != unif_d and self.size > 0:
+                    self.uniform_delay = -1
+                else:
+                    self.uniform_delay = unif_d
+            else:
+                int_delays.assign(d_ptr + start, d_ptr + stop)
+                self.delay.push_back(int_delays)
+                self.uniform_delay = -1
+
+            self.size += 1
+            self.nb_synapses += stop - start
+
+        if max_d > self.max_delay:
+            self.max_delay = max_d
+
     cpdef int get_max_delay(self):
         return self.max_delay
 
@@ -237,40 +590,7 @@ cdef class LILConnectivity:
     #####################################################
     cpdef all_to_all(self, pre, post, weights, delays, allow_self_connections):
         " Implementation of the all-to-all pattern "
-        cdef double weight
-        cdef int r_post, size_pre, i
-        cdef list tmp, post_ranks, pre_ranks
-        cdef vector[int] r
-        cdef vector[double] w, d
-
-        # Retríeve ranks
-        post_ranks = post.ranks.tolist()
-        pre_ranks = pre.ranks.tolist()
-
-        for r_post in post_ranks:
-            # List of pre ranks
-            tmp = [i for i  in pre_ranks]
-            if not allow_self_connections:
-                try:
-                    tmp.remove(r_post)
-                except: # was not in the list
-                    pass
-            r = tmp
-            size_pre = len(tmp)
-            # Weights
-            if isinstance(weights, (int, float)):
-                weight = weights
-                w = vector[double](1, weight)
-            elif isinstance(weights, RandomDistribution):
-                w = weights.get_list_values(size_pre)
-            # Delays
-            if isinstance(delays, (float, int)):
-                d = vector[double](1, delays)
-            elif isinstance(delays, RandomDistribution):
-                d = delays.get_list_values(size_pre)
-
-            # Create the dendrite
-            self.push_back(r_post, r, w, d)
+        self.add_csr(*_all_to_all_csr(pre, post, weights, delays, allow_self_connections))
 
     cpdef one_to_one(self, pre, post, weights, delays):
         """ Cython implementation of the one-to-one pattern."""
@@ -294,81 +614,11 @@ cdef class LILConnectivity:
 
     cpdef fixed_probability(self, pre, post, probability, weights, delays, allow_self_connections):
         " Implementation of the fixed-probability pattern "
-        cdef double weight
-        cdef int r_post, r_pre, size_pre, max_size_pre
-        cdef list post_ranks
-        cdef vector[int] r
-        cdef vector[double] w, d
-        cdef np.ndarray random_values, tmp, pre_ranks
-
-        # Retríeve ranks
-        post_ranks = post.ranks.tolist()
-        pre_ranks = pre.ranks
-        max_size_pre = len(pre.ranks)
-
-        for r_post in post_ranks:
-            # List of pre ranks
-            random_values = np.random.random(max_size_pre)
-            tmp = pre_ranks[random_values < probability]
-            if not allow_self_connections:
-                tmp = tmp[tmp != r_post]
-
-            # sort the indices to prevent irregular accesses
-            r = np.sort(tmp)
-            size_pre = tmp.size
-            if size_pre == 0:
-                continue
-
-            # Weights
-            if isinstance(weights, (int, float)):
-                weight = weights
-                w = vector[double](1, weight)
-            elif isinstance(weights, RandomDistribution):
-                w = weights.get_list_values(size_pre)
-            # Delays
-            if isinstance(delays, (float, int)):
-                d = vector[double](1, delays)
-            elif isinstance(delays, RandomDistribution):
-                d = delays.get_list_values(size_pre)
-            # Create the dendrite
-            self.push_back(r_post, r, w, d)
+        self.add_csr(*_fixed_probability_csr(pre, post, probability, weights, delays, allow_self_connections))
 
     cpdef fixed_number_pre(self, pre, post, int number, weights, delays, allow_self_connections):
-        cdef double weight
-        cdef int r_post, r_pre, size_pre
-        cdef list pre_ranks, post_ranks
-        cdef vector[int] r
-        cdef vector[double] w, d
-
-        # Retríeve ranks
-        post_ranks = post.ranks.tolist()
-        pre_ranks = pre.ranks.tolist()
-
-        for r_post in post_ranks:
-            # List of pre ranks
-            r = np.random.choice(pre_ranks, size=number, replace=False)
-            if len(r) == 0:
-                continue
-            if not allow_self_connections:
-                while r_post in list(r): # the post index is in the list
-                    r = np.random.choice(pre_ranks, size=number, replace=False)
-
-            # sort the indices to prevent irregular accesses
-            r = np.sort(r)
-
-            # Weights
-            if isinstance(weights, (int, float)):
-                weight = weights
-                w = vector[double](1, weight)
-            elif isinstance(weights, RandomDistribution):
-                w = weights.get_list_values(number)
-            # Delays
-            if isinstance(delays, (float, int)):
-                d = vector[double](1, delays)
-            elif isinstance(delays, RandomDistribution):
-                d = delays.get_list_values(number)
-            # Create the dendrite
-            self.push_back(r_post, r, w, d)
+        " Implementation of the fixed_number_pre pattern, the dendrites are generated in parallel "
+        self.add_csr(*_fixed_number_pre_csr(pre, post, number, weights, delays, allow_self_connections))
 
     cpdef fixed_number_post(self, pre, post, int number, weights, delays, allow_self_connections):
         cdef double weight
@@ -420,150 +670,127 @@ cdef class LILConnectivity:
             self.push_back(r_post, r, w, d)
 
     cpdef gaussian(self, pre_pop, post_pop, float amp, float sigma, delays, limit, allow_self_connections):
-        cdef float distance, value
-        cdef int post, pre, pre_size, post_size, c, nb_synapses, pre_dim, post_dim
-        cdef tuple pre_coord, post_coord
-        cdef tuple pre_geometry, post_geometry
-        cdef list ranks, values
+        " Implementation of the gaussian pattern, the dendrites are generated in parallel "
+        self.add_csr(*_dog_csr(pre_pop, post_pop, amp, sigma, 0.0, 1.0, delays, limit * amp, False, allow_self_connections))
 
-        cdef vector[int] r
-        cdef vector[double] w, d
+    cpdef dog(self, pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections):
+        " Implementation of the difference-of-gaussian pattern, the dendrites are generated in parallel "
+        self.add_csr(*_dog_csr(pre_pop, post_pop, amp_pos, sigma_pos, amp_neg, sigma_neg, delays, limit * fabs(amp_pos - amp_neg), True, allow_self_connections))
 
-        # Retrieve simulation time step
-        dt = get_global_config('dt')
+###################################################
+######## CSR object to hold flat synapses #########
+###################################################
+class CSRConnectivity:
+    """
+    Container for the ranks, weights and delays of a projection stored as flat
+    arrays in compressed sparse row (CSR) format.
+
+    Contrary to LILConnectivity, no vector is allocated per dendrite: the arrays are
+    handed over to the C++ side as they are (see init_from_csr_connectivity() in
+    the generated wrapper), which reduces the peak memory for large projections.
+
+    The attributes describing the connectivity are the same as in LILConnectivity.
+    """
+    def __init__(self, post_ranks, indptr, indices, weights, delays):
+        """
+        :param post_ranks: post-synaptic rank of each row (rows can be empty or unsorted).
+        :param indptr: row pointer array of size (number of rows + 1).
+        :param indices: pre-synaptic ranks, array of size indptr[-1].
+        :param weights: single value or array of size indptr[-1].
+        :param delays: single value or array of size indptr[-1] (in ms).
+        """
+        self.dt = get_global_config('dt')
 
-        # Population sizes
-        pre_geometry = pre_pop.geometry
-        post_geometry = post_pop.geometry
-        if isinstance(pre_geometry, int):
-            pre_size = pre_geometry
-            pre_dim = 1
-        else:
-            pre_dim = len(pre_geometry)
-            pre_size = 1
-            for c in pre_geometry:
-                pre_size  = pre_size * c
-        if isinstance(post_geometry, int):
-            post_size = post_geometry
-            post_dim = 1
+        self.post_rank = np.ascontiguousarray(post_ranks, dtype=np.intc)
+        self.row_ptr = np.ascontiguousarray(indptr, dtype=np.longlong)
+        self.pre_rank = np.ascontiguousarray(indices, dtype=np.intc)
+        self.w = np.ascontiguousarray(np.atleast_1d(weights), dtype=np.float64)
+
+        if self.row_ptr.size != self.post_rank.size + 1 or self.row_ptr[-1] != self.pre_rank.size:
+            ANNarchy.intern.Messages._error("CSRConnectivity: the sizes of post_ranks, indptr and indices do not match.")
+        if self.w.size not in [1, self.pre_rank.size]:
+            ANNarchy.intern.Messages._error("CSRConnectivity: weights must be a single value or contain one value per synapse.")
+
+        # Delays are stored in steps
+        self.delay = np.ascontiguousarray(np.round(np.atleast_1d(np.asarray(delays, dtype=np.float64))/self.dt), dtype=np.intc)
+        if self.delay.size not in [1, self.pre_rank.size]:
+            ANNarchy.intern.Messages._error("CSRConnectivity: delays must be a single value or contain one value per synapse.")
+        self.max_delay = max(0, int(np.max(self.delay))) if self.pre_rank.size > 0 else 0
+        if self.delay.size == 1:
+            self.uniform_delay = int(self.delay[0])
         else:
-            post_dim = len(post_geometry)
-            post_size = 1
-            for c in post_geometry:
-                post_size  = post_size * c
-
-        # Create the projection data
-        for post in list(range(post_size)):
-            ranks = []
-            values = []
-            if post_dim == 1:
-                post_coord = (post/float(post_size-1), )
-            elif post_dim == 2:
-                post_coord = Coordinates.get_normalized_2d_coord(post, post_geometry)
-            elif post_dim == 3:
-                post_coord = Coordinates.get_normalized_3d_coord(post, post_geometry)
-            else:
-                post_coord = Coordinates.get_normalized_coord(post, post_geometry)
-            for pre in list(range(pre_size)):
-                if not allow_self_connections and pre==post:
-                    continue
-                if pre_dim == 1:
-                    pre_coord = (pre/float(pre_size-1), )
-                    distance = Coordinates.comp_dist1D(pre_coord, post_coord)
-                elif pre_dim == 2:
-                    pre_coord = Coordinates.get_normalized_2d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist2D(pre_coord, post_coord)
-                elif pre_dim == 3:
-                    pre_coord = Coordinates.get_normalized_3d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist3D(pre_coord, post_coord)
-                else:
-                    pre_coord = Coordinates.get_normalized_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_distND(pre_coord, post_coord)
-                value = amp * exp(-distance/(2.0*sigma**2))
-                if value > limit * amp:
-                    ranks.append(pre)
-                    values.append(value)
-            nb_synapses = len(ranks)
-            r = ranks
-            w = values
-            if isinstance(delays, (float, int)):
-                d = vector[double](1, delays)
-            elif isinstance(delays, RandomDistribution):
-                d = delays.get_list_values(nb_synapses)
-            # Create the dendrite
-            self.push_back(post, r, w, d)
+            self.uniform_delay = -1
 
-    cpdef dog(self, pre_pop, post_pop, float amp_pos, float sigma_pos, float amp_neg, float sigma_neg, delays, limit, allow_self_connections):
-        cdef float distance, value
-        cdef int post, pre, pre_size, post_size, c, nb_synapses, pre_dim, post_dim
-        cdef tuple pre_coord, post_coord
-        cdef tuple pre_geometry, post_geometry
-        cdef list ranks, values
+        # Only the non-empty rows are dendrites, they are stored in ascending order of
+        # the post-synaptic ranks so that the C++ side can use the arrays as they are.
+        self._sort_rows()
+        self.row_lengths = np.diff(self.row_ptr)
+        self.size = int(self.post_rank.size)
+        self.nb_synapses = int(self.pre_rank.size)
+        self.requires_sorting = False
+        if np.any(self.post_rank[1:] == self.post_rank[:-1]):
+            ANNarchy.intern.Messages._error("CSRConnectivity: the same post-synaptic neuron is contained several times.")
+
+    def _sort_rows(self):
+        """
+        Removes the empty rows and sorts the remaining ones by post-synaptic rank.
+        """
+        row_lengths = np.diff(self.row_ptr)
+        rows = np.flatnonzero(row_lengths)
+        ranks = self.post_rank[rows]
+        is_sorted = np.all(ranks[1:] >= ranks[:-1])
+        if is_sorted and rows.size == self.post_rank.size:
+            return
 
-        cdef vector[int] r
-        cdef vector[double] w, d
+        if not is_sorted:
+            rows = rows[np.argsort(ranks, kind='stable')]
+        row_lengths = row_lengths[rows]
+        row_ptr = np.zeros(rows.size + 1, dtype=np.longlong)
+        np.cumsum(row_lengths, out=row_ptr[1:])
+
+        # Gather the synapses of the reordered rows
+        if not is_sorted:
+            synapses = np.repeat(self.row_ptr[rows] - row_ptr[:-1], row_lengths) + np.arange(self.pre_rank.size)
+            self.pre_rank = np.ascontiguousarray(self.pre_rank[synapses])
+            if self.w.size > 1:
+                self.w = np.ascontiguousarray(self.w[synapses])
+            if self.delay.size > 1:
+                self.delay = np.ascontiguousarray(self.delay[synapses])
+
+        self.post_rank = np.ascontiguousarray(self.post_rank[rows])
+        self.row_ptr = row_ptr
+
+    def get_max_delay(self):
+        return self.max_delay
 
-        # Population sizes
-        pre_geometry = pre_pop.geometry
-        post_geometry = post_pop.geometry
-        if isinstance(pre_geometry, int):
-            pre_size = pre_geometry
-            pre_dim = 1
-        else:
-            pre_dim = len(pre_geometry)
-            pre_size = 1
-            for c in pre_geometry:
-                pre_size  = pre_size * c
-        if isinstance(post_geometry, int):
-            post_size = post_geometry
-            post_dim = 1
-        else:
-            post_dim = len(post_geometry)
-            post_size = 1
-            for c in post_geometry:
-                post_size  = post_size * c
-
-        # Create the projection data as LIL
-        for post in list(range(post_size)):
-            ranks = []
-            values = []
-            if post_dim == 1:
-                post_coord = (post/float(post_size-1), )
-            elif post_dim == 2:
-                post_coord = Coordinates.get_normalized_2d_coord(post, post_geometry)
-            elif post_dim == 3:
-                post_coord = Coordinates.get_normalized_3d_coord(post, post_geometry)
-            else:
-                post_coord = Coordinates.get_normalized_coord(post, post_geometry)
-            for pre in list(range(pre_size)):
-                if not allow_self_connections and pre==post:
-                    continue
-                if pre_dim == 1:
-                    pre_coord = (pre/float(pre_size-1), )
-                    distance = Coordinates.comp_dist1D(pre_coord, post_coord)
-                elif pre_dim == 2:
-                    pre_coord = Coordinates.get_normalized_2d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist2D(pre_coord, post_coord)
-                elif pre_dim == 3:
-                    pre_coord = Coordinates.get_normalized_3d_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_dist3D(pre_coord, post_coord)
-                else:
-                    pre_coord = Coordinates.get_normalized_coord(pre, pre_geometry)
-                    distance = Coordinates.comp_distND(pre_coord, post_coord)
-                value = amp_pos * exp(-distance/(2.0*sigma_pos**2)) - amp_neg * exp(-distance/(2.0*sigma_neg**2))
-                if fabs(value) > limit * fabs(amp_pos - amp_neg):
-                    ranks.append(pre)
-                    values.append(value)
-            nb_synapses = len(ranks)
-            r = ranks
-            w = values
-            if isinstance(delays, (float, int)):
-                d = vector[double](1, delays)
-            elif isinstance(delays, RandomDistribution):
-                d = delays.get_list_values(nb_synapses)
+    def get_uniform_delay(self):
+        return self.uniform_delay
 
-            # Create the dendrite
-            self.push_back(post, r, w, d)
+    def compute_average_row_length(self):
+        rl = self.row_lengths
+        return np.mean(rl), np.std(rl), np.amin(rl), np.amax(rl)
+
+    def compute_average_col_idx_gap(self):
+        # gaps between successive column indices, excluding the row borders
+        gaps = np.diff(self.pre_rank)
+        inner = np.ones(gaps.size, dtype=np.bool_)
+        borders = self.row_ptr[1:-1] - 1
+        inner[borders[(borders >= 0) & (borders < gaps.size)]] = False
+        return np.mean(gaps[inner]), np.std(gaps[inner])
+
+    def validate(self):
+        # Duplicated rows are rejected by the constructor
+        pass
+
+    def to_lil(self):
+        """
+        Returns the same connectivity as LILConnectivity.
+        """
+        lil = LILConnectivity()
+        weights = self.w if self.w.size == self.pre_rank.size else self.w[0]
+        delays = self.delay * self.dt if self.delay.size == self.pre_rank.size else self.delay[0] * self.dt
+        lil.add_csr(self.post_rank, self.row_ptr, self.pre_rank, weights, delays)
+        return lil
 
 cdef _get_weights_delays(int size, weights, delays):
 
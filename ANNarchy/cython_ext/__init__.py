@@ -1,6 +1,6 @@
 # export connector functions
 from .Connector import one_to_one, all_to_all, gaussian, dog, fixed_probability, fixed_number_pre, fixed_number_post
-from .Connector import LILConnectivity
+from .Connector import LILConnectivity, CSRConnectivity
 
 __all__ = [
     # Methods
@@ -13,5 +13,6 @@ __all__ = [
     'fixed_number_post',
     # Classes
     'LILConnectivity',
+    'CSRConnectivity',
     'Coordinates'
 ]
\ No newline at end of file
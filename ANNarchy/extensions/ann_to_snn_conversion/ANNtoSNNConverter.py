@@ -433,10 +433,8 @@ class ANNtoSNNConverter :
                 self._snn_network.simulate_until(duration_per_sample, population=last_layer)
 
                 # Read-out accumulated inputs
-                data = self._snn_network.get(self._monitor).get('spike')
-                act_pred = np.zeros(nb_classes)
-                for neur_rank, spike_times in data.items():
-                    act_pred[neur_rank] = len(spike_times)
+                _, ranks = self._snn_network.get(self._monitor).get('spike', events=True)
+                act_pred = np.bincount(ranks, minlength=nb_classes)
 
                 # Gather all neurons which fulfilled the condition
                 prediction = np.argwhere(act_pred == np.amax(act_pred)).flatten()
@@ -456,13 +454,11 @@ class ANNtoSNNConverter :
                 self._snn_network.simulate(duration_per_sample)
 
                 # Retrieve the recorded spike events
-                data = self._snn_network.get(self._monitor).get('spike')
+                _, ranks = self._snn_network.get(self._monitor).get('spike', events=True)
 
                 # The predicted label is the neuron index with the highest number of spikes.
                 # Therefore, we count the number of spikes each output neuron emitted.
-                act_pred = np.zeros(nb_classes)
-                for neur_rank, spike_times in data.items():
-                    act_pred[neur_rank] = len(spike_times)
+                act_pred = np.bincount(ranks, minlength=nb_classes)
 
                 # Gather all neurons which achieved highest number of spikes
                 prediction = np.argwhere(act_pred == np.amax(act_pred)).flatten()
@@ -3,7 +3,9 @@
 :license: GPLv2, see LICENSE for details.
 """
 
+import re
 import time
+import ANNarchy
 import ANNarchy.core.Global as Global
 from ANNarchy.core.PopulationView import PopulationView
 from ANNarchy.intern.Profiler import Profiler
@@ -13,6 +15,7 @@ from ANNarchy.intern import Messages
 from ANNarchy.parser.Extraction import extract_functions
 
 from ANNarchy.generator.PyxGenerator import PyxGenerator
+from ANNarchy.generator.Sanity import check_batch
 from ANNarchy.generator.MonitorGenerator import MonitorGenerator
 from ANNarchy.generator.Population import SingleThreadGenerator, OpenMPGenerator, CUDAGenerator
 from ANNarchy.generator.Projection import SingleThreadProjectionGenerator, OpenMPProjectionGenerator, CUDAProjectionGenerator
@@ -88,6 +91,7 @@ class CodeGenerator(object):
         # Target container for the generated code snippets
         self._pop_desc = []
         self._proj_desc = []
+        self._units = {}
 
     def generate(self):
         """
@@ -106,6 +110,10 @@ class CodeGenerator(object):
             * for each projection a seperate header file, contain semantic
               logic of a projection respectively synapse object (filename:
               proj<id>)
+            * OpenMP only: for each population/projection a translation unit
+              (pop<id>.cpp, proj<id>.cpp) which instantiates the object and
+              its simulation kernels, so that only the changed objects need
+              to be recompiled.
         """
         if Profiler().enabled:
             t0 = time.time()
@@ -132,6 +140,9 @@ class CodeGenerator(object):
         # corresponding populations.
         self._propagate_global_ops()
 
+        # Several instances of the network in the same library (see setup(batch_size=...))
+        check_batch(self._populations, self._projections)
+
         # Create all populations
         for pop in self._populations:
             self._pop_desc.append(self._popgen.header_struct(pop, self._annarchy_dir))
@@ -143,6 +154,10 @@ class CodeGenerator(object):
         # where all source files should take place
         source_dest = self._annarchy_dir+'/generate/net'+str(self._net_id)+'/'
 
+        # Move the instances and kernel calls into separate translation units
+        if get_global_config('paradigm') == "openmp":
+            self._split_compilation_units()
+
         # Generate header code for the analysed pops and projs
         if get_global_config('paradigm') == "openmp":
             with open(source_dest+'ANNarchy.h', 'w') as ofile:
@@ -176,6 +191,10 @@ class CodeGenerator(object):
         else:
             raise NotImplementedError
 
+        # Generate the translation units for the analysed pops and projs
+        if get_global_config('paradigm') == "openmp":
+            self._generate_compilation_units(source_dest)
+
         # Generate cython code for the analysed pops and projs
         with open(source_dest+'ANNarchyCore'+str(self._net_id)+'.pyx', 'w') as ofile:
             ofile.write(self._pyxgen.generate())
@@ -186,6 +205,95 @@ class CodeGenerator(object):
             t1 = time.time()
             Profiler().add_entry(t0, t1, "generate", "compile")
 
+    def _split_compilation_units(self):
+        """
+        Each population and projection is compiled in its own translation unit. The
+        calls emitted into ANNarchy.cpp (update, compute_psp, ...) are replaced by
+        calls to wrapper functions defined in these units. As the methods of the
+        structs are only used there, the simulation kernels are not compiled as part
+        of ANNarchy.cpp anymore.
+        """
+        if get_global_config('num_threads') == 1:
+            signature, call_args = "()", "()"
+        else:
+            signature, call_args = "(const int tid, const int nt)", "(tid, nt)"
+
+        pop_keys = ['init', 'rng_update', 'update', 'delay_update', 'gops_update']
+        proj_keys = ['init', 'compute_psp', 'rng_update', 'update', 'post_event']
+
+        objects = [('pop', pop, desc, pop_keys) for pop, desc in zip(self._populations, self._pop_desc)] + \
+                  [('proj', proj, desc, proj_keys) for proj, desc in zip(self._projections, self._proj_desc)]
+
+        for prefix, obj, desc, keys in objects:
+            name = prefix + str(obj.id)
+
+            wrapper = ""
+            for key in keys:
+                if key not in desc.keys() or desc[key].strip() == "":
+                    continue
+
+                func_name = name + '_' + key
+                wrapper += "void %(func)s%(sig)s {\n%(body)s}\n" % {
+                    'func': func_name, 'sig': signature if key != 'init' else "()", 'body': desc[key]
+                }
+
+                # the header declares the wrapper, ANNarchy.cpp calls it
+                desc['extern'] += "void %(func)s%(sig)s;\n" % {
+                    'func': func_name, 'sig': signature if key != 'init' else "()"
+                }
+                desc[key] = ("    " if key == 'init' else "\t") + func_name + (call_args if key != 'init' else "()") + ";\n"
+
+            self._units[name] = {
+                'instance': desc['instance'],
+                'wrapper': wrapper
+            }
+
+            # the instance is defined in the translation unit
+            desc['instance'] = ""
+
+    def _generate_compilation_units(self, source_dest):
+        """
+        Writes the translation units prepared in _split_compilation_units(). A unit only includes
+        the headers of the objects it refers to (e.g. the pre- and post-synaptic population
+        of a projection), so changing one object does not trigger the recompilation of the others.
+
+        Parameters:
+
+        * source_dest: path to folder where generated files are stored.
+        """
+        # Objects referenced in the headers
+        references = {}
+        for name in self._units.keys():
+            with open(source_dest + name + '.hpp', 'r') as rfile:
+                code = rfile.read()
+            references[name] = set(re.findall(r'\b(pop\d+|proj\d+)\b', code)) & set(self._units.keys())
+
+        # Same ordering as in ANNarchy.h: populations first, then projections
+        ordering = ['pop' + str(pop.id) for pop in self._populations] + ['proj' + str(proj.id) for proj in self._projections]
+
+        for name, unit in self._units.items():
+            # gather the referenced objects recursively
+            required = set([name])
+            stack = [name]
+            while len(stack) > 0:
+                for ref in references[stack.pop()]:
+                    if ref not in required:
+                        required.add(ref)
+                        stack.append(ref)
+
+            include = ""
+            for dep in ordering:
+                if dep in required:
+                    include += "#include \"" + dep + ".hpp\"\n"
+
+            with open(source_dest + name + '.cpp', 'w') as ofile:
+                ofile.write(BaseTemplate.omp_unit_template % {
+                    'annarchy_version': ANNarchy.__release__,
+                    'include': include,
+                    'instance': unit['instance'],
+                    'wrapper': unit['wrapper']
+                })
+
     def _generate_file_overview(self, source_dest):
         """
         Generate a logfile, where we log which Population/Projection object is stored in
@@ -265,7 +373,7 @@ class CodeGenerator(object):
 
         # Make sure the operations are declared only once
         for pop in self._populations:
-            pop.global_operations = [dict(y) for y in sorted(set(tuple(x.items())) for x in pop.global_operations)]
+            pop.global_operations = [dict(y) for y in sorted(set(tuple(x.items()) for x in pop.global_operations))]
             pop.delayed_variables = sorted(list(set(pop.delayed_variables)))
 
     def _generate_header(self):
@@ -0,0 +1,238 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import os
+import shutil
+import hashlib
+import json
+import time
+
+import ANNarchy
+
+from ANNarchy.intern.ConfigManagement import get_global_config
+from ANNarchy.intern import Messages
+
+class CompilationCache :
+    """
+    Persistent, content-addressed storage of compiled ANNarchyCore libraries.
+
+    The generated sources, the Makefile (which contains the compiler, its flags and
+    the python environment), the floating precision, the paradigm and the ANNarchy
+    release are hashed into a single key. If a library with the same key was compiled
+    before, possibly in another working directory, it can be re-used without calling make.
+
+    The cache is located in the folder set by *setup(compilation_cache_dir=...)* (default:
+    ~/.cache/ANNarchy). Each entry is a subfolder named by its key, which contains the shared
+    library. The modification time of the subfolder is updated on each access and the least
+    recently used entries are removed when the total size exceeds *compilation_cache_size* (in MB).
+    """
+    def __init__(self, cache_dir=None, max_size=None):
+        """
+        Constructor.
+
+        :param cache_dir: location of the cache, by default the global configuration is used.
+        :param max_size: maximum size in MB, by default the global configuration is used.
+        """
+        if cache_dir is None:
+            cache_dir = get_global_config('compilation_cache_dir')
+        if max_size is None:
+            max_size = get_global_config('compilation_cache_size')
+
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size = int(max_size * 1024 * 1024)
+
+    def compute_key(self, source_dir):
+        """
+        Computes the content hash for the files located in *source_dir* (normally annarchy/generate/netX).
+
+        Log files are ignored. The header files shipped with ANNarchy (sparse matrix formats
+        etc.) are hashed too, as they are included by the generated code.
+        """
+        sha = hashlib.sha256()
+
+        # Global settings which influence the generated library
+        sha.update(ANNarchy.__release__.encode('utf-8'))
+        sha.update(get_global_config('paradigm').encode('utf-8'))
+        sha.update(get_global_config('precision').encode('utf-8'))
+
+        # Generated code and Makefile
+        for fname in sorted(os.listdir(source_dir)):
+            if fname.endswith(".log"):
+                continue
+            sha.update(fname.encode('utf-8'))
+            with open(source_dir + '/' + fname, 'rb') as rfile:
+                sha.update(rfile.read())
+
+        # ANNarchy headers
+        for folder in [ANNarchy.__path__[0]+'/include', ANNarchy.__path__[0]+'/thirdparty']:
+            for fname in sorted(os.listdir(folder)):
+                if not fname.endswith('.hpp'):
+                    continue
+                with open(folder + '/' + fname, 'rb') as rfile:
+                    sha.update(rfile.read())
+
+        return sha.hexdigest()
+
+    def lookup(self, key, libname, target):
+        """
+        Copies the library *libname* stored under *key* to the file *target*.
+
+        Returns True if the entry was found, False otherwise.
+        """
+        entry = self.cache_dir + '/' + key
+        if not os.path.isfile(entry + '/' + libname):
+            self._update_statistics(hit=False)
+            return False
+
+        # Copy to a temporary file first, other processes might load the target
+        shutil.copy(entry + '/' + libname, target + '.tmp')
+        os.replace(target + '.tmp', target)
+
+        # LRU: mark the entry as recently used
+        os.utime(entry, None)
+
+        self._update_statistics(hit=True)
+        return True
+
+    def store(self, key, libname, source):
+        """
+        Adds the library file *source* to the cache under *key* and removes the least
+        recently used entries if the cache exceeds its size limit.
+        """
+        entry = self.cache_dir + '/' + key
+        try:
+            os.makedirs(entry, exist_ok=True)
+            # Several jobs might compile the same network at the same time,
+            # therefore we write to a process-specific file and rename it.
+            tmp_file = entry + '/' + libname + '.' + str(os.getpid())
+            shutil.copy(source, tmp_file)
+            os.replace(tmp_file, entry + '/' + libname)
+        except OSError as err:
+            Messages._warning("Could not store the library in the compilation cache:", err)
+            return
+
+        self.evict()
+
+    def entries(self):
+        """
+        Returns a list of tuples (last access, size in bytes, path) for all cache entries.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        res = []
+        for key in os.listdir(self.cache_dir):
+            entry = self.cache_dir + '/' + key
+            if not os.path.isdir(entry):
+                continue
+            size = 0
+            for fname in os.listdir(entry):
+                try:
+                    size += os.path.getsize(entry + '/' + fname)
+                except OSError:
+                    pass
+            try:
+                res.append((os.path.getmtime(entry), size, entry))
+            except OSError:
+                # removed by a concurrent process
+                continue
+
+        return res
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the size limit is respected.
+        """
+        entries = sorted(self.entries())
+        total_size = sum([size for _, size, _ in entries])
+
+        while total_size > self.max_size and len(entries) > 1:
+            _, size, entry = entries.pop(0)
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def statistics(self):
+        """
+        Returns a dictionary containing the number of hits and misses, the number of entries and the size of the cache in bytes.
+        """
+        stats = {'hits': 0, 'misses': 0}
+        try:
+            with open(self.cache_dir + '/statistics.json', 'r') as rfile:
+                stats.update(json.load(rfile))
+        except (OSError, ValueError):
+            pass
+
+        entries = self.entries()
+        stats['entries'] = len(entries)
+        stats['size'] = sum([size for _, size, _ in entries])
+
+        return stats
+
+    def _update_statistics(self, hit):
+        """
+        Increments the hit or miss counter. The counters are stored next to the
+        entries so they are accumulated over all runs sharing the cache.
+        """
+        stats = {'hits': 0, 'misses': 0}
+        try:
+            with open(self.cache_dir + '/statistics.json', 'r') as rfile:
+                stats.update(json.load(rfile))
+        except (OSError, ValueError):
+            pass
+
+        stats['hits' if hit else 'misses'] += 1
+        stats['last_access'] = time.time()
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = self.cache_dir + '/statistics.json.' + str(os.getpid())
+            with open(tmp_file, 'w') as wfile:
+                json.dump(stats, wfile)
+            os.replace(tmp_file, self.cache_dir + '/statistics.json')
+        except OSError:
+            # statistics are only informative
+            pass
+
+def compilation_cache_statistics(print_stats=True):
+    """
+    Returns (and prints by default) the hit/miss statistics of the compilation cache.
+
+    The cache is enabled with `setup(compilation_cache=True)`:
+
+    ```python
+    ann.setup(compilation_cache=True)
+    ...
+    ann.compile()
+    ann.compilation_cache_statistics()
+    ```
+
+    :param print_stats: print the statistics on the console.
+    :returns: a dictionary with the keys 'hits', 'misses', 'entries' and 'size' (in bytes).
+    """
+    from ANNarchy.core.Global import _bytes_human_readable
+
+    cache = CompilationCache()
+    stats = cache.statistics()
+
+    if print_stats:
+        total = stats['hits'] + stats['misses']
+        ratio = 100.0 * stats['hits'] / total if total > 0 else 0.0
+        Messages._print("Compilation cache:", cache.cache_dir)
+        Messages._print("  hits:", stats['hits'], "misses:", stats['misses'], "(hit rate: %.1f %%)" % ratio)
+        Messages._print("  entries:", stats['entries'], "size:", _bytes_human_readable(stats['size']), "/", _bytes_human_readable(cache.max_size))
+
+    return stats
+
+def clear_compilation_cache():
+    """
+    Removes all libraries stored in the compilation cache and resets the statistics.
+    """
+    CompilationCache().clear()
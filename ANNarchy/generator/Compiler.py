@@ -3,7 +3,7 @@
 :license: GPLv2, see LICENSE for details.
 """
 
-import os, sys, importlib
+import os, sys
 import subprocess
 import shutil
 import multiprocessing
@@ -15,17 +15,16 @@ import numpy as np
 import ANNarchy
 
 from ANNarchy.intern.NetworkManager import NetworkManager
+from ANNarchy.intern.SharedLibraryManager import SharedLibraryManager
 from ANNarchy.intern.Profiler import Profiler
 from ANNarchy.intern.ConfigManagement import get_global_config, _update_global_config, _check_paradigm
 from ANNarchy.intern.GlobalObjects import GlobalObjectManager
 from ANNarchy.intern import Messages
 
-from ANNarchy.extensions.bold.NormProjection import _update_num_aff_connections
 from ANNarchy.generator.Template.MakefileTemplate import *
-from ANNarchy.generator.CodeGenerator import CodeGenerator
+from ANNarchy.generator.CompilationCache import CompilationCache
 from ANNarchy.generator.Sanity import check_structure, check_experimental_features
 from ANNarchy.generator.Utils import check_cuda_version
-from ANNarchy.parser.report.Report import report
 
 from packaging.version import parse as parse_version
 
@@ -85,6 +84,7 @@ def compile(
         silent=False,
         debug_build=False,
         profile_enabled=False,
+        jobs=None,
         net_id=0
     ):
     """
@@ -106,6 +106,7 @@ def compile(
     :param cuda_config: dictionary defining the CUDA configuration for each population and projection.
     :param annarchy_json: compiler flags etc can be stored in a .json file normally placed in the home directory (see comment below). With this flag one can directly assign a file location.
     :param silent: defines if status message like "Compiling... OK" should be printed.
+    :param jobs: number of parallel jobs used by make. If set to None, the number of available CPU cores is used.
     """
     # Check if the network has already been compiled
     if NetworkManager().is_compiled(net_id=net_id):
@@ -214,6 +215,7 @@ def compile(
         cuda_config=cuda_config,
         debug_build=debug_build,
         profile_enabled=profile_enabled,
+        jobs=jobs,
         populations=populations,
         projections=projections,
         net_id=net_id
@@ -229,14 +231,18 @@ def compile(
     # Create the Python objects
     _instantiate(compiler.net_id, cuda_config=compiler.cuda_config, user_config=compiler.user_config)
 
-    # NormProjections require an update of afferent projections
-    _update_num_aff_connections(compiler.net_id)
+    # NormProjections require an update of afferent projections (only
+    # possible if the bold extension was imported)
+    if 'ANNarchy.extensions.bold' in sys.modules:
+        from ANNarchy.extensions.bold.NormProjection import _update_num_aff_connections
+        _update_num_aff_connections(compiler.net_id)
 
     if get_global_config('verbose'):
         Messages._print('OK')
 
     # Create a report if requested
     if options.report is not None:
+        from ANNarchy.parser.report.Report import report
         report(options.report)
 
 def python_environment():
@@ -309,7 +315,7 @@ class Compiler(object):
     " Main class to generate C++ code efficiently"
 
     def __init__(self, annarchy_dir, clean, compiler, compiler_flags, add_sources, extra_libs, path_to_json, silent, cuda_config, debug_build,
-                 profile_enabled, populations, projections, net_id):
+                 profile_enabled, populations, projections, net_id, jobs=None):
 
         # Store arguments
         self.annarchy_dir = annarchy_dir
@@ -325,6 +331,7 @@ class Compiler(object):
         self.populations = populations
         self.projections = projections
         self.net_id = net_id
+        self.jobs = jobs if jobs is not None else multiprocessing.cpu_count()
 
         # Get user-defined config
         self.user_config = {
@@ -392,19 +399,21 @@ class Compiler(object):
 
         # Perform compilation if something has changed
         if changed or not os.path.isfile(self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'):
-            self.compilation()
+            if get_global_config('compilation_cache'):
+                self.cached_compilation()
+            else:
+                self.compilation()
 
         if get_global_config('debug') or get_global_config('disable_shared_library_time_offset'):
             # In case of debugging or high-throughput simulations we want to
             # disable the below trick
             NetworkManager().set_code_directory(net_id=self.net_id, directory=self.annarchy_dir)
         else:
-            # Store the library in random subfolder
+            # Store the library in a subfolder named after its content.
             # We circumvent with this an issue with reloading of shared libraries
             # see PEP 489: (https://www.python.org/dev/peps/pep-0489/) for more details
-            NetworkManager().set_code_directory(net_id=self.net_id, directory=self.annarchy_dir+'/run_'+str(time.time()))
-            os.mkdir(NetworkManager().get_code_directory(net_id=self.net_id))
-            shutil.copy(self.annarchy_dir+'/ANNarchyCore' + str(self.net_id) + '.so', NetworkManager().get_code_directory(net_id=self.net_id))
+            directory = SharedLibraryManager().prepare(self.annarchy_dir, 'ANNarchyCore' + str(self.net_id))
+            NetworkManager().set_code_directory(net_id=self.net_id, directory=directory)
 
         NetworkManager().set_compiled(net_id=self.net_id)
         if Profiler().enabled:
@@ -455,18 +464,43 @@ class Compiler(object):
                 if file.endswith(".log"):
                     continue
                 basename, extension = os.path.splitext(file)
-                if not extension in ['h', 'hpp', 'cpp', 'cu']: # ex: .o
+                if not extension in ['.h', '.hpp', '.cpp', '.cu']: # ex: .o
                     continue
                 if not os.path.isfile(self.annarchy_dir+'/generate/net'+ str(self.net_id) + '/' + file):
                     if file.startswith('ANNarchyCore'):
                         continue
                     os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + file)
-                    if os.path.isfile(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + '.o'):
-                        os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + '.o')
+                    # remove the object and dependency files of a removed translation unit
+                    for suffix in ['.o', '.d']:
+                        if os.path.isfile(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + suffix):
+                            os.remove(self.annarchy_dir+'/build/net'+ str(self.net_id) + '/' + basename + suffix)
                     changed = True
 
         return changed
 
+    def cached_compilation(self):
+        """
+        Look up the library in the compilation cache before calling make. On a miss,
+        the library is compiled and then stored in the cache.
+        """
+        cache = CompilationCache()
+        key = cache.compute_key(self.annarchy_dir + '/generate/net' + str(self.net_id))
+        libname = 'ANNarchyCore' + str(self.net_id) + '.so'
+
+        if cache.lookup(key, libname, self.annarchy_dir + '/' + libname):
+            if not self.silent:
+                Messages._print('Compiling ... OK (cached library)')
+            if get_global_config('verbose'):
+                Messages._print('Library', libname, 'was found in the compilation cache (key: '+key+')')
+
+            # Note that the last compilation was successful
+            with open(self.annarchy_dir + '/compilation', 'w') as wfile:
+                wfile.write("1")
+            return
+
+        self.compilation()
+        cache.store(key, libname, self.annarchy_dir + '/' + libname)
+
     def compilation(self):
         """ Create ANNarchyCore.so and py extensions if something has changed. """
         # STDOUT
@@ -490,7 +524,7 @@ class Compiler(object):
         verbose = "> compile_stdout.log 2> compile_stderr.log" if not get_global_config('verbose') else ""
 
         # Start the compilation process
-        make_process = subprocess.Popen("make all -j4" + verbose, shell=True)
+        make_process = subprocess.Popen("make all -j" + str(self.jobs) + " " + verbose, shell=True)
 
         # Check for errors
         if make_process.wait() != 0:
@@ -626,8 +660,17 @@ class Compiler(object):
             # Windows: to test....
             Messages._warning("Compilation on windows is not supported yet. We recommend to use WSL on windows systems.")
 
+        # Translation units: the folder might contain files from
+        # previous compilations, so the sources are listed explicitly
+        sources = "ANNarchy.cpp"
+        for pop in self.populations:
+            sources += " pop" + str(pop.id) + ".cpp"
+        for proj in self.projections:
+            sources += " proj" + str(proj.id) + ".cpp"
+
         # Gather all Makefile flags
         makefile_flags = {
+            'sources': sources,
             'compiler': self.compiler,
             'add_sources': self.add_sources,
             'cpu_flags': cpu_flags,
@@ -660,6 +703,9 @@ class Compiler(object):
         """
         Code generation dependent on paradigm
         """
+        # The code generators import the parser (sympy), they are only loaded when needed
+        from ANNarchy.generator.CodeGenerator import CodeGenerator
+
         generator = CodeGenerator(self.annarchy_dir, self.populations, self.projections, self.net_id, self.cuda_config)
         generator.generate()
 
@@ -669,33 +715,21 @@ def load_cython_lib(libname, libpath):
     Load the shared library created by Cython using importlib. Follows the example
     "Multiple modules in one library" in PEP 489.
 
-    TODO:
-
     As described in PEP 489 "Module Reloading" a reloading of dynamic extension modules is
-    not supported. This leads to some problems for our reusage of the ANNarchyCore library ...
+    not supported. The SharedLibraryManager therefore ensures that a library is never loaded
+    twice from the same path and measures the loading time.
 
     Sources:
 
     PEP 489: (https://www.python.org/dev/peps/pep-0489/)
     """
-    # create a loader to mimic find module
-    loader = importlib.machinery.ExtensionFileLoader(libname, libpath)
-    spec = importlib.util.spec_from_loader(libname, loader)
-    module = importlib.util.module_from_spec(spec)
-
-    if get_global_config('verbose'):
-        Messages._print('Loading library...', libname, libpath)
-
-    loader.exec_module(module)
-
-    if get_global_config('verbose'):
-        Messages._print('Library loaded.')
+    return SharedLibraryManager().load(libname, libpath)
 
-    return module
-
-def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_list=None):
+def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_list=None, libname=None):
     """ After every is compiled, actually create the Cython objects and
-        bind them to the Python ones."""
+        bind them to the Python ones.
+
+        *libname* overrides the name of the library (ANNarchyCore<import_id>), e.g. for precompiled networks."""
     if Profiler().enabled:
         t0 = time.time()
         Profiler().add_entry(t0, t0, "overall", "instantiate") # placeholder, to have the correct ordering
@@ -706,12 +740,19 @@ def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_
 
     # subdirectory where the library lies
     annarchy_dir = NetworkManager().get_code_directory(net_id=import_id)
-    libname = 'ANNarchyCore' + str(import_id)
+    if libname is None:
+        libname = 'ANNarchyCore' + str(import_id)
     libpath = annarchy_dir + '/' + libname + '.so'
 
+    if Profiler().enabled:
+        t_load = time.time()
+
     cython_module = load_cython_lib(libname, libpath)
     NetworkManager().set_cy_instance(net_id=net_id, instance=cython_module)
 
+    if Profiler().enabled:
+        Profiler().add_entry(t_load, time.time(), "load library", "instantiate")
+
     # Set the CUDA device
     if _check_paradigm("cuda"):
         device = 0
@@ -172,8 +172,8 @@ class MonitorGenerator(object):
             struct_code += base_tpl['struct'] % rec_dict
             init_code += base_tpl['init'] % rec_dict
             recording_code += base_tpl['record'][get_global_config('paradigm')] % rec_dict
-            size_in_bytes += base_tpl['size_in_bytes'][get_global_config('paradigm')] % rec_dict
-            clear_code += base_tpl['clear'][get_global_config('paradigm')] % rec_dict
+            size_in_bytes += base_tpl['size_in_bytes'] % rec_dict
+            clear_code += base_tpl['clear'] % rec_dict
 
             # Record axon spike events
             if pop.neuron_type.axon_spike:
@@ -187,6 +187,8 @@ class MonitorGenerator(object):
                 struct_code += base_tpl['struct'] % rec_dict
                 init_code += base_tpl['init'] % rec_dict
                 recording_code += base_tpl['record'][get_global_config('paradigm')] % rec_dict
+                size_in_bytes += base_tpl['size_in_bytes'] % rec_dict
+                clear_code += base_tpl['clear'] % rec_dict
 
         ids = {
             'id': pop.id,
@@ -215,6 +215,24 @@ attribute_acc = {
             %(write_dirty_flag)s
             return;
         }
+""",
+    'local_get_subset': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            %(read_dirty_flag)s
+            for (auto it = ranks.cbegin(); it != ranks.cend(); it++)
+                values.push_back(%(name)s[*it]);
+            return values;
+        }
+""",
+    'local_set_subset': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            for (int i = 0; i < ranks.size(); i++)
+                %(name)s[ranks[i]] = value[i];
+            %(write_dirty_flag)s
+            return;
+        }
 """,
     'global_get': """
         // Global %(attr_type)s %(name)s
@@ -264,6 +282,25 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+
+    // Gather/scatter of the values of a subset of neurons (see PopulationView)
+    std::vector<%(ctype)s> get_local_attribute_subset_%(ctype_name)s(std::string name, std::vector<int> ranks) {
+        std::vector<%(ctype)s> values;
+        values.reserve(ranks.size());
+%(local_get_subset)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::get_local_attribute_subset_%(ctype_name)s: " << name << " not found" << std::endl;
+        return values;
+    }
+
+    void set_local_attribute_subset_%(ctype_name)s(std::string name, std::vector<int> ranks, std::vector<%(ctype)s> value) {
+        assert( (ranks.size() == value.size()) );
+%(local_set_subset)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::set_local_attribute_subset_%(ctype_name)s: " << name << " not found" << std::endl;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -173,6 +173,11 @@ class OpenMPGenerator(PopulationGenerator):
         if 'update_global_ops' in pop._specific_template.keys():
             update_global_ops = pop._specific_template['update_global_ops']
 
+        # The partial results of parallel reductions are also required by specific populations
+        declare_partials, init_partials = self._globalops_partials(pop)
+        declare_additional += declare_partials
+        init_additional += init_partials
+
         # Fill the template
         code = self._templates['population_header'] % {
             # version tag
@@ -311,15 +316,15 @@ class OpenMPGenerator(PopulationGenerator):
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    DelayBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    DelayBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
         else:
             # Spiking networks should only exchange spikes
             declare_code += """
     // Delays for spike population
-    std::deque< std::vector<int> > _delayed_spike;
+    DelayBuffer< std::vector<int> > _delayed_spike;
 """
             for var in pop.delayed_variables:
                 attr = self._get_attr(pop, var)
@@ -327,10 +332,10 @@ class OpenMPGenerator(PopulationGenerator):
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    DelayBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    DelayBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
 
         # Initialization
         init_code = """
@@ -353,18 +358,16 @@ class OpenMPGenerator(PopulationGenerator):
         # Delaying spike events is done differently
         if pop.neuron_type.type == 'spike':
             init_code += """
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike = DelayBuffer< std::vector<int> >(max_delay, std::vector<int>());"""
 
             update_code += """
             #pragma omp single
             {
-                _delayed_spike.push_front(spiked);
-                _delayed_spike.pop_back();
+                _delayed_spike.push(spiked);
             }
 """
             reset_code += """
-        _delayed_spike.clear();
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike.fill(std::vector<int>());"""
 
             resize_code += """
         _delayed_spike.resize(max_delay, std::vector<int>());
@@ -536,6 +539,30 @@ class OpenMPGenerator(PopulationGenerator):
     ##################################################
     # Global operations
     ##################################################
+    def _parallel_globalops(self, pop):
+        """
+        Global operations are computed with parallel reductions if the population is large enough,
+        otherwise the overhead of the synchronization between the threads outweighs the gain.
+        """
+        return pop.size >= max(Global.OMP_MIN_NB_GLOBAL_OPS, get_global_config('num_threads'))
+
+    def _globalops_partials(self, pop):
+        """
+        The parallel reductions store the partial result of each thread in an array, which
+        is allocated in init_population() as the number of threads is known at this point.
+        """
+        if len(pop.global_operations) == 0 or not self._parallel_globalops(pop):
+            return "", ""
+
+        declare = "\n    // Partial results of the threads for the global operations\n"
+        init = "\n        // Partial results of the threads for the global operations\n"
+        for op in pop.global_operations:
+            ids = {'op': op['function'], 'var': op['variable'], 'type': get_global_config('precision')}
+            declare += "    std::vector<%(type)s> _partial_%(op)s_%(var)s;\n" % ids
+            init += "        _partial_%(op)s_%(var)s = std::vector<%(type)s>(global_num_threads, 0.0);\n" % ids
+
+        return declare, init
+
     def _update_globalops(self, pop):
         """
         Update of global functions is a call of pre-implemented functions defined in GlobalOperationTemplate. In case
@@ -543,14 +570,16 @@ class OpenMPGenerator(PopulationGenerator):
 
         We consider two cases:
 
-        a) the number of neurons is small, then we compute the operation thread-wise with openMP tasks (TODO: overhead??)
-        b) the number of neurons is high enough for a parallel implementation, where we first compute the local result
-           and then reduce over all available threads.
+        a) the number of neurons is small (below Global.OMP_MIN_NB_GLOBAL_OPS), then we compute the operations
+           thread-wise with openMP tasks.
+        b) the number of neurons is high enough for a parallel implementation, where each thread first computes
+           the result on its chunk of the array. The partial results are then combined pairwise in a tree, which
+           requires log2(nt) synchronizations.
         """
         if len(pop.global_operations) == 0:
             return ""
 
-        if True: # parallel reduction is currently disabled
+        if not self._parallel_globalops(pop):
             from ANNarchy.generator.Template.GlobalOperationTemplate import global_operation_templates_st_call as call_template
 
             code = ""
@@ -571,16 +600,35 @@ class OpenMPGenerator(PopulationGenerator):
         else:
             from ANNarchy.generator.Template.GlobalOperationTemplate import global_operation_templates_omp_call as call_template
             from ANNarchy.generator.Template.GlobalOperationTemplate import global_operation_templates_omp_reduce as red_template
+            from ANNarchy.generator.Template.GlobalOperationTemplate import global_operation_templates_omp_result as res_template
 
-            code = ""
+            call_code = ""
+            red_code = ""
+            res_code = ""
             for op in pop.global_operations:
-                code += call_template[op['function']] % {'var': op['variable'] }
-                code += red_template[op['function']] % {'var': op['variable'] }
+                call_code += call_template[op['function']] % {'var': op['variable'] }
+                red_code += red_template[op['function']] % {'var': op['variable'] }
+                res_code += res_template[op['function']] % {'var': op['variable'] }
 
             return """
         if ( _active ){
-%(code)s
-        }""" % {'code': tabify(code,3)}
+            // partial results on the chunk of each thread
+            int beg = static_cast<int>((static_cast<long int>(size) * tid) / nt);
+            int end = static_cast<int>((static_cast<long int>(size) * (tid+1)) / nt);
+%(call)s
+            // tree reduction: the thread 0 holds the final results
+            for (int stride = 1; stride < nt; stride *= 2) {
+                #pragma omp barrier
+                if ( (tid %% (2*stride) == 0) && (tid + stride < nt) ) {
+%(reduce)s
+                }
+            }
+
+            if (tid == 0) {
+%(result)s
+            }
+            #pragma omp barrier
+        }""" % {'call': tabify(call_code, 3), 'reduce': tabify(red_code, 5), 'result': tabify(res_code, 4)}
 
     def _update_random_distributions(self, pop):
         """
@@ -523,6 +523,9 @@ _spike_history.shrink_to_fit();
         accessors = ""
 
         for ctype in code_ids_per_type.keys():
+            local_attribute_get_ptr = ""
+            local_attribute_get_subset = ""
+            local_attribute_set_subset = ""
             local_attribute_get1 = ""
             local_attribute_get2 = ""
             local_attribute_set1 = ""
@@ -541,6 +544,16 @@ _spike_history.shrink_to_fit();
                     local_attribute_set1 += self._templates["attr_acc"]["local_set_all"] % ids
                     local_attribute_set2 += self._templates["attr_acc"]["local_set_single"] % ids
 
+                    # Raw pointers for zero-copy views (not for the spike list, which changes
+                    # its size, and std::vector<bool> which has no contiguous storage)
+                    if 'local_get_ptr' in self._templates["attr_acc"] and ctype != "bool" and ids['name'] != "spiked":
+                        local_attribute_get_ptr += self._templates["attr_acc"]["local_get_ptr"] % ids
+
+                    # Gather/scatter of a subset of neurons (the spike list is not indexed by ranks)
+                    if ids['name'] != "spiked":
+                        local_attribute_get_subset += self._templates["attr_acc"]["local_get_subset"] % ids
+                        local_attribute_set_subset += self._templates["attr_acc"]["local_set_subset"] % ids
+
                 elif locality == "global":
                     global_attribute_get += self._templates["attr_acc"]["global_get"] % ids
                     global_attribute_set += self._templates["attr_acc"]["global_set"] % ids
@@ -559,6 +572,9 @@ _spike_history.shrink_to_fit();
             # build up the final codes
             if local_attribute_get1 != "":
                 accessors += self._templates["accessor_template"]["local"] % {
+                    'local_get_ptr' : local_attribute_get_ptr,
+                    'local_get_subset' : local_attribute_get_subset,
+                    'local_set_subset' : local_attribute_set_subset,
                     'local_get1' : local_attribute_get1,
                     'local_get2' : local_attribute_get2,
                     'local_set1' : local_attribute_set1,
@@ -17,6 +17,7 @@ population_header = """/*
 #pragma once
 
 #include "ANNarchy.h"
+#include "DelayBuffer.hpp"
 #include <random>
 
 %(include_additional)s
@@ -166,6 +167,12 @@ attribute_acc = {
         if ( name.compare("%(name)s") == 0 ) {
             return %(name)s;
         }
+""",
+    'local_get_ptr': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            return %(name)s.data();
+        }
 """,
     'local_get_single': """
         // Local %(attr_type)s %(name)s
@@ -186,6 +193,22 @@ attribute_acc = {
             %(name)s[rk] = value;
             return;
         }
+""",
+    'local_get_subset': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            for (auto it = ranks.cbegin(); it != ranks.cend(); it++)
+                values.push_back(%(name)s[*it]);
+            return values;
+        }
+""",
+    'local_set_subset': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            for (int i = 0; i < ranks.size(); i++)
+                %(name)s[ranks[i]] = value[i];
+            return;
+        }
 """,
     'global_get': """
         // Global %(attr_type)s %(name)s
@@ -220,6 +243,15 @@ attribute_template = {
         return std::vector<%(ctype)s>();
     }
 
+    // Raw pointer onto the storage of the attribute (zero-copy views, see Population.view())
+    %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(std::string name) {
+%(local_get_ptr)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::get_local_attribute_ptr_%(ctype_name)s: " << name << " not found" << std::endl;
+        return nullptr;
+    }
+
     %(ctype)s get_local_attribute_%(ctype_name)s(std::string name, int rk) {
         assert( (rk < size) );
 %(local_get2)s
@@ -244,6 +276,25 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+
+    // Gather/scatter of the values of a subset of neurons (see PopulationView)
+    std::vector<%(ctype)s> get_local_attribute_subset_%(ctype_name)s(std::string name, std::vector<int> ranks) {
+        std::vector<%(ctype)s> values;
+        values.reserve(ranks.size());
+%(local_get_subset)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::get_local_attribute_subset_%(ctype_name)s: " << name << " not found" << std::endl;
+        return values;
+    }
+
+    void set_local_attribute_subset_%(ctype_name)s(std::string name, std::vector<int> ranks, std::vector<%(ctype)s> value) {
+        assert( (ranks.size() == value.size()) );
+%(local_set_subset)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::set_local_attribute_subset_%(ctype_name)s: " << name << " not found" << std::endl;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -284,16 +335,13 @@ attribute_cpp_init = {
 attribute_delayed = {
     'local': {
         'init': """
-        _delayed_%(name)s = std::deque< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
+        _delayed_%(name)s = DelayBuffer< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
 
         'update': """
-        _delayed_%(name)s.push_front(%(name)s);
-        _delayed_%(name)s.pop_back();
+        _delayed_%(name)s.push(%(name)s);
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
     _delayed_%(name)s.resize(max_delay, std::vector< %(type)s >(size, 0.0));
@@ -301,15 +349,12 @@ attribute_delayed = {
     },
     'global':{
         'init': """
-        _delayed_%(name)s = std::deque< %(type)s >(max_delay, 0.0);""",
+        _delayed_%(name)s = DelayBuffer< %(type)s >(max_delay, 0.0);""",
         'update': """
-        _delayed_%(name)s.push_front(%(name)s);
-        _delayed_%(name)s.pop_back();
+        _delayed_%(name)s.push(%(name)s);
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
     _delayed_%(name)s.resize(max_delay, 0.0);
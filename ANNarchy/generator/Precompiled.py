@@ -0,0 +1,335 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import os
+import sys
+import json
+import pickle
+import shutil
+
+import ANNarchy
+
+from ANNarchy.core.Constant import Constant
+from ANNarchy.core.Neuron import Neuron
+from ANNarchy.core.Synapse import Synapse
+from ANNarchy.core.Population import Population
+from ANNarchy.core.PopulationView import PopulationView
+from ANNarchy.core.Projection import Projection
+from ANNarchy.core.Monitor import Monitor
+from ANNarchy.intern.NetworkManager import NetworkManager
+from ANNarchy.intern.SharedLibraryManager import SharedLibraryManager
+from ANNarchy.intern.GlobalObjects import GlobalObjectManager
+from ANNarchy.intern.ConfigManagement import get_global_config, _update_global_config
+from ANNarchy.intern import Messages
+from ANNarchy.generator.Compiler import _instantiate
+
+# Global settings which must be identical to the ones used during compilation
+_exported_config = ['paradigm', 'precision', 'only_int_idx_type', 'dt', 'structural_plasticity', 'num_threads', 'disable_parallel_rng', 'batch_size']
+
+# Projection flags which are set by connect_XXX() or the code generator and influence the Cython wrapper
+_projection_flags = ['_single_constant_weight', '_storage_format', '_storage_order', '_no_split_matrix', '_parallel_pattern', '_has_pop_view', '_saveable']
+
+def export_compiled(directory:str, net_id:int=0) -> None:
+    """
+    Exports the compiled network into a self-contained folder, which can be instantiated with `load_compiled()`
+    without re-running the script defining the network:
+
+    ```python
+    ann.compile()
+    ann.export_compiled('artifact/')
+    ```
+
+    The folder contains:
+
+    * the shared library (ANNarchyCore*.so),
+    * *manifest.json*: the global configuration, the constants and the populations, projections and monitors with the C++ type of their attributes,
+    * *models.pkl*: the analysed neuron and synapse types and the initial values of the attributes (pickled),
+    * *projX.npz*: the connectivity (ranks, weights and delays) of each projection.
+
+    The current values of the other attributes are not exported, use `save()` and `load()` for this purpose.
+    Specific populations and projections (e.g. `SpikeSourceArray`) and extensions are not supported.
+
+    :param directory: folder where the network is exported. It is created if necessary.
+    :param net_id: id of the network (default: 0, the global network).
+    """
+    if not NetworkManager().is_compiled(net_id=net_id):
+        Messages._error('export_compiled(): the network has not been compiled yet.')
+
+    code_dir = NetworkManager().get_code_directory(net_id=net_id)
+    libname = 'ANNarchyCore' + str(net_id)
+    if code_dir is None or not os.path.isfile(code_dir + '/' + libname + '.so'):
+        Messages._error('export_compiled(): the library of the network', net_id, 'was not found.')
+
+    if len(NetworkManager().get_extensions(net_id=net_id)) > 0:
+        Messages._error('export_compiled(): networks using extensions can not be exported.')
+
+    populations = NetworkManager().get_populations(net_id=net_id)
+    projections = NetworkManager().get_projections(net_id=net_id)
+    monitors = NetworkManager().get_monitors(net_id=net_id)
+
+    for obj in populations + projections:
+        if obj._specific_template != {}:
+            Messages._error('export_compiled():', obj.name, 'is a', type(obj).__name__, ', specific populations and projections can not be exported.')
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    shutil.copy(code_dir + '/' + libname + '.so', directory + '/' + libname + '.so')
+
+    manifest = {
+        'release': ANNarchy.__release__,
+        'python': '%d.%d' % sys.version_info[:2],
+        'library': libname,
+        'config': {key: get_global_config(key) for key in _exported_config},
+        'constants': {obj.name: float(obj.value) for obj in GlobalObjectManager().get_constants()},
+        'populations': [],
+        'projections': [],
+        'monitors': [],
+    }
+    models = {'populations': {}, 'projections': {}}
+
+    for pop in populations:
+        manifest['populations'].append({
+            'id': pop.id,
+            'name': pop.name,
+            'geometry': list(pop.geometry),
+            'neuron': pop.neuron_type.name,
+            'type': pop.neuron_type.type,
+            'stop_condition': pop.stop_condition,
+            'storage_order': pop._storage_order,
+            'max_delay': int(pop.max_delay),
+            'enabled': bool(pop.enabled),
+            'compute_mean_fr': float(pop._compute_mean_fr),
+            'global_operations': pop.global_operations,
+            'attributes': _attributes(pop.neuron_type.description),
+        })
+        models['populations'][pop.id] = {'neuron': pop.neuron_type.__dict__, 'init': pop.init}
+
+    for proj in projections:
+        filename = 'proj' + str(proj.id) + '.npz'
+        proj.save_connectivity(directory + '/' + filename)
+
+        entry = {
+            'id': proj.id,
+            'name': proj.name,
+            'pre': _population_reference(proj.pre),
+            'post': _population_reference(proj.post),
+            'target': proj.target,
+            'synapse': proj.synapse_type.name,
+            'disable_omp': bool(proj.disable_omp),
+            'max_delay': int(proj.max_delay),
+            'uniform_delay': int(proj.uniform_delay),
+            'connectivity': filename,
+            'flags': {flag: getattr(proj, flag) for flag in _projection_flags},
+            'attributes': _attributes(proj.synapse_type.description),
+        }
+        if hasattr(proj, '_bsr_size'):
+            entry['flags']['_bsr_size'] = proj._bsr_size
+
+        manifest['projections'].append(entry)
+        models['projections'][proj.id] = {'synapse': proj.synapse_type.__dict__, 'init': proj.init}
+
+    for monitor in monitors:
+        if isinstance(monitor.object, Projection):
+            reference = {'projection': monitor.object.id}
+        elif isinstance(monitor.object, (Population, PopulationView)):
+            reference = _population_reference(monitor.object)
+        else:
+            Messages._error('export_compiled(): monitors on', type(monitor.object).__name__, 'objects can not be exported.')
+
+        manifest['monitors'].append({
+            'object': reference,
+            'variables': monitor._variables,
+            'period': float(monitor.period),
+            'period_offset': float(monitor.period_offset),
+            'start': bool(monitor._start),
+            'spill_dir': monitor._spill_dir,
+            'flush_every': monitor._flush_every,
+        })
+
+    with open(directory + '/manifest.json', 'w') as wfile:
+        json.dump(manifest, wfile, indent=2)
+
+    with open(directory + '/models.pkl', 'wb') as wfile:
+        _ModelPickler(wfile, protocol=pickle.HIGHEST_PROTOCOL).dump(models)
+
+def load_compiled(directory:str, num_threads:int=None) -> dict:
+    """
+    Instantiates a network exported with `export_compiled()`. The neuron and synapse types are neither parsed
+    nor is any code generated or compiled, the shared library is directly loaded:
+
+    ```python
+    import ANNarchy as ann
+
+    net = ann.load_compiled('artifact/')
+    pop = net['populations']['pop0']
+    ann.simulate(1000.)
+    ```
+
+    The objects are added to the global network, which must be empty. The global configuration used during
+    the compilation (paradigm, floating precision, *dt*...) is restored.
+
+    :param directory: folder containing the exported network.
+    :param num_threads: number of threads used by the simulation (openMP only). By default, the number of threads used during the export. As the code generated for a single thread differs from the parallel one, a library exported with one thread can not be run with several threads and vice versa.
+    :returns: a dictionary with the keys 'populations', 'projections' and 'monitors', mapping the names of the objects to the objects (the monitors are a list).
+    """
+    if not os.path.isfile(directory + '/manifest.json'):
+        Messages._error('load_compiled(): no exported network found in', directory)
+
+    with open(directory + '/manifest.json', 'r') as rfile:
+        manifest = json.load(rfile)
+
+    # Sanity checks
+    if manifest['release'] != ANNarchy.__release__:
+        Messages._error('load_compiled(): the network was exported with ANNarchy', manifest['release'], ', the current version is', ANNarchy.__release__)
+    if manifest['python'] != '%d.%d' % sys.version_info[:2]:
+        Messages._error('load_compiled(): the network was exported with Python', manifest['python'], ', the library can not be loaded with Python', '%d.%d' % sys.version_info[:2])
+    exported_threads = manifest['config'].get('num_threads') or 1
+    if num_threads is not None and (num_threads > 1) != (exported_threads > 1):
+        Messages._error('load_compiled(): the library was generated for', exported_threads, 'thread(s), it can not be run with', num_threads, 'thread(s).')
+    if NetworkManager().is_compiled(net_id=0) or NetworkManager().number_populations(net_id=0) > 0:
+        Messages._error('load_compiled(): the global network is not empty, call clear() first.')
+
+    # Global configuration
+    for key, value in manifest['config'].items():
+        _update_global_config(key, value)
+    if num_threads is not None:
+        _update_global_config('num_threads', num_threads)
+
+    # Constants
+    for name, value in manifest['constants'].items():
+        constant = GlobalObjectManager().get_constant(name)
+        if constant is None:
+            Constant(name, value)
+        else:
+            constant.value = value
+
+    # Neuron/synapse types and initial values, the constants must exist
+    with open(directory + '/models.pkl', 'rb') as rfile:
+        models = _ModelUnpickler(rfile).load()
+
+    # Populations
+    populations = {}
+    for entry in manifest['populations']:
+        model = models['populations'][entry['id']]
+        neuron = _restore_type(Neuron, model['neuron'])
+
+        pop = Population(geometry=tuple(entry['geometry']), neuron=neuron, name=entry['name'], stop_condition=entry['stop_condition'], storage_order=entry['storage_order'])
+        # The generated classes are named after the ids of the exported network
+        pop.id = entry['id']
+        pop.class_name = 'pop' + str(pop.id)
+
+        pop.init.update(model['init'])
+        pop.max_delay = entry['max_delay']
+        pop.enabled = entry['enabled']
+        pop._compute_mean_fr = entry['compute_mean_fr']
+        pop.global_operations = entry['global_operations']
+        populations[pop.id] = pop
+
+    # Projections
+    projections = {}
+    for entry in manifest['projections']:
+        model = models['projections'][entry['id']]
+        synapse = _restore_type(Synapse, model['synapse'])
+
+        proj = Projection(
+            pre=_population_from_reference(entry['pre'], populations),
+            post=_population_from_reference(entry['post'], populations),
+            target=entry['target'],
+            synapse=synapse,
+            name=entry['name'],
+            disable_omp=entry['disable_omp']
+        )
+        proj.id = entry['id']
+
+        proj.connect_from_file(directory + '/' + entry['connectivity'], storage_format=entry['flags']['_storage_format'], storage_order=entry['flags']['_storage_order'])
+        for flag, value in entry['flags'].items():
+            setattr(proj, flag, value)
+        proj.max_delay = entry['max_delay']
+        proj.uniform_delay = entry['uniform_delay']
+
+        proj.init.update(model['init'])
+        projections[proj.id] = proj
+
+    # The maximal delays might have been modified by connect_from_file()
+    for entry in manifest['populations']:
+        populations[entry['id']].max_delay = entry['max_delay']
+
+    # Monitors
+    monitors = []
+    for entry in manifest['monitors']:
+        if 'projection' in entry['object']:
+            obj = projections[entry['object']['projection']]
+        else:
+            obj = _population_from_reference(entry['object'], populations)
+
+        monitors.append(Monitor(
+            obj,
+            variables=entry['variables'],
+            period=entry['period'],
+            period_offset=entry['period_offset'] if entry['period_offset'] > 0.0 else None,
+            start=entry['start'],
+            spill_dir=entry['spill_dir'],
+            flush_every=entry['flush_every']
+        ))
+
+    # Load the library, as compile() would do
+    if get_global_config('debug') or get_global_config('disable_shared_library_time_offset'):
+        code_dir = os.path.abspath(directory)
+    else:
+        code_dir = SharedLibraryManager().prepare(directory, manifest['library'])
+    NetworkManager().set_code_directory(net_id=0, directory=code_dir)
+    NetworkManager().set_compiled(net_id=0)
+    _instantiate(0, libname=manifest['library'])
+
+    return {
+        'populations': {pop.name: pop for pop in populations.values()},
+        'projections': {proj.name: proj for proj in projections.values()},
+        'monitors': monitors,
+    }
+
+def _attributes(description):
+    "Name, kind, locality and C++ type of the attributes of a neuron or synapse description."
+    attributes = []
+    for kind in ['parameters', 'variables']:
+        for attr in description[kind]:
+            attributes.append({'name': attr['name'], 'kind': kind[:-1], 'locality': attr['locality'], 'ctype': attr['ctype']})
+    return attributes
+
+class _ModelPickler(pickle.Pickler):
+    "Stores the Constant objects by name, they are re-created from the manifest."
+    def persistent_id(self, obj):
+        if isinstance(obj, Constant):
+            return obj.name
+        return None
+
+class _ModelUnpickler(pickle.Unpickler):
+    "Replaces the names stored by _ModelPickler with the current Constant objects."
+    def persistent_load(self, pid):
+        return GlobalObjectManager().get_constant(pid)
+
+def _population_reference(pop):
+    "JSON-compatible reference to a Population or PopulationView."
+    if isinstance(pop, PopulationView):
+        return {
+            'population': pop.population.id,
+            'ranks': [int(rk) for rk in pop.ranks],
+            'geometry': list(pop.geometry) if pop.geometry is not None else None
+        }
+    return {'population': pop.id}
+
+def _population_from_reference(reference, populations):
+    "Inverse of _population_reference()."
+    pop = populations[reference['population']]
+    if 'ranks' in reference:
+        geometry = tuple(reference['geometry']) if reference['geometry'] is not None else None
+        return PopulationView(pop, reference['ranks'], geometry=geometry)
+    return pop
+
+def _restore_type(cls, state):
+    "Re-creates an analysed Neuron or Synapse without calling the parser."
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
@@ -1044,6 +1044,69 @@ if (_transmission && %(post_prefix)s_active){
 } // active
 """
 
+spiking_summation_fixed_delay_outer_loop_thr = """
+// Event-based summation
+if (_transmission && %(post_prefix)s_active){
+    %(spiked_array_fusion)s
+
+    // Offset of this thread in the thread-local buffers
+    int _thr_off = tid * _thr_size;
+
+    // Iterate over all incoming spikes (possibly delayed constantly)
+    for(int _idx_j = tid; _idx_j < %(pre_array)s.size(); _idx_j += nt) {
+        // Rank of the presynaptic neuron
+        int rk_j = %(pre_array)s[_idx_j];
+
+        // Find the presynaptic neuron in the inverse connectivity matrix
+        auto inv_post_ptr = inv_pre_rank.find(rk_j);
+        if (inv_post_ptr == inv_pre_rank.end())
+            continue;
+
+        // List of postsynaptic neurons receiving spikes from that neuron
+        std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+        // Number of post neurons
+        int nb_post = inv_post.size();
+
+        // Iterate over connected post neurons
+        for(int _idx_i = 0; _idx_i < nb_post; _idx_i++){
+            // Retrieve the correct indices
+            int i = inv_post[_idx_i].first;
+            int j = inv_post[_idx_i].second;
+
+            // Event-driven integration
+            %(event_driven)s
+
+            // Remember the rows touched by this thread
+            if (!_thr_touched[_thr_off + post_rank[i]]) {
+                _thr_touched[_thr_off + post_rank[i]] = 1;
+                _thr_rows[tid].push_back(post_rank[i]);
+            }
+
+            // Update conductance (thread-local)
+            %(g_target)s
+
+            // Synaptic plasticity: pre-events
+            %(pre_event)s
+        }
+    }
+
+    // Reduce the touched rows, each row is reduced by exactly one thread
+    #pragma omp barrier
+    for (int _t = 0; _t < nt; _t++) {
+        for (int rk_post : _thr_rows[_t]) {
+            if (rk_post %% nt != tid)
+                continue;
+
+            int _thr_idx = _t * _thr_size + rk_post;
+%(thr_reduce)s
+            _thr_touched[_thr_idx] = 0;
+        }
+    }
+    #pragma omp barrier
+    _thr_rows[tid].clear();
+} // active
+"""
+
 spiking_summation_fixed_delay_inner_loop = """
 // Event-based summation
 if (_transmission && %(post_prefix)s_active) {
@@ -1434,7 +1497,8 @@ conn_templates = {
     'update_variables': update_variables,
     'spiking_sum_fixed_delay': {
         'inner_loop': spiking_summation_fixed_delay_inner_loop,
-        'outer_loop': spiking_summation_fixed_delay_outer_loop
+        'outer_loop': spiking_summation_fixed_delay_outer_loop,
+        'outer_loop_thr': spiking_summation_fixed_delay_outer_loop_thr
     },
     'spiking_sum_variable_delay': spiking_summation_variable_delay,
     'post_event': spiking_post_event,
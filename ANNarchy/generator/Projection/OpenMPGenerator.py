@@ -165,6 +165,28 @@ class OpenMPGenerator(ProjectionGenerator):
             post_slices_.push_back(std::min<int>(t*chunk_size, this->num_rows_));
 """
 
+        # Thread-local buffers for the spike propagation, allocated once
+        if proj.synapse_type.type == "spike" and self._thread_local_psp(proj, single_matrix):
+            targets = [proj.target] if isinstance(proj.target, str) else proj.target
+            declare_additional += """
+    // thread-local accumulation of the post-synaptic conductances
+    int _thr_size;
+    std::vector<char> _thr_touched;
+    std::vector<std::vector<int>> _thr_rows;"""
+            init_additional += """
+        // thread-local accumulation of the post-synaptic conductances
+        _thr_size = pop%(id_post)s.get_size();
+        _thr_touched = std::vector<char>(_thr_size * global_num_threads, 0);
+        _thr_rows = std::vector<std::vector<int>>(global_num_threads, std::vector<int>());""" % {'id_post': proj.post.id}
+            for target in targets:
+                declare_additional += """
+    std::vector<%(float_prec)s> _thr_g_%(target)s;""" % {'float_prec': get_global_config('precision'), 'target': target}
+                init_additional += """
+        _thr_g_%(target)s = std::vector<%(float_prec)s>(_thr_size * global_num_threads, 0.0);""" % {'float_prec': get_global_config('precision'), 'target': target}
+                size_in_bytes += """
+        // thread-local conductances %(target)s
+        size_in_bytes += sizeof(%(float_prec)s) * _thr_g_%(target)s.capacity();""" % {'float_prec': get_global_config('precision'), 'target': target}
+
         # Additional info (overwritten)
         include_additional = ""
         struct_additional = ""
@@ -780,27 +802,12 @@ class OpenMPGenerator(ProjectionGenerator):
         #
         # Early implementations used atomics to protect, a clear performance
         # limiter. The user ilyasm proposed a solution using shared arrays and
-        # a following reduction. Here we initialize the thread local array.
-        if proj._storage_order == "post_to_pre":
-            psp_prefix = ""
-            if not proj.disable_omp: # TODO: are there other conditions?
-                psp_prefix += """
-#ifdef _OPENMP"""
-                targets = [proj.target] if type(proj.target) == str else proj.target
-                for target in targets:
-                    psp_prefix += """
-        std::vector< double > pop%(id)s_%(target)s_thr(pop%(id)s.get_size()*global_num_threads, 0.0);""" % { 'id': proj.post.id, 'target': target }
-                psp_prefix += """
-#endif
-"""
-
-            psp_prefix += """
-        int nb_post;
-        double sum;"""
-        else:
-            psp_prefix = """
+        # a following reduction. The thread local arrays are members of the
+        # projection (see _thread_local_psp()), so they are allocated only once.
+        psp_prefix = """
         int nb_post;
         double sum;"""
+        thread_local_psp = self._thread_local_psp(proj, single_matrix)
 
         # Basic tags, dependent on storage format are assuming a feedforward
         # transmission.
@@ -917,6 +924,10 @@ class OpenMPGenerator(ProjectionGenerator):
                     if proj.max_delay > 1 and proj.uniform_delay == -1: # TODO: openMP is switched off for non uniform delays
                         g_target_code += """
             %(post_prefix)sg_%(target)s%(post_index)s %(operation)s %(g_target)s
+"""% target_dict
+                    elif thread_local_psp and operation in ["+=", "-="] and not eq['bounds']:
+                        g_target_code += """
+            _thr_g_%(target)s[_thr_off + post_rank[i]] %(operation)s %(g_target)s
 """% target_dict
                     elif proj.disable_omp or get_global_config('num_threads') == 1:
                         g_target_code += """
@@ -990,7 +1001,13 @@ if (%(condition)s) {
 
             g_target_code = ""
             for target in targets:
-                g_target_code += """
+                if thread_local_psp:
+                    g_target_code += """
+            // Increase the post-synaptic conductance g_target += w
+            _thr_g_%(target)s[_thr_off + post_rank[i]] += w%%(local_index)s;
+""" % {'target': target}
+                else:
+                    g_target_code += """
             // Increase the post-synaptic conductance g_target += w
             %(post_prefix)sg_%(target)s%(post_index)s += w%(local_index)s;
 """
@@ -1051,6 +1068,15 @@ if (%(condition)s) {
             pre_array = "%(pre_prefix)sspiked" % ids
             template = self._templates['spiking_sum_fixed_delay'][proj._parallel_pattern]
 
+        # Thread-local accumulation, the reduction only visits the touched rows
+        thr_reduce = ""
+        if thread_local_psp:
+            template = self._templates['spiking_sum_fixed_delay']['outer_loop_thr']
+            for target in ([proj.target] if isinstance(proj.target, str) else proj.target):
+                thr_reduce += """
+            %(post_prefix)sg_%(target)s[rk_post] += _thr_g_%(target)s[_thr_idx];
+            _thr_g_%(target)s[_thr_idx] = 0.0;""" % {'post_prefix': ids['post_prefix'], 'target': target}
+
         # sanity check
         if template == None:
             raise Messages.CodeGeneratorException("\tproj{}: no template available (Configuration: format={}, order={}, single_matrix={}, pattern={})".format(proj.id, proj._storage_format, proj._storage_order, single_matrix, proj._parallel_pattern))
@@ -1075,7 +1101,8 @@ if (%(condition)s) {
                 'pre_event': pre_code,
                 'g_target': g_target_code,
                 'event_driven': event_driven_code,
-                'spiked_array_fusion': spiked_array_fusion_code
+                'spiked_array_fusion': spiked_array_fusion_code,
+                'thr_reduce': thr_reduce
             })
             code = template % ids
 
@@ -1108,6 +1135,25 @@ if (%(condition)s) {
 
         return psp_prefix, code
 
+    def _thread_local_psp(self, proj, single_matrix):
+        """
+        Spike propagation over a single post_to_pre LIL matrix is parallelized over the
+        presynaptic spikes if the user enabled it (disable_omp=False). Concurrent updates
+        of the same post-synaptic neuron are accumulated in thread-local buffers, which
+        are members of the projection, and reduced afterwards.
+        """
+        if proj.synapse_type.type != "spike" or proj._specific_template != {}:
+            return False
+
+        if proj._storage_format != "lil" or proj._storage_order != "post_to_pre":
+            return False
+
+        # Non-uniform delays are processed single-threaded
+        if proj.max_delay > 1 and proj.uniform_delay == -1:
+            return False
+
+        return single_matrix and not proj.disable_omp and get_global_config('num_threads') > 1
+
     def _header_structural_plasticity(self, proj):
         """
         Generate extension code for C header_struct: variable declaration, add and remove synapses.
@@ -10,7 +10,7 @@ from ANNarchy.extensions.convolution import Transpose
 from ANNarchy.intern.ConfigManagement import get_global_config, _check_paradigm, _check_precision
 
 # Useful functions
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available, attribute_views_available, csr_export_available
 
 class ProjectionGenerator(object):
     """
@@ -494,6 +494,39 @@ class ProjectionGenerator(object):
         if (!success)
             return false;
 
+%(init_weights)s
+%(init_delays)s
+
+        // init other variables than 'w' or delay
+        if (!init_attributes()){
+            return false;
+        }
+
+    #ifdef _DEBUG_CONN
+        static_cast<%(sparse_format)s*>(this)->print_data_representation();
+    #endif
+        return true;
+    }
+
+    bool init_from_csr( const int* row_indices_ptr, const long long num_rows,
+                        const long long* row_ptr,
+                        const int* column_indices_ptr,
+                        const double* values_ptr, const long long num_values,
+                        const int* delays_ptr, const long long num_delays) {
+    #ifdef _DEBUG
+        std::cout << "   ... init from flat CSR buffers ..." << std::endl;
+    #endif
+        // The buffers are owned by Python, the rows are sorted and not empty (see CSRConnectivity).
+        // They are accessed through views with the interface of a LIL, the synapses are not copied.
+        auto row_indices = std::vector<%(idx_type)s>(row_indices_ptr, row_indices_ptr + num_rows);
+        auto column_indices = CSRView<int, long long>(column_indices_ptr, row_ptr, num_rows);
+        auto values = CSRView<double, long long>(values_ptr, row_ptr, num_rows, num_values == 1);
+        auto delays = CSRView<int, long long>(delays_ptr, row_ptr, num_rows, num_delays == 1);
+
+        bool success = static_cast<%(sparse_format)s*>(this)->init_matrix_from_lil(row_indices, column_indices%(add_args)s%(num_threads)s);
+        if (!success)
+            return false;
+
 %(init_weights)s
 %(init_delays)s
 
@@ -662,10 +695,17 @@ class ProjectionGenerator(object):
 
             attributes.append(var['name'])
 
+        # Raw pointers for zero-copy views (std::vector<bool> has no contiguous storage)
+        export_views = attribute_views_available(proj)
+        export_csr = csr_export_available(proj)
+
         # Final code, can contain of multiple sets of accessor functions
         final_code = ""
         for ctype in code_ids_per_type.keys():
             # Attribute accessors/declarators
+            local_attribute_get_ptr = ""
+            local_attribute_export_csr = ""
+            semiglobal_attribute_get_ptr = ""
             local_attribute_get1 = ""
             local_attribute_get2 = ""
             local_attribute_get3 = ""
@@ -697,6 +737,12 @@ class ProjectionGenerator(object):
                     local_attribute_get3 += self._templates["attr_acc"]["local_get_single"] % ids
                     local_attribute_set3 += self._templates["attr_acc"]["local_set_single"] % ids
 
+                    if export_views and ctype != "bool":
+                        local_attribute_get_ptr += self._templates["attr_acc"]["local_get_ptr"] % ids
+
+                    if export_csr and ctype != "bool":
+                        local_attribute_export_csr += self._templates["attr_acc"]["local_export_csr"] % ids
+
                 #
                 # Semiglobal variables can be vec[d] or d
                 elif locality == "semiglobal":
@@ -706,6 +752,9 @@ class ProjectionGenerator(object):
                     semiglobal_attribute_set1 += self._templates["attr_acc"]["semiglobal_set_all"] % ids
                     semiglobal_attribute_set2 += self._templates["attr_acc"]["semiglobal_set_single"] % ids
 
+                    if export_views and ctype != "bool":
+                        semiglobal_attribute_get_ptr += self._templates["attr_acc"]["semiglobal_get_ptr"] % ids
+
                 #
                 # Global variables are only d
                 else:
@@ -743,6 +792,30 @@ class ProjectionGenerator(object):
                     'ctype_name': ctype.replace(" ", "_")
                 }
             
+            if local_attribute_get_ptr != "":
+                final_code += self._templates["accessor_template"]["local_ptr"] % {
+                    'local_get_ptr' : local_attribute_get_ptr,
+                    'id_proj': proj.id,
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
+
+            if local_attribute_export_csr != "":
+                final_code += self._templates["accessor_template"]["local_csr"] % {
+                    'local_export_csr' : local_attribute_export_csr,
+                    'id_proj': proj.id,
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
+
+            if semiglobal_attribute_get_ptr != "":
+                final_code += self._templates["accessor_template"]["semiglobal_ptr"] % {
+                    'semiglobal_get_ptr' : semiglobal_attribute_get_ptr,
+                    'id_proj': proj.id,
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
+
             if global_attribute_get != "":
                 final_code += self._templates["accessor_template"]["global"] % {
                     'global_get' : global_attribute_get,
@@ -227,6 +227,35 @@ attribute_template = {
     void set_semiglobal_attribute_%(ctype_name)s(std::string name, int rk_post, %(ctype)s value) {
 %(semiglobal_set2)s
     }
+""",
+    # Raw pointers onto the storage of the attributes (zero-copy views, see Projection.view()).
+    # Only available for LIL matrices, which store one std::vector per dendrite.
+    "local_ptr": """
+    %(ctype)s* get_local_attribute_row_ptr_%(ctype_name)s(std::string name, int lil_idx) {
+%(local_get_ptr)s
+
+        // should not happen
+        std::cerr << "ProjStruct%(id_proj)s::get_local_attribute_row_ptr_%(ctype_name)s: " << name << " not found" << std::endl;
+        return nullptr;
+    }
+""",
+    # Bulk export of a local attribute in the order of export_csr_connectivity() (see Projection.sparse_matrix()).
+    "local_csr": """
+    void export_local_attribute_csr_%(ctype_name)s(std::string name, %(ctype)s* values) {
+%(local_export_csr)s
+
+        // should not happen
+        std::cerr << "ProjStruct%(id_proj)s::export_local_attribute_csr_%(ctype_name)s: " << name << " not found" << std::endl;
+    }
+""",
+    "semiglobal_ptr": """
+    %(ctype)s* get_semiglobal_attribute_ptr_%(ctype_name)s(std::string name) {
+%(semiglobal_get_ptr)s
+
+        // should not happen
+        std::cerr << "ProjStruct%(id_proj)s::get_semiglobal_attribute_ptr_%(ctype_name)s: " << name << " not found" << std::endl;
+        return nullptr;
+    }
 """,
     "global": """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -291,6 +320,21 @@ attribute_acc = {
             %(write_dirty_flag)s
             return;
         }
+""",
+    'local_get_ptr': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            %(read_dirty_flag)s
+            return %(name)s[lil_idx].data();
+        }
+""",
+    'local_export_csr': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            %(read_dirty_flag)s
+            export_csr_variable<%(type)s>(%(name)s, values);
+            return;
+        }
 """,
     #
     # Semiglobal attributes
@@ -324,6 +368,13 @@ attribute_acc = {
             %(write_dirty_flag)s
             return;
         }
+""",
+    'semiglobal_get_ptr': """
+        // Semiglobal %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            %(read_dirty_flag)s
+            return %(name)s.data();
+        }
 """,
     #
     # Global attributes
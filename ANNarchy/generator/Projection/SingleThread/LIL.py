@@ -294,6 +294,19 @@ for (%(idx_type)s i = 0; i < post_rank.size(); i++) {
 """
 }
 
+# Batched simulation (setup(batch_size=...)): the instances share the connectivity,
+# the neurons of the instance _b are stored at the offset _b * size in the arrays
+# of the populations.
+lil_batch_loop = """
+%(pre_copy)s
+
+for (int _b = 0; _b < %(batch_size)s; _b++) {
+    const int _batch_pre = _b * %(pre_size)s;
+    const int _batch_post = _b * %(post_size)s;
+%(code)s
+}
+"""
+
 ###############################################################################
 # Optimized kernel for default rate-coded continuous transmission using SIMD
 # instructions and a single weight value for all synapses in the projection.
@@ -946,6 +959,46 @@ if (_transmission && %(post_prefix)s_active){
 } // active
 """
 
+# Batched simulation (setup(batch_size=...)): the spike events of all instances
+# are stored in the same array, the instance is recovered from the rank.
+spiking_summation_fixed_delay_batched = """
+// Event-based summation
+if (_transmission && %(post_prefix)s_active){
+    %(spiked_array_fusion)s
+
+    // Iterate over all incoming spikes (possibly delayed constantly)
+    for(int _idx_j = 0; _idx_j < %(pre_array)s.size(); _idx_j++){
+        // Instance and rank of the presynaptic neuron
+        int _batch_idx = %(pre_array)s[_idx_j] / %(pre_size)s;
+        int rk_j = %(pre_array)s[_idx_j] - _batch_idx * %(pre_size)s;
+        const int _batch_pre = _batch_idx * %(pre_size)s;
+        const int _batch_post = _batch_idx * %(post_size)s;
+        // Find the presynaptic neuron in the inverse connectivity matrix
+        auto inv_post_ptr = inv_pre_rank.find(rk_j);
+        if (inv_post_ptr == inv_pre_rank.end())
+            continue;
+        // List of postsynaptic neurons receiving spikes from that neuron
+        std::vector< std::pair<int, int> >& inv_post = inv_post_ptr->second;
+        // Number of post neurons
+        int nb_post = inv_post.size();
+
+        // Iterate over connected post neurons
+        for(int _idx_i = 0; _idx_i < nb_post; _idx_i++){
+            // Retrieve the correct indices
+            int i = inv_post[_idx_i].first;
+            int j = inv_post[_idx_i].second;
+
+            // Event-driven integration
+            %(event_driven)s
+            // Update conductance
+            %(g_target)s
+            // Synaptic plasticity: pre-events
+            %(pre_event)s
+        }
+    }
+} // active
+"""
+
 # Uses a ring buffer to process non-uniform delays in spiking networks
 spiking_summation_variable_delay = """
 // Event-based summation
@@ -1247,6 +1300,7 @@ conn_templates = {
 
     # operations
     'rate_coded_sum': lil_summation_operation,
+    'batch_loop': lil_batch_loop,
     'vectorized_default_psp': {
         'sse': {
             'single_w': continuous_transmission_sse_single_weight,
@@ -1263,6 +1317,7 @@ conn_templates = {
     },
     'update_variables': update_variables,
     'spiking_sum_fixed_delay': spiking_summation_fixed_delay,
+    'spiking_sum_fixed_delay_batched': spiking_summation_fixed_delay_batched,
     'spiking_sum_variable_delay': spiking_summation_variable_delay,
     'post_event': spiking_post_event,
     'structural_plasticity': structural_plasticity
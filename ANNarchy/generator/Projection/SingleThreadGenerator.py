@@ -457,10 +457,13 @@ class SingleThreadGenerator(ProjectionGenerator):
         # Dictionary of keywords to transform the parsed equations
         ids = deepcopy(self._template_ids)
 
+        # Several instances of the network share the connectivity (see setup(batch_size=...))
+        batch_size = get_global_config('batch_size')
+
         # For a default continous transmission we can use a hand-written
-        # AVX implementation or unrolled versions of the BSR
-        if isinstance(proj.synapse_type, DefaultRateCodedSynapse) or \
-                      proj.synapse_type.description['psp']['eq']=="w*pre.r":
+        # AVX implementation or unrolled versions of the BSR (not for batches)
+        if batch_size == 1 and (isinstance(proj.synapse_type, DefaultRateCodedSynapse) or \
+                      proj.synapse_type.description['psp']['eq']=="w*pre.r"):
 
             simd_type = None
 
@@ -582,8 +585,13 @@ class SingleThreadGenerator(ProjectionGenerator):
         # The psp uses in almost all cases one time the pre-synaptic index,
         # therefore I want to spare the usage of the explicit rk_pre variable.
         if proj._storage_format == "lil":
-            ids['pre_index'] = "[pre_rank[i][j]]"
-            ids['post_index'] = "[post_rank[i]]"
+            if batch_size > 1:
+                # the neurons of an instance are stored after the ones of the previous instance
+                ids['pre_index'] = "[pre_rank[i][j] + _batch_pre]"
+                ids['post_index'] = "[post_rank[i] + _batch_post]"
+            else:
+                ids['pre_index'] = "[pre_rank[i][j]]"
+                ids['post_index'] = "[post_rank[i]]"
         elif proj._storage_format == "csr":
             ids['pre_index'] = "[col_idx[j]]"
 
@@ -670,13 +678,23 @@ class SingleThreadGenerator(ProjectionGenerator):
 
             # add non-default template ids
             ids.update({
-                'pre_copy': pre_copy,
+                'pre_copy': pre_copy if batch_size == 1 else "",
                 'psp': psp.replace(';', '')
             })
 
             # Generate the code depending on the operation
             sum_code = template[proj.synapse_type.operation] %  ids
 
+            # The connectivity is traversed once per instance, the delayed variables are copied only once
+            if batch_size > 1:
+                sum_code = self._templates['batch_loop'] % {
+                    'pre_copy': pre_copy,
+                    'batch_size': batch_size,
+                    'pre_size': proj.pre.population.size if isinstance(proj.pre, PopulationView) else proj.pre.size,
+                    'post_size': proj.post.population.size if isinstance(proj.post, PopulationView) else proj.post.size,
+                    'code': tabify(sum_code, 1)
+                }
+
         else:
             ids.update({'delay_u' : '[delay-1]'})
 
@@ -807,13 +825,22 @@ class SingleThreadGenerator(ProjectionGenerator):
         # transmission.
         ids = deepcopy(self._template_ids)
 
+        # Several instances of the network share the connectivity (see setup(batch_size=...))
+        batch_size = get_global_config('batch_size')
+
         # The spike transmission is triggered from pre-synaptic side
         # and the indices need to be changed.
         if proj._storage_format == "lil":
-            ids.update({
-                'pre_index': '[rk_j]',
-                'post_index': '[post_rank[i]]',
-            })
+            if batch_size > 1:
+                ids.update({
+                    'pre_index': '[rk_j + _batch_pre]',
+                    'post_index': '[post_rank[i] + _batch_post]',
+                })
+            else:
+                ids.update({
+                    'pre_index': '[rk_j]',
+                    'post_index': '[post_rank[i]]',
+                })
 
         elif proj._storage_format == "csr":
             if proj._storage_order == "post_to_pre":
@@ -987,6 +1014,14 @@ if (%(condition)s) {
             pre_array = "%(pre_prefix)sspiked" % ids
             template = self._templates['spiking_sum_fixed_delay']
 
+        # The ranks of the spiking neurons encode the instance
+        if batch_size > 1:
+            template = self._templates['spiking_sum_fixed_delay_batched']
+            ids.update({
+                'pre_size': proj.pre.population.size if isinstance(proj.pre, PopulationView) else proj.pre.size,
+                'post_size': proj.post.population.size if isinstance(proj.post, PopulationView) else proj.post.size,
+            })
+
         if template == None:
             Messages._error("Code generation error: no template available")
 
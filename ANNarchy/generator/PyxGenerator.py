@@ -22,7 +22,7 @@ from ANNarchy.generator.Population import CUDATemplates as cuda_templates
 from ANNarchy.generator.Projection.SingleThread import *
 from ANNarchy.generator.Projection.OpenMP import *
 from ANNarchy.generator.Projection.CUDA import *
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available, attribute_views_available, csr_export_available
 
 class PyxGenerator(object):
     """
@@ -388,6 +388,15 @@ def _set_%(name)s(%(float_prec)s value):
                 'ctype_name': ctype.replace(" ", "_")
             }
 
+        # Raw pointers for zero-copy views (std::vector<bool> has no contiguous storage)
+        if get_global_config('paradigm') == "openmp":
+            for ctype in datatypes["local"]:
+                if ctype != "bool":
+                    export_parameters_variables += PyxTemplate.pyx_default_pop_attribute_view_export % {
+                        'ctype': ctype,
+                        'ctype_name': ctype.replace(" ", "_")
+                    }
+
         # Global parameters and variables
         for ctype in datatypes["global"]:
             export_parameters_variables += PyxTemplate.pyx_default_pop_attribute_export["global"] % {
@@ -497,6 +506,9 @@ def _set_%(name)s(%(float_prec)s value):
         set_local_all = ""
         get_local = ""
         set_local = ""
+        get_local_subset = ""
+        set_local_subset = ""
+        get_local_view = ""
         get_global = ""
         set_global = ""
 
@@ -508,6 +520,13 @@ def _set_%(name)s(%(float_prec)s value):
                 'ctype_name': ctype.replace(" ", "_")
             }
 
+            # The array shares the memory of the std::vector (no copy)
+            if get_global_config('paradigm') == "openmp" and ctype != "bool":
+                get_local_view += """
+        if ctype == "%(ctype)s":
+            return np.asarray(<%(ctype)s[:pop%(id)s.get_size()]> pop%(id)s.get_local_attribute_ptr_%(ctype_name)s(cpp_string))
+""" % ids
+
             # Population.get_cython_attribute expect np.array
             get_local_all += """
         if ctype == "%(ctype)s":
@@ -517,6 +536,10 @@ def _set_%(name)s(%(float_prec)s value):
         if ctype == "%(ctype)s":
             return pop%(id)s.get_local_attribute_%(ctype_name)s(cpp_string, rk)
 """ % ids
+            get_local_subset += """
+        if ctype == "%(ctype)s":
+            return np.array(pop%(id)s.get_local_attribute_subset_%(ctype_name)s(cpp_string, ranks))
+""" % ids
 
             # Setter
             set_local_all += """
@@ -527,6 +550,10 @@ def _set_%(name)s(%(float_prec)s value):
         if ctype == "%(ctype)s":
             pop%(id)s.set_local_attribute_%(ctype_name)s(cpp_string, rk, value)
 """ % ids
+            set_local_subset += """
+        if ctype == "%(ctype)s":
+            pop%(id)s.set_local_attribute_subset_%(ctype_name)s(cpp_string, ranks, value)
+""" % ids
 
         # Global parameters/variables
         for ctype in datatypes["global"]:
@@ -554,7 +581,14 @@ def _set_%(name)s(%(float_prec)s value):
                 'get_local_all': get_local_all,
                 'set_local_all': set_local_all,
                 'get_local': get_local,
-                'set_local': set_local
+                'set_local': set_local,
+                'get_local_subset': get_local_subset,
+                'set_local_subset': set_local_subset
+            }
+
+        if get_local_view != "":
+            wrapper_code += PyxTemplate.pyx_default_pop_attribute_view_wrapper % {
+                'get_local_view': get_local_view
             }
 
         if get_global != "":
@@ -651,6 +685,26 @@ def _set_%(name)s(%(float_prec)s value):
                     'ctype_name': ctype.replace(" ", "_")
                 }
 
+            # Raw pointers for zero-copy views (std::vector<bool> has no contiguous storage)
+            if attribute_views_available(proj):
+                for locality in ["local", "semiglobal"]:
+                    for ctype in datatypes[locality]:
+                        if ctype != "bool":
+                            export_parameters_variables += PyxTemplate.pyx_proj_attribute_view_export[locality] % {
+                                'ctype': ctype,
+                                'ctype_name': ctype.replace(" ", "_")
+                            }
+
+            # Bulk export in CSR format (std::vector<bool> has no contiguous storage)
+            if csr_export_available(proj):
+                export_parameters_variables += PyxTemplate.pyx_proj_csr_export["connectivity"]
+                for ctype in datatypes["local"]:
+                    if ctype != "bool":
+                        export_parameters_variables += PyxTemplate.pyx_proj_csr_export["local"] % {
+                            'ctype': ctype,
+                            'ctype_name': ctype.replace(" ", "_")
+                        }
+
             # Global parameters and variables
             for ctype in datatypes["global"]:
                 export_parameters_variables += PyxTemplate.pyx_proj_attribute_export["global"] % {
@@ -692,6 +746,7 @@ def _set_%(name)s(%(float_prec)s value):
             export_connector = tabify("bool fixed_number_pre_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(idx_type)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s)", 2)
         else:
             export_connector = tabify("bool init_from_lil(vector[%(idx_type)s], vector[vector[%(idx_type)s]], vector[vector[%(float_prec)s]], vector[vector[int]], bool)", 2)
+            export_connector += "\n" + tabify("bool init_from_csr(const int*, long long, const long long*, const int*, const double*, long long, const int*, long long)", 2)
 
         # Data types, only of interest if "only_int_idx_type" configuration flag is false
         idx_types = determine_idx_type_for_projection(proj)
@@ -858,6 +913,17 @@ def _set_%(name)s(%(float_prec)s value):
 
     def init_from_lil(self, post_rank, pre_rank, w, delay, requires_sorting):
         return proj%(id_proj)s.init_from_lil(post_rank, pre_rank, w, delay, requires_sorting)
+
+    def init_from_csr_connectivity(self, synapses):
+        " synapses is an instance of CSRConnectivity, the flat arrays are passed without conversion (they can be read-only) "
+        cdef const int[::1] post_rank = synapses.post_rank
+        cdef const long long[::1] row_ptr = synapses.row_ptr
+        cdef const int[::1] pre_rank = synapses.pre_rank
+        cdef const double[::1] w = synapses.w
+        cdef const int[::1] delay = synapses.delay
+        if pre_rank.shape[0] == 0:
+            return proj%(id_proj)s.init_from_lil([], [], [], [], False)
+        return proj%(id_proj)s.init_from_csr(&post_rank[0], post_rank.shape[0], &row_ptr[0], &pre_rank[0], &w[0], w.shape[0], &delay[0], delay.shape[0])
 """ % {'id_proj': proj.id}
 
         wrapper_args = ""
@@ -935,6 +1001,13 @@ def _set_%(name)s(%(float_prec)s value):
         set_semiglobal = ""
         set_global = ""
         get_global = ""
+        get_local_view = ""
+        get_semiglobal_view = ""
+        export_local_csr = ""
+
+        # The arrays share the memory of the std::vectors (no copy)
+        export_views = attribute_views_available(proj)
+        export_csr = csr_export_available(proj)
 
         datatypes = PyxGenerator._get_datatypes(proj)
         for ctype in datatypes["local"]:
@@ -944,6 +1017,22 @@ def _set_%(name)s(%(float_prec)s value):
                 'ctype_name': ctype.replace(" ", "_")
             }
 
+            # Empty rows can not be wrapped (the pointer might be NULL)
+            if export_views and ctype != "bool":
+                get_local_view += """
+        if ctype == "%(ctype)s":
+            return [np.asarray(<%(ctype)s[:proj%(id_proj)s.dendrite_size(idx)]> proj%(id_proj)s.get_local_attribute_row_ptr_%(ctype_name)s(cpp_string, idx)) if proj%(id_proj)s.dendrite_size(idx) > 0 else np.zeros(0, dtype="%(np_type)s") for idx in range(proj%(id_proj)s.nb_dendrites())]
+""" % dict(ids, np_type={'double': 'float64', 'float': 'float32', 'int': 'int32'}[ctype])
+
+            # The values are written into a numpy array allocated on the Python side
+            if export_csr and ctype in ["double", "float", "int"]:
+                export_local_csr += """
+        if ctype == "%(ctype)s":
+            values_%(ctype_name)s = np.empty(max(1, nb_synapses), dtype="%(np_type)s")
+            proj%(id_proj)s.export_local_attribute_csr_%(ctype_name)s(cpp_string, <%(ctype)s*> np.PyArray_DATA(values_%(ctype_name)s))
+            return values_%(ctype_name)s[:nb_synapses]
+""" % dict(ids, np_type={'double': 'float64', 'float': 'float32', 'int': 'int32'}[ctype])
+
             get_local_all += """
         if ctype == "%(ctype)s":
             return proj%(id_proj)s.get_local_attribute_all_%(ctype_name)s(cpp_string)
@@ -979,6 +1068,11 @@ def _set_%(name)s(%(float_prec)s value):
             get_semiglobal_all += """
         if ctype == "%(ctype)s":
             return proj%(id_proj)s.get_semiglobal_attribute_all_%(ctype_name)s(cpp_string)
+""" % ids
+            if export_views and ctype != "bool":
+                get_semiglobal_view += """
+        if ctype == "%(ctype)s":
+            return np.asarray(<%(ctype)s[:proj%(id_proj)s.nb_dendrites()]> proj%(id_proj)s.get_semiglobal_attribute_ptr_%(ctype_name)s(cpp_string))
 """ % ids
             set_semiglobal_all += """
         if ctype == "%(ctype)s":
@@ -1032,6 +1126,22 @@ def _set_%(name)s(%(float_prec)s value):
                 'id_proj': proj.id
             }
 
+        if get_local_view != "":
+            wrapper_code += PyxTemplate.pyx_proj_attribute_view_wrapper["local"] % {
+                'get_local_view': get_local_view
+            }
+
+        if get_semiglobal_view != "":
+            wrapper_code += PyxTemplate.pyx_proj_attribute_view_wrapper["semiglobal"] % {
+                'get_semiglobal_view': get_semiglobal_view
+            }
+
+        if export_csr:
+            wrapper_code += PyxTemplate.pyx_proj_csr_wrapper % {
+                'export_local_csr': export_local_csr,
+                'id_proj': proj.id
+            }
+
         if get_global != "":
             wrapper_code += PyxTemplate.pyx_proj_attribute_wrapper["global"] % {
                 'get_global': get_global,
@@ -1076,16 +1186,25 @@ def _set_%(name)s(%(float_prec)s value):
         vector[%(type)s] %(name)s
         bool record_%(name)s
 """ % {'name': var['name'], 'type': var['ctype']}
+            else:
+                continue
+
+            # Spilling to disk is only implemented for the openMP monitors
+            if get_global_config('paradigm') == "openmp":
+                tpl_code += """        void flush_%(name)s()
+""" % {'name': var['name']}
 
         if pop.neuron_type.type == 'spike':
             tpl_code += """
-        map[int, vector[long]] spike
+        vector[long] spike_times
+        vector[int] spike_ranks
         bool record_spike
         void clear_spike()
 """
             if pop.neuron_type.axon_spike:
                 tpl_code += """
-        map[int, vector[long]] axon_spike
+        vector[long] axon_spike_times
+        vector[int] axon_spike_ranks
         bool record_axon_spike
         void clear_axon_spike()
 """
@@ -1099,6 +1218,9 @@ def _set_%(name)s(%(float_prec)s value):
         vector[vector[%(float_prec)s]] _sum_%(target)s
         bool record__sum_%(target)s
 """ % {'target': target, 'float_prec': get_global_config('precision')}
+                if get_global_config('paradigm') == "openmp":
+                    tpl_code += """        void flush__sum_%(target)s()
+""" % {'target': target}
 
         return tpl_code % {'id' : pop.id, 'name': pop.name}
 
@@ -1128,7 +1250,15 @@ cdef class PopRecorder%(id)s_wrapper:
     property period_offset:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).period_offset_
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).period_offset_ = val
+
+    def spill(self, str prefix, int flush_every):
+        (PopRecorder%(id)s.get_instance(self.id)).spill_prefix_ = prefix.encode('utf-8')
+        (PopRecorder%(id)s.get_instance(self.id)).flush_every_ = flush_every
 """
+        flush_tpl = """    def flush_%(name)s(self):
+        (PopRecorder%(id)s.get_instance(self.id)).flush_%(name)s()
+""" if get_global_config('paradigm') == "openmp" else ""
+
         attributes = []
         for var in pop.neuron_type.description['variables']:
             # Avoid doublons
@@ -1145,30 +1275,30 @@ cdef class PopRecorder%(id)s_wrapper:
     def clear_%(name)s(self):
         (PopRecorder%(id)s.get_instance(self.id)).%(name)s.clear()
 """ % {'id' : pop.id, 'name': var['name']}
+            if var['name'] in pop.neuron_type.description['local'] + pop.neuron_type.description['global']:
+                tpl_code += flush_tpl % {'id' : pop.id, 'name': var['name']}
 
         if pop.neuron_type.type == 'spike':
-            tpl_code += """
-    property spike:
-        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).spike
-        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).spike = val
-    property record_spike:
-        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).record_spike
-        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).record_spike = val
-    def clear_spike(self):
-        (PopRecorder%(id)s.get_instance(self.id)).clear_spike()
-""" % {'id' : pop.id}
+            # The spike events are copied into numpy arrays without conversion into Python objects
+            spike_tpl = """
+    def get_%(name)s_events(self):
+        cdef PopRecorder%(id)s* recorder = PopRecorder%(id)s.get_instance(self.id)
+        cdef size_t nb_events = recorder.%(name)s_times.size()
+        if nb_events == 0:
+            return np.zeros(0, dtype=np.int_), np.zeros(0, dtype=np.intc)
+        times = np.asarray(<long[:nb_events]> recorder.%(name)s_times.data()).copy()
+        ranks = np.asarray(<int[:nb_events]> recorder.%(name)s_ranks.data()).copy()
+        return times, ranks
+    property record_%(name)s:
+        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s
+        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s = val
+    def clear_%(name)s(self):
+        (PopRecorder%(id)s.get_instance(self.id)).clear_%(name)s()
+"""
+            tpl_code += spike_tpl % {'id' : pop.id, 'name': 'spike'}
 
             if pop.neuron_type.axon_spike:
-                tpl_code += """
-    property axon_spike:
-        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).axon_spike
-        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).axon_spike = val
-    property record_axon_spike:
-        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).record_axon_spike
-        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).record_axon_spike = val
-    def clear_axon_spike(self):
-        (PopRecorder%(id)s.get_instance(self.id)).clear_axon_spike()
-""" % {'id' : pop.id}
+                tpl_code += spike_tpl % {'id' : pop.id, 'name': 'axon_spike'}
 
         # Arrays for the presynaptic sums
         if pop.neuron_type.type == 'rate':
@@ -1185,6 +1315,7 @@ cdef class PopRecorder%(id)s_wrapper:
     def clear_%(name)s(self):
         (PopRecorder%(id)s.get_instance(self.id)).%(name)s.clear()
 """ % {'id' : pop.id, 'name': '_sum_'+target}
+                tpl_code += flush_tpl % {'id' : pop.id, 'name': '_sum_'+target}
 
         return tpl_code % {'id' : pop.id, 'name': pop.name}
 
@@ -54,6 +54,55 @@ def check_structure(populations, projections):
     # Check locality of variable is respected
     _check_locality(populations, projections)
 
+def check_batch(populations, projections):
+    """
+    The batched simulation (setup(batch_size=...)) is restricted to networks whose instances only differ by
+    the local neural variables: the connectivity and the synaptic variables are shared by all instances.
+
+    Called after the specific populations/projections generated their code and the global operations were
+    propagated to the populations.
+    """
+    if get_global_config('batch_size') == 1:
+        return
+
+    if not isinstance(get_global_config('batch_size'), int) or get_global_config('batch_size') < 1:
+        raise Messages.ANNarchyException("setup(): batch_size must be a positive integer.", True)
+
+    if not _check_paradigm("openmp") or get_global_config('num_threads') > 1:
+        raise Messages.ANNarchyException("Batched simulations (batch_size > 1) are only available for single-threaded CPU code (paradigm='openmp' and num_threads=1).", True)
+
+    if get_global_config('structural_plasticity'):
+        raise Messages.ANNarchyException("Batched simulations (batch_size > 1) can not be combined with structural plasticity.", True)
+
+    for pop in populations:
+        if len(pop._specific_template) > 0:
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1): the population " + pop.name + " uses specific code, which does not support several instances.", True)
+
+        if len(pop.neuron_type.description['global']) > 0:
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1): the population " + pop.name + " has global attributes (" + ", ".join(pop.neuron_type.description['global']) + "), they would be shared by all instances.", True)
+
+        if len(pop.global_operations) > 0:
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1): global operations (min/max/mean...) on the population " + pop.name + " would mix the instances.", True)
+
+    for proj in projections:
+        if len(proj._specific_template) > 0:
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1): the projection " + proj.name + " uses specific code, which does not support several instances.", True)
+
+        if proj._storage_format != "lil" or proj._storage_order != "post_to_pre":
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1) are only available for the LIL format in post_to_pre order (projection " + proj.name + ").", True)
+
+        if get_global_config('use_cpp_connectors'):
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1) can not be combined with use_cpp_connectors.", True)
+
+        # The synapses are shared, so they can not be modified by the instances
+        description = proj.synapse_type.description
+        if len(description['variables']) > 0 or len(description.get('post_spike', [])) > 0 or \
+            any(eq['name'] != 'g_target' for eq in description.get('pre_spike', [])):
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1): the synapses of the projection " + proj.name + " are plastic, but the connectivity is shared by all instances.", True)
+
+        if proj.synapse_type.type == "spike" and proj.max_delay > 1 and proj.uniform_delay == -1:
+            raise Messages.ANNarchyException("Batched simulations (batch_size > 1) do not support non-uniform delays in spiking projections (projection " + proj.name + ").", True)
+
 def check_experimental_features(populations, projections):
     """
     The idea behind this method, is to check if new experimental features are used. This
@@ -48,6 +48,10 @@ omp_header_template = """#pragma once
  */
 %(custom_func)s
 
+// Populations and projections are compiled in separate translation
+// units (popX.cpp, projX.cpp) which include only the required headers.
+#ifndef _ANNARCHY_SEPARATE_UNIT
+
 /*
  * Structures for the populations
  *
@@ -122,6 +126,7 @@ void setNumberThreads(int threads, std::vector<int> core_list);
 */
 void setSeed(long int seed, int num_sources, bool use_seed_seq);
 
+#endif
 """
 
 st_body_template = """
@@ -834,6 +839,20 @@ omp_run_until_template = {
     """
 }
 
+# Translation unit for a single population or projection (OpenMP/single thread).
+# The object is defined here together with the wrappers called by singleStep()
+# and initialize(), so the simulation kernels are only compiled in this file.
+omp_unit_template = """/*
+ *  ANNarchy-version: %(annarchy_version)s
+ */
+#define _ANNARCHY_SEPARATE_UNIT
+%(include)s
+// Instance
+%(instance)s
+// Wrappers called by ANNarchy.cpp
+%(wrapper)s
+"""
+
 omp_initialize_template = """
 %(prof_init)s
     // Internal variables
@@ -176,84 +176,45 @@ global_operation_templates_st_call = {
 """
 }
 
+# Partial result of each thread on its chunk [beg, end) of the array
 global_operation_templates_omp_call = {
-    'max': """#pragma omp master
-{
-    _max_%(var)s = %(var)s[0];
-}
-auto local_max_%(var)s = max_value(%(var)s.data(), chunks_[tid], chunks_[tid+1]);
+    'max': """_partial_max_%(var)s[tid] = max_value(%(var)s.data(), beg, end);
 """,
-    'min': """#pragma omp master
-{
-    _min_%(var)s = %(var)s[0];
-}
-auto local_min_%(var)s = min_value(%(var)s.data(), chunks_[tid], chunks_[tid+1]);
+    'min': """_partial_min_%(var)s[tid] = min_value(%(var)s.data(), beg, end);
 """,
-    'mean': """#pragma omp master
-{
-    _mean_%(var)s = 0.0;
-}
-auto local_mean_%(var)s = mean_value(%(var)s.data(), chunks_[tid], chunks_[tid+1], %(var)s.size());
+    'mean': """_partial_mean_%(var)s[tid] = mean_value(%(var)s.data(), beg, end, %(var)s.size());
 """,
-    'norm1': """#pragma omp master
-{
-    _norm1_%(var)s = 0.0;
-}
-auto local_norm1_%(var)s = norm1_value(%(var)s.data(), chunks_[tid], chunks_[tid+1]);
+    'norm1': """_partial_norm1_%(var)s[tid] = norm1_value(%(var)s.data(), beg, end);
 """,
-    'norm2': """#pragma omp master
-{
-    _norm2_%(var)s = 0.0;
-}
-auto local_norm2_%(var)s = norm2_value(%(var)s.data(), chunks_[tid], chunks_[tid+1]);
+    'norm2': """_partial_norm2_%(var)s[tid] = norm2_value(%(var)s.data(), beg, end);
 """
 }
 
+# Combines the partial results of the threads tid and tid+stride (one level of the reduction tree)
 global_operation_templates_omp_reduce = {
-    'max': """#pragma omp for schedule(static, 1)
-for (int t = 0; t < nt; t++)
-{
-    #pragma omp critical
-    {
-        if ( local_max_%(var)s > _max_%(var)s )
-            _max_%(var)s = local_max_%(var)s;
-    }
-}
+    'max': """if ( _partial_max_%(var)s[tid+stride] > _partial_max_%(var)s[tid] )
+    _partial_max_%(var)s[tid] = _partial_max_%(var)s[tid+stride];
 """,
-    'min': """#pragma omp for schedule(static, 1)
-for (int t = 0; t < nt; t++)
-{
-    #pragma omp critical
-    {
-        if ( local_min_%(var)s < _min_%(var)s )
-            _min_%(var)s = local_min_%(var)s;
-    }
-}
+    'min': """if ( _partial_min_%(var)s[tid+stride] < _partial_min_%(var)s[tid] )
+    _partial_min_%(var)s[tid] = _partial_min_%(var)s[tid+stride];
 """,
-    'mean': """#pragma omp for reduction(+: _mean_%(var)s)
-for (int t = 0; t < nt; t++)
-{
-    _mean_%(var)s += local_mean_%(var)s;
-}
+    'mean': """_partial_mean_%(var)s[tid] += _partial_mean_%(var)s[tid+stride];
 """,
-    'norm1': """#pragma omp for reduction(+: _norm1_%(var)s)
-for (int t = 0; t < nt; t++)
-{
-    _norm1_%(var)s += local_norm1_%(var)s;
-}
+    'norm1': """_partial_norm1_%(var)s[tid] += _partial_norm1_%(var)s[tid+stride];
 """,
-    'norm2': """#pragma omp for reduction(+: _norm2_%(var)s)
-for (int t = 0; t < nt; t++)
-{
-    _norm2_%(var)s += local_norm2_%(var)s;
-}
-#pragma omp master
-{
-    _norm2_%(var)s = sqrt(_norm2_%(var)s);
-}
+    'norm2': """_partial_norm2_%(var)s[tid] += _partial_norm2_%(var)s[tid+stride];
 """
 }
 
+# The root of the reduction tree holds the result
+global_operation_templates_omp_result = {
+    'max': "_max_%(var)s = _partial_max_%(var)s[0];\n",
+    'min': "_min_%(var)s = _partial_min_%(var)s[0];\n",
+    'mean': "_mean_%(var)s = _partial_mean_%(var)s[0];\n",
+    'norm1': "_norm1_%(var)s = _partial_norm1_%(var)s[0];\n",
+    'norm2': "_norm2_%(var)s = sqrt(_partial_norm2_%(var)s[0]);\n"
+}
+
 global_operation_templates_omp_extern = {
     'max': "%(type)s max_value(const %(type)s*, const int, const int);\n",
     'min': "extern %(type)s min_value(const %(type)s*, const int, const int);\n",
@@ -6,19 +6,37 @@ MAKEFILE templates.
 """
 
 # Linux, Seq or OMP
+#
+# Each population/projection is compiled in its own object file. The
+# dependencies on the headers are tracked by the compiler (-MMD), so
+# only the objects whose code changed are rebuilt.
 linux_omp_template = """# Makefile generated by ANNarchy
-all:
+SOURCES := %(sources)s ANNarchyCore%(net_id)s.cpp
+OBJECTS := $(SOURCES:.cpp=.o)
+
+all: ANNarchyCore%(net_id)s.so
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+
+%%.o: %%.cpp Makefile
+\t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC -MMD -MP %(openmp)s -c $< -o $@ \\
+        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s \\
+        %(cython_ext)s
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
 \t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC -shared %(openmp)s \\
-        *.cpp  %(add_sources)s -o ANNarchyCore%(net_id)s.so \\
+        $(OBJECTS) %(add_sources)s -o ANNarchyCore%(net_id)s.so \\
         %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s \\
         %(cython_ext)s \\
         %(python_lib)s \\
         %(python_libpath)s %(extra_libs)s
 \tmv ANNarchyCore%(net_id)s.so ../..
 
+-include $(OBJECTS:.o=.d)
+
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
 
@@ -43,34 +61,62 @@ clean:
 
 # OSX, with clang, Seq only
 osx_clang_template = """# Makefile generated by ANNarchy
-all:
+SOURCES := %(sources)s ANNarchyCore%(net_id)s.cpp
+OBJECTS := $(SOURCES:.cpp=.o)
+
+all: ANNarchyCore%(net_id)s.so
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+
+%%.o: %%.cpp Makefile
+\t%(compiler)s -stdlib=libc++ -std=c++14 %(cpu_flags)s -fpermissive -MMD -MP %(openmp)s -c $< -o $@ \\
+        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
+        %(cython_ext)s
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
 \t%(compiler)s -stdlib=libc++ -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
+        $(OBJECTS) -o ANNarchyCore%(net_id)s.so \\
         %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
         %(cython_ext)s \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
 \tmv ANNarchyCore%(net_id)s.so ../..
 
+-include $(OBJECTS:.o=.d)
+
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
 
 # OSX, with gcc, OpenMP
 osx_gcc_template = """# Makefile generated by ANNarchy
-all:
+SOURCES := %(sources)s ANNarchyCore%(net_id)s.cpp
+OBJECTS := $(SOURCES:.cpp=.o)
+
+all: ANNarchyCore%(net_id)s.so
+
+ANNarchyCore%(net_id)s.cpp: ANNarchyCore%(net_id)s.pyx
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+
+%%.o: %%.cpp Makefile
+\t%(compiler)s -std=c++14 %(cpu_flags)s -fpermissive -MMD -MP %(openmp)s -c $< -o $@ \\
+        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s  -I%(thirdparty_include)s \\
+        %(cython_ext)s
+
+ANNarchyCore%(net_id)s.so: $(OBJECTS)
 \t%(compiler)s -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
+        $(OBJECTS) -o ANNarchyCore%(net_id)s.so \\
         %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s  -I%(thirdparty_include)s \\
         %(cython_ext)s \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
 \tmv ANNarchyCore%(net_id)s.so ../..
 
+-include $(OBJECTS:.o=.d)
+
 clean:
-\trm -rf *.o
+\trm -rf *.o *.d
 \trm -rf *.so
 """
@@ -41,6 +41,52 @@ public:
     int period_;
     int period_offset_;
     long int offset_;
+
+    // Spilling of the recorded data to disk: if spill_prefix_ is set, the buffer
+    // of a variable is appended to the file <spill_prefix_><name>.bin each time
+    // it holds flush_every_ recordings.
+    std::string spill_prefix_ = "";
+    unsigned int flush_every_ = 0;
+
+    template<typename T>
+    void spill(std::vector< std::vector<T> > &buffer, const std::string &name) {
+        if (spill_prefix_.empty() || buffer.empty())
+            return;
+        std::ofstream ofs(spill_prefix_ + name + ".bin", std::ios::binary | std::ios::app);
+        for (auto it = buffer.begin(); it != buffer.end(); it++)
+            ofs.write(reinterpret_cast<const char*>(it->data()), it->size() * sizeof(T));
+        buffer.clear();
+    }
+
+    template<typename T>
+    void spill(std::vector<T> &buffer, const std::string &name) {
+        if (spill_prefix_.empty() || buffer.empty())
+            return;
+        std::ofstream ofs(spill_prefix_ + name + ".bin", std::ios::binary | std::ios::app);
+        ofs.write(reinterpret_cast<const char*>(buffer.data()), buffer.size() * sizeof(T));
+        buffer.clear();
+    }
+
+    // std::vector<bool> is bit-packed, the values are written as one byte each
+    void spill(std::vector< std::vector<bool> > &buffer, const std::string &name) {
+        if (spill_prefix_.empty() || buffer.empty())
+            return;
+        std::ofstream ofs(spill_prefix_ + name + ".bin", std::ios::binary | std::ios::app);
+        for (auto it = buffer.begin(); it != buffer.end(); it++) {
+            std::vector<char> tmp(it->begin(), it->end());
+            ofs.write(tmp.data(), tmp.size());
+        }
+        buffer.clear();
+    }
+
+    void spill(std::vector<bool> &buffer, const std::string &name) {
+        if (spill_prefix_.empty() || buffer.empty())
+            return;
+        std::ofstream ofs(spill_prefix_ + name + ".bin", std::ios::binary | std::ios::app);
+        std::vector<char> tmp(buffer.begin(), buffer.end());
+        ofs.write(tmp.data(), tmp.size());
+        buffer.clear();
+    }
 };
 %(record_classes)s
 """
@@ -113,7 +159,8 @@ public:
     'struct': """
     // Local variable %(name)s
     std::vector< std::vector< %(type)s > > %(name)s ;
-    bool record_%(name)s ; """,
+    bool record_%(name)s ;
+    void flush_%(name)s() { this->spill(this->%(name)s, "%(name)s"); } """,
     'init': """
         this->%(name)s = std::vector< std::vector< %(type)s > >();
         this->record_%(name)s = false; """,
@@ -128,6 +175,8 @@ public:
                 }
                 this->%(name)s.push_back(tmp);
             }
+            if(this->flush_every_ > 0 && this->%(name)s.size() >= this->flush_every_)
+                this->flush_%(name)s();
         }""",
     'size_in_bytes': """
 // local variable %(name)s
@@ -154,13 +203,16 @@ for(auto it=%(name)s.begin(); it!= %(name)s.end(); it++) {
         'struct': """
     // Global variable %(name)s
     std::vector< %(type)s > %(name)s ;
-    bool record_%(name)s ; """,
+    bool record_%(name)s ;
+    void flush_%(name)s() { this->spill(this->%(name)s, "%(name)s"); } """,
         'init': """
         this->%(name)s = std::vector< %(type)s >();
         this->record_%(name)s = false; """,
         'recording': """
         if(this->record_%(name)s && ( (t - this->offset_) %% this->period_ == this->period_offset_ )){
             this->%(name)s.push_back(pop%(id)s.%(name)s);
+            if(this->flush_every_ > 0 && this->%(name)s.size() >= this->flush_every_)
+                this->flush_%(name)s();
         } """,
         'size_in_bytes': """
 // global variable %(name)s
@@ -629,30 +681,25 @@ size_in_bytes += sizeof(%(type)s) * %(name)s.capacity();
 
 recording_spike_tpl= {
     'struct': """
-    // Local variable %(name)s
-    std::map<int, std::vector< %(type)s > > %(name)s ;
+    // Spike events %(name)s: time step and rank of each event in the order of emission.
+    // Both arrays only grow, clear_%(name)s() keeps the capacity so that the following
+    // recordings do not need to allocate memory again.
+    std::vector< %(type)s > %(name)s_times ;
+    std::vector< int > %(name)s_ranks ;
+    std::vector< char > _%(name)s_recorded ; // recorded neurons, if only a part of the population is recorded
     bool record_%(name)s ;
     void clear_%(name)s() {
-        for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
-            it->second.clear();
-            it->second.shrink_to_fit();
-        }
-        // (HD: 8th Sep 2023): do not clear the top-level structure, otherwise the return of get_spike()
-        //                     will not be as expected: an empty list assigned to the corresponding neuron
-        //                     index.
-        //%(name)s.clear();
+        %(name)s_times.clear();
+        %(name)s_ranks.clear();
     }
 """,
     'init' : """
-        this->%(name)s = std::map<int,  std::vector< %(type)s > >();
-        if(!this->partial){
-            for(int i=0; i<pop%(id)s.size; i++) {
-                this->%(name)s[i]=std::vector<%(type)s>();
-            }
-        }
-        else{
+        this->%(name)s_times = std::vector< %(type)s >();
+        this->%(name)s_ranks = std::vector< int >();
+        if(this->partial){
+            this->_%(name)s_recorded = std::vector< char >(pop%(id)s.size, 0);
             for(int i=0; i<this->ranks.size(); i++) {
-                this->%(name)s[this->ranks[i]]=std::vector<%(type)s>();
+                this->_%(name)s_recorded[this->ranks[i]] = 1;
             }
         }
         this->record_%(name)s = false;
@@ -661,52 +708,35 @@ recording_spike_tpl= {
         'openmp' : """
         if(this->record_%(name)s){
             for(int i=0; i<pop%(id)s.%(rec_target)s.size(); i++){
-                if(!this->partial){
-                    this->%(name)s[pop%(id)s.%(rec_target)s[i]].push_back(t);
-                }
-                else{
-                    if( std::find(this->ranks.begin(), this->ranks.end(), pop%(id)s.%(rec_target)s[i])!=this->ranks.end() ){
-                        this->%(name)s[pop%(id)s.%(rec_target)s[i]].push_back(t);
-                    }
-                }
+                int rk = pop%(id)s.%(rec_target)s[i];
+                if(this->partial && !this->_%(name)s_recorded[rk])
+                    continue;
+                this->%(name)s_times.push_back(t);
+                this->%(name)s_ranks.push_back(rk);
             }
         } """,
-        'cuda' : """if(this->record_spike){
+        'cuda' : """if(this->record_%(name)s){
             for(int i=0; i<pop%(id)s.spike_count; i++){
-                if(!this->partial){
-                    this->spike[pop%(id)s.spiked[i]].push_back(t);
-                }
-                else{
-                    if( std::find(this->ranks.begin(), this->ranks.end(), pop%(id)s.spiked[i])!=this->ranks.end() ){
-                        this->spike[pop%(id)s.spiked[i]].push_back(t);
-                    }
-                }
+                int rk = pop%(id)s.spiked[i];
+                if(this->partial && !this->_%(name)s_recorded[rk])
+                    continue;
+                this->%(name)s_times.push_back(t);
+                this->%(name)s_ranks.push_back(rk);
             }
         } """
     },
-    'size_in_bytes': {
-        'openmp' : """
+    'size_in_bytes': """
 // record spike events
-size_in_bytes += sizeof(%(name)s);
-for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
-    size_in_bytes += sizeof(int); // key
-    size_in_bytes += sizeof(%(type)s) * (it->second).capacity(); // value
-}
-        """,
-        'cuda': """
-        // TODO:
-        """
-    },
-    'clear': {
-        'openmp' : """
-            for (auto it = this->spike.begin(); it != this->spike.end(); it++) {
-                it->second.clear();
-                it->second.shrink_to_fit();
-            }
-            this->spike.clear();
-        """,
-        'cuda': """
-        // TODO:
-        """
-    }
+size_in_bytes += sizeof(%(type)s) * %(name)s_times.capacity();
+size_in_bytes += sizeof(int) * %(name)s_ranks.capacity();
+size_in_bytes += sizeof(char) * _%(name)s_recorded.capacity();
+""",
+    'clear': """
+            this->%(name)s_times.clear();
+            this->%(name)s_times.shrink_to_fit();
+            this->%(name)s_ranks.clear();
+            this->%(name)s_ranks.shrink_to_fit();
+            this->_%(name)s_recorded.clear();
+            this->_%(name)s_recorded.shrink_to_fit();
+"""
 }
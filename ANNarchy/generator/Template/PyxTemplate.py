@@ -44,6 +44,8 @@ cdef extern from "ANNarchy.h":
         int period_
         int period_offset_
         long offset_
+        string spill_prefix_
+        unsigned int flush_every_
 
 %(monitor_struct)s
 
@@ -182,6 +184,8 @@ pyx_default_pop_attribute_export = {
         %(ctype)s get_local_attribute_%(ctype_name)s(string, int)
         void set_local_attribute_all_%(ctype_name)s(string, vector[%(ctype)s])
         void set_local_attribute_%(ctype_name)s(string, int, %(ctype)s)
+        vector[%(ctype)s] get_local_attribute_subset_%(ctype_name)s(string, vector[int])
+        void set_local_attribute_subset_%(ctype_name)s(string, vector[int], vector[%(ctype)s])
 """,
     'global': """
         # Global attributes
@@ -190,6 +194,18 @@ pyx_default_pop_attribute_export = {
 """
 }
 
+# Raw pointers onto the storage of local attributes (openMP only)
+pyx_default_pop_attribute_view_export = """
+        %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(string)
+"""
+
+pyx_default_pop_attribute_view_wrapper = """
+    # Zero-copy views onto the local attributes
+    def get_local_attribute_view(self, name, ctype):
+        cpp_string = name.encode('utf-8')
+%(get_local_view)s
+"""
+
 pyx_default_pop_attribute_wrapper = {
     'local': """
     # Local Attribute
@@ -208,6 +224,14 @@ pyx_default_pop_attribute_wrapper = {
     def set_local_attribute(self, name, rk, value, ctype):
         cpp_string = name.encode('utf-8')
 %(set_local)s
+
+    def get_local_attribute_subset(self, name, ranks, ctype):
+        cpp_string = name.encode('utf-8')
+%(get_local_subset)s
+
+    def set_local_attribute_subset(self, name, ranks, value, ctype):
+        cpp_string = name.encode('utf-8')
+%(set_local_subset)s
 """,
     'global': """
     def get_global_attribute(self, name, ctype):
@@ -437,6 +461,60 @@ pyx_proj_attribute_export = {
 """
 }
 
+# Raw pointers onto the storage of local and semiglobal attributes (LIL only)
+pyx_proj_attribute_view_export = {
+    'local': """
+        %(ctype)s* get_local_attribute_row_ptr_%(ctype_name)s(string, int)
+""",
+    'semiglobal': """
+        %(ctype)s* get_semiglobal_attribute_ptr_%(ctype_name)s(string)
+"""
+}
+
+pyx_proj_attribute_view_wrapper = {
+    'local': """
+    # Zero-copy views onto the rows of local attributes
+    def get_local_attribute_view(self, name, ctype):
+        cpp_string = name.encode('utf-8')
+%(get_local_view)s
+""",
+    'semiglobal': """
+    # Zero-copy views onto the semiglobal attributes
+    def get_semiglobal_attribute_view(self, name, ctype):
+        cpp_string = name.encode('utf-8')
+%(get_semiglobal_view)s
+"""
+}
+
+# Bulk export of the connectivity and of the local attributes in CSR format
+pyx_proj_csr_export = {
+    'connectivity': """
+        void export_csr_connectivity(long long*, int*)
+""",
+    'local': """
+        void export_local_attribute_csr_%(ctype_name)s(string, %(ctype)s*)
+"""
+}
+
+pyx_proj_csr_wrapper = """
+    # Connectivity in CSR format, one row per dendrite in the order of post_rank()
+    def export_csr_connectivity(self):
+        cdef int nb_rows = proj%(id_proj)s.get_post_rank().size()
+        cdef long nb_synapses = proj%(id_proj)s.nb_synapses()
+        indptr = np.empty(nb_rows+1, dtype=np.longlong)
+        indices = np.empty(max(1, nb_synapses), dtype=np.intc)
+        cdef long long[::1] indptr_view = indptr
+        cdef int[::1] indices_view = indices
+        proj%(id_proj)s.export_csr_connectivity(&indptr_view[0], &indices_view[0])
+        return indptr, indices[:nb_synapses]
+
+    # Local attribute in the order of export_csr_connectivity()
+    def export_local_attribute_csr(self, name, ctype):
+        cpp_string = name.encode('utf-8')
+        cdef long nb_synapses = proj%(id_proj)s.nb_synapses()
+%(export_local_csr)s
+"""
+
 pyx_proj_attribute_wrapper = {
     'local': """
     # Local Attribute
@@ -341,6 +341,33 @@ def cpp_connector_available(connector_name, desired_format, storage_order):
         # Fall back to Python construction
         return False
 
+def attribute_views_available(proj):
+    """
+    Checks if the C++ core exports the storage of the local and semiglobal attributes of
+    a projection to the Python frontend (Projection.view()). This requires the attributes
+    to be stored in one std::vector per dendrite, i.e. a non-partitioned LIL matrix on CPUs.
+    """
+    if not _check_paradigm("openmp") or proj._storage_format != "lil":
+        return False
+
+    # Specific projections provide their own accessors
+    if proj._specific_template != {}:
+        return False
+
+    return get_global_config('num_threads') == 1 or proj._no_split_matrix
+
+def csr_export_available(proj):
+    """
+    Checks if the C++ core can export the connectivity and the local attributes of a
+    projection in CSR format into preallocated arrays (Projection.sparse_matrix()). All
+    CPU storage formats implement export_csr_connectivity() and export_csr_variable().
+    """
+    if not _check_paradigm("openmp"):
+        return False
+
+    # Specific projections provide their own accessors
+    return proj._specific_template == {}
+
 #####################################################################
 #   Code formatting
 #####################################################################
@@ -1 +1,3 @@
 from .Compiler import compile
+from .CompilationCache import compilation_cache_statistics, clear_compilation_cache
+from .Precompiled import export_compiled, load_compiled
@@ -177,7 +177,8 @@ class BSRMatrix {
     //  Initialization methods
     //
 
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector<std::vector<IT>> column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> row_indices, LIL column_indices) {
     #ifdef _DEBUG
         std::cout << "BSRMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -450,8 +451,8 @@ class BSRMatrix {
         return std::vector<VT>(tile_data_.size(), default_value);
     }
 
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<VT> &variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const LIL &data) {
     #ifdef _DEBUG
         std::cout << "BSRMatrix::update_matrix_variable_all()" << std::endl;
     #endif
@@ -462,7 +463,7 @@ class BSRMatrix {
 
         // update matrix row by row
         for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++ ) {
-            update_matrix_variable_row(variable, lil_idx, data[lil_idx]);
+            update_matrix_variable_row<VT>(variable, lil_idx, data[lil_idx]);
         }
     }
 
@@ -542,6 +543,40 @@ class BSRMatrix {
         return lil_variable;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto pre_ranks = get_dendrite_pre_rank(lil_idx);
+            col_idx = std::copy(pre_ranks.begin(), pre_ranks.end(), col_idx);
+            nnz += pre_ranks.size();
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector<VT>& variable, VT* values) {
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto row = get_matrix_variable_row(variable, lil_idx);
+            values = std::copy(row.begin(), row.end(), values);
+        }
+    }
+
     /**
      *  @brief      retrieve a specific row from the given variable.
      *  @details    this function is only called by the Python interface to retrieve the current value of a *local* variable.
@@ -135,7 +135,8 @@ public:
         return gpu_block_column_index_;
     }
 
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "BSRMatrixCUDA::init_matrix_from_lil()" << std::endl;
     #endif
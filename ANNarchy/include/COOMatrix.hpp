@@ -173,7 +173,8 @@ class COOMatrix {
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "COOMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -315,8 +316,8 @@ class COOMatrix {
     }
 
         // ATTENTION: we assume sorted indices (otherwise the copy here is not correct)
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<VT> &variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const LIL &data) {
     #ifdef _DEBUG
         std::cout << "COOMatrix::update_matrix_variable_all()" << std::endl;
     #endif
@@ -374,6 +375,37 @@ class COOMatrix {
         return lil_variable;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The nonzeros are stored sorted by rows in the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        ST j = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            while (j < row_indices_.size() && row_indices_[j] == post_ranks_[lil_idx])
+                j++;
+            row_ptr[lil_idx+1] = j;
+        }
+        std::copy(column_indices_.begin(), column_indices_.end(), col_idx);
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector<VT> &variable, VT* values) {
+        std::copy(variable.begin(), variable.end(), values);
+    }
+
     /**
      *  @brief      retrieve a specific row from the given variable.
      *  @details    this function is only called by the Python interface to retrieve the current value of a *local* variable.
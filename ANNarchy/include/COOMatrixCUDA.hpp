@@ -183,7 +183,8 @@ class COOMatrixCUDA: public COOMatrix<IT, ST> {
         return SEGMENT_SIZE;
     }
 
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "COOMatrixCUDA::init_matrix_from_lil()" << std::endl;
     #endif
@@ -93,7 +93,8 @@ public:
      *  @brief      initialize from LIL representation.
      *  @see        LILMatrix::init_matrix_from_lil(), CSRMatrix::init_matrix_from_lil()
      */
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<IT> > column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> row_indices, LIL column_indices) {
     #ifdef _DEBUG
         std::cout << "CSRCMatrix::init_matrix_from_lil():" << std::endl;
     #endif
@@ -171,7 +171,8 @@ public:
         free_device_memory();
     }
 
-    bool init_matrix_from_lil(std::vector<IT> &row_indices, std::vector< std::vector<IT> > &column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &row_indices, LIL &column_indices) {
     #ifdef _DEBUG
         std::cout << "CSRCMatrixCUDAT::init_matrix_from_lil() " << std::endl;
     #endif
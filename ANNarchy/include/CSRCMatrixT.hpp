@@ -149,7 +149,8 @@ class CSRCMatrixT{
     /*
      *  Create CSRC_T from LIL while ensuring an ascending index in rows. This function is called from Python.
      */
-    bool init_matrix_from_lil(std::vector<IT> post_ranks, std::vector< std::vector<IT> > pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> post_ranks, LIL pre_ranks) {
     #ifdef _DEBUG
         std::cout << "CSRCMatrixT::init_matrix_from_lil()" << std::endl;
     #endif
@@ -499,8 +500,8 @@ class CSRCMatrixT{
         }
     }
 
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<VT> &variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const LIL &data) {
         for (auto r = 0; r < post_ranks_.size(); r++) {
             IT rank = post_ranks_[r];
             auto beg = data[r].begin();
@@ -540,6 +541,40 @@ class CSRCMatrixT{
         return values;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto pre_ranks = get_dendrite_pre_rank(lil_idx);
+            col_idx = std::copy(pre_ranks.begin(), pre_ranks.end(), col_idx);
+            nnz += pre_ranks.size();
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector<VT>& variable, VT* values) {
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto row = get_matrix_variable_row(variable, lil_idx);
+            values = std::copy(row.begin(), row.end(), values);
+        }
+    }
+
     /**
      *  @brief      Initialize a vector variable
      *  @details    Variables marked as 'semiglobal' stored in a vector of the size of LILMatrix::post_rank
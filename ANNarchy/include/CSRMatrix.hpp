@@ -136,7 +136,8 @@ class CSRMatrix {
      *  @brief      Initialize CSR based on a LIL representation.
      *  @see        LILMatrix::init_matrix_from_lil()
      */
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<IT> > column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> row_indices, LIL column_indices) {
     #ifdef _DEBUG
         std::cout << "CSRMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -431,14 +432,14 @@ class CSRMatrix {
         std::copy(data.begin(), data.end(), variable.begin() + row_begin_[row_idx]);
     }
 
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<VT> &variable, const std::vector< std::vector<VT> > &data) 
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const LIL &data) 
     {
         if (data.size() != post_ranks_.size())
             std::cerr << "Update variable failed: mismatch of data field sizes." << std::endl;
 
         for (auto i = 0; i < post_ranks_.size(); i++) {
-            update_matrix_variable_row(variable, i, data[i]);
+            update_matrix_variable_row<VT>(variable, i, data[i]);
         }
     }
 
@@ -468,6 +469,40 @@ class CSRMatrix {
         return values;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            IT row_idx = post_ranks_[lil_idx];
+            col_idx = std::copy(col_idx_.begin()+row_begin_[row_idx], col_idx_.begin()+row_begin_[row_idx+1], col_idx);
+            nnz += row_begin_[row_idx+1] - row_begin_[row_idx];
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector<VT> &variable, VT* values) {
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            IT row_idx = post_ranks_[lil_idx];
+            values = std::copy(variable.begin()+row_begin_[row_idx], variable.begin()+row_begin_[row_idx+1], values);
+        }
+    }
+
     /**
      *  @brief      Initialize a vector variable
      *  @details    Variables marked as 'semiglobal' stored in a vector of the size of LILMatrix::post_rank
@@ -0,0 +1,108 @@
+/*
+ *    DelayBuffer.hpp
+ *
+ *    This file is part of ANNarchy.
+ *
+ *    Copyright (C) 2020  Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+ *                        Julien Vitay <julien.vitay@gmail.com>
+ *
+ *    This program is free software: you can redistribute it and/or modify
+ *    it under the terms of the GNU General Public License as published by
+ *    the Free Software Foundation, either version 2 of the License, or
+ *    (at your option) any later version.
+ *
+ *    ANNarchy is distributed in the hope that it will be useful,
+ *    but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *    GNU General Public License for more details.
+ *
+ *    You should have received a copy of the GNU General Public License
+ *    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <vector>
+#include <utility>
+
+/**
+ *  @brief      Circular buffer storing the past values of a delayed population variable.
+ *  @details    The buffer is allocated once with max_delay slots. push() overwrites the oldest slot
+ *              and rotates the head index, so no memory is allocated during the simulation if the
+ *              stored values keep their size. buffer[0] contains the most recent value and
+ *              buffer[d] the value stored d steps before.
+ */
+template<typename T>
+class DelayBuffer {
+    std::vector<T> slots_;  ///< preallocated slots
+    int head_;              ///< index of the most recent value in slots_
+
+public:
+    DelayBuffer() : head_(0) {}
+
+    /**
+     *  @brief      Allocates the buffer.
+     *  @param[in]  max_delay   number of stored steps.
+     *  @param[in]  value       initial value of all slots.
+     */
+    DelayBuffer(int max_delay, const T& value) : slots_(max_delay, value), head_(0) {}
+
+    /**
+     *  @brief      Value stored *delay* steps before the most recent one.
+     *  @details    Only index arithmetic, no bounds check.
+     */
+    inline T& operator[](int delay) {
+        int idx = head_ + delay;
+        return slots_[idx < static_cast<int>(slots_.size()) ? idx : idx - slots_.size()];
+    }
+
+    inline const T& operator[](int delay) const {
+        int idx = head_ + delay;
+        return slots_[idx < static_cast<int>(slots_.size()) ? idx : idx - slots_.size()];
+    }
+
+    /**
+     *  @brief      Stores a new value, the oldest one is overwritten.
+     *  @details    The value is copied into the existing slot, which re-uses its capacity.
+     */
+    inline void push(const T& value) {
+        if (slots_.empty())
+            return;
+
+        head_ = (head_ == 0) ? static_cast<int>(slots_.size()) - 1 : head_ - 1;
+        slots_[head_] = value;
+    }
+
+    /**
+     *  @brief      Number of stored steps.
+     */
+    inline size_t size() const {
+        return slots_.size();
+    }
+
+    /**
+     *  @brief      Increases the number of stored steps, the stored values are kept and the new
+     *              (oldest) slots are set to *value*.
+     */
+    void resize(int max_delay, const T& value) {
+        if (max_delay <= static_cast<int>(slots_.size()))
+            return;
+
+        std::vector<T> slots;
+        slots.reserve(max_delay);
+        for (int d = 0; d < static_cast<int>(slots_.size()); d++)
+            slots.push_back((*this)[d]);
+        slots.resize(max_delay, value);
+
+        slots_ = std::move(slots);
+        head_ = 0;
+    }
+
+    /**
+     *  @brief      Sets all slots to *value*.
+     */
+    void fill(const T& value) {
+        for (auto it = slots_.begin(); it != slots_.end(); it++)
+            *it = value;
+        head_ = 0;
+    }
+};
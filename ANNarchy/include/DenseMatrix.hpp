@@ -279,7 +279,8 @@ public:
      *  @param      post_ranks          contains row indices
      *  @param      pre_ranks           contains for each row the corresponding column indices
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "DenseMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -499,8 +500,8 @@ public:
      *  @param[in]  variable    Variable container initialized with LILMatrix::init_matrix_variable() and similiar functions.
      *  @param[in]  values      new values for the row indicated by lil_idx stored as a list of list according to LILMatrix::pre_rank
      */
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<VT> &variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<VT> &variable, const LIL &data) {
     #ifdef _DEBUG
         std::cout << "DenseMatrix::update_matrix_variable_all()" << std::endl;
     #endif
@@ -509,7 +510,7 @@ public:
         assert( (num_rows_ == data.size()) );
 
         for (IT row_idx = 0; row_idx < data.size(); row_idx++) {
-            update_matrix_variable_row(variable, row_idx, data[row_idx]);
+            update_matrix_variable_row<VT>(variable, row_idx, data[row_idx]);
         }
     }
 
@@ -584,6 +585,47 @@ public:
         return values;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). All rows are exported, as in get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of num_rows()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT row_idx = 0; row_idx < num_rows_; row_idx++) {
+            for (IT c = 0; c < num_columns_; c++) {
+                ST idx = row_major ? static_cast<ST>(row_idx) * num_columns_ + c : static_cast<ST>(c) * num_rows_ + row_idx;
+                if (mask_[idx]) {
+                    *col_idx++ = c;
+                    nnz++;
+                }
+            }
+            row_ptr[row_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector<VT> &variable, VT* values) {
+        for (IT row_idx = 0; row_idx < num_rows_; row_idx++) {
+            for (IT c = 0; c < num_columns_; c++) {
+                ST idx = row_major ? static_cast<ST>(row_idx) * num_columns_ + c : static_cast<ST>(c) * num_rows_ + row_idx;
+                if (mask_[idx])
+                    *values++ = variable[idx];
+            }
+        }
+    }
+
     /**
      *  @brief      retrieve a specific row from the given variable.
      *  @details    this function is only called by the Python interface to retrieve the current value of a *local* variable.
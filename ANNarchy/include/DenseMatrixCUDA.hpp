@@ -129,7 +129,8 @@ public:
     #endif
     }
 
-    bool init_matrix_from_lil(std::vector<IT> &row_indices, std::vector< std::vector<IT> > &column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &row_indices, LIL &column_indices) {
     #ifdef _DEBUG
         std::cout << "DenseMatrixCUDA::init_matrix_from_lil() " << std::endl;
     #endif
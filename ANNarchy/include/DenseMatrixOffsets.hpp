@@ -139,12 +139,27 @@ public:
         return pre_ranks;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    the rows are exported as in get_post_rank(), the column indices are shifted by the column offset.
+     *  @param[out] row_ptr     array of num_rows()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        static_cast<DenseMatrix<IT, ST, MT, row_major>*>(this)->export_csr_connectivity(row_ptr, col_idx);
+
+        for (PT j = 0; j < row_ptr[this->num_rows_]; j++)
+            col_idx[j] += this->low_column_rank_;
+    }
+
     /**
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
      *  @todo       Instead of duplicating the code, one might transform the post_ranks/pre_ranks array and then call the DenseMatrix::init_matrix_from_lil()
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "DenseMatrixOffsets::init_matrix_from_lil()" << std::endl;
     #endif
@@ -176,7 +176,8 @@ public:
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "DiaMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -273,15 +274,15 @@ public:
      *  @param[in]  variable        Diagonal variable container
      *  @param[in]  data            LIL variable container
      */
-    template <typename VT>
-    inline void update_matrix_variable_all(std::vector<std::vector<VT>> &variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(std::vector<std::vector<VT>> &variable, const LIL &data) {
     #ifdef _DEBUG
         std::cout << "DiaMatrix::update_matrix_variable_all()" << std::endl;
     #endif
         assert( (post_ranks_.size() == data.size()) );
 
         for (IT i = 0; i < post_ranks_.size(); i++) {
-            update_matrix_variable_row(variable, i, data[i]);
+            update_matrix_variable_row<VT>(variable, i, data[i]);
         }
     }
 
@@ -339,6 +340,47 @@ public:
         return values;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            IT row_idx = post_ranks_[lil_idx];
+            for (auto map_it = offsets_.begin(); map_it != offsets_.end(); map_it++) {
+                if (diagonals_[map_it->second][row_idx]) {
+                    *col_idx++ = map_it->first + row_idx;
+                    nnz++;
+                }
+            }
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector< std::vector<VT> >& variable, VT* values) {
+        for (IT lil_idx = 0; lil_idx < post_ranks_.size(); lil_idx++) {
+            IT row_idx = post_ranks_[lil_idx];
+            for (auto map_it = offsets_.begin(); map_it != offsets_.end(); map_it++) {
+                if (diagonals_[map_it->second][row_idx])
+                    *values++ = variable[map_it->second][row_idx];
+            }
+        }
+    }
+
     /**
      *  @brief      retrieve a specific row from the given variable.
      *  @details    this function is only called by the Python interface to retrieve the current value of a *local* variable.
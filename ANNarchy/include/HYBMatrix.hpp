@@ -81,7 +81,8 @@ class HYBMatrix {
      *              This version was suggested by: 
      *              Bell & Garland (2009) Implementing sparse matrix-vector multiplication on throughput-oriented processors
      */
-    IT determine_ell_size_hist(const std::vector<IT> row_indices, const std::vector<std::vector<IT>> column_indices) {
+    template<typename LIL>
+    IT determine_ell_size_hist(const std::vector<IT> &row_indices, const LIL &column_indices) {
         std::map<IT, int> row_length_hist;
         for(auto it = column_indices.begin(); it != column_indices.end(); it++) {
             row_length_hist[it->size()]++;
@@ -124,7 +125,8 @@ class HYBMatrix {
      *              row-length or the average row-length. But as we use ELLPACK as partition, we should ensure
      *              that all rows are completely filled. But also enough rows must be then in the ELLPACK partition.
      */
-    IT determine_ell_size_avg(const std::vector<IT> row_indices, const std::vector<std::vector<IT>> column_indices) {
+    template<typename LIL>
+    IT determine_ell_size_avg(const std::vector<IT> &row_indices, const LIL &column_indices) {
     #ifdef _DEBUG
         std::cout << "HYBMatrix::determine_ell_size() - try to determine a good partition size" << std::endl;
     #endif
@@ -276,7 +278,8 @@ class HYBMatrix {
     /*
      *
      */
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<IT> > column_indices, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> row_indices, LIL column_indices, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
         if (ell_size != std::numeric_limits<unsigned int>::max()) {
             ell_size_ = ell_size;
         } else {
@@ -430,8 +433,8 @@ class HYBMatrix {
         return new_variable;
     }
 
-    template <typename VT>
-    inline void update_matrix_variable_all(hyb_local<VT>* variable, const std::vector< std::vector<VT> > &data) {
+    template <typename VT, typename LIL>
+    inline void update_matrix_variable_all(hyb_local<VT>* variable, const LIL &data) {
     #ifdef _DEBUG
         std::cout << "HYBMatrix()::update_matrix_variable_all()" << std::endl;
     #endif
@@ -467,6 +470,40 @@ class HYBMatrix {
         return lil_variable;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto pre_ranks = get_dendrite_pre_rank(lil_idx);
+            col_idx = std::copy(pre_ranks.begin(), pre_ranks.end(), col_idx);
+            nnz += pre_ranks.size();
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const hyb_local<VT>* variable, VT* values) {
+        for (IT lil_idx = 0; lil_idx < nb_dendrites(); lil_idx++) {
+            auto row = get_matrix_variable_row(variable, lil_idx);
+            values = std::copy(row.begin(), row.end(), values);
+        }
+    }
+
     template <typename VT>
     inline std::vector< VT > get_matrix_variable_row(const hyb_local<VT>* variable, const IT &lil_idx) {
         auto result = ell_matrix_->get_matrix_variable_row(variable->ell, lil_idx);
@@ -89,7 +89,8 @@ class HYBMatrixCUDA: public HYBMatrix<IT, ST, false>
         return coo_matrix_gpu;
     }
 
-    bool init_matrix_from_lil(std::vector<IT> row_indices, std::vector< std::vector<IT> > column_indices, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> row_indices, LIL column_indices, unsigned int ell_size=std::numeric_limits<unsigned int>::max()) {
     #ifdef _DEBUG
         std::cout << "HYBMatrixCUDA::init_matrix_from_lil()" << std::endl;
     #endif
@@ -139,7 +139,8 @@ public:
     /**
      *  @see    LILMatrix::init_matrix_from_lil()
      */
-    bool init_matrix_from_lil(std::vector<IT> &row_indices, std::vector< std::vector<IT> > &column_indices) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &row_indices, LIL &column_indices) {
     #ifdef _DEBUG
         std::cout << "LILInvMatrix::init_matrix_from_lil():" << std::endl;
     #endif
@@ -213,8 +213,10 @@ public:
     /**
      *  @brief      initialize connectivity based on a provided LIL representation.
      *  @details    simply sets the post_rank and pre_rank arrays without further sanity checking.
+     *  @tparam     LIL     list of lists of column indices, e. g. std::vector< std::vector<IT> > or CSRView.
      */
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks) {
     #ifdef _DEBUG
         std::cout << "LILMatrix::init_matrix_from_lil()" << std::endl;
     #endif
@@ -225,7 +227,7 @@ public:
 
         // store the data
         this->post_rank = post_ranks;
-        this->pre_rank = pre_ranks;
+        this->pre_rank = std::vector< std::vector<IT> >(pre_ranks.begin(), pre_ranks.end());
 
     #ifdef _DEBUG
         print_matrix_statistics();
@@ -617,14 +619,14 @@ public:
      *  @param[in]  variable    Variable container initialized with LILMatrix::init_matrix_variable() and similiar functions.
      *  @param[in]  values      new values for the row indicated by lil_idx stored as a list of list according to LILMatrix::pre_rank
      */
-    template <typename VT>
+    template <typename VT, typename LIL>
     inline void update_matrix_variable_all(std::vector< std::vector<VT> > &variable,
-                             const std::vector< std::vector<VT> > &data)
+                             const LIL &data)
     {
         assert( (data.size() == post_rank.size()) );
 
         for (auto i = 0; i < post_rank.size(); i++) {
-            update_matrix_variable_row(variable, i, data[i]);
+            update_matrix_variable_row<VT>(variable, i, data[i]);
         }
     }
 
@@ -639,6 +641,38 @@ public:
         return variable;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The rows follow the order of get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        PT nnz = 0;
+        row_ptr[0] = 0;
+        for (IT lil_idx = 0; lil_idx < pre_rank.size(); lil_idx++) {
+            col_idx = std::copy(pre_rank[lil_idx].begin(), pre_rank[lil_idx].end(), col_idx);
+            nnz += pre_rank[lil_idx].size();
+            row_ptr[lil_idx+1] = nnz;
+        }
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT>
+    void export_csr_variable(const std::vector< std::vector<VT> > &variable, VT* values) {
+        for (auto it = variable.begin(); it != variable.end(); it++) {
+            values = std::copy(it->begin(), it->end(), values);
+        }
+    }
+
     /**
      *  @brief      retrieve a specific row from the given variable.
      *  @details    this function is only called by the Python interface to retrieve the current value of a *local* variable.
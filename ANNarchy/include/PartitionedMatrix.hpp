@@ -170,7 +170,8 @@ public:
         return efferents;
     }
 
-    bool init_matrix_from_lil(std::vector<IT> &post_ranks, std::vector< std::vector<IT> > &pre_ranks, const IT num_partitions) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT> &post_ranks, LIL &pre_ranks, const IT num_partitions) {
     #ifdef _DEBUG
         std::cout << "PartitionedMatrix::init_matrix_from_lil():" << std::endl;
     #endif
@@ -186,7 +187,7 @@ public:
         for(; slice_it != slices_.end(); slice_it++, part_idx++) {
             // create sub matrix with the previously determined slices
             auto post_rank_slice = std::vector<IT>(post_ranks.begin()+slice_it->first, post_ranks.begin()+slice_it->second);
-            auto pre_rank_slice = std::vector< std::vector<IT> >(pre_ranks.begin()+slice_it->first, pre_ranks.begin()+slice_it->second);
+            auto pre_rank_slice = lil_slice(pre_ranks, slice_it->first, slice_it->second);
 
             // initialize the sub-matrices
             bool success = sub_matrices_[part_idx]->init_matrix_from_lil(post_rank_slice, pre_rank_slice);
@@ -445,8 +446,8 @@ public:
         }
     }
 
-    template <typename VT, typename PART_TYPE>
-    inline void update_matrix_variable_all(std::vector< PART_TYPE > &variable, const std::vector< std::vector<VT> > &data)
+    template <typename VT, typename PART_TYPE, typename LIL>
+    inline void update_matrix_variable_all(std::vector< PART_TYPE > &variable, const LIL &data)
     {
         assert ( (variable.size() == num_partitions_) );
         assert ( (slices_.size() == num_partitions_) );
@@ -454,9 +455,9 @@ public:
         auto it = slices_.begin();
         int part_idx = 0;
         for(; it != slices_.end(); it++, part_idx++) {
-            auto data_slice = std::vector< std::vector<VT> >(data.begin()+it->first, data.begin()+it->second);
+            auto data_slice = lil_slice(data, it->first, it->second);
 
-            sub_matrices_[part_idx]->update_matrix_variable_all(variable[part_idx], data_slice);
+            sub_matrices_[part_idx]->template update_matrix_variable_all<VT>(variable[part_idx], data_slice);
         }
     }
 
@@ -474,6 +475,44 @@ public:
         return new_variable;
     }
 
+    /**
+     *  @brief      copies the connectivity into preallocated arrays in CSR format.
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()). The partitions export their rows one after the other, as in get_post_rank().
+     *  @tparam     PT          data type of the row pointers.
+     *  @tparam     CT          data type of the column indices.
+     *  @param[out] row_ptr     array of nb_dendrites()+1 elements.
+     *  @param[out] col_idx     array of nb_synapses() elements receiving the column indices (pre-synaptic ranks).
+     */
+    template <typename PT, typename CT>
+    void export_csr_connectivity(PT* row_ptr, CT* col_idx) {
+        IT row_offset = 0;
+        PT nnz = 0;
+        for (auto it = sub_matrices_.begin(); it != sub_matrices_.end(); it++) {
+            IT num_rows = (*it)->nb_dendrites();
+            (*it)->export_csr_connectivity(row_ptr + row_offset, col_idx + nnz);
+            for (IT r = 0; r <= num_rows; r++)
+                row_ptr[row_offset + r] += nnz;
+
+            row_offset += num_rows;
+            nnz = row_ptr[row_offset];
+        }
+        row_ptr[0] = 0;
+    }
+
+    /**
+     *  @brief      copies a variable into a preallocated array, in the order of export_csr_connectivity().
+     *  @details    this function is only called by the Python interface (Projection.sparse_matrix()).
+     *  @tparam     VT          data type of the variable.
+     *  @param[out] values      array of nb_synapses() elements.
+     */
+    template <typename VT, typename PART_TYPE>
+    void export_csr_variable(const std::vector< PART_TYPE > &variable, VT* values) {
+        for (int part_idx = 0; part_idx < sub_matrices_.size(); part_idx++) {
+            sub_matrices_[part_idx]->export_csr_variable(variable[part_idx], values);
+            values += sub_matrices_[part_idx]->nb_synapses();
+        }
+    }
+
     template <typename VT, typename PART_TYPE>
     inline std::vector< VT > get_matrix_variable_row(const std::vector< PART_TYPE > &variable, const IT &lil_idx) {
         // find the correct partition
@@ -129,7 +129,8 @@ class SELLMatrixCUDA : public SELLMatrix<IT, ST, false> {
     /*
     *   init matrix from lil format  
     */
-    bool init_matrix_from_lil(std::vector<IT>& post_ranks, std::vector< std::vector<IT> >& pre_ranks) {
+    template<typename LIL>
+    bool init_matrix_from_lil(std::vector<IT>& post_ranks, LIL &pre_ranks) {
         assert((post_ranks.size() == pre_ranks.size()));
         assert((post_ranks.size() > 0));
 
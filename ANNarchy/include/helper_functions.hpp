@@ -21,6 +21,11 @@
  */
 #pragma once
 
+#include <algorithm>
+#include <cstddef>
+#include <iterator>
+#include <vector>
+
 // Sort criterion must be in a. The values
 // are sorted ascending.
 template<typename Type1, typename Type2>
@@ -45,3 +50,153 @@ void pairsort(Type1 *a, Type2 *b, int n)
         b[i] = pairt[i].second;
     }
 }
+
+/**
+ *  @brief      Read-only view on buffers in compressed sparse row (CSR) format.
+ *  @details    The view provides the part of the interface of a list-of-lists (std::vector< std::vector<T> >)
+ *              used by the init_matrix_from_lil() and update_matrix_variable_all() methods of the sparse matrix
+ *              classes. The buffers are not copied, they must stay valid while the view is used. If the view
+ *              is created with single_value set to true, the buffer contains only one value which is repeated
+ *              in each row (e. g. a constant weight).
+ *  @tparam     T       data type of the stored values.
+ *  @tparam     PT      data type of the row pointers.
+ */
+template<typename T, typename PT>
+class CSRView {
+public:
+    /**
+     *  @brief      Random access iterator over the elements of one row.
+     *  @details    The step is 0 if a single value is repeated.
+     */
+    class element_iterator {
+        const T* data_;
+        std::ptrdiff_t idx_;
+        std::ptrdiff_t step_;
+
+    public:
+        using iterator_category = std::random_access_iterator_tag;
+        using value_type = T;
+        using difference_type = std::ptrdiff_t;
+        using pointer = const T*;
+        using reference = const T&;
+
+        element_iterator(const T* data, std::ptrdiff_t idx, std::ptrdiff_t step): data_(data), idx_(idx), step_(step) {}
+
+        reference operator*() const { return data_[idx_ * step_]; }
+        pointer operator->() const { return data_ + idx_ * step_; }
+        reference operator[](difference_type n) const { return data_[(idx_ + n) * step_]; }
+
+        element_iterator& operator++() { idx_++; return *this; }
+        element_iterator operator++(int) { element_iterator tmp(*this); idx_++; return tmp; }
+        element_iterator& operator--() { idx_--; return *this; }
+        element_iterator operator--(int) { element_iterator tmp(*this); idx_--; return tmp; }
+        element_iterator& operator+=(difference_type n) { idx_ += n; return *this; }
+        element_iterator& operator-=(difference_type n) { idx_ -= n; return *this; }
+        element_iterator operator+(difference_type n) const { return element_iterator(data_, idx_ + n, step_); }
+        element_iterator operator-(difference_type n) const { return element_iterator(data_, idx_ - n, step_); }
+        difference_type operator-(const element_iterator& other) const { return idx_ - other.idx_; }
+
+        bool operator==(const element_iterator& other) const { return idx_ == other.idx_; }
+        bool operator!=(const element_iterator& other) const { return idx_ != other.idx_; }
+        bool operator<(const element_iterator& other) const { return idx_ < other.idx_; }
+        bool operator>(const element_iterator& other) const { return idx_ > other.idx_; }
+        bool operator<=(const element_iterator& other) const { return idx_ <= other.idx_; }
+        bool operator>=(const element_iterator& other) const { return idx_ >= other.idx_; }
+    };
+
+    /**
+     *  @brief      One row of the view, behaves like a const std::vector<T>.
+     *  @details    The conversion to std::vector creates a copy of this row only.
+     */
+    class row {
+        const T* data_;
+        std::size_t size_;
+        std::ptrdiff_t step_;
+
+    public:
+        row(const T* data, std::size_t size, std::ptrdiff_t step): data_(data), size_(size), step_(step) {}
+
+        std::size_t size() const { return size_; }
+        bool empty() const { return size_ == 0; }
+        const T& operator[](std::size_t idx) const { return data_[idx * step_]; }
+
+        element_iterator begin() const { return element_iterator(data_, 0, step_); }
+        element_iterator end() const { return element_iterator(data_, size_, step_); }
+        element_iterator cbegin() const { return begin(); }
+        element_iterator cend() const { return end(); }
+
+        template<typename U>
+        operator std::vector<U>() const { return std::vector<U>(begin(), end()); }
+    };
+
+    /**
+     *  @brief      Forward iterator over the rows of the view.
+     */
+    class row_iterator {
+        const CSRView* view_;
+        std::size_t idx_;
+        mutable row row_;
+
+    public:
+        using iterator_category = std::forward_iterator_tag;
+        using value_type = row;
+        using difference_type = std::ptrdiff_t;
+        using pointer = const row*;
+        using reference = row;
+
+        row_iterator(const CSRView* view, std::size_t idx): view_(view), idx_(idx), row_(nullptr, 0, 0) {}
+
+        row operator*() const { return (*view_)[idx_]; }
+        const row* operator->() const { row_ = (*view_)[idx_]; return &row_; }
+
+        row_iterator& operator++() { idx_++; return *this; }
+        row_iterator operator++(int) { row_iterator tmp(*this); idx_++; return tmp; }
+        row_iterator operator+(difference_type n) const { return row_iterator(view_, idx_ + n); }
+
+        bool operator==(const row_iterator& other) const { return idx_ == other.idx_; }
+        bool operator!=(const row_iterator& other) const { return idx_ != other.idx_; }
+    };
+
+    CSRView(const T* data, const PT* row_ptr, std::size_t num_rows, bool single_value=false):
+        data_(data), row_ptr_(row_ptr), num_rows_(num_rows), single_value_(single_value) {}
+
+    std::size_t size() const { return num_rows_; }
+    bool empty() const { return num_rows_ == 0; }
+
+    row operator[](std::size_t idx) const {
+        std::size_t row_size = static_cast<std::size_t>(row_ptr_[idx+1] - row_ptr_[idx]);
+        if (single_value_)
+            return row(data_, row_size, 0);
+        return row(data_ + (row_ptr_[idx] - row_ptr_[0]), row_size, 1);
+    }
+
+    row_iterator begin() const { return row_iterator(this, 0); }
+    row_iterator end() const { return row_iterator(this, num_rows_); }
+
+    /**
+     *  @brief      View on the rows [first, last) of this view.
+     */
+    CSRView slice(std::size_t first, std::size_t last) const {
+        return CSRView(single_value_ ? data_ : data_ + (row_ptr_[first] - row_ptr_[0]), row_ptr_ + first, last - first, single_value_);
+    }
+
+private:
+    const T* data_;
+    const PT* row_ptr_;
+    std::size_t num_rows_;
+    bool single_value_;
+};
+
+/**
+ *  @brief      Returns the rows [first, last) of a list-of-lists.
+ *  @details    The rows of a std::vector are copied, a CSRView returns a view without copy.
+ */
+template<typename T>
+std::vector< std::vector<T> > lil_slice(const std::vector< std::vector<T> >& lil, std::size_t first, std::size_t last) {
+    return std::vector< std::vector<T> >(lil.begin() + first, lil.begin() + last);
+}
+
+template<typename T, typename PT>
+CSRView<T, PT> lil_slice(const CSRView<T, PT>& lil, std::size_t first, std::size_t last) {
+    return lil.slice(first, last);
+}
@@ -112,94 +112,79 @@ class SpikeSourceArray(SpecificPopulation):
 
         self._specific_template['declare_additional'] = """
     // Custom local parameter spike_times
-    // std::vector< %(float_prec)s > r ;
     std::vector< std::vector< long int > > spike_times ;
-    std::vector< long int >  next_spike ;
-    std::vector< int > idx_next_spike;
+    // Schedule of all spikes sorted by time step (then rank) and the first event not emitted yet
+    std::vector< long int > _event_times ;
+    std::vector< int > _event_ranks ;
+    std::size_t _event_cursor ;
     long int _t;
 
-    // Recompute the spike times
+    // Rebuilds the schedule from the spike times of all neurons
     void recompute_spike_times(){
-        std::fill(next_spike.begin(), next_spike.end(), -10000);
-        std::fill(idx_next_spike.begin(), idx_next_spike.end(), 0);
-        for(int i=0; i< size; i++){
-            if(!spike_times[i].empty()){
-                int idx = 0;
-                // Find the first spike time which is not in the past
-                while(spike_times[i][idx] < _t){
-                    idx++;
-                }
-                // Set the next spike
-                if(idx < spike_times[i].size())
-                    next_spike[i] = spike_times[i][idx];
-                else
-                    next_spike[i] = -10000;
-            }
+        std::vector< std::pair< long int, int > > events;
+        std::size_t nb_events = 0;
+        for(int i=0; i < spike_times.size(); i++)
+            nb_events += spike_times[i].size();
+        events.reserve(nb_events);
+        for(int i=0; i < spike_times.size(); i++){
+            for(auto it = spike_times[i].begin(); it != spike_times[i].end(); it++)
+                events.push_back(std::make_pair(*it, i));
+        }
+        std::sort(events.begin(), events.end());
+
+        _event_times.resize(nb_events);
+        _event_ranks.resize(nb_events);
+        for(std::size_t k=0; k < nb_events; k++){
+            _event_times[k] = events[k].first;
+            _event_ranks[k] = events[k].second;
         }
+        this->reset_cursor();
     }
-"""% { 'float_prec': get_global_config('precision') }
 
-        #self._specific_template['access_parameters_variables'] = ""
+    // The first spike which is not in the past
+    void reset_cursor(){
+        _event_cursor = std::lower_bound(_event_times.begin(), _event_times.end(), _t) - _event_times.begin();
+    }
+"""
 
         self._specific_template['init_additional'] = """
         _t = 0;
-        next_spike = std::vector<long int>(size, -10000);
-        idx_next_spike = std::vector<int>(size, 0);
+        _event_cursor = 0;
         this->recompute_spike_times();
 """ 
 
         self._specific_template['reset_additional'] = """
         _t = 0;
-        this->recompute_spike_times();
+        this->reset_cursor();
+"""
+
+        # Only the events of the current step are visited
+        emit_spikes = """
+                spiked.clear();
+                while(_event_cursor < _event_times.size() && _event_times[_event_cursor] == _t){
+                    int rk = _event_ranks[_event_cursor];
+                    last_spike[rk] = _t;
+                    spiked.push_back(rk);
+                    _event_cursor++;
+                }
+                _t++;
 """
 
         if get_global_config('num_threads') == 1:
             self._specific_template['update_variables'] = """
         if(_active){
-            spiked.clear();
-            for(int i = 0; i < size; i++){
-                // Emit spike
-                if( _t == next_spike[i] ){
-                    last_spike[i] = _t;
-                    idx_next_spike[i]++ ;
-                    if(idx_next_spike[i] < spike_times[i].size()){
-                        next_spike[i] = spike_times[i][idx_next_spike[i]];
-                    }
-                    spiked.push_back(i);
-                }
-            }
-            _t++;
+%(emit_spikes)s
         }
-"""
+""" % {'emit_spikes': emit_spikes}
         else:
             self._specific_template['update_variables'] = """
         if(_active){
             #pragma omp single
             {
-                spiked.clear();
-            }
-
-            #pragma omp for
-            for(int i = 0; i < size; i++){
-                // Emit spike
-                if( _t == next_spike[i] ){
-                    last_spike[i] = _t;
-                    idx_next_spike[i]++ ;
-                    if(idx_next_spike[i] < spike_times[i].size()){
-                        next_spike[i] = spike_times[i][idx_next_spike[i]];
-                    }
-
-                    #pragma omp critical
-                    spiked.push_back(i);
-                }
-            }
-
-            #pragma omp single
-            {
-                _t++;
+%(emit_spikes)s
             }
         }
-"""
+""" % {'emit_spikes': emit_spikes}
         self._specific_template['test_spike_cond'] = ""
 
         self._specific_template['export_additional'] ="""
@@ -0,0 +1,370 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import os
+import numpy as np
+
+from ANNarchy.intern.SpecificPopulation import SpecificPopulation
+from ANNarchy.intern.StreamFeeder import StreamFeeder
+from ANNarchy.intern.ConfigManagement import get_global_config
+from ANNarchy.intern import Messages
+from ANNarchy.core.Population import Population
+from ANNarchy.core.Neuron import Neuron
+
+class StreamingTimedArray(SpecificPopulation):
+    """
+    Rate-coded population presenting a stream of inputs which does not fit into memory (video frames, audio features...).
+
+    Contrary to the ``TimedArray``, the inputs are not copied into the C++ core at once: they are read by chunks of ``chunk_length`` inputs in a background thread, which keeps at most ``prefetch`` chunks in advance. The C++ core holds two chunks (the current one and the next one), swaps them when the current one is consumed and swaps the next input with `r` instead of copying it.
+
+    The source can be an array whose first axis corresponds to time. A ``np.memmap`` is read from the disk only when the corresponding chunk is needed:
+
+    ```python
+    frames = np.memmap('frames.dat', dtype=np.uint8, mode='r', shape=(100000, 64, 64))
+
+    inp = ann.StreamingTimedArray(frames, schedule=40.)
+    ```
+
+    A path to a raw binary file is opened the same way, the ``dtype`` of the file and the ``geometry`` must then be provided:
+
+    ```python
+    inp = ann.StreamingTimedArray('frames.dat', geometry=(64, 64), dtype=np.uint8, schedule=40.)
+    ```
+
+    The source can also be an iterator (e.g. a Python generator) returning one input per scheduled time point:
+
+    ```python
+    def features():
+        for block in audio_blocks():
+            yield compute_features(block)
+
+    inp = ann.StreamingTimedArray(features(), geometry=20, schedule=10.)
+    ```
+
+    The first input is set at the beginning of the simulation, the next ones every ``schedule`` ms (default: every step). When the stream is exhausted, the last input is kept.
+
+    Calling ``reset()`` restarts the presentation from the first input for arrays and files. Iterators can not be rewound: they continue where they are. For the same reason, an iterator can only be consumed by a single network: create one ``StreamingTimedArray`` (with its own iterator) per network.
+
+    ``view('r')`` is supported: the inputs are then copied into ``r`` instead of being swapped with it, so that the view always reflects the current input.
+
+    Only the CPU paradigm is supported. As the C++ core requests the chunks from Python, reading a source should not itself wait for the simulation.
+
+    :param source: array whose first axis is time, path to a raw binary file or iterator of inputs.
+    :param geometry: desired dimensions of the population. Required for files and iterators.
+    :param schedule: interval in ms between two inputs. Default: every step.
+    :param chunk_length: number of inputs read at once.
+    :param prefetch: maximal number of chunks read in advance.
+    :param dtype: numpy type of the values stored in a raw binary file. Default: the floating precision of the network.
+    :param name: optional name for the population.
+    """
+    def __init__(self,
+                 source,
+                 geometry:int|tuple=None,
+                 schedule:float=0.,
+                 chunk_length:int=100,
+                 prefetch:int=4,
+                 dtype=None,
+                 name:str=None,
+                 copied:bool=False):
+
+        neuron = Neuron(
+            parameters="",
+            equations="r = 0.0",
+            name="Streaming Timed Array",
+            description="Timed array reading its inputs from a stream."
+        )
+
+        # Raw binary files are mapped into memory
+        if isinstance(source, (str, os.PathLike)):
+            if geometry is None:
+                Messages._error("StreamingTimedArray: the *geometry* argument must be set when reading a file.")
+            if dtype is None:
+                dtype = np.float32 if get_global_config('precision') == "float" else np.float64
+            source = np.memmap(source, dtype=dtype, mode='r')
+            source = source.reshape((-1, int(np.prod(geometry))))
+
+        # Geometry of the population
+        if hasattr(source, 'shape'):
+            if geometry is None:
+                geometry = source.shape[1:]
+        elif hasattr(source, '__iter__'):
+            if geometry is None:
+                Messages._error("StreamingTimedArray: the *geometry* argument must be set when the source is an iterator.")
+        else:
+            Messages._error("StreamingTimedArray: the source must be an array, a file name or an iterator.")
+
+        if chunk_length < 1 or prefetch < 1:
+            Messages._error("StreamingTimedArray: *chunk_length* and *prefetch* must be positive.")
+
+        SpecificPopulation.__init__(self, geometry=geometry, neuron=neuron, name=name, copied=copied)
+
+        if hasattr(source, 'shape') and int(np.prod(source.shape[1:])) != self.size:
+            Messages._error("StreamingTimedArray: mismatch between the inputs (", source.shape[1:], ") and the geometry (", self.geometry, ").")
+
+        self.init['schedule'] = schedule
+
+        self._source = source
+        self._chunk_length = chunk_length
+        self._prefetch = prefetch
+        self._feeder = None
+        # An iterator is consumed by the first network using it (see _copy() and _instantiate())
+        self._copied = copied
+        self._iterator_taken = False
+
+    @property
+    def r(self):
+        if self.initialized:
+            return self._get_cython_attribute("r")
+        else:
+            Messages._error("Read-out of 'r' is only possible after compile.")
+
+    @r.setter
+    def r(self, new_r):
+        Messages._error("The value of r is defined through the *source* argument.")
+
+    def _copy(self):
+        "Returns a copy of the population when creating networks."
+        if not hasattr(self._source, 'shape'):
+            # The frames of an iterator would be distributed between the networks
+            if self._iterator_taken:
+                Messages._error("StreamingTimedArray: the iterator source of", self.name, "is already used by another network, create one StreamingTimedArray per network.")
+            self._iterator_taken = True
+        return StreamingTimedArray(source=self._source, geometry=self.geometry, schedule=self.schedule, chunk_length=self._chunk_length, prefetch=self._prefetch, name=self.name, copied=True)
+
+    def _generate_st(self):
+        """
+        adjust code templates for the specific population for single thread.
+        """
+        self._generate_omp()
+
+        self._specific_template['update_variables'] = """
+        if(_active) {
+%(present_input)s
+        }
+""" % {'present_input': self._present_input()}
+
+    def _generate_omp(self):
+        """
+        adjust code templates for the specific population for openMP.
+        """
+        self._specific_template['declare_additional'] = """
+    // Custom local parameters of a StreamingTimedArray
+    int _interval; // Number of steps between two inputs
+    long int _t; // Internal time
+    std::vector< std::vector< %(float_prec)s > > _front; // Chunk of inputs being presented
+    std::vector< std::vector< %(float_prec)s > > _back; // Next chunk of inputs
+    std::size_t _frame; // Next input in _front
+    bool _copy_input; // Inputs are copied into r instead of swapped, as a view onto r exists
+    // Requests the next chunk (fill_back_buffer()) from the Python side, set before init_population()
+    void (*_fetch)(void*) = nullptr;
+    void* _feeder = nullptr;
+""" % {'float_prec': get_global_config('precision')}
+
+        self._specific_template['access_additional'] = """
+    // Custom local parameters of a StreamingTimedArray
+    void set_interval(int interval) { _interval = interval; }
+    int get_interval() { return _interval; }
+    void set_feeder(void (*fetch)(void*), void* feeder) { _fetch = fetch; _feeder = feeder; }
+    void set_copy_input(bool copy_input) { _copy_input = copy_input; }
+
+    // The vectors of the consumed chunk are re-used
+    void fill_back_buffer(const %(float_prec)s* values, int nb_frames) {
+        _back.resize(nb_frames);
+        for(int k = 0; k < nb_frames; k++)
+            _back[k].assign(values + k*size, values + (k+1)*size);
+    }
+
+    // Loads the first two chunks of the stream
+    void start_stream() {
+        _front.clear();
+        _back.clear();
+        _frame = 0;
+        if(_fetch == nullptr)
+            return;
+
+        _fetch(_feeder);
+        _front.swap(_back);
+        if(!_front.empty())
+            _fetch(_feeder);
+    }
+
+    // Number of inputs in the C++ buffers which were not presented yet
+    int get_buffered_frames() { return _front.size() - _frame + _back.size(); }
+""" % {'float_prec': get_global_config('precision')}
+
+        self._specific_template['init_additional'] = """
+        // Initialize counters
+        _t = 0;
+        _interval = 1;
+        _frame = 0;
+        _copy_input = false;
+"""
+        self._specific_template['export_additional'] = """
+        # Custom local parameters of a StreamingTimedArray
+        void set_interval(int)
+        int get_interval()
+        void set_feeder(void (*)(void*) noexcept, void*)
+        void set_copy_input(bool)
+        void fill_back_buffer(const %(float_prec)s*, int)
+        void start_stream()
+        int get_buffered_frames()
+""" % {'float_prec': get_global_config('precision')}
+
+        self._specific_template['reset_additional'] ="""
+        _t = 0;
+        r.assign(size, 0.0);
+"""
+
+        self._specific_template['wrapper_access_additional'] = """
+    # Custom local parameters of a StreamingTimedArray
+    cdef object _feeder
+
+    cpdef set_interval( self, interval ):
+        pop%(id)s.set_interval( interval )
+    cpdef int get_interval( self ):
+        return pop%(id)s.get_interval()
+
+    # The feeder (StreamFeeder) is called back by the C++ core when it needs the next chunk
+    cpdef set_feeder( self, feeder ):
+        self._feeder = feeder
+        pop%(id)s.set_feeder( pop%(id)s_wrapper._fetch_chunk, <void*>self )
+    cpdef start_stream( self ):
+        pop%(id)s.start_stream()
+    cpdef set_copy_input( self, bool copy_input ):
+        pop%(id)s.set_copy_input( copy_input )
+    cpdef int get_buffered_frames( self ):
+        return pop%(id)s.get_buffered_frames()
+
+    @staticmethod
+    cdef void _fetch_chunk( void* wrapper ) noexcept with gil:
+        cdef %(float_prec)s[:, ::1] values
+        chunk = (<pop%(id)s_wrapper>wrapper)._feeder.next_chunk()
+        if chunk is None or chunk.shape[0] == 0:
+            pop%(id)s.fill_back_buffer(NULL, 0)
+        else:
+            values = chunk
+            pop%(id)s.fill_back_buffer(&values[0, 0], values.shape[0])
+""" % { 'id': self.id, 'float_prec': get_global_config('precision') }
+
+        # The master thread calls back Python: it is the one which might hold the GIL (step())
+        self._specific_template['update_variables'] = """
+        if(_active){
+            #pragma omp master
+            {
+%(present_input)s
+            }
+            #pragma omp barrier
+        }
+""" % {'present_input': self._present_input()}
+
+        self._specific_template['size_in_bytes'] = """
+        // buffers
+        size_in_bytes += (_front.capacity() + _back.capacity()) * sizeof(std::vector<%(float_prec)s>);
+        for( auto it = _front.begin(); it != _front.end(); it++ )
+            size_in_bytes += it->capacity() * sizeof(%(float_prec)s);
+        for( auto it = _back.begin(); it != _back.end(); it++ )
+            size_in_bytes += it->capacity() * sizeof(%(float_prec)s);
+""" % {'float_prec': get_global_config('precision')}
+
+    def _present_input(self):
+        "Code shared by the single thread and openMP implementations."
+        return """
+            #ifdef _DEBUG
+                std::cout << "StreamingTimedArray::update() - " << _t << " " << _frame << "/" << _front.size() << std::endl;
+            #endif
+
+            // Check if it is time to set the input
+            if(_t % _interval == 0){
+                // The current chunk is consumed, the next one is already loaded
+                if(_frame == _front.size() && !_back.empty()){
+                    _front.swap(_back);
+                    _frame = 0;
+                    _fetch(_feeder);
+                }
+
+                // Exchange the input with r, if the stream is exhausted the last input is kept.
+                // The storage of r must not change while a view onto it exists.
+                if(_frame < _front.size()){
+                    if(_copy_input)
+                        std::copy(_front[_frame].begin(), _front[_frame].end(), r.begin());
+                    else
+                        r.swap(_front[_frame]);
+                    _frame++;
+                }
+            }
+
+            // Always increment the internal time
+            _t++;
+"""
+
+    def _generate_cuda(self):
+        """
+        The inputs are requested from Python during the simulation, which is not implemented for CUDA devices.
+        """
+        Messages._error('StreamingTimedArray is not available on CUDA yet.')
+
+    def _instantiate(self, module):
+        if not self._copied and not hasattr(self._source, 'shape'):
+            if self._iterator_taken and self._feeder is None:
+                Messages._error("StreamingTimedArray: the iterator source of", self.name, "is already used by another network, create one StreamingTimedArray per network.")
+            self._iterator_taken = True
+
+        # Create the Cython instance
+        self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size, self.max_delay)
+
+        dtype = np.float32 if get_global_config('precision') == "float" else np.float64
+        self._feeder = StreamFeeder(self._source, self.size, self._chunk_length, self._prefetch, dtype)
+        self.cyInstance.set_feeder(self._feeder)
+
+    def _init_attributes(self):
+        Population._init_attributes(self)
+        self._start_stream()
+
+    def _start_stream(self):
+        "(Re)starts the stream, iterators which were already started continue where they are."
+        if self._feeder.start():
+            self.cyInstance.start_stream()
+
+    def view(self, name:str, writable:bool=False) -> np.ndarray:
+        """
+        Returns a Numpy array sharing its memory with ``r`` (see ``Population.view()``). The following inputs
+        are copied into ``r`` instead of being swapped with it.
+        """
+        data = Population.view(self, name, writable)
+        self.cyInstance.set_copy_input(True)
+        return data
+
+    def _clear(self):
+        if self._feeder is not None:
+            self._feeder.stop()
+        Population._clear(self)
+
+    def reset(self, attributes:list=None) -> None:
+        """
+        Resets the population and restarts the stream from the first input (except for iterators).
+
+        :param attributes: list of attributes which should be reinitialized. Default: all attributes, the stream is only restarted in that case.
+        """
+        Population.reset(self, attributes)
+        if attributes is None:
+            self._start_stream()
+
+    def __setattr__(self, name, value):
+        if name == 'schedule':
+            if self.initialized:
+                self.cyInstance.set_interval(max(1, round(value / get_global_config('dt'))))
+            else:
+                self.init['schedule'] = value
+        else:
+            Population.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        if name == 'schedule':
+            if self.initialized:
+                return get_global_config('dt') * self.cyInstance.get_interval()
+            else:
+                return self.init['schedule']
+        else:
+            return Population.__getattribute__(self, name)
@@ -4,6 +4,7 @@ from .PoissonPopulation import PoissonPopulation
 from .SpikeSourceArray import SpikeSourceArray
 from .SpikeTrains import HomogeneousCorrelatedSpikeTrains
 from .TimedArray import TimedArray, TimedPoissonPopulation
+from .StreamingTimedArray import StreamingTimedArray
 
 # SpecificProjecion inheritances
 from .CurrentInjection import CurrentInjection
@@ -13,5 +14,6 @@ __all__ = [
     'InputArray',
     'PoissonPopulation', 'SpikeSourceArray', 'TimedArray',
     'HomogeneousCorrelatedSpikeTrains', 'TimedPoissonPopulation',
+    'StreamingTimedArray',
     'DecodingProjection', 'CurrentInjection'
 ]
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import numpy as np
+
+from ANNarchy.intern import Messages
+
+class AttributeView(np.ndarray):
+    """
+    Numpy array sharing its memory with an attribute of the C++ core, returned by
+    Population.view() and Projection.view().
+
+    The C++ data can be deallocated or reallocated while the view is still referenced
+    on the Python side. The views created by the same call share a validity flag, which
+    is cleared by invalidate() before (or as soon as possible after) the memory is released.
+    Any further access to the values through such a view, or through the arrays derived
+    from it (e.g. slices), raises an error instead of reading freed memory.
+    """
+    def __new__(cls, data, writable, valid):
+        """
+        :param data: numpy array wrapping the C++ data.
+        :param writable: if the values can be modified through the view.
+        :param valid: list containing a single boolean, shared by the views which are invalidated together.
+        """
+        obj = np.asarray(data).view(cls)
+        obj._valid = valid
+        obj.flags.writeable = writable
+        return obj
+
+    def __array_finalize__(self, obj):
+        # arrays derived from a view (slices, reshape, ...) share its memory and therefore its validity
+        self._valid = getattr(obj, '_valid', None) or [True]
+
+    @staticmethod
+    def invalidate(valid):
+        "Marks the views sharing the flag *valid* as unusable."
+        valid[0] = False
+
+    def _check_valid(self):
+        if not object.__getattribute__(self, '_valid')[0]:
+            Messages._error('the view onto the C++ data is not valid anymore (the data was deallocated), call view() again.')
+
+    def __getattribute__(self, name):
+        # methods and properties accessing the values (tolist(), argmax(), T, ...)
+        if name[0] != '_':
+            object.__getattribute__(self, '_check_valid')()
+        return super().__getattribute__(name)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # arithmetic operators, comparisons and reductions (sum(), mean(), ...)
+        inputs = tuple(AttributeView._unwrap(x) for x in inputs)
+        out = kwargs.get('out', None)
+        if out is not None:
+            kwargs['out'] = tuple(AttributeView._unwrap(x) for x in out)
+
+        results = getattr(ufunc, method)(*inputs, **kwargs)
+
+        # in-place operations must return the view itself
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        return results
+
+    def __array_function__(self, func, types, args, kwargs):
+        for arg in args:
+            if isinstance(arg, AttributeView):
+                arg._check_valid()
+        return super().__array_function__(func, types, args, kwargs)
+
+    @staticmethod
+    def _unwrap(x):
+        if isinstance(x, AttributeView):
+            x._check_valid()
+            return x.view(np.ndarray)
+        return x
+
+def _guarded(name):
+    "Checks the validity of the view before calling the method *name* of numpy.ndarray."
+    method = getattr(np.ndarray, name)
+    def wrapper(self, *args, **kwargs):
+        self._check_valid()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+# Special methods are looked up on the type and bypass __getattribute__()
+for _name in ['__getitem__', '__setitem__', '__iter__', '__contains__', '__repr__', '__str__', '__format__',
+              '__bool__', '__int__', '__float__', '__complex__', '__index__', '__array__',
+              '__copy__', '__deepcopy__', '__reduce__', '__reduce_ex__']:
+    setattr(AttributeView, _name, _guarded(_name))
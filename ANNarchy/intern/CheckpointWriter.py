@@ -0,0 +1,89 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ANNarchy.intern.ConfigManagement import get_global_config
+from ANNarchy.intern import Messages
+
+class CheckpointWriter :
+    """
+    Writes the files of *save(..., asynchronous=True)* in a background thread.
+
+    The data is copied from the C++ core in the calling thread, only the serialization,
+    compression and writing are deferred. A single worker thread is used, so the files
+    are written in the order of the calls (incremental checkpoints require their base).
+
+    The number of checkpoints in flight is bounded by *checkpoint_queue_size*: when the
+    queue is full, submit() blocks until the oldest checkpoint is written.
+
+    The class is implemented as singleton and therefore initialized on first request.
+    """
+    _instance = None
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        pass
+
+    def __new__(cls):
+        """
+        First call construction of the CheckpointWriter. No additional arguments are required.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._executor = None
+            cls._instance._lock = threading.Condition()
+            cls._instance._pending = []
+
+        return cls._instance
+
+    def submit(self, method, *args):
+        """
+        Calls *method(*args)* in the background thread and returns a `concurrent.futures.Future`.
+        """
+        max_pending = max(1, get_global_config('checkpoint_queue_size'))
+
+        with self._lock:
+            # Wait for a free slot
+            while len(self._pending) >= max_pending:
+                self._lock.wait()
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ANNarchy-checkpoint")
+
+            future = self._executor.submit(method, *args)
+            self._pending.append(future)
+
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        "Frees the slot of a written checkpoint."
+        with self._lock:
+            if future in self._pending:
+                self._pending.remove(future)
+            self._lock.notify_all()
+
+        if future.exception() is not None:
+            Messages._warning('save(): writing the checkpoint failed in the background thread:', future.exception())
+
+    def pending(self):
+        "Number of checkpoints which are not written yet."
+        with self._lock:
+            return len(self._pending)
+
+    def wait(self):
+        """
+        Blocks until all submitted checkpoints are written. The first exception raised
+        while writing is raised again.
+        """
+        with self._lock:
+            futures = list(self._pending)
+
+        for future in futures:
+            future.result()
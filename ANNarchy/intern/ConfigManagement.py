@@ -40,6 +40,7 @@ class ConfigManager:
                 num_threads = 1,
                 visible_cores = [],
                 paradigm = 'openmp',
+                batch_size = 1,
                 # Logging
                 verbose = False,
                 suppress_warnings = False,
@@ -60,6 +61,15 @@ class ConfigManager:
                 # Profiling
                 profiling = False,
                 profile_out = None,
+                # Compilation cache
+                compilation_cache = False,
+                compilation_cache_dir = "~/.cache/ANNarchy",
+                compilation_cache_size = 2048,
+                # Equation cache
+                equation_cache = True,
+                equation_cache_dir = "~/.cache/ANNarchy/equations",
+                # Checkpoints
+                checkpoint_queue_size = 2,
                 # Other
                 debug = False,
                 disable_shared_library_time_offset = False
@@ -114,15 +124,26 @@ def setup(**keyValueArgs):
     * num_threads: number of treads used by openMP (overrides the environment variable ``OMP_NUM_THREADS`` when set, default = None).
     * visible_cores: allows a fine-grained control which cores are useable for the created threads (default = [] for no limitation).
                      It can be used to limit created openMP threads to a physical socket.
+    * batch_size: number of instances of the network simulated by the same library (default: 1). The instances share the connectivity of the projections,
+                  while each one has its own neural variables. Local attributes of populations get a leading batch dimension.
+                  PopulationView.get() and PopulationView.sum() return one row per instance, PopulationView.spike one list of ranks per instance
+                  and PopulationView.set() applies the same values to all instances, while individual neurons access the first instance.
+                  Initial values given as random distributions are drawn separately for each instance.
     * structural_plasticity: allows synapses to be dynamically added/removed during the simulation (default: False).
     * seed: the seed (integer) to be used in the random number generators (default = None is equivalent to time(NULL)).
+    * compilation_cache: if True, compiled libraries are stored in a persistent cache shared by all working directories and re-used when the generated code is identical (default: False).
+    * compilation_cache_dir: location of the compilation cache (default: "~/.cache/ANNarchy").
+    * compilation_cache_size: maximal size of the compilation cache in MB, the least recently used libraries are removed first (default: 2048).
+    * equation_cache: if True, the C++ code generated by the parser for each equation is stored on disk and re-used when a neuron or synapse with the same equations is analysed again (default: True).
+    * equation_cache_dir: location of the equation cache (default: "~/.cache/ANNarchy/equations").
+    * checkpoint_queue_size: maximal number of checkpoints written in the background by `save(..., asynchronous=True)`, further calls block until a checkpoint is written (default: 2).
 
     The following parameters are mainly for debugging and profiling, and should be ignored by most users:
 
     * verbose: shows details about compilation process on console (by default False). Additional some information of the network construction will be shown.
     * suppress_warnings: if True, warnings (e. g. from the mathematical parser) are suppressed.
     * show_time: if True, initialization times are shown. Attention: verbose should be set to True additionally.
-    * disable_shared_library_time_offset: by default False. If set to True, the shared library generated by ANNarchy will not be extended by time offset.
+    * disable_shared_library_time_offset: by default False. If set to True, the shared library generated by ANNarchy is loaded directly from the compilation folder instead of a copy in a run_* subfolder.
 
     **Note:**
 
@@ -5,9 +5,7 @@
 
 from ANNarchy.intern import ConfigManagement
 from ANNarchy.intern import Messages
-
-import os
-import shutil
+from ANNarchy.intern.SharedLibraryManager import SharedLibraryManager
 
 class NetworkManager :
     """
@@ -52,7 +50,8 @@ class NetworkManager :
                 'extensions': [],
                 'instance': None,
                 'compiled': False,
-                'directory': None
+                'directory': None,
+                'checkpoint': None
             },
         ]
         self._py_instances = [None]
@@ -131,7 +130,8 @@ class NetworkManager :
             'extensions': [],
             'instance': None,
             'compiled': False,
-            'directory': None
+            'directory': None,
+            'checkpoint': None
         }
 
         found = -1
@@ -194,27 +194,9 @@ class NetworkManager :
             pass
 
         elif self._network_desc[0]['directory'] != None:
-            # Removes the library used in last running instance
-            if os.path.isfile(self._network_desc[0]['directory']+'/ANNarchyCore' + str(0) + '.so'):
-                os.remove(self._network_desc[0]['directory']+'/ANNarchyCore' + str(0) + '.so')
-
-            try:
-                if os.path.isdir(self._network_desc[0]['directory']):
-                    os.rmdir(self._network_desc[0]['directory'])
-
-            except OSError as err:
-                # we notice a not empty directory error
-                if err.errno == 39:
-                    if ConfigManagement.get_global_config('debug') or ConfigManagement.get_global_config('verbose'):
-                        Messages._warning("Attempted to clear:", self._network_desc[0]['directory'], "using os.rmdir failed ... retry with shutil")
-
-                    # we re-try it with shutil, if it again fails, we ignore it ...
-                    shutil.rmtree(self._network_desc[0]['directory'], ignore_errors=True)
-
-                else:
-                    # Re-throw other errors
-                    raise
-
+            # The library folder is kept to be re-used on the next run, only
+            # additional copies created for this process are removed.
+            SharedLibraryManager().release(self._network_desc[0]['directory'])
             self._network_desc[0]['directory'] = None
 
         # This will trigger as last consequence
@@ -452,3 +434,19 @@ class NetworkManager :
             self._network_desc[net_id]['instance'] = instance
         else:
             Messages._error("Network", net_id, "not existing ...")
+
+    ################################
+    ## Checkpoints
+    ################################
+    def get_checkpoint(self, net_id):
+        "Returns the last checkpoint saved/loaded for the network (dictionary with the file name and the time step) or None."
+        if net_id < len(self._network_desc):
+            return self._network_desc[net_id]['checkpoint']
+        else:
+            Messages._error("Network", net_id, "not existing ...")
+
+    def set_checkpoint(self, net_id, filename, step):
+        if net_id < len(self._network_desc):
+            self._network_desc[net_id]['checkpoint'] = {'filename': filename, 'step': step}
+        else:
+            Messages._error("Network", net_id, "not existing ...")
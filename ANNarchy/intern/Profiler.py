@@ -5,7 +5,6 @@
 
 import time
 import csv
-import matplotlib.pylab as plt
 
 from ANNarchy.intern.ConfigManagement import get_global_config, _update_global_config, _check_paradigm
 from ANNarchy.intern import Messages
@@ -186,6 +185,9 @@ class Profiler :
         """
         Visualize the timeline.
         """
+        # matplotlib is only imported when needed, as it is slow to import
+        import matplotlib.pylab as plt
+
         f, ax = plt.subplots()
 
         scale_param = 1.0 # origin data is in second
@@ -0,0 +1,159 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+from ANNarchy.intern.ConfigManagement import get_global_config
+from ANNarchy.intern import Messages
+
+import numpy as np
+from multiprocessing import shared_memory
+
+# Arrays of a CSRConnectivity object placed into shared memory. The delays are stored in ms
+# as expected by the constructor of CSRConnectivity.
+_csr_arrays = ['post_rank', 'row_ptr', 'pre_rank', 'w', 'delay']
+
+class SharedConnectivity :
+    """
+    Connectivity of the projections of the magic network, built once by the parent process of
+    parallel_run() and placed into shared memory blocks (see multiprocessing.shared_memory).
+
+    The worker processes attach read-only to these blocks and initialize their projections from
+    them instead of calling the connector method again. Only the projections whose connectivity is
+    built on the Python side are shared, the C++ connectors (see *use_cpp_connectors* in setup())
+    are executed by each worker as before.
+
+    The parent process owns the blocks and has to call release() once all workers are done.
+    """
+    def __init__(self, projections):
+        """
+        Builds the connectivity of the given projections and copies it into shared memory.
+
+        :param projections: list of Projection objects of the magic network.
+        """
+        from ANNarchy.generator.Utils import cpp_connector_available
+
+        self._blocks = []           # SharedMemory objects owned by this process
+        self.descriptors = {}       # projection id -> {array name: (block name, dtype, size)}
+
+        for proj in projections:
+            if proj._connection_method is None or len(proj._specific_template) > 0:
+                continue
+            if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                continue
+
+            if proj._lil_connectivity:
+                synapses = proj._lil_connectivity
+            else:
+                synapses = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+
+            self.descriptors[proj.id] = self._share(_flat_arrays(synapses))
+
+    def _share(self, arrays):
+        "Copies the arrays into new shared memory blocks."
+        descriptor = {}
+        for name, array in arrays.items():
+            # a block can not be empty
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            self._blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            descriptor[name] = (block.name, array.dtype.str, array.size)
+        return descriptor
+
+    def size_in_bytes(self):
+        "Returns the size of all shared memory blocks."
+        return sum(block.size for block in self._blocks)
+
+    def release(self):
+        "Closes and removes the shared memory blocks."
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+def attach_shared_connectivity(projections, descriptors):
+    """
+    Attaches the projections of a worker to the connectivity shared by the parent process, must
+    be called before the network is instantiated.
+
+    Returns the attached SharedMemory objects, which should be closed with detach_shared_connectivity()
+    once the network is instantiated (the C++ side copies the data).
+    """
+    from ANNarchy.cython_ext import CSRConnectivity
+
+    blocks = []
+    for proj in projections:
+        if not proj.id in descriptors:
+            continue
+
+        arrays = {}
+        for name in _csr_arrays:
+            block_name, dtype, size = descriptors[proj.id][name]
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks.append(block)
+            arrays[name] = np.ndarray((size,), dtype=dtype, buffer=block.buf)
+            arrays[name].flags.writeable = False
+
+        proj._shared_connectivity = CSRConnectivity(
+            arrays['post_rank'], arrays['row_ptr'], arrays['pre_rank'], arrays['w'], arrays['delay']
+        )
+
+    return blocks
+
+def detach_shared_connectivity(projections, blocks):
+    "Releases the references of the worker onto the shared memory blocks."
+    for proj in projections:
+        proj._shared_connectivity = None
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            Messages._debug('SharedConnectivity: the block', block.name, 'is still referenced.')
+
+def _flat_arrays(synapses):
+    """
+    Returns the content of a LILConnectivity or CSRConnectivity object as flat arrays in CSR format.
+    """
+    from ANNarchy.cython_ext import CSRConnectivity
+
+    dt = get_global_config('dt')
+
+    if isinstance(synapses, CSRConnectivity):
+        return {
+            'post_rank': synapses.post_rank,
+            'row_ptr': synapses.row_ptr,
+            'pre_rank': synapses.pre_rank,
+            'w': synapses.w,
+            'delay': synapses.delay * dt,
+        }
+
+    pre_rank = synapses.pre_rank
+    row_lengths = np.array([len(row) for row in pre_rank], dtype=np.longlong)
+    row_ptr = np.zeros(len(pre_rank) + 1, dtype=np.longlong)
+    np.cumsum(row_lengths, out=row_ptr[1:])
+
+    if row_ptr[-1] == 0:
+        return {
+            'post_rank': np.array(synapses.post_rank, dtype=np.intc),
+            'row_ptr': row_ptr,
+            'pre_rank': np.zeros(0, dtype=np.intc),
+            'w': np.zeros(1, dtype=np.float64),
+            'delay': np.zeros(1, dtype=np.float64),
+        }
+
+    # LILConnectivity stores one delay per dendrite if it is uniform within the dendrite
+    if synapses.uniform_delay >= 0:
+        delay = np.array([synapses.uniform_delay * dt], dtype=np.float64)
+    else:
+        delay = np.concatenate([
+            np.repeat(np.asarray(d, dtype=np.float64), length) if len(d) == 1 else np.asarray(d, dtype=np.float64)
+            for d, length in zip(synapses.delay, row_lengths)
+        ]) * dt
+
+    return {
+        'post_rank': np.array(synapses.post_rank, dtype=np.intc),
+        'row_ptr': row_ptr,
+        'pre_rank': np.concatenate(pre_rank).astype(np.intc),
+        'w': np.concatenate(synapses.w).astype(np.float64),
+        'delay': delay,
+    }
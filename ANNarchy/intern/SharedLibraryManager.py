@@ -0,0 +1,205 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+from ANNarchy.intern import ConfigManagement
+from ANNarchy.intern import Messages
+
+import os
+import shutil
+import hashlib
+import importlib.machinery
+import importlib.util
+import atexit
+import time
+
+class SharedLibraryManager :
+    """
+    This class manages the copies of the ANNarchyCore libraries which are loaded into the
+    Python process.
+
+    A shared library can not be reloaded from the same path (see PEP 489), therefore each
+    library is loaded from a subfolder 'run_<hash>' of the compilation directory, where
+    <hash> is computed from the content of the library. If the library did not change since
+    the last run, the existing copy is re-used. Only if the same library was already loaded
+    in the current process, an additional copy 'run_<hash>_<n>' is created, which is removed
+    when the process terminates. Subfolders containing outdated versions of a library are
+    removed on the next start, if they were created by the current process or were not used
+    for a while (other processes might still run in the same directory). When the process
+    terminates, the folders it created are removed, except the one holding the last version
+    of each library.
+
+    The class is implemented as singleton and therefore initialized on first request.
+    """
+    _instance = None    # singleton instance
+    _garbage_age = 86400    # time (in seconds) after which unused folders of other processes are removed
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        pass
+
+    def __new__(cls):
+        """
+        First call construction of the SharedLibraryManager. No additional arguments are required.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._loaded = set()       # paths of the libraries loaded in this process
+            cls._instance._duplicates = set()   # folders created only for this process
+            cls._instance._created = {}         # folders created by this process (with the time of their last use)
+            cls._instance._latest = {}          # folder holding the last version of each library
+            cls._instance._load_times = {}      # time (in seconds) spent in loading a library
+            atexit.register(cls._instance.cleanup)
+
+        return cls._instance
+
+    def prepare(self, annarchy_dir, libname):
+        """
+        Returns the folder from which the library *libname* (e.g. ANNarchyCore0) located
+        in *annarchy_dir* should be loaded. The library is copied only if necessary.
+        """
+        annarchy_dir = os.path.abspath(annarchy_dir)
+        source = annarchy_dir + '/' + libname + '.so'
+
+        # Content hash of the library
+        sha = hashlib.sha256()
+        with open(source, 'rb') as rfile:
+            for block in iter(lambda: rfile.read(1 << 20), b''):
+                sha.update(block)
+        digest = sha.hexdigest()[:16]
+
+        # The same library can not be loaded twice from the same path
+        directory = annarchy_dir + '/run_' + digest
+        idx = 0
+        while directory + '/' + libname + '.so' in self._loaded:
+            idx += 1
+            directory = annarchy_dir + '/run_' + digest + '_' + str(idx)
+
+        if os.path.isfile(directory + '/' + libname + '.so'):
+            Messages._debug("Re-use the library", libname, "located in", directory)
+            # mark the folder as used, see collect_garbage()
+            os.utime(directory)
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._created[directory] = None
+            # write to a temporary file, another process might load the library
+            tmp_file = directory + '/' + libname + '.so.' + str(os.getpid())
+            shutil.copy(source, tmp_file)
+            os.replace(tmp_file, directory + '/' + libname + '.so')
+
+        if idx > 0:
+            self._duplicates.add(directory)
+        if directory in self._created:
+            self._created[directory] = os.path.getmtime(directory)
+        self._latest[annarchy_dir + '/' + libname] = annarchy_dir + '/run_' + digest
+
+        self.collect_garbage(annarchy_dir, libname, keep=directory)
+
+        return directory
+
+    def load(self, libname, libpath):
+        """
+        Load the shared library created by Cython using importlib. Follows the example
+        "Multiple modules in one library" in PEP 489.
+
+        Sources:
+
+        PEP 489: (https://www.python.org/dev/peps/pep-0489/)
+        """
+        t0 = time.time()
+
+        # create a loader to mimic find module
+        loader = importlib.machinery.ExtensionFileLoader(libname, libpath)
+        spec = importlib.util.spec_from_loader(libname, loader)
+        module = importlib.util.module_from_spec(spec)
+
+        if ConfigManagement.get_global_config('verbose'):
+            Messages._print('Loading library...', libname, libpath)
+
+        loader.exec_module(module)
+        self._loaded.add(os.path.abspath(libpath))
+
+        t1 = time.time()
+        self._load_times[libname] = t1 - t0
+
+        if ConfigManagement.get_global_config('verbose'):
+            Messages._print('Library loaded.')
+        if ConfigManagement.get_global_config('show_time'):
+            Messages._print('Loading', libname, 'took', (t1-t0)*1000, 'milliseconds')
+
+        return module
+
+    def load_time(self, libname):
+        """
+        Returns the time in seconds needed to load the library *libname* the last time, None if it was not loaded yet.
+        """
+        if libname in self._load_times.keys():
+            return self._load_times[libname]
+        return None
+
+    def collect_garbage(self, annarchy_dir, libname, keep=None):
+        """
+        Removes the subfolders of *annarchy_dir* which contain an outdated copy of *libname*. Folders
+        holding libraries loaded by this process are not removed. As concurrent processes might use the
+        same directory, the folders created by other processes are only removed when they were not used
+        for *_garbage_age* seconds.
+        """
+        annarchy_dir = os.path.abspath(annarchy_dir)
+        now = time.time()
+        for folder in os.listdir(annarchy_dir):
+            directory = annarchy_dir + '/' + folder
+            if not folder.startswith('run_') or not os.path.isdir(directory):
+                continue
+            if keep is not None and directory == os.path.abspath(keep):
+                continue
+
+            # remove the folders of crashed/old runs, but only for the same library
+            content = os.listdir(directory)
+            if len(content) > 0 and not libname + '.so' in content:
+                continue
+            if os.path.abspath(directory + '/' + libname + '.so') in self._loaded:
+                continue
+            try:
+                if directory not in self._created and now - os.path.getmtime(directory) < self._garbage_age:
+                    continue
+            except OSError:
+                # removed in the meantime by another process
+                continue
+
+            Messages._debug("Remove outdated library folder", directory)
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def release(self, directory):
+        """
+        Called when the network using the library in *directory* is destroyed. The folder is kept
+        for the next run, unless it was an additional copy for this process.
+        """
+        directory = os.path.abspath(directory)
+        if directory in self._duplicates:
+            shutil.rmtree(directory, ignore_errors=True)
+            self._duplicates.discard(directory)
+
+    def cleanup(self):
+        """
+        Removes the additional copies created by this process, registered with atexit. The other folders
+        created by this process are removed as well, unless they hold the last version of a library or were
+        used by another process in the meantime (re-using a folder updates its modification time).
+        """
+        for directory in self._duplicates:
+            shutil.rmtree(directory, ignore_errors=True)
+        self._duplicates = set()
+
+        latest = set(self._latest.values())
+        for directory, last_use in self._created.items():
+            if directory in latest:
+                continue
+            try:
+                if os.path.getmtime(directory) > last_use:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+        self._created = {}
@@ -0,0 +1,138 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+from ANNarchy.intern import Messages
+
+import queue
+import threading
+import numpy as np
+
+class StreamFeeder :
+    """
+    Reads the inputs of a StreamingTimedArray by chunks of *chunk_length* frames in a background
+    thread and keeps at most *prefetch* chunks in a bounded queue.
+
+    The source is either an array whose first axis is the time (np.ndarray, np.memmap, only the
+    requested slices are read from the disk) or an iterator returning one input per step of the
+    schedule. Arrays are read again from the beginning by start(), iterators are consumed once.
+
+    The C++ core requests the chunks with next_chunk() while the simulation is running (the GIL is
+    released by simulate(), so the thread can read the next chunks in the meantime).
+    """
+    def __init__(self, source, size, chunk_length, prefetch, dtype):
+        """
+        :param source: array (first axis is time) or iterator of inputs.
+        :param size: number of neurons of the population.
+        :param chunk_length: number of frames per chunk.
+        :param prefetch: maximal number of chunks waiting in the queue.
+        :param dtype: numpy type of the chunks, must match the floating precision of the C++ core.
+        """
+        self.source = source
+        self.size = size
+        self.chunk_length = chunk_length
+        self.dtype = dtype
+
+        self._rewindable = hasattr(source, 'shape')
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._thread = None
+        self._iterator = None
+        self._exception = None
+
+    def start(self):
+        """
+        Starts to read the source, the chunks which were not consumed yet are dropped. Has no effect
+        on iterators which were already started, they continue where they are.
+
+        Returns True if the source is read from the beginning.
+        """
+        if self._iterator is not None:
+            return False
+
+        self.stop()
+
+        if not self._rewindable:
+            self._iterator = iter(self.source)
+
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._stop.clear()
+        self._exception = None
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        "Terminates the reading thread."
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        # a full queue would block the thread
+        while self._thread.is_alive():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(0.01)
+        self._thread = None
+
+    def next_chunk(self):
+        """
+        Returns the next chunk as a C-contiguous array of shape (frames, size), None when the source is exhausted.
+        """
+        if self._thread is None:
+            return None
+
+        chunk = self._queue.get()
+        if chunk is None:
+            self._thread.join()
+            self._thread = None
+            if self._exception is not None:
+                Messages._warning('StreamingTimedArray: reading the inputs failed (', self._exception, '), the last input is kept.')
+        return chunk
+
+    def _read(self):
+        "Fills the queue, the last element is always None."
+        try:
+            for chunk in self._chunks():
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            self._exception = e
+
+        self._put(None)
+
+    def _put(self, item):
+        "Puts the item into the queue, returns False if stop() was called in the meantime."
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _chunks(self):
+        "Generator over the chunks of the source."
+        if self._rewindable:
+            for start in range(0, self.source.shape[0], self.chunk_length):
+                values = self.source[start:start+self.chunk_length]
+                yield np.ascontiguousarray(values, dtype=self.dtype).reshape((values.shape[0], self.size))
+            return
+
+        chunk = np.empty((self.chunk_length, self.size), dtype=self.dtype)
+        nb_frames = 0
+        for value in self._iterator:
+            chunk[nb_frames] = np.asarray(value, dtype=self.dtype).reshape(self.size)
+            nb_frames += 1
+            if nb_frames == self.chunk_length:
+                yield chunk
+                chunk = np.empty((self.chunk_length, self.size), dtype=self.dtype)
+                nb_frames = 0
+                if self._stop.is_set():
+                    return
+
+        if nb_frames > 0:
+            yield chunk[:nb_frames]
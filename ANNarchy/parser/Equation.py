@@ -6,6 +6,7 @@
 from ANNarchy.intern.ConfigManagement import get_global_config
 from ANNarchy.intern import Messages
 from .ParserTemplate import create_local_dict, user_functions
+from .EquationCache import EquationCache
 
 import sympy as sp
 import re
@@ -61,6 +62,7 @@ class Equation(object):
         self.untouched = untouched
         self.method = method
         self.num_flops = 0
+        self._dependencies = None
 
         # Determine the type of the equation
         if not type:
@@ -87,6 +89,14 @@ class Equation(object):
 
     def parse(self):
         "Main method called after creating the object."
+        # Identical equations were possibly already parsed
+        key = EquationCache().compute_key(self)
+        entry = EquationCache().lookup(key)
+        if entry is not None:
+            self._dependencies = entry['dependencies']
+            self.num_flops = entry['num_flops']
+            return entry['code']
+
         try:
             if self.type == 'ODE':
                 code = self.analyse_ODE(self.expression)
@@ -101,6 +111,8 @@ class Equation(object):
         except Exception as e:
             Messages._print(e)
             Messages._error('Parser: cannot analyse', self.expression)
+
+        EquationCache().store(key, code, self.dependencies(), self.num_flops)
         return code
 
     def identify_type(self):
@@ -229,8 +241,8 @@ class Equation(object):
         # Every other operation gets a weight of 1 (the default)
         weighted_count = weighted_count.replace(sp.Symbol, type(sp.S.One))
 
-        # return the (re-)weighted result
-        return weighted_count
+        # return the (re-)weighted result as a Python integer
+        return int(weighted_count)
 
     ###############################################
     ### ODE
@@ -736,6 +748,9 @@ class Equation(object):
 
     def dependencies(self):
         "Returns all dependencies of the equation"
+        if self._dependencies is not None: # found in the cache
+            return list(self._dependencies)
+
         deps = []
         for att in self.attributes:
             if self.local_dict[att] in self.analysed.atoms():
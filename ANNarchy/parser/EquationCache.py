@@ -0,0 +1,164 @@
+"""
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+
+import os
+import json
+import copy
+import hashlib
+
+import sympy
+
+import ANNarchy
+
+from ANNarchy.intern.ConfigManagement import get_global_config
+from ANNarchy.intern import Messages
+
+# Increase when the content of the entries changes
+_cache_format = 1
+
+class EquationCache :
+    """
+    Memoization of the results of Equation.parse(): the generated C++ code, the dependencies
+    and the number of floating point operations.
+
+    The key is computed from the equation (name, text, type and numerical method), the local
+    dictionary of sympy symbols and functions, the floating precision, the sympy version and the
+    source code of the parser. If *setup(equation_cache=True)* (default), the entries are kept in
+    memory for the current process and stored as small JSON files in *equation_cache_dir* (default:
+    ~/.cache/ANNarchy/equations), so that identical models are not parsed again in later runs.
+
+    The class is implemented as singleton and therefore initialized on first request.
+    """
+    _instance = None    # singleton instance
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        pass
+
+    def __new__(cls):
+        """
+        First call construction of the EquationCache. No additional arguments are required.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._entries = {}         # entries known by this process
+            cls._instance._environment = None   # versions and parser sources, computed once
+            cls._instance._disk_enabled = True  # set to False if the cache folder is not writable
+            cls._instance._hits = 0
+            cls._instance._misses = 0
+
+        return cls._instance
+
+    def compute_key(self, equation):
+        """
+        Returns the key for the Equation object *equation*, which must not have been parsed yet.
+        """
+        if self._environment is None:
+            sha = hashlib.sha256()
+            sha.update(str(_cache_format).encode('utf-8'))
+            sha.update(ANNarchy.__release__.encode('utf-8'))
+            sha.update(sympy.__version__.encode('utf-8'))
+            parser_dir = os.path.dirname(os.path.abspath(__file__))
+            for filename in ['Equation.py', 'ParserTemplate.py']:
+                with open(parser_dir + '/' + filename, 'rb') as rfile:
+                    sha.update(rfile.read())
+            self._environment = sha.hexdigest()
+
+        local_dict = sorted((name, type(value).__name__, str(value)) for name, value in equation.local_dict.items())
+
+        sha = hashlib.sha256()
+        for item in [
+                self._environment, get_global_config('precision'),
+                equation.name, equation.expression, equation.type, equation.method,
+                equation.attributes, equation.variables,
+                local_dict, sorted(equation.user_functions.items())
+            ]:
+            sha.update(repr(item).encode('utf-8'))
+            sha.update(b'\0')
+
+        return sha.hexdigest()
+
+    def lookup(self, key):
+        """
+        Returns the entry (dictionary with the keys 'code', 'dependencies' and 'num_flops') stored under *key*, None if not available.
+        """
+        if not get_global_config('equation_cache'):
+            return None
+
+        entry = self._entries.get(key, None)
+
+        if entry is None and self._disk_enabled:
+            try:
+                with open(self._path(key), 'r') as rfile:
+                    entry = json.load(rfile)
+                self._entries[key] = entry
+            except (OSError, ValueError):
+                entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        # the callers might modify the code (e.g. the pre_loop dictionary of ODEs)
+        return copy.deepcopy(entry)
+
+    def store(self, key, code, dependencies, num_flops):
+        """
+        Stores the result of Equation.parse() under *key*.
+        """
+        if not get_global_config('equation_cache'):
+            return
+
+        entry = {'code': code, 'dependencies': list(dependencies), 'num_flops': int(num_flops)}
+        self._entries[key] = copy.deepcopy(entry)
+
+        if not self._disk_enabled:
+            return
+
+        try:
+            content = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            Messages._debug('EquationCache: the entry', key, 'can not be serialized:', e)
+            return
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write to a temporary file, another process might read the entry
+            tmp_file = path + '.' + str(os.getpid())
+            with open(tmp_file, 'w') as wfile:
+                wfile.write(content)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            Messages._debug('EquationCache: unable to write to', self._cache_dir(), ':', e)
+            self._disk_enabled = False
+
+    def statistics(self):
+        "Returns the number of hits and misses since the start of the process."
+        return {'hits': self._hits, 'misses': self._misses}
+
+    def clear(self):
+        "Removes all entries from memory and disk."
+        self._entries = {}
+        cache_dir = self._cache_dir()
+        if not os.path.isdir(cache_dir):
+            return
+
+        for folder in os.listdir(cache_dir):
+            if not os.path.isdir(cache_dir + '/' + folder):
+                continue
+            for filename in os.listdir(cache_dir + '/' + folder):
+                if filename.endswith('.json'):
+                    os.remove(cache_dir + '/' + folder + '/' + filename)
+
+    def _cache_dir(self):
+        return os.path.abspath(os.path.expanduser(get_global_config('equation_cache_dir')))
+
+    def _path(self, key):
+        # two-level layout to limit the number of files per folder
+        return self._cache_dir() + '/' + key[:2] + '/' + key + '.json'
@@ -1,2 +1,10 @@
-from .AnalyseNeuron import analyse_neuron
-from .AnalyseSynapse import analyse_synapse
+# The parser depends on sympy, which is slow to import: the analysis
+# functions are only imported on first access.
+def __getattr__(name):
+    if name == "analyse_neuron":
+        from .AnalyseNeuron import analyse_neuron
+        return analyse_neuron
+    elif name == "analyse_synapse":
+        from .AnalyseSynapse import analyse_synapse
+        return analyse_synapse
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,77 @@
+"""
+Measures the time needed to build the connectivity of a projection (LILConnectivity)
+depending on the number of synapses, for the connectors relying on the bulk CSR path
+of LILConnectivity.
+
+The connectivity is only built, no code is generated or compiled:
+
+    python benchmarks/connectivity.py [--max-size 4000] [--probability 0.1]
+
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy.sparse import random as sparse_random
+
+import ANNarchy as ann
+
+def build(proj):
+    "Builds the LILConnectivity as done during compile() and returns the time in seconds."
+    t0 = time.perf_counter()
+    lil = proj._connection_method(*((proj.pre, proj.post,) + proj._connection_args))
+    return time.perf_counter() - t0, lil.nb_synapses
+
+def run(sizes, probability):
+    neuron = ann.Neuron(equations="r = 0.0")
+
+    print("%-28s %8s %12s %10s %14s" % ("connector", "size", "synapses", "time (s)", "synapses/s"))
+    for size in sizes:
+        ann.clear()
+        pre = ann.Population(size, neuron)
+        post = ann.Population(size, neuron)
+
+        patterns = {}
+
+        proj = ann.Projection(pre, post, "fixed_probability")
+        proj.connect_fixed_probability(probability, weights=ann.Uniform(0.0, 1.0))
+        patterns["fixed_probability"] = proj
+
+        proj = ann.Projection(pre, post, "fixed_probability_delays")
+        proj.connect_fixed_probability(probability, weights=1.0, delays=ann.DiscreteUniform(1.0, 5.0))
+        patterns["fixed_probability (delays)"] = proj
+
+        proj = ann.Projection(pre, post, "fixed_number_pre")
+        proj.connect_fixed_number_pre(int(probability * size), weights=ann.Uniform(0.0, 1.0))
+        patterns["fixed_number_pre"] = proj
+
+        proj = ann.Projection(pre, post, "gaussian")
+        proj.connect_gaussian(amp=1.0, sigma=0.1, limit=0.5)
+        patterns["gaussian"] = proj
+
+        proj = ann.Projection(pre, post, "from_sparse")
+        proj.connect_from_sparse(sparse_random(size, size, density=probability, format='csc'))
+        patterns["from_sparse"] = proj
+
+        # the dense matrix grows quadratically, the runtime is dominated by its creation
+        if size <= 4000:
+            weights = np.random.random((size, size)).astype(object)
+            weights[np.random.random((size, size)) > probability] = None
+            proj = ann.Projection(pre, post, "from_matrix")
+            proj.connect_from_matrix(weights)
+            patterns["from_matrix"] = proj
+
+        for name, proj in patterns.items():
+            duration, nb_synapses = build(proj)
+            print("%-28s %8d %12d %10.4f %14.0f" % (name, size, nb_synapses, duration, nb_synapses / duration))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Connection time versus number of synapses.")
+    parser.add_argument("--max-size", type=int, default=4000, help="largest population size (default: 4000)")
+    parser.add_argument("--probability", type=float, default=0.1, help="connection probability (default: 0.1)")
+    args = parser.parse_args()
+
+    sizes = [s for s in [250, 500, 1000, 2000, 4000, 8000, 16000] if s <= args.max_size]
+    run(sizes, args.probability)
@@ -0,0 +1,65 @@
+"""
+Measures the simulation time of a rate-coded population normalizing its activity with
+global operations (mean, max, min, norm1, norm2) depending on the number of threads, for
+the two implementations of the global operations with openMP:
+
+* serial: each operation is computed by a single thread (openMP tasks).
+* parallel: each thread reduces its chunk of the population, the partial results are then
+  combined in a tree. It is used by default for populations with at least
+  Global.OMP_MIN_NB_GLOBAL_OPS neurons.
+
+One network is compiled for each size, number of threads and implementation:
+
+    python benchmarks/global_operations.py [--sizes 1000 10000 100000] [--threads 2 4 8] [--duration 1000]
+
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+import argparse
+import time
+
+import ANNarchy as ann
+from ANNarchy.core import Global
+
+def run(size, threads, parallel, duration):
+    "Builds and simulates the population, returns the simulation time in seconds."
+    ann.clear()
+    ann.setup(num_threads=threads)
+
+    # The serial implementation is enforced with an unreachable threshold
+    threshold = Global.OMP_MIN_NB_GLOBAL_OPS
+    Global.OMP_MIN_NB_GLOBAL_OPS = 1 if parallel else size + 1
+
+    neuron = ann.Neuron(
+        parameters = "tau = 10.0",
+        equations = """
+            tau * dr/dt + r = sum(exc) + Uniform(-1.0, 1.0) - mean(r)
+            x = (r - min(r)) / (max(r) - min(r) + 1e-6)
+            l1 = norm1(r)
+            l2 = norm2(r)
+        """
+    )
+    ann.Population(size, neuron)
+
+    try:
+        ann.compile(directory="annarchy_global_operations", silent=True)
+    finally:
+        Global.OMP_MIN_NB_GLOBAL_OPS = threshold
+
+    t0 = time.perf_counter()
+    ann.simulate(duration)
+    return time.perf_counter() - t0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serial and parallel global operations depending on the number of threads.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="number of neurons (default: 1000 10000 100000)")
+    parser.add_argument("--threads", type=int, nargs="+", default=[2, 4, 8], help="number of threads (default: 2 4 8)")
+    parser.add_argument("--duration", type=float, default=1000.0, help="simulated time in ms (default: 1000)")
+    args = parser.parse_args()
+
+    print("%8s %8s %12s %12s %8s" % ("size", "threads", "serial (s)", "parallel (s)", "speedup"))
+    for size in args.sizes:
+        for threads in args.threads:
+            serial = run(size, threads, False, args.duration)
+            parallel = run(size, threads, True, args.duration)
+            print("%8d %8d %12.4f %12.4f %8.2f" % (size, threads, serial, parallel, serial / parallel))
@@ -0,0 +1,86 @@
+"""
+Measures the simulation time of a balanced network of excitatory and inhibitory
+integrate-and-fire neurons (COBA benchmark) for the two parallelization schemes of
+the spike propagation over a single LIL matrix:
+
+* disable_omp=True (default): the post-synaptic neurons of each spike are distributed
+  over the threads.
+* disable_omp=False: the spikes are distributed over the threads, the conductances are
+  accumulated in thread-local buffers and only the touched rows are reduced.
+
+The matrices are not split, as the thread-local buffers are only used on single matrices:
+
+    python benchmarks/spiking_psp.py [--size 4000] [--threads 4] [--duration 1000]
+
+:copyright: Copyright 2013 - now, see AUTHORS.
+:license: GPLv2, see LICENSE for details.
+"""
+import argparse
+import time
+
+import ANNarchy as ann
+
+def run(size, duration, disable_omp):
+    "Builds and simulates the network, returns the simulation time in seconds and the number of spikes."
+    ann.clear()
+
+    COBA = ann.Neuron(
+        parameters="""
+            El = -60.0
+            Vr = -60.0
+            Erev_exc = 0.0
+            Erev_inh = -80.0
+            Vt = -50.0
+            tau = 20.0
+            tau_exc = 5.0
+            tau_inh = 10.0
+            I = 20.0
+        """,
+        equations="""
+            tau * dv/dt = (El - v) + g_exc * (Erev_exc - v) + g_inh * (Erev_inh - v ) + I
+            tau_exc * dg_exc/dt = - g_exc
+            tau_inh * dg_inh/dt = - g_inh
+        """,
+        spike = "v > Vt",
+        reset = "v = Vr",
+        refractory = 5.0
+    )
+
+    P = ann.Population(geometry=size, neuron=COBA)
+    P.v = ann.Normal(-55.0, 5.0)
+    P.g_exc = ann.Normal(4.0, 1.5)
+    P.g_inh = ann.Normal(20.0, 12.0)
+
+    n_exc = int(0.8 * size)
+    Pe = P[:n_exc]
+    Pi = P[n_exc:]
+
+    Ce = ann.Projection(pre=Pe, post=P, target='exc', disable_omp=disable_omp)
+    Ce.connect_fixed_probability(weights=0.6, probability=0.02, storage_format="lil")
+    Ci = ann.Projection(pre=Pi, post=P, target='inh', disable_omp=disable_omp)
+    Ci.connect_fixed_probability(weights=6.7, probability=0.02, storage_format="lil")
+
+    m = ann.Monitor(P, 'spike')
+
+    ann.compile(directory="annarchy_spiking_psp", silent=True)
+
+    t0 = time.perf_counter()
+    ann.simulate(duration)
+    duration = time.perf_counter() - t0
+
+    nb_spikes = sum(len(s) for s in m.get('spike').values())
+    return duration, nb_spikes
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Spike propagation with and without thread-local buffers.")
+    parser.add_argument("--size", type=int, default=4000, help="number of neurons (default: 4000)")
+    parser.add_argument("--threads", type=int, default=4, help="number of threads (default: 4)")
+    parser.add_argument("--duration", type=float, default=1000.0, help="simulated time in ms (default: 1000)")
+    args = parser.parse_args()
+
+    ann.setup(num_threads=args.threads, disable_split_matrix=True)
+
+    print("%-36s %8s %10s %12s" % ("spike propagation", "size", "time (s)", "spikes"))
+    for name, disable_omp in [("post-synaptic neurons (default)", True), ("spikes + thread-local buffers", False)]:
+        duration, nb_spikes = run(args.size, args.duration, disable_omp)
+        print("%-36s %8d %10.4f %12d" % (name, args.size, duration, nb_spikes))
@@ -146,6 +146,10 @@ if sys.platform.startswith('darwin'):
     extra_compile_args.append("-stdlib=libc++")
     extra_link_args = ["-stdlib=libc++"]
 
+# OpenMP is used by the connector methods (Connector.pyx). The default clang on
+# MacOS does not support -fopenmp, the prange loops are then executed sequentially.
+openmp_args = ["-fopenmp"] if sys.platform.startswith('linux') else []
+
 ################################################
 # Perform the installation
 ################################################
@@ -161,8 +165,8 @@ extensions = [
     Extension("ANNarchy.cython_ext.Connector",
             ["ANNarchy/cython_ext/Connector.pyx"],
             include_dirs=[numpy.get_include()],
-            extra_compile_args=extra_compile_args,
-            extra_link_args=extra_link_args,
+            extra_compile_args=extra_compile_args + openmp_args,
+            extra_link_args=extra_link_args + openmp_args,
             language="c++"),
     Extension("ANNarchy.cython_ext.Coordinates",
             ["ANNarchy/cython_ext/Coordinates.pyx"],
@@ -0,0 +1,104 @@
+"""
+
+    test_EquationCache.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import tempfile
+from shutil import rmtree
+import unittest
+
+from ANNarchy.intern.ConfigManagement import get_global_config, _update_global_config
+from ANNarchy.parser.Equation import Equation
+from ANNarchy.parser.EquationCache import EquationCache
+
+# Minimal description of a neuron with a local variable and a global parameter
+description = {
+    'attributes': ['v', 'tau'],
+    'local': ['v'],
+    'semiglobal': [],
+    'global': ['tau'],
+    'functions': [],
+    'variables': [{'name': 'v'}],
+}
+
+class test_EquationCache(unittest.TestCase):
+    """
+    Test that the results of the equation parser are cached in memory and on disk.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.old_config = {
+            'equation_cache': get_global_config('equation_cache'),
+            'equation_cache_dir': get_global_config('equation_cache_dir')
+        }
+        _update_global_config('equation_cache', True)
+        _update_global_config('equation_cache_dir', self.tmp_dir)
+        EquationCache().clear()
+
+    def tearDown(self):
+        EquationCache().clear()
+        for key, value in self.old_config.items():
+            _update_global_config(key, value)
+        rmtree(self.tmp_dir)
+
+    def _parse(self, expression):
+        eq = Equation('v', expression, description, method='explicit')
+        code = eq.parse()
+        return code, sorted(eq.dependencies()), eq.num_flops
+
+    def test_hit(self):
+        """
+        Parsing the same equation again returns the stored result.
+        """
+        hits = EquationCache().statistics()['hits']
+
+        first = self._parse("tau * dv/dt = -v + 1.0")
+        self.assertEqual(EquationCache().statistics()['hits'], hits)
+
+        second = self._parse("tau * dv/dt = -v + 1.0")
+        self.assertEqual(EquationCache().statistics()['hits'], hits + 1)
+        self.assertEqual(first, second)
+
+        files = [f for folder in os.listdir(self.tmp_dir) for f in os.listdir(self.tmp_dir + '/' + folder)]
+        self.assertEqual(len(files), 1)
+
+    def test_disk(self):
+        """
+        Entries stored on disk are found after the memory is emptied, and are identical to an uncached parse.
+        """
+        first = self._parse("tau * dv/dt = -v + 2.0")
+        EquationCache()._entries = {}
+
+        hits = EquationCache().statistics()['hits']
+        second = self._parse("tau * dv/dt = -v + 2.0")
+        self.assertEqual(EquationCache().statistics()['hits'], hits + 1)
+        self.assertEqual(first, second)
+
+        _update_global_config('equation_cache', False)
+        self.assertEqual(first, self._parse("tau * dv/dt = -v + 2.0"))
+
+    def test_key(self):
+        """
+        A different expression or numerical method leads to a different entry.
+        """
+        eq1 = Equation('v', "tau * dv/dt = -v", description, method='explicit')
+        eq2 = Equation('v', "tau * dv/dt = -v", description, method='midpoint')
+        eq3 = Equation('v', "tau * dv/dt = -2*v", description, method='explicit')
+        keys = [EquationCache().compute_key(eq) for eq in [eq1, eq2, eq3]]
+        self.assertEqual(len(set(keys)), 3)
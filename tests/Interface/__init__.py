@@ -2,4 +2,11 @@ import unittest
 from .test_IO import test_IO_Rate, test_IO_Spiking
 from .test_Record import test_Record
 from .test_Report import test_Report_Rate, test_Report_Spiking
+from .test_CompilationCache import test_CompilationCache
+from .test_ImportTime import test_ImportTime
 from .test_TimedArray import test_TimedArray, test_TimedArrayUpdate
+from .test_Precompiled import test_Precompiled
+from .test_ParallelRun import test_ParallelRun
+from .test_Batch import test_Batch
+from .test_SpikeSourceArray import test_SpikeSourceArray
+from .test_StreamingTimedArray import test_StreamingTimedArray
@@ -0,0 +1,221 @@
+"""
+
+    test_Batch.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Monitor, Network, Uniform, setup
+from ANNarchy.intern.ConfigManagement import get_global_config
+
+class test_Batch(unittest.TestCase):
+    """
+    Test the simulation of several instances of a network in the same library
+    (setup(batch_size=...)): each instance must behave like the network compiled
+    without batch dimension.
+    """
+    batch_size = 3
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the same networks with and without batch dimension.
+        """
+        if get_global_config('num_threads') > 1:
+            raise unittest.SkipTest("batched simulations are single-threaded")
+
+        rate_input = Neuron(
+            parameters = "I = 0.0",
+            equations = "r = I"
+        )
+        rate_output = Neuron(
+            parameters = "tau = 5.0",
+            equations = "tau * dr/dt + r = sum(exc)"
+        )
+        spiking = Neuron(
+            parameters = """
+                I = 0.0
+                tau = 10.0
+            """,
+            equations = """
+                tau * dv/dt = -v + I + g_exc
+                g_exc = 0.0
+            """,
+            spike = "v > 1.0",
+            reset = "v = 0.0"
+        )
+
+        weights = numpy.random.uniform(0.0, 1.0, (4, 5))
+
+        inp = Population(5, rate_input)
+        out = Population(4, rate_output)
+        proj = Projection(inp, out, 'exc')
+        proj.connect_from_matrix(weights, delays=2.0)
+
+        sp_inp = Population(5, spiking)
+        sp_out = Population(4, spiking)
+        sp_proj = Projection(sp_inp, sp_out, 'exc')
+        sp_proj.connect_from_matrix(weights, delays=2.0)
+        sp_view = Projection(sp_inp[2:], sp_out[:2], 'exc')
+        sp_view.connect_one_to_one(weights=0.5)
+
+        noisy = Population(6, rate_input)
+        noisy.I = Uniform(0.0, 1.0)
+
+        m_r = Monitor(out, 'r')
+        m_v = Monitor(sp_out, ['v', 'spike'])
+
+        objects = [inp, out, proj, sp_inp, sp_out, sp_proj, sp_view, noisy, m_r, m_v]
+        observed = [inp, out, sp_inp, noisy, m_r, m_v]
+
+        setup(batch_size=cls.batch_size)
+        try:
+            cls.batched = Network()
+            cls.batched.add(objects)
+            cls.batched.compile(silent=True)
+        finally:
+            setup(batch_size=1)
+        cls.inp, cls.out, cls.sp_inp, cls.noisy, cls.m_r, cls.m_v = [cls.batched.get(obj) for obj in observed]
+
+        cls.reference = Network()
+        cls.reference.add(objects)
+        cls.reference.compile(silent=True)
+        cls.ref_inp, _, cls.ref_sp_inp, cls.ref_noisy, cls.ref_m_r, cls.ref_m_v = [cls.reference.get(obj) for obj in observed]
+
+        cls.inputs = numpy.random.uniform(0.5, 3.0, (cls.batch_size, 5))
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.batched
+        del cls.reference
+
+    def setUp(self):
+        self.batched.reset()
+
+    def test_attributes(self):
+        """
+        Local attributes have a leading batch dimension, a single set of values is used by all instances.
+        """
+        out = self.out
+        self.assertEqual(out.r.shape, (self.batch_size, 4))
+
+        out.tau = 2.0
+        numpy.testing.assert_allclose(out.tau, 2.0 * numpy.ones((self.batch_size, 4)))
+
+        out.tau = numpy.arange(4)
+        numpy.testing.assert_allclose(out.tau, numpy.tile(numpy.arange(4), (self.batch_size, 1)))
+
+        out.tau = numpy.arange(4 * self.batch_size).reshape((self.batch_size, 4))
+        numpy.testing.assert_allclose(out.tau[-1], numpy.arange(4) + 4 * (self.batch_size - 1))
+
+        out.tau = 5.0
+
+    def test_view_attributes(self):
+        """
+        A PopulationView returns the values of its neurons in each instance, the values it sets are used by all instances.
+        """
+        out = self.out
+        out.tau = numpy.arange(4 * self.batch_size).reshape((self.batch_size, 4))
+        expected = numpy.array(out.tau)
+
+        view = out[1:3]
+        numpy.testing.assert_allclose(view.get('tau'), expected[:, 1:3])
+
+        view.set({'tau': [10.0, 20.0]})
+        expected[:, 1:3] = [10.0, 20.0]
+        numpy.testing.assert_allclose(out.tau, expected)
+        numpy.testing.assert_allclose(view.get('tau'), numpy.tile([10.0, 20.0], (self.batch_size, 1)))
+
+        out[0:1].set({'tau': 30.0})
+        expected[:, 0] = 30.0
+        numpy.testing.assert_allclose(out.tau, expected)
+
+        out.tau = 5.0
+
+    def test_instances(self):
+        """
+        Each instance reproduces the simulation of the network without batch dimension.
+        """
+        self.inp.I = self.inputs
+        self.sp_inp.I = self.inputs
+        self.batched.simulate(50.0)
+
+        r = self.m_r.get('r')
+        v = self.m_v.get('v')
+        spikes = self.m_v.get('spike')
+        self.assertEqual(r.shape, (50, self.batch_size, 4))
+        self.assertEqual(v.shape, (50, self.batch_size, 4))
+
+        for b in range(self.batch_size):
+            self.reference.reset()
+            self.ref_inp.I = self.inputs[b]
+            self.ref_sp_inp.I = self.inputs[b]
+            self.reference.simulate(50.0)
+
+            numpy.testing.assert_allclose(r[:, b, :], self.ref_m_r.get('r'))
+            numpy.testing.assert_allclose(v[:, b, :], self.ref_m_v.get('v'))
+
+            ref_spikes = self.ref_m_v.get('spike')
+            for rank in range(4):
+                self.assertEqual(spikes[b * 4 + rank], ref_spikes[rank])
+
+    def test_random_init(self):
+        """
+        Initial values drawn from a random distribution differ between the instances and are restored by reset().
+        """
+        I = self.noisy.I
+        self.assertEqual(I.shape, (self.batch_size, 6))
+        self.assertEqual(self.ref_noisy.I.shape, (6,))
+        for b in range(1, self.batch_size):
+            self.assertFalse(numpy.allclose(I[0], I[b]))
+
+        self.noisy.I = 0.0
+        self.batched.reset()
+        numpy.testing.assert_allclose(self.noisy.I, I)
+
+    def test_view_sum(self):
+        """
+        PopulationView.sum() returns the weighted sums of the selected neurons in each instance.
+        """
+        self.inp.I = self.inputs
+        self.batched.simulate(5.0)
+
+        sums = self.out.sum('exc')
+        self.assertEqual(sums.shape, (self.batch_size, 4))
+        numpy.testing.assert_allclose(self.out[2:4].sum('exc'), sums[:, 2:4])
+        numpy.testing.assert_allclose(self.out[0:2].sum('exc'), sums[:, 0:2])
+
+    def test_view_spike(self):
+        """
+        PopulationView.spike returns the ranks of the selected neurons which spiked in each instance.
+        """
+        self.sp_inp.I = self.inputs
+        view = self.sp_inp[1:4]
+
+        nb_spikes = 0
+        for _ in range(50):
+            self.batched.step()
+            spikes = numpy.array(self.sp_inp.spike)
+            view_spikes = view.spike
+            self.assertEqual(len(view_spikes), self.batch_size)
+            for b in range(self.batch_size):
+                expected = sorted(int(rank) - 5 * b for rank in spikes if 5 * b + 1 <= rank < 5 * b + 4)
+                self.assertEqual(view_spikes[b], expected)
+                nb_spikes += len(expected)
+        self.assertGreater(nb_spikes, 0)
@@ -0,0 +1,98 @@
+"""
+
+    test_CompilationCache.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import time
+import tempfile
+from shutil import rmtree
+import unittest
+
+from ANNarchy.generator.CompilationCache import CompilationCache
+
+class test_CompilationCache(unittest.TestCase):
+    """
+    Test the storage, look-up and eviction of the compilation cache. The
+    libraries are replaced by dummy files, so no compilation is required.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.source_dir = self.tmp_dir + '/generate'
+        os.mkdir(self.source_dir)
+        with open(self.source_dir + '/ANNarchy.cpp', 'w') as wfile:
+            wfile.write("// network 1")
+        with open(self.source_dir + '/codegen.log', 'w') as wfile:
+            wfile.write("pop0, Population")
+
+        self.cache = CompilationCache(cache_dir=self.tmp_dir+'/cache', max_size=1)
+
+    def tearDown(self):
+        rmtree(self.tmp_dir)
+
+    def _write_lib(self, size):
+        with open(self.tmp_dir + '/lib.so', 'wb') as wfile:
+            wfile.write(b'0' * size)
+        return self.tmp_dir + '/lib.so'
+
+    def test_key(self):
+        """
+        The key depends only on the generated code, not on the log files.
+        """
+        key = self.cache.compute_key(self.source_dir)
+
+        with open(self.source_dir + '/codegen.log', 'w') as wfile:
+            wfile.write("pop0, Population, renamed")
+        self.assertEqual(key, self.cache.compute_key(self.source_dir))
+
+        with open(self.source_dir + '/ANNarchy.cpp', 'w') as wfile:
+            wfile.write("// network 2")
+        self.assertNotEqual(key, self.cache.compute_key(self.source_dir))
+
+    def test_hit_and_miss(self):
+        """
+        A stored library is found and copied to the target.
+        """
+        key = self.cache.compute_key(self.source_dir)
+        target = self.tmp_dir + '/ANNarchyCore0.so'
+
+        self.assertFalse(self.cache.lookup(key, 'ANNarchyCore0.so', target))
+
+        self.cache.store(key, 'ANNarchyCore0.so', self._write_lib(100))
+        self.assertTrue(self.cache.lookup(key, 'ANNarchyCore0.so', target))
+        self.assertEqual(os.path.getsize(target), 100)
+
+        stats = self.cache.statistics()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_eviction(self):
+        """
+        The least recently used entry is removed if the size limit is exceeded.
+        """
+        lib = self._write_lib(600 * 1024)
+
+        self.cache.store('first', 'ANNarchyCore0.so', lib)
+        old = time.time() - 100
+        os.utime(self.cache.cache_dir + '/first', (old, old))
+
+        self.cache.store('second', 'ANNarchyCore0.so', lib)
+
+        self.assertFalse(os.path.isdir(self.cache.cache_dir + '/first'))
+        self.assertTrue(os.path.isdir(self.cache.cache_dir + '/second'))
@@ -27,6 +27,7 @@ import unittest
 from unittest.mock import patch
 import numpy
 from ANNarchy import clear, load_parameters, save_parameters
+from ANNarchy.core.IO import _load_data
 from .networks import define_rate_net, define_spike_net
 
 def p_from_attr(attributes, isparam):
@@ -70,7 +71,7 @@ class test_IO_Rate(unittest.TestCase):
         cls.isparam = [True, False, True, False, True]
         cls.savefolder = '_networksave/'
         os.mkdir(cls.savefolder)
-        cls.save_extensions = ['.data', '.npz', '.txt.gz']
+        cls.save_extensions = ['.data', '.npz', '.txt.gz', '/']
 
     @classmethod
     def tearDownClass(cls):
@@ -126,6 +127,39 @@ class test_IO_Rate(unittest.TestCase):
         with patch('sys.stdout', new=io.StringIO()): # suppress print
             self.network.save(self.savefolder + "ratenet.mat")
 
+    def test_incremental_save_and_load(self):
+        """
+        An incremental checkpoint only contains the modified attributes, loading
+        it replays the chain starting from the full checkpoint.
+        """
+        with patch('sys.stdout', new=io.StringIO()): # suppress print
+            self.network.save(self.savefolder + "ratenet_base.npz")
+            self.set_attributes(self.new_attr)
+            self.network.save(self.savefolder + "ratenet_delta.npz", incremental=True)
+
+        desc = _load_data(self.savefolder + "ratenet_delta.npz", None)
+        self.assertNotIn('pop1', desc) # not modified
+        self.assertEqual(list(desc['pop2']['attributes']), ['baseline', 'r'])
+
+        self.network.reset(projections=True, synapses=True)
+        self.network.load(self.savefolder + "ratenet_delta.npz")
+        assert_allclose_named(self.get_attributes(), self.new_attr,
+                              self.attribute_names)
+
+    def test_asynchronous_save_and_load(self):
+        """
+        Save the network in a background thread: the modifications made after
+        save() returned must not be contained in the file.
+        """
+        self.set_attributes(self.new_attr)
+        with patch('sys.stdout', new=io.StringIO()): # suppress print
+            future = self.network.save(self.savefolder + "ratenet_async.npz", asynchronous=True)
+            self.network.reset(projections=True, synapses=True)
+            future.result()
+        self.network.load(self.savefolder + "ratenet_async.npz")
+        assert_allclose_named(self.get_attributes(), self.new_attr,
+                              self.attribute_names)
+
     def test_parameters_save_and_load(self):
         """
         Save and load only the parameters of the network
@@ -171,7 +205,7 @@ class test_IO_Spiking(unittest.TestCase):
         cls.isparam = [True, False, True, True, False]
         cls.savefolder = '_networksave/'
         os.mkdir(cls.savefolder)
-        cls.save_extensions = ['.data', '.npz', '.txt.gz']
+        cls.save_extensions = ['.data', '.npz', '.txt.gz', '/']
 
     def setUp(self):
         """ Clear the network before every test. """
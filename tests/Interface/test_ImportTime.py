@@ -0,0 +1,75 @@
+"""
+
+    test_ImportTime.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import sys
+import subprocess
+import unittest
+
+import ANNarchy
+from ANNarchy.intern import Messages
+
+# Imports ANNarchy in a fresh interpreter, prints the import time and the
+# heavy modules which were loaded.
+import_script = """
+import sys, time
+t0 = time.perf_counter()
+import ANNarchy
+duration = time.perf_counter() - t0
+heavy = ['sympy', 'matplotlib', 'ANNarchy.parser.Equation', 'ANNarchy.parser.report.LatexParser',
+         'ANNarchy.generator.CodeGenerator', 'ANNarchy.extensions.bold', 'ANNarchy.extensions.convolution']
+print('import_time=' + str(duration))
+print('loaded=' + ','.join([m for m in heavy if m in sys.modules]))
+"""
+
+class test_ImportTime(unittest.TestCase):
+    """
+    Benchmark of the time needed by *import ANNarchy*. The parser (sympy), the
+    profiler plots (matplotlib), the code generators and the extensions are
+    only imported when used.
+    """
+    def _import(self):
+        "Returns the import time and the list of heavy modules loaded."
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ANNarchy.__file__)) + os.pathsep + env.get('PYTHONPATH', '')
+        out = subprocess.run([sys.executable, "-c", import_script], env=env, capture_output=True, text=True, check=True).stdout
+        values = dict(line.split('=', 1) for line in out.split('\n') if '=' in line)
+        return float(values['import_time']), [m for m in values['loaded'].split(',') if m != '']
+
+    def test_import_time(self):
+        """
+        The heavy dependencies are not loaded by *import ANNarchy*, the best
+        import time over several runs is only printed in verbose mode.
+        """
+        durations = []
+        for _ in range(3):
+            duration, loaded = self._import()
+            durations.append(duration)
+            self.assertEqual(loaded, [])
+
+        Messages._debug("import ANNarchy: %.3f s (best of %d)" % (min(durations), len(durations)))
+
+    def test_lazy_parser(self):
+        """
+        The analysis functions are still available from ANNarchy.parser.
+        """
+        from ANNarchy.parser import analyse_neuron, analyse_synapse
+        self.assertTrue(callable(analyse_neuron))
+        self.assertTrue(callable(analyse_synapse))
@@ -0,0 +1,154 @@
+"""
+
+    test_ParallelRun.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import sys
+import json
+import subprocess
+import tempfile
+from shutil import rmtree
+import unittest
+
+import ANNarchy
+
+# parallel_run() requires the magic network, so the test runs in a separate
+# interpreter. Each call to the connector method appends a line to a file.
+parallel_script = """
+import os, sys, json
+import ANNarchy as ann
+
+def pattern(pre, post, weight):
+    synapses = ann.LILConnectivity()
+    for rk in range(post.size):
+        synapses.add(rk, [(rk + i) % pre.size for i in range(3)], [weight * (rk + 1), weight, weight], [1.0, 2.0, 1.0])
+    return synapses
+
+def counted(method):
+    def wrapper(*args):
+        with open(sys.argv[1] + '/calls.txt', 'a') as wfile:
+            wfile.write('call\\n')
+        return method(*args)
+    return wrapper
+
+pop = ann.Population(10, ann.Neuron(parameters="I = 0.0", equations="r = I + sum(exc)"))
+proj = ann.Projection(pop, pop, 'exc')
+proj.connect_with_func(pattern, weight=0.5)
+proj2 = ann.Projection(pop, pop, 'inh')
+proj2.connect_fixed_number_pre(4, weights=ann.Uniform(0.0, 1.0))
+proj2._connection_method = counted(proj2._connection_method)
+proj3 = ann.Projection(pop, pop, 'plastic', ann.Synapse(equations="dw/dt = 1.0"))
+proj3.connect_one_to_one(weights=1.0)
+ann.compile(directory=sys.argv[1] + '/annarchy', silent=True)
+
+def simulation(idx, net):
+    net.simulate(5.0)
+    p1, p2 = net.get(proj), net.get(proj2)
+    return [p1.post_ranks, p1.w, p1.delay, p2.post_ranks, [d.pre_ranks for d in p2.dendrites], p2.w]
+
+shared = ann.parallel_run(method=simulation, number=3, max_processes=2)
+with open(sys.argv[1] + '/calls.txt', 'r') as rfile:
+    calls_shared = len(rfile.readlines())
+
+not_shared = ann.parallel_run(method=simulation, number=2, max_processes=2, shared_connectivity=False)
+with open(sys.argv[1] + '/calls.txt', 'r') as rfile:
+    calls_not_shared = len(rfile.readlines()) - calls_shared
+
+print('calls=' + json.dumps([calls_shared, calls_not_shared]))
+print('shared=' + json.dumps(shared))
+print('reference=' + json.dumps([proj.post_ranks, proj.w, proj.delay]))
+
+def task(idx, net, value):
+    weights = net.get(proj).w
+    net.get(proj).w = value
+    net.get(pop).I = value
+    net.simulate(5.0)
+    return [os.getpid(), net.get_time(), list(net.get(pop).r), net.get(proj3).w, weights]
+
+values = [float(i) for i in range(6)]
+with ann.ParallelPool(max_processes=2) as pool:
+    streamed = [[idx, res] for idx, res in pool.imap(task, number=6, value=values)]
+    ordered = pool.run(task, number=6, value=values)
+print('streamed=' + json.dumps(streamed))
+print('ordered=' + json.dumps(ordered))
+"""
+
+class test_ParallelRun(unittest.TestCase):
+    """
+    Test that parallel_run(number=N) builds the connectivity only once and
+    shares it with the workers, and the re-use of the workers by ParallelPool.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ANNarchy.__file__)) + os.pathsep + env.get('PYTHONPATH', '')
+        res = subprocess.run([sys.executable, "-c", parallel_script, cls.tmp_dir], env=env, capture_output=True, text=True, cwd=cls.tmp_dir)
+        cls.returncode = res.returncode
+        cls.stderr = res.stderr
+        cls.values = dict(line.split('=', 1) for line in res.stdout.split('\n') if '=' in line)
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.tmp_dir)
+
+    def test_calls(self):
+        """
+        The connector is called by the instantiation of the magic network and
+        once for all workers, or once per worker if the sharing is disabled.
+        """
+        self.assertEqual(self.returncode, 0, self.stderr)
+        self.assertEqual(json.loads(self.values['calls']), [2, 2])
+
+    def test_connectivity(self):
+        """
+        All workers obtain the same connectivity as the magic network.
+        """
+        self.assertEqual(self.returncode, 0, self.stderr)
+        shared = json.loads(self.values['shared'])
+        reference = json.loads(self.values['reference'])
+
+        self.assertEqual(len(shared), 3)
+        for result in shared:
+            self.assertEqual(result[:3], reference)
+            self.assertEqual(result[3:], shared[0][3:])
+
+    def test_pool(self):
+        """
+        The workers of ParallelPool are re-used and the network is reset
+        before each task, including the plastic and non-plastic weights.
+        """
+        self.assertEqual(self.returncode, 0, self.stderr)
+        streamed = json.loads(self.values['streamed'])
+        ordered = json.loads(self.values['ordered'])
+        reference = json.loads(self.values['reference'])
+
+        self.assertEqual(sorted(idx for idx, _ in streamed), list(range(6)))
+        streamed = [res for _, res in sorted(streamed, key=lambda x: x[0])]
+
+        pids = set(res[0] for res in streamed)
+        self.assertLessEqual(len(pids), 2)
+        self.assertTrue(set(res[0] for res in ordered).issubset(pids))
+
+        for idx, res in enumerate(ordered):
+            self.assertEqual(res[1:], streamed[idx][1:])
+            self.assertEqual(res[1], 5.0)
+            self.assertEqual(res[3], [[6.0]] * 10)
+            self.assertEqual(res[4], reference[1])
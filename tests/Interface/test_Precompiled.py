@@ -0,0 +1,143 @@
+"""
+
+    test_Precompiled.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import sys
+import json
+import subprocess
+import tempfile
+from shutil import rmtree
+import unittest
+import numpy
+
+import ANNarchy
+from ANNarchy import Constant, Neuron, Population, Projection, Monitor, Network, Uniform, export_compiled, load_compiled
+from ANNarchy.intern.Messages import ANNarchyException
+
+# Loads the exported network in a fresh interpreter, simulates it and
+# prints the recordings.
+load_script = """
+import sys, json
+import ANNarchy as ann
+net = ann.load_compiled(sys.argv[1])
+ann.simulate(50.0)
+m_v, m_spike = net['monitors']
+print('sympy=' + str('sympy' in sys.modules))
+print('v=' + json.dumps(m_v.get('v').tolist()))
+print('spike=' + json.dumps(m_spike.get('spike')))
+print('w=' + json.dumps(net['projections']['delayed'].w))
+"""
+
+class test_Precompiled(unittest.TestCase):
+    """
+    Test the export of a compiled network with export_compiled() and its
+    instantiation with load_compiled() in another process.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile and export the network for this test
+        """
+        Constant('scale', 2.0)
+
+        neuron = Neuron(
+            parameters = """
+                tau = 10.0
+                I = 0.0
+            """,
+            equations = """
+                tau * dv/dt = -v + scale * I + g_exc
+                g_exc = 0.0
+            """,
+            spike = "v > 1.0",
+            reset = "v = 0.0"
+        )
+
+        pop1 = Population(10, neuron, name="input")
+        pop1.I = numpy.linspace(0.0, 1.5, 10)
+        pop2 = Population(5, neuron, name="output")
+
+        proj1 = Projection(pop1, pop2, 'exc', name="delayed")
+        proj1.connect_all_to_all(weights=Uniform(0.0, 0.5), delays=2.0)
+        proj2 = Projection(pop1[5:], pop2, 'exc', name="view")
+        proj2.connect_one_to_one(weights=0.3)
+
+        m_v = Monitor(pop2, 'v')
+        m_spike = Monitor(pop1[5:], 'spike')
+
+        cls.network = Network()
+        cls.network.add([pop1, pop2, proj1, proj2, m_v, m_spike])
+        cls.network.compile(silent=True)
+
+        cls.m_v = cls.network.get(m_v)
+        cls.m_spike = cls.network.get(m_spike)
+        cls.proj1 = cls.network.get(proj1)
+
+        cls.export_dir = tempfile.mkdtemp()
+        export_compiled(cls.export_dir, net_id=cls.network.id)
+
+        cls.network.simulate(50.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.export_dir)
+        del cls.network
+
+    def test_files(self):
+        """
+        The folder contains the library, the manifest and the connectivity.
+        """
+        with open(self.export_dir + '/manifest.json', 'r') as rfile:
+            manifest = json.load(rfile)
+
+        self.assertTrue(os.path.isfile(self.export_dir + '/' + manifest['library'] + '.so'))
+        self.assertEqual([pop['name'] for pop in manifest['populations']], ['input', 'output'])
+        self.assertEqual([proj['name'] for proj in manifest['projections']], ['delayed', 'view'])
+        self.assertEqual(len(manifest['monitors']), 2)
+        self.assertEqual(manifest['constants'], {'scale': 2.0})
+        self.assertEqual(manifest['projections'][0]['uniform_delay'], 2)
+        self.assertIn({'name': 'v', 'kind': 'variable', 'locality': 'local', 'ctype': 'double'}, manifest['populations'][0]['attributes'])
+
+    def test_load(self):
+        """
+        The loaded network does not require the parser and reproduces the simulation.
+        """
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ANNarchy.__file__)) + os.pathsep + env.get('PYTHONPATH', '')
+        res = subprocess.run([sys.executable, "-c", load_script, self.export_dir], env=env, capture_output=True, text=True, cwd=self.export_dir)
+        self.assertEqual(res.returncode, 0, res.stderr)
+        values = dict(line.split('=', 1) for line in res.stdout.split('\n') if '=' in line)
+
+        self.assertEqual(values['sympy'], 'False')
+        numpy.testing.assert_allclose(json.loads(values['w']), self.proj1.w)
+        numpy.testing.assert_allclose(json.loads(values['v']), self.m_v.get('v'))
+
+        spikes = {int(rk): times for rk, times in json.loads(values['spike']).items()}
+        self.assertEqual(spikes, self.m_spike.get('spike'))
+
+    def test_num_threads(self):
+        """
+        The number of threads can not be changed between one and several threads.
+        """
+        with open(self.export_dir + '/manifest.json', 'r') as rfile:
+            exported_threads = json.load(rfile)['config']['num_threads'] or 1
+
+        with self.assertRaises(ANNarchyException):
+            load_compiled(self.export_dir, num_threads=2 if exported_threads == 1 else 1)
@@ -21,11 +21,14 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
+import os
+import shutil
+import tempfile
 import unittest
 import numpy
 
-from ANNarchy import clear, Monitor, Neuron, Network, Projection, Population, \
-    Synapse
+from ANNarchy import clear, mean_fr, Monitor, Neuron, Network, Projection, \
+    Population, Synapse
 
 neuron = Neuron(
     equations="r = t"
@@ -80,6 +83,11 @@ q = Monitor(pop1[0] + pop1[2], 'r')
 r = Monitor(pop2[:2] + pop2.neuron(4), 'r')
 s = Monitor(pop3, ['v', 'spike'])
 t = Monitor(pop4, ['v', 'spike'])
+w = Monitor(pop3[1:], 'spike')
+
+spill_dir = tempfile.mkdtemp()
+u = Monitor(pop1, 'r', spill_dir=spill_dir, flush_every=3)
+v = Monitor(pop1[:2], 'r', spill_dir=spill_dir, flush_every=3)
 
 class test_Record(unittest.TestCase):
     """
@@ -96,7 +104,7 @@ class test_Record(unittest.TestCase):
         Compile the network for this test
         """
         cls.test_net = Network()
-        cls.test_net.add([pop1, pop2, pop3, pop4, proj, m, n, o, p, q, r, s, t])
+        cls.test_net.add([pop1, pop2, pop3, pop4, proj, m, n, o, p, q, r, s, t, u, v, w])
         cls.test_net.compile(silent=True)
 
     @classmethod
@@ -106,6 +114,7 @@ class test_Record(unittest.TestCase):
         """
         del cls.test_net
         clear()
+        shutil.rmtree(spill_dir, ignore_errors=True)
 
     def setUp(self):
         """
@@ -126,6 +135,9 @@ class test_Record(unittest.TestCase):
         self.test_net.get(r).get()
         self.test_net.get(s).get()
         self.test_net.get(t).get()
+        self.test_net.get(u).get()
+        self.test_net.get(v).get()
+        self.test_net.get(w).get()
 
     def test_r_sim_10(self):
         """
@@ -278,6 +290,34 @@ class test_Record(unittest.TestCase):
         datas = self.test_net.get(s).get('spike')
         self.assertEqual(datas[0], [4, 6, 8])
 
+    def test_spike_events(self):
+        """
+        Tests the spikes returned as arrays of time steps and ranks, and
+        their use by the analysis methods.
+        """
+        self.test_net.simulate(10)
+        times, ranks = self.test_net.get(s).get('spike', events=True, keep=True)
+        numpy.testing.assert_equal(times, [4, 4, 4, 6, 6, 6, 8, 8, 8])
+        numpy.testing.assert_equal(ranks, [0, 1, 2, 0, 1, 2, 0, 1, 2])
+
+        numpy.testing.assert_equal(self.test_net.get(s).histogram((times, ranks)), [3, 0, 3, 0, 3])
+        numpy.testing.assert_allclose(self.test_net.get(s).mean_fr((times, ranks)), 300.0)
+        numpy.testing.assert_allclose(mean_fr((times, ranks)), 750.0)
+        numpy.testing.assert_allclose(mean_fr((times, ranks), duration=10), 300.0)
+        t_raster, n_raster = self.test_net.get(s).raster_plot()
+        numpy.testing.assert_allclose(t_raster, times)
+        numpy.testing.assert_equal(n_raster, ranks)
+
+    def test_spike_popview(self):
+        """
+        Tests the spikes of a *PopulationView*: only the selected neurons are
+        recorded.
+        """
+        self.test_net.simulate(10)
+        self.assertEqual(self.test_net.get(w).get('spike', keep=True), {1: [4, 6, 8], 2: [4, 6, 8]})
+        _, ranks = self.test_net.get(w).get('spike', events=True)
+        numpy.testing.assert_equal(ranks, [1, 2, 1, 2, 1, 2])
+
     def test_r_ref(self):
         """
         Tests if the variable *v* of a *Population* consisting of neurons with
@@ -299,3 +339,56 @@ class test_Record(unittest.TestCase):
         self.test_net.simulate(10)
         data_t = self.test_net.get(t).get('spike')
         self.assertEqual(data_t[1], [2, 7])
+
+    def test_spill_to_disk(self):
+        """
+        Tests the recordings spilled to disk every 3 steps: *get()* returns a
+        memory-mapped array over the file, including the recordings which
+        were still buffered.
+        """
+        self.test_net.simulate(10)
+        data_u = self.test_net.get(u).get('r', keep=True)
+        self.assertIsInstance(data_u, numpy.memmap)
+        numpy.testing.assert_allclose(data_u, numpy.arange(10)[:, None] * numpy.ones((1, 3)))
+
+        # keep=False moves the file away, the next recordings start a new one
+        data_u = self.test_net.get(u).get('r')
+        self.test_net.simulate(2)
+        numpy.testing.assert_allclose(data_u.shape, (10, 3))
+        numpy.testing.assert_allclose(self.test_net.get(u).get('r'), [[10.0, 10.0, 10.0], [11.0, 11.0, 11.0]])
+
+    def test_spill_rerun(self):
+        """
+        Tests that recording into a spill directory containing the file of a
+        previous run with the same prefix only returns the new recordings.
+        """
+        net = Network()
+        net.add([pop1, u])
+        net.compile(silent=True)
+        net.simulate(5)
+        net.get(u).get('r', keep=True)
+        stale = net.get(u)._spill_prefix() + 'r.bin'
+        self.assertTrue(os.path.isfile(stale))
+        del net
+
+        # the slot of the deleted network is not necessarily reused, so the
+        # file of the first run is moved to the prefix of the second one
+        net = Network()
+        net.add([pop1, u])
+        filename = net.get(u)._spill_prefix() + 'r.bin'
+        if filename != stale:
+            shutil.move(stale, filename)
+        net.compile(silent=True)
+        net.simulate(2)
+        data_u = net.get(u).get('r', keep=True)
+        del net
+
+        numpy.testing.assert_allclose(data_u, numpy.arange(2)[:, None] * numpy.ones((1, 3)))
+
+    def test_spill_popview(self):
+        """
+        Tests the spilled recordings of a *PopulationView*.
+        """
+        self.test_net.simulate(5)
+        data_v = self.test_net.get(v).get('r')
+        numpy.testing.assert_allclose(data_v, numpy.arange(5)[:, None] * numpy.ones((1, 2)))
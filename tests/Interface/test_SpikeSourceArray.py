@@ -0,0 +1,90 @@
+"""
+
+    test_SpikeSourceArray.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+
+from ANNarchy import SpikeSourceArray, Monitor, Network
+
+class test_SpikeSourceArray(unittest.TestCase):
+    """
+    Test the emission of spikes by a SpikeSourceArray: the spike times of all
+    neurons are merged into a single schedule sorted by time.
+    """
+    spike_times = [
+        [1.0, 3.0, 3.0, 8.0],
+        [],
+        [8.0, 0.0, 3.0],
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test.
+        """
+        inp = SpikeSourceArray(spike_times=cls.spike_times)
+        m = Monitor(inp, 'spike')
+
+        cls.test_net = Network()
+        cls.test_net.add([inp, m])
+        cls.test_net.compile(silent=True)
+
+        cls.inp = cls.test_net.get(inp)
+        cls.m = cls.test_net.get(m)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.test_net
+
+    def setUp(self):
+        self.test_net.reset()
+        self.inp.spike_times = self.spike_times
+
+    def test_spike_times(self):
+        """
+        Spikes are emitted at the given (sorted, unique) times.
+        """
+        self.test_net.simulate(10.0)
+        spikes = self.m.get('spike')
+        self.assertEqual(spikes[0], [1, 3, 8])
+        self.assertEqual(spikes[1], [])
+        self.assertEqual(spikes[2], [0, 3, 8])
+
+    def test_update_spike_times(self):
+        """
+        Setting spike_times during a simulation only affects the spikes which are not in the past.
+        """
+        self.test_net.simulate(5.0)
+        self.inp.spike_times = [[2.0, 6.0], [7.0], [4.0, 5.0, 9.0]]
+        self.test_net.simulate(5.0)
+        spikes = self.m.get('spike')
+        self.assertEqual(spikes[0], [1, 3, 6])
+        self.assertEqual(spikes[1], [7])
+        self.assertEqual(spikes[2], [0, 3, 5, 9])
+
+    def test_reset(self):
+        """
+        reset() of the population replays the spike times relative to the current time.
+        """
+        self.test_net.simulate(10.0)
+        self.inp.reset()
+        self.test_net.simulate(10.0)
+        spikes = self.m.get('spike')
+        self.assertEqual(spikes[0], [1, 3, 8, 11, 13, 18])
+        self.assertEqual(spikes[2], [0, 3, 8, 10, 13, 18])
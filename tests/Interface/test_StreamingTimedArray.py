@@ -0,0 +1,137 @@
+"""
+
+    test_StreamingTimedArray.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import tempfile
+import unittest
+import numpy
+
+from ANNarchy import StreamingTimedArray, Monitor, Network
+from ANNarchy.intern.ConfigManagement import _check_paradigm
+from ANNarchy.intern.Messages import ANNarchyException
+
+class test_StreamingTimedArray(unittest.TestCase):
+    """
+    Test the presentation of inputs read by chunks from an array, a raw
+    binary file or an iterator.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test. The chunks are small so that the
+        C++ buffers are swapped several times.
+        """
+        cls.inputs = numpy.arange(30 * 4, dtype=numpy.float64).reshape((30, 4))
+
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        filename = os.path.join(cls.tmp_dir.name, 'inputs.dat')
+        cls.inputs.astype(numpy.float32).tofile(filename)
+
+        inp = StreamingTimedArray(cls.inputs, chunk_length=4, prefetch=2)
+        inp_file = StreamingTimedArray(filename, geometry=(2, 2), dtype=numpy.float32, schedule=2., chunk_length=3)
+
+        m = Monitor(inp, 'r')
+        m_file = Monitor(inp_file, 'r')
+
+        cls.test_net = Network()
+        cls.test_net.add([inp, inp_file, m, m_file])
+        cls.test_net.compile(silent=True)
+
+        cls.inp = cls.test_net.get(inp)
+        cls.m = cls.test_net.get(m)
+        cls.m_file = cls.test_net.get(m_file)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.test_net
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.test_net.reset()
+
+    def test_stream(self):
+        """
+        The inputs of the array and the file are presented in order, the last
+        one is kept when the stream is exhausted.
+        """
+        self.test_net.simulate(40.0)
+
+        r = self.m.get('r')
+        numpy.testing.assert_allclose(r[:30], self.inputs)
+        numpy.testing.assert_allclose(r[30:], numpy.tile(self.inputs[-1], (10, 1)))
+
+        r_file = self.m_file.get('r').reshape((40, 4))
+        numpy.testing.assert_allclose(r_file[0::2], self.inputs[:20])
+        numpy.testing.assert_allclose(r_file[1::2], self.inputs[:20])
+
+    def test_reset(self):
+        """
+        reset() presents the array again from the first input.
+        """
+        self.test_net.simulate(5.0)
+        self.inp.reset()
+        self.test_net.simulate(5.0)
+
+        r = self.m.get('r')
+        numpy.testing.assert_allclose(r[:5], self.inputs[:5])
+        numpy.testing.assert_allclose(r[5:], self.inputs[:5])
+
+    def test_iterator(self):
+        """
+        The inputs returned by a generator are presented in order.
+        """
+        def generator():
+            for values in self.inputs[:7]:
+                yield values
+
+        inp = StreamingTimedArray(generator(), geometry=4, chunk_length=2)
+        m = Monitor(inp, 'r')
+
+        net = Network()
+        net.add([inp, m])
+        net.compile(silent=True)
+        net.simulate(10.0)
+
+        r = net.get(m).get('r')
+        numpy.testing.assert_allclose(r[:7], self.inputs[:7])
+        numpy.testing.assert_allclose(r[7:], numpy.tile(self.inputs[6], (3, 1)))
+
+    def test_iterator_shared(self):
+        """
+        An iterator can not be consumed by two networks.
+        """
+        inp = StreamingTimedArray(iter(self.inputs), geometry=4)
+
+        net = Network()
+        net.add([inp])
+        with self.assertRaises(ANNarchyException):
+            Network().add([inp])
+
+    def test_view(self):
+        """
+        A view onto r follows the inputs, which are then copied into r instead of swapped.
+        """
+        if not _check_paradigm("openmp"):
+            self.skipTest("views are only available with openMP")
+
+        r = self.inp.view('r')
+        for t in range(10):
+            self.test_net.step()
+            numpy.testing.assert_allclose(r, self.inputs[t])
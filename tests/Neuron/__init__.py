@@ -8,6 +8,6 @@ from .test_IndividualNeuron import test_IndividualNeuron
 
 # Operations
 from .test_GlobalOperations import (test_GlobalOps_1D, test_GlobalOps_1D_Large,
-                                    test_GlobalOps_2D)
+                                    test_GlobalOps_1D_Parallel, test_GlobalOps_2D)
 from .test_NeuronUpdate import test_NeuronUpdate
 from .test_SpikingNeuron import test_SpikingCondition
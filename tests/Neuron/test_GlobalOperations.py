@@ -24,6 +24,7 @@ import unittest
 import numpy
 
 from ANNarchy import clear, Network, Neuron, Population
+from ANNarchy.core import Global
 
 class test_GlobalOps_1D(unittest.TestCase):
     """
@@ -198,6 +199,66 @@ class test_GlobalOps_1D_Large(unittest.TestCase):
 
         numpy.testing.assert_allclose(self.net_pop.max_r, numpy.amax(rand_val))
 
+class test_GlobalOps_1D_Parallel(unittest.TestCase):
+    """
+    Populations with at least Global.OMP_MIN_NB_GLOBAL_OPS neurons compute
+    the global operations with parallel reductions over the threads.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters="""
+                r=0
+            """,
+            equations="""
+                mean_r = mean(r)
+                max_r = max(r)
+                min_r = min(r)
+                l1 = norm1(r)
+                l2 = norm2(r)
+            """
+        )
+
+        cls.size = Global.OMP_MIN_NB_GLOBAL_OPS + 17
+        pop = Population(cls.size, neuron)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop])
+        cls.test_net.compile(silent=True)
+
+        cls.net_pop = cls.test_net.get(pop)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def tearDown(self):
+        """
+        After each test we call *reset()* to reset the network.
+        """
+        self.test_net.reset()
+
+    def test_global_ops(self):
+        """
+        All operations are reduced at the same time.
+        """
+        rand_val = numpy.random.uniform(-1.0, 1.0, self.size)
+        self.net_pop.r = rand_val
+        self.test_net.simulate(2)
+
+        numpy.testing.assert_allclose(self.net_pop.mean_r, numpy.mean(rand_val), rtol=1e-5, atol=1e-10)
+        numpy.testing.assert_allclose(self.net_pop.max_r, numpy.amax(rand_val))
+        numpy.testing.assert_allclose(self.net_pop.min_r, numpy.amin(rand_val))
+        numpy.testing.assert_allclose(self.net_pop.l1, numpy.linalg.norm(rand_val, 1), rtol=1e-5)
+        numpy.testing.assert_allclose(self.net_pop.l2, numpy.linalg.norm(rand_val, 2), rtol=1e-5)
+
 class test_GlobalOps_2D(unittest.TestCase):
     """
     ANNarchy support several global operations, there are always applied on
@@ -22,9 +22,12 @@
 
 """
 import unittest
+import numpy
 from numpy.testing import assert_allclose
 
 from ANNarchy import clear, Network, Neuron, Population, Uniform
+from ANNarchy.intern.ConfigManagement import _check_paradigm
+from ANNarchy.intern.Messages import ANNarchyException
 
 neuron = Neuron(
     parameters = """tau = 10""",
@@ -139,6 +142,47 @@ class test_Population1D(unittest.TestCase):
         self.net_pop1.tau = 5.0
         assert_allclose(self.net_pop1.tau, [5.0, 5.0, 5.0])
 
+    def test_view(self):
+        """
+        A view shares its memory with the C++ core: it follows the simulation
+        and the values written through a writable view are used by the core.
+        """
+        if not _check_paradigm("openmp"):
+            self.skipTest("views are only available with openMP")
+
+        r = self.net_pop1.view('r')
+        self.assertFalse(r.flags.writeable)
+        self.test_net.simulate(2)
+        assert_allclose(r, self.net_pop1.r)
+
+        tau = self.net_pop1.view('tau', writable=True)
+        tau[:] = 5.0
+        assert_allclose(self.net_pop1.tau, [5.0, 5.0, 5.0])
+
+    def test_view_invalidated(self):
+        """
+        A view (and the arrays derived from it) can not be used anymore once the C++ data is deallocated.
+        """
+        if not _check_paradigm("openmp"):
+            self.skipTest("views are only available with openMP")
+
+        r = self.net_pop1.view('r')
+        r_slice = r[1:]
+        self.net_pop1._invalidate_views()
+
+        with self.assertRaises(ANNarchyException):
+            r[0]
+        with self.assertRaises(ANNarchyException):
+            r_slice[0]
+        with self.assertRaises(ANNarchyException):
+            r.sum()
+        with self.assertRaises(ANNarchyException):
+            r + 1.0
+        with self.assertRaises(ANNarchyException):
+            numpy.mean(r)
+        with self.assertRaises(ANNarchyException):
+            r.tolist()
+
     def test_set_tau_2(self):
         """
         Assigned a new value, all instances will change.
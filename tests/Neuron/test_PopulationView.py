@@ -100,4 +100,18 @@ class test_PopulationView(unittest.TestCase):
         "old" data definitions.
         """
         view = self.net_pop1[2, :]
-        numpy.testing.assert_equal(isinstance(view.ranks, numpy.ndarray), True)
\ No newline at end of file
+        numpy.testing.assert_equal(isinstance(view.ranks, numpy.ndarray), True)
+
+    def test_set_subset(self):
+        """
+        Tests the setting of arrays and lists of values through a
+        *PopulationView*, the other neurons of the population are unchanged.
+        """
+        view = self.net_pop1[1:3, 2:4]
+        view.tau = numpy.arange(4) + 1.0
+        view.set({'r': [0.5, 1.5, 2.5, 3.5]})
+
+        numpy.testing.assert_allclose(view.tau, [1.0, 2.0, 3.0, 4.0])
+        numpy.testing.assert_allclose(self.net_pop1.r[1:3, 2:4], [[0.5, 1.5], [2.5, 3.5]])
+        self.assertEqual(numpy.count_nonzero(self.net_pop1.r), 4)
+        numpy.testing.assert_allclose(self.net_pop1.tau[0], 10.0)
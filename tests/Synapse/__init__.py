@@ -9,6 +9,7 @@ from .test_RateCustomConnectivity import (test_CustomConnectivityNoDelay,
                                           test_CustomConnectivityUniformDelay)
 from .test_Dendrite import test_DendriteDefaultSynapse, test_DendriteModifiedSynapse
 from .test_Projection import test_Projection
+from .test_LILConnectivity import test_LILConnectivity
 
 # Operations
 from .test_RateSynapse import test_Locality, test_AccessPSP, test_ModifiedPSP
@@ -27,6 +28,7 @@ if _check_paradigm('openmp'):
     from .test_RateDelays import test_NonuniformDelay
     from .test_RateCustomConnectivity import test_CustomConnectivityNonUniformDelay
     from .test_SpikingTransmission import test_SpikeTransmissionNonUniformDelay
+    from .test_SpikingTransmission import test_SpikeTransmissionThreadLocal
     from .test_StructuralPlasticityModel import test_StructuralPlasticityModel, test_StructuralPlasticityModelDelay
     from .test_StructuralPlasticityEnvironment import test_StructuralPlasticityEnvironment
     from .test_Convolution import test_Convolution
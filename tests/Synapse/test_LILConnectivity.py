@@ -0,0 +1,148 @@
+"""
+
+    test_LILConnectivity.py
+
+    This file is part of ANNarchy.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+from types import SimpleNamespace
+import numpy
+
+from ANNarchy.cython_ext import LILConnectivity, CSRConnectivity
+from ANNarchy.intern.ConfigManagement import get_global_config, _update_global_config
+
+class test_LILConnectivity(unittest.TestCase):
+    """
+    Test the bulk construction of a LILConnectivity from CSR arrays, the
+    CSRConnectivity container and the vectorized/parallel connector patterns.
+    No compilation is required.
+    """
+    def test_add_csr(self):
+        """
+        add_csr() must produce the same structure as successive calls to add().
+        """
+        dt = get_global_config('dt')
+        indptr = numpy.array([0, 2, 2, 5])
+        indices = numpy.array([1, 3, 0, 2, 4])
+        weights = numpy.array([0.1, 0.2, 0.3, 0.4, 0.5])
+        delays = numpy.array([1, 2, 1, 3, 2]) * dt
+
+        bulk = LILConnectivity()
+        bulk.add_csr([2, 5, 7], indptr, indices, weights, delays)
+
+        ref = LILConnectivity()
+        ref.add(2, [1, 3], [0.1, 0.2], [dt, 2*dt])
+        ref.add(7, [0, 2, 4], [0.3, 0.4, 0.5], [dt, 3*dt, 2*dt])
+
+        self.assertEqual(list(bulk.post_rank), list(ref.post_rank))
+        self.assertEqual(list(bulk.pre_rank), list(ref.pre_rank))
+        numpy.testing.assert_allclose(numpy.concatenate(bulk.w), numpy.concatenate(ref.w))
+        self.assertEqual(list(bulk.delay), list(ref.delay))
+        self.assertEqual(bulk.nb_synapses, ref.nb_synapses)
+        self.assertEqual(bulk.max_delay, ref.max_delay)
+        self.assertEqual(bulk.uniform_delay, -1)
+
+    def test_add_csr_uniform(self):
+        """
+        Single values for weights and delays are expanded as in add().
+        """
+        dt = get_global_config('dt')
+        lil = LILConnectivity()
+        lil.add_csr(None, [0, 1, 3], [4, 0, 1], 0.5, 2*dt)
+
+        self.assertEqual(list(lil.post_rank), [0, 1])
+        self.assertEqual([list(w) for w in lil.w], [[0.5], [0.5, 0.5]])
+        self.assertEqual(lil.uniform_delay, 2)
+        self.assertEqual(lil.max_delay, 2)
+
+    def test_fixed_probability(self):
+        """
+        The rows are sorted and contain no self-connections. Only the ranks
+        of the populations are required, so we avoid creating a Population
+        which would be added to the global network.
+        """
+        pop = SimpleNamespace(ranks=numpy.arange(100))
+
+        lil = LILConnectivity()
+        lil.fixed_probability(pop, pop, 0.2, 1.0, 0.0, False)
+
+        self.assertEqual(lil.nb_synapses, sum([len(r) for r in lil.pre_rank]))
+        for post_rank, pre_ranks in zip(lil.post_rank, lil.pre_rank):
+            self.assertTrue(post_rank not in pre_ranks)
+            self.assertEqual(list(pre_ranks), sorted(pre_ranks))
+
+    def test_csr_connectivity(self):
+        """
+        CSRConnectivity describes the same connectivity as the LIL built from
+        its arrays, empty rows are not counted as dendrites.
+        """
+        dt = get_global_config('dt')
+        csr = CSRConnectivity([2, 5, 7], [0, 2, 2, 5], [1, 3, 0, 2, 4], 0.5, 2*dt)
+
+        self.assertEqual(csr.size, 2)
+        self.assertEqual(csr.nb_synapses, 5)
+        self.assertEqual(csr.uniform_delay, 2)
+        self.assertFalse(csr.requires_sorting)
+        self.assertEqual(csr.compute_average_row_length()[0], 2.5)
+
+        lil = csr.to_lil()
+        self.assertEqual(list(lil.post_rank), [2, 7])
+        self.assertEqual(list(lil.pre_rank), [[1, 3], [0, 2, 4]])
+        self.assertEqual([list(w) for w in lil.w], [[0.5, 0.5], [0.5, 0.5, 0.5]])
+        self.assertEqual(lil.uniform_delay, csr.uniform_delay)
+
+    def test_csr_connectivity_unsorted(self):
+        """
+        CSRConnectivity removes the empty rows and sorts the others by post-synaptic
+        rank, the weights and delays of each synapse follow their row.
+        """
+        dt = get_global_config('dt')
+        csr = CSRConnectivity([7, 5, 2], [0, 3, 3, 5], [0, 2, 4, 1, 3], [0.1, 0.2, 0.3, 0.4, 0.5], [1*dt, 2*dt, 3*dt, 4*dt, 5*dt])
+
+        self.assertFalse(csr.requires_sorting)
+        self.assertEqual(list(csr.post_rank), [2, 7])
+        self.assertEqual(list(csr.row_ptr), [0, 2, 5])
+        self.assertEqual(list(csr.pre_rank), [1, 3, 0, 2, 4])
+        self.assertEqual(list(csr.w), [0.4, 0.5, 0.1, 0.2, 0.3])
+        self.assertEqual(list(csr.delay), [4, 5, 1, 2, 3])
+
+    def test_fixed_number_pre_deterministic(self):
+        """
+        The parallel fixed_number_pre pattern draws sorted rows of the requested
+        size without self-connections. As each row has its own random stream,
+        the result only depends on the seed, not on the number of threads.
+        """
+        pop = SimpleNamespace(ranks=numpy.arange(50))
+        num_threads = get_global_config('num_threads')
+
+        results = []
+        try:
+            for threads in [1, 2]:
+                _update_global_config('num_threads', threads)
+                numpy.random.seed(42)
+                lil = LILConnectivity()
+                lil.fixed_number_pre(pop, pop, 10, 1.0, 0.0, False)
+                results.append(lil)
+        finally:
+            _update_global_config('num_threads', num_threads)
+
+        self.assertEqual(results[0].nb_synapses, 500)
+        self.assertEqual(list(results[0].pre_rank), list(results[1].pre_rank))
+        for post_rank, pre_ranks in zip(results[0].post_rank, results[0].pre_rank):
+            self.assertEqual(len(set(pre_ranks)), 10)
+            self.assertTrue(post_rank not in pre_ranks)
+            self.assertEqual(list(pre_ranks), sorted(pre_ranks))
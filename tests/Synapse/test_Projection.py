@@ -25,6 +25,7 @@ import numpy
 from scipy import sparse
 
 from ANNarchy import Neuron, Synapse, Population, Projection, Network
+from ANNarchy.intern.Messages import ANNarchyException
 
 class test_Projection():
     """
@@ -154,3 +155,48 @@ class test_Projection():
         neurons recieving synapses.
         """
         self.assertEqual(self.net_proj.post_ranks, [1, 3])
+
+    def test_view(self):
+        """
+        Tests the zero-copy views onto the synaptic weights (one array per
+        dendrite) and the semiglobal parameter *alpha*. Only the LIL format
+        exports its storage.
+        """
+        if not hasattr(self.net_proj.cyInstance, 'get_local_attribute_view'):
+            self.skipTest("no views for the storage format " + self.storage_format)
+
+        w = self.net_proj.view('w')
+        self.assertEqual([len(row) for row in w], [8, 4])
+        self.assertFalse(w[0].flags.writeable)
+
+        self.test_net.simulate(1)
+        numpy.testing.assert_allclose(w[1], self.net_proj.w[1])
+
+        alpha = self.net_proj.view('alpha', writable=True)
+        alpha[1] = 2.0
+        numpy.testing.assert_allclose(self.net_proj.alpha, [8.0, 2.0])
+
+        # the views can not be used anymore after the C++ side reallocated the data
+        self.net_proj._invalidate_views()
+        with self.assertRaises(ANNarchyException):
+            w[1][0]
+        with self.assertRaises(ANNarchyException):
+            alpha.max()
+
+    def test_sparse_matrix(self):
+        """
+        Tests the export of local, semiglobal and global attributes as sparse
+        matrices, the rows are the post-synaptic neurons.
+        """
+        W = self.net_proj.sparse_matrix('w')
+        self.assertEqual(W.shape, (4, 8))
+        numpy.testing.assert_allclose(W.toarray(), self.weight_matrix.T.toarray())
+
+        indptr, indices, alpha = self.net_proj.sparse_matrix('alpha', raw=True)
+        numpy.testing.assert_equal(indptr, [0, 0, 8, 8, 12])
+        numpy.testing.assert_equal(numpy.sort(indices[8:]), [2, 3, 4, 5])
+        numpy.testing.assert_allclose(alpha, 8.0)
+
+        numpy.testing.assert_allclose(self.net_proj.sparse_matrix('tau').data, 5000.0)
+
+        numpy.testing.assert_allclose(self.net_proj.connectivity_matrix(), self.weight_matrix.T.toarray())
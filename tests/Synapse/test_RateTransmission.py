@@ -215,3 +215,15 @@ class test_RateTransmissionFixedNumberPre(unittest.TestCase):
         """
         tmp = [dend.size for dend in self.test_proj.dendrites]
         numpy.testing.assert_allclose(tmp, 3)
+
+    def test_sparse_matrix(self):
+        """
+        The connectivity exported in CSR format contains the pre-synaptic ranks
+        of each dendrite.
+        """
+        W = self.test_proj.sparse_matrix()
+        self.assertEqual(W.shape, (9, 9))
+        self.assertEqual(W.nnz, 27)
+        for dend in self.test_proj.dendrites:
+            numpy.testing.assert_equal(numpy.sort(W[dend.post_rank].indices), numpy.sort(dend.pre_ranks))
+        numpy.testing.assert_allclose(W.data, 0.1)
@@ -20,9 +20,10 @@
     You should have received a copy of the GNU General Public License
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+import unittest
 import numpy
 from ANNarchy import (clear, DiscreteUniform, Monitor, Network, Neuron,
-                      Population, Projection)
+                      Population, Projection, Synapse)
 
 class test_SpikeTransmissionNoDelay():
     """
@@ -237,3 +238,67 @@ class test_SpikeTransmissionNonUniformDelay():
         # 1st neuron gets 2 events at t==2, 2 events at t==3 and 1 event at t==4
         # 2nd neuron gets 1 event at t==2, 2 events at t==3, and 2 evets at t==4
         numpy.testing.assert_allclose(g_exc_data, [[0., 0.], [0., 0.], [2., 1.], [2., 2.], [1., 2.]])
+
+class test_SpikeTransmissionThreadLocal(unittest.TestCase):
+    """
+    With disable_omp=False, the spike propagation of a single LIL matrix is
+    parallelized over the pre-synaptic spikes and the conductances are
+    accumulated in thread-local buffers before the reduction.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build up the network
+        """
+        simple_emit = Neuron(
+            spike = "(t==1) or (t==3)",
+        )
+        simple_recv = Neuron(
+            equations = """
+                g_exc = 0
+                g_inh = 0
+            """,
+            spike = "g_exc>30"
+        )
+        double_syn = Synapse(
+            pre_spike = "g_target += 2 * w"
+        )
+
+        # simple in/out populations
+        in_pop = Population(5, neuron=simple_emit)
+        out_pop = Population(3, neuron=simple_recv)
+
+        # TC: default and modified pre_spike
+        proj = Projection(pre=in_pop, post=out_pop, target="exc", disable_omp=False)
+        proj.connect_all_to_all(weights=1.0, storage_format="lil")
+
+        proj2 = Projection(pre=in_pop, post=out_pop, target="inh", synapse=double_syn, disable_omp=False)
+        proj2.connect_all_to_all(weights=0.5, storage_format="lil")
+
+        # Monitor to record the currents
+        m = Monitor(out_pop, ["g_exc", "g_inh"])
+
+        # build network and store required object
+        # instances
+        net = Network()
+        net.add([in_pop, out_pop, proj, proj2, m])
+        cls.test_net = net
+        cls.test_net.compile(silent=True)
+        cls.test_m = net.get(m)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def test_thread_local(self):
+        """
+        The spikes are emitted at t==1 and t==3, the buffers must be cleared
+        in between.
+        """
+        self.test_net.simulate(5)
+        numpy.testing.assert_allclose(self.test_m.get('g_exc'), [[0.]*3, [0.]*3, [5.]*3, [0.]*3, [5.]*3])
+        numpy.testing.assert_allclose(self.test_m.get('g_inh'), [[0.]*3, [0.]*3, [5.]*3, [0.]*3, [5.]*3])